@@ -1,9 +1,15 @@
+from urllib3 import PoolManager
+
 from dsp_tools.commands.xmlupload.iri_resolver import IriResolver
+from dsp_tools.commands.xmlupload.make_rdf_graph.jsonld_utils import serialise_jsonld_for_resource
+from dsp_tools.commands.xmlupload.make_rdf_graph.jsonld_utils import serialise_jsonld_for_value
+from dsp_tools.commands.xmlupload.make_rdf_graph.make_resource_and_values import create_resource_with_values
 from dsp_tools.commands.xmlupload.models.permission import PermissionValue
 from dsp_tools.setup.ansi_colors import BOLD_GREEN
 from dsp_tools.setup.ansi_colors import YELLOW
 from dsp_tools.utils.data_formats.date_util import is_full_date
 from dsp_tools.utils.data_formats.shared import check_notna
+from dsp_tools.utils.telemetry import PhaseSummary
 from dsp_tools.utils.xml_parsing.parse_clean_validate_xml import validate_root_emit_user_message
 
 PermissionValue.RV
@@ -17,8 +23,19 @@ YELLOW
 
 IriResolver.non_empty()
 
+# the rdflib based serialisation is the reference for the direct JSON-LD payloads, it is only used by the tests
+create_resource_with_values
+serialise_jsonld_for_resource
+serialise_jsonld_for_value
+
 is_full_date("")
 
 check_notna("")
 
 validate_root_emit_user_message()
+
+# the connection pool classes of the shared HTTP session layer are read by urllib3
+PoolManager.pool_classes_by_scheme
+
+# the summary of a phase is only read when it is serialised
+PhaseSummary.throughput_per_second
@@ -27,6 +27,7 @@ class ValidateDataConfig:
     is_on_prod_server: bool
     skip_ontology_validation: bool
     do_not_request_resource_metadata_from_db: bool
+    use_api_cache: bool = True
 
 
 class ValidationSeverity(Enum):
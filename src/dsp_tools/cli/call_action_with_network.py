@@ -29,6 +29,7 @@ from dsp_tools.commands.migration.migration import migration
 from dsp_tools.commands.resume_xmlupload.resume_xmlupload import resume_xmlupload
 from dsp_tools.commands.start_stack.start_stack import StackConfiguration
 from dsp_tools.commands.start_stack.start_stack import StackHandler
+from dsp_tools.commands.validate_data.shacl_validator import shacl_validator_requires_docker
 from dsp_tools.commands.validate_data.validate_data import validate_data
 from dsp_tools.commands.xmlupload.upload_config import UploadConfig
 from dsp_tools.commands.xmlupload.xmlupload import xmlupload
@@ -68,6 +69,8 @@ def call_upload_files(args: argparse.Namespace) -> bool:
         xml_file=xml_path,
         creds=get_creds(args),
         imgdir=image_dir,
+        num_of_workers=max(args.workers, 1),
+        max_bytes_per_second=_megabytes_to_bytes(args.max_mb_per_second),
     )
 
 
@@ -84,7 +87,7 @@ def call_ingest_xmlupload(args: argparse.Namespace) -> bool:
     id2iri_file = args.id2iri_file
     if id2iri_file:
         required_files.append(Path(id2iri_file))
-    always_requires_docker = False if args.skip_validation else True
+    always_requires_docker = not args.skip_validation and shacl_validator_requires_docker()
     network_requirements = NetworkRequirements(
         args.server, always_requires_docker=always_requires_docker, ingest_url=args.dsp_ingest_url
     )
@@ -100,6 +103,7 @@ def call_ingest_xmlupload(args: argparse.Namespace) -> bool:
         skip_ontology_validation=args.skip_ontology_validation,
         id2iri_file=id2iri_file,
         do_not_request_resource_metadata_from_db=args.do_not_request_resource_metadata_from_db,
+        use_api_cache=not args.no_api_cache,
     )
 
 
@@ -109,7 +113,7 @@ def call_xmlupload(args: argparse.Namespace) -> bool:
     id2iri_file = args.id2iri_file
     if id2iri_file:
         required_files.append(Path(id2iri_file))
-    always_requires_docker = False if args.skip_validation else True
+    always_requires_docker = not args.skip_validation and shacl_validator_requires_docker()
     network_requirements = NetworkRequirements(
         args.server, always_requires_docker=always_requires_docker, ingest_url=args.dsp_ingest_url
     )
@@ -139,6 +143,13 @@ def call_xmlupload(args: argparse.Namespace) -> bool:
             imgdir=args.imgdir,
             config=UploadConfig(
                 interrupt_after=interrupt_after,
+                num_of_workers=max(args.workers, 1),
+                num_of_ingest_workers=max(args.ingest_workers, 0),
+                max_ingest_bytes_in_flight=_megabytes_to_bytes(args.max_ingest_mb_in_flight),
+                use_media_cache=not args.no_media_cache,
+                check_cached_media=not args.no_media_cache_check,
+                use_xml_cache=args.xml_cache,
+                use_api_cache=not args.no_api_cache,
                 skip_iiif_validation=args.no_iiif_uri_validation,
                 skip_validation=args.skip_validation,
                 ignore_duplicate_files_warning=args.ignore_duplicate_files_warning,
@@ -150,13 +161,19 @@ def call_xmlupload(args: argparse.Namespace) -> bool:
         )
 
 
+def _megabytes_to_bytes(megabytes: int | None) -> int | None:
+    if megabytes is None or megabytes <= 0:
+        return None
+    return megabytes * 1024 * 1024
+
+
 def call_validate_data(args: argparse.Namespace) -> bool:
     xml_path = Path(args.xmlfile)
     required_files = [xml_path]
     id2iri_file = args.id2iri_file
     if id2iri_file:
         required_files.append(Path(id2iri_file))
-    network_requirements = NetworkRequirements(args.server, always_requires_docker=True)
+    network_requirements = NetworkRequirements(args.server, always_requires_docker=shacl_validator_requires_docker())
     path_deps = PathDependencies(required_files)
     check_input_dependencies(path_deps, [network_requirements])
 
@@ -168,6 +185,8 @@ def call_validate_data(args: argparse.Namespace) -> bool:
         skip_ontology_validation=args.skip_ontology_validation,
         id2iri_file=id2iri_file,
         do_not_request_resource_metadata_from_db=args.do_not_request_resource_metadata_from_db,
+        use_xml_cache=args.xml_cache,
+        use_api_cache=not args.no_api_cache,
     )
 
 
@@ -207,6 +207,15 @@ def _add_upload_files(
     subparser.add_argument(
         "-i", "--imgdir", default=".", help="folder from where the paths in the <bitstream> tags are evaluated"
     )
+    subparser.add_argument(
+        "--workers", type=int, default=1, help="number of files that are uploaded at the same time (default: 1)"
+    )
+    subparser.add_argument(
+        "--max-mb-per-second",
+        type=int,
+        default=None,
+        help="maximum number of megabytes per second that are uploaded by all workers together",
+    )
     subparser.add_argument("xml_file", help="path to XML file containing the data")
 
 
@@ -266,6 +275,14 @@ def _add_ingest_xmlupload(
             "Do not request IRIs of existing resources from the db (references to existing resources won't be checked)"
         ),
     )
+    subparser.add_argument(
+        "--no-api-cache",
+        action="store_true",
+        help=(
+            "download the ontologies and lists from the server, "
+            "even if they have not changed since an earlier run (stored in ~/.dsp-tools/cache/)"
+        ),
+    )
 
 
 def _add_xmlupload(
@@ -297,6 +314,53 @@ def _add_xmlupload(
         ),
     )
     subparser.add_argument("--interrupt-after", type=int, default=-1, help="interrupt after this number of resources")
+    subparser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="number of resources that are created at the same time (default: 1, i.e. one after the other)",
+    )
+    subparser.add_argument(
+        "--ingest-workers",
+        type=int,
+        default=0,
+        help=(
+            "number of files that are uploaded at the same time, ahead of the creation of their resources "
+            "(default: 0, i.e. each file is uploaded right before its resource is created)"
+        ),
+    )
+    subparser.add_argument(
+        "--max-ingest-mb-in-flight",
+        type=int,
+        default=None,
+        help="with '--ingest-workers': maximum number of megabytes that are uploaded at the same time",
+    )
+    subparser.add_argument(
+        "--no-media-cache",
+        action="store_true",
+        help="upload all files, even if a file with the same content was already uploaded to the same server",
+    )
+    subparser.add_argument(
+        "--no-media-cache-check",
+        action="store_true",
+        help="reuse files from the media cache without checking if they still exist on the server",
+    )
+    subparser.add_argument(
+        "--xml-cache",
+        action="store_true",
+        help=(
+            "reuse the parsed XML file of an earlier run on the same unchanged file, "
+            "instead of parsing and validating it again (stored in ~/.dsp-tools/cache/)"
+        ),
+    )
+    subparser.add_argument(
+        "--no-api-cache",
+        action="store_true",
+        help=(
+            "download the ontologies and lists from the server, "
+            "even if they have not changed since an earlier run (stored in ~/.dsp-tools/cache/)"
+        ),
+    )
     subparser.add_argument("xmlfile", help="path to the XML file containing the data")
     subparser.add_argument(
         "--no-iiif-uri-validation",
@@ -344,6 +408,22 @@ def _add_validate_data(
     )
     subparser.set_defaults(action="validate-data")
     subparser.add_argument("xmlfile", help="path to the XML file containing the data")
+    subparser.add_argument(
+        "--xml-cache",
+        action="store_true",
+        help=(
+            "reuse the parsed XML file of an earlier run on the same unchanged file, "
+            "instead of parsing and validating it again (stored in ~/.dsp-tools/cache/)"
+        ),
+    )
+    subparser.add_argument(
+        "--no-api-cache",
+        action="store_true",
+        help=(
+            "download the ontologies and lists from the server, "
+            "even if they have not changed since an earlier run (stored in ~/.dsp-tools/cache/)"
+        ),
+    )
     subparser.add_argument("-u", "--user", default=root_user_email, help=username_text)
     subparser.add_argument("-p", "--password", default=root_user_pw, help=password_text)
     subparser.add_argument(
@@ -23,6 +23,7 @@ from dsp_tools.setup.ansi_colors import BOLD_RED
 from dsp_tools.setup.ansi_colors import RESET_TO_DEFAULT
 from dsp_tools.setup.logger_config import logger_config
 from dsp_tools.setup.warnings_config import initialize_warnings
+from dsp_tools.utils.http_session import log_connection_stats
 from dsp_tools.utils.interactive import prompt_until_valid_answer
 
 
@@ -80,6 +81,7 @@ def run(args: Sequence[str]) -> None:
         print(err if isinstance(err, InternalError) else InternalError(custom_msg=str(err)))
         success = False
 
+    log_connection_stats()
     if not success:
         logger.error("Terminate without success")
         sys.exit(1)
@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+import hashlib
+import json
+from dataclasses import dataclass
+from dataclasses import field
+from pathlib import Path
+
+from loguru import logger
+
+from dsp_tools.utils.file_utils import write_atomically
+
+
+@dataclass(frozen=True)
+class CachedResponse:
+    """
+    The content of a response, and the value that tells whether it is still up to date,
+    e.g. the last modification date of an ontology.
+    """
+
+    content: str
+    validator: str
+
+
+@dataclass
+class ApiResponseCache:
+    """
+    Responses of the DSP-API that rarely change (ontologies and lists), kept across runs,
+    so that they do not have to be downloaded again if they have not changed on the server.
+
+    An entry is identified by the server and the IRI of the requested ontology or list.
+    Every entry is stored with a validator, which the client compares with the current state on the server.
+    If the validator has changed, the entry is downloaded again and replaced.
+    """
+
+    directory: Path = field(default_factory=lambda: Path.home() / ".dsp-tools" / "cache" / "api-responses")
+
+    def get(self, server: str, iri: str) -> CachedResponse | None:
+        """Returns the entry of the IRI on the server, or None if there is no valid entry."""
+        location = self._get_location(server, iri)
+        if not location.is_file():
+            return None
+        try:
+            entry = json.loads(location.read_text(encoding="utf-8"))
+            return CachedResponse(content=entry["content"], validator=entry["validator"])
+        except (OSError, json.JSONDecodeError, KeyError, TypeError):
+            logger.warning(f"Ignoring the invalid entry {location} of the API response cache")
+            return None
+
+    def put(self, server: str, iri: str, response: CachedResponse) -> None:
+        """Stores the entry, replacing an older entry of the same IRI on the same server."""
+        entry = {"server": server, "iri": iri, "validator": response.validator, "content": response.content}
+        try:
+            write_atomically(self._get_location(server, iri), json.dumps(entry, ensure_ascii=False))
+        except OSError:
+            logger.exception(f"Unable to store the response of {iri} in the API response cache {self.directory}")
+
+    def _get_location(self, server: str, iri: str) -> Path:
+        key = hashlib.sha256(f"{server}\n{iri}".encode()).hexdigest()
+        return self.directory / f"{key}.json"
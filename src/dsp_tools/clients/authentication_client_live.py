@@ -1,15 +1,17 @@
 from dataclasses import dataclass
+from dataclasses import field
 from http import HTTPStatus
 from importlib.metadata import version
 from typing import Any
 from typing import cast
 
-import requests
 from requests import RequestException
+from requests import Session
 
 from dsp_tools.clients.authentication_client import AuthenticationClient
 from dsp_tools.clients.exceptions import FatalNonOkApiResponseCode
 from dsp_tools.error.exceptions import BadCredentialsError
+from dsp_tools.utils.http_session import make_session
 from dsp_tools.utils.request_utils import RequestParameters
 from dsp_tools.utils.request_utils import log_and_raise_request_exception
 from dsp_tools.utils.request_utils import log_request
@@ -28,6 +30,7 @@ class AuthenticationClientLive(AuthenticationClient):
     email: str
     password: str
     _token: str | None = None
+    _session: Session = field(init=False, default_factory=make_session)
 
     def get_token(self) -> str:
         """
@@ -44,7 +47,7 @@ class AuthenticationClientLive(AuthenticationClient):
         request_params = RequestParameters("POST", url, data=payload, timeout=TIMEOUT_10, headers=headers)
         log_request(request_params)
         try:
-            response = requests.post(
+            response = self._session.post(
                 request_params.url,
                 json=request_params.data,
                 headers=request_params.headers,
@@ -55,17 +58,19 @@ class AuthenticationClientLive(AuthenticationClient):
 
         match response.status_code:
             case HTTPStatus.OK:
-                log_response(response, include_response_content=False, status_code=response.status_code)
+                log_response(
+                    response, include_response_content=False, status_code=response.status_code, request=request_params
+                )
                 res_json: dict[str, Any] = response.json()
                 tkn = cast(str, res_json["token"])
                 self._token = tkn
                 return tkn
             case HTTPStatus.UNAUTHORIZED | HTTPStatus.BAD_REQUEST:
-                log_response(response, status_code=response.status_code)
+                log_response(response, status_code=response.status_code, request=request_params)
                 raise BadCredentialsError(
                     f"Login to the API with the email '{self.email}' was not successful. "
                     f"Please ensure that an account for this email exists and that the password is correct."
                 )
             case _:
-                log_response(response, status_code=response.status_code)
+                log_response(response, status_code=response.status_code, request=request_params)
                 raise FatalNonOkApiResponseCode(url, response.status_code, response.text)
@@ -1,7 +1,6 @@
 from dataclasses import dataclass
 from dataclasses import field
 from functools import partial
-from importlib.metadata import version
 from typing import Any
 from typing import Literal
 from typing import cast
@@ -17,12 +16,15 @@ from dsp_tools.clients.connection import Connection
 from dsp_tools.clients.exceptions import InvalidInputError
 from dsp_tools.error.exceptions import PermanentConnectionError
 from dsp_tools.setup.logger_config import WARNINGS_SAVEPATH
+from dsp_tools.utils.http_session import make_session
+from dsp_tools.utils.rate_control import RequestSlot
+from dsp_tools.utils.rate_control import get_rate_controller
 from dsp_tools.utils.request_utils import PostFiles
 from dsp_tools.utils.request_utils import RequestParameters
 from dsp_tools.utils.request_utils import ResponseCodeAndText
 from dsp_tools.utils.request_utils import log_and_raise_timeouts
+from dsp_tools.utils.request_utils import log_failed_request
 from dsp_tools.utils.request_utils import log_request
-from dsp_tools.utils.request_utils import log_request_failure_and_sleep
 from dsp_tools.utils.request_utils import log_response
 from dsp_tools.utils.request_utils import should_retry_request
 
@@ -41,14 +43,13 @@ class ConnectionLive(Connection):
 
     server: str
     authenticationClient: AuthenticationClient | None = None
-    session: Session = field(init=False, default=Session())
+    session: Session = field(init=False, default_factory=make_session)
     # downtimes of server-side services -> API still processes request
     # -> retry too early has side effects (e.g. duplicated resources)
     timeout_put_post: int = field(init=False, default=30 * 60)
     timeout_get: int = field(init=False, default=20)
 
     def __post_init__(self) -> None:
-        self.session.headers["User-Agent"] = f"DSP-TOOLS/{version('dsp-tools')}"
         if self.server.endswith("/"):
             self.server = self.server[:-1]
         if self.authenticationClient and (token := self.authenticationClient.get_token()):
@@ -167,32 +168,37 @@ class ConnectionLive(Connection):
         """
         action = partial(self.session.request, **params.as_kwargs())
         num_of_retries = 24  # xmlupload must handle > 45 min fuseki downtime due to compaction, see DEV-5089
+        rate_controller = get_rate_controller()
         for retry_counter in range(num_of_retries):
-            try:
-                log_request(params, dict(self.session.headers))
-                response = action()
-            except (TimeoutError, ReadTimeout) as err:
-                log_and_raise_timeouts(err)
-            except (ConnectionError, RequestException):
-                self._renew_session()
-                log_request_failure_and_sleep(
-                    reason="Connection Error raised", retry_counter=retry_counter, exc_info=True
+            with rate_controller.request_slot() as slot:
+                try:
+                    log_request(params, dict(self.session.headers))
+                    response = action()
+                except (TimeoutError, ReadTimeout) as err:
+                    slot.record_timeout()
+                    log_failed_request(params, dict(self.session.headers))
+                    log_and_raise_timeouts(err)
+                except (ConnectionError, RequestException):
+                    log_failed_request(params, dict(self.session.headers))
+                    self._renew_session()
+                    slot.record_failure("Connection Error raised", retry_counter, exc_info=True)
+                    continue
+
+                log_response(
+                    response, status_code=response.status_code, request=params, extra_headers=dict(self.session.headers)
                 )
-                continue
+                if response.status_code == HTTP_OK:
+                    return response
 
-            log_response(response, status_code=response.status_code)
-            if response.status_code == HTTP_OK:
-                return response
-
-            self._handle_non_ok_responses(response, retry_counter)
+                self._handle_non_ok_responses(response, slot, retry_counter)
 
         # if all attempts have failed, raise error
         msg = f"Permanently unable to execute the network action. See {WARNINGS_SAVEPATH} for more information."
         raise PermanentConnectionError(msg)
 
-    def _handle_non_ok_responses(self, response: Response, retry_counter: int) -> None:
+    def _handle_non_ok_responses(self, response: Response, slot: RequestSlot, retry_counter: int) -> None:
         if should_retry_request(ResponseCodeAndText(response.status_code, response.text)):
-            log_request_failure_and_sleep("Transient Error", retry_counter, exc_info=False)
+            slot.record_failure("Transient Error", retry_counter, exc_info=False)
             return None
         api_msg = self._extract_original_api_err_msg(str(response.content))
         blame = self._determine_blame(api_msg)
@@ -228,7 +234,6 @@ class ConnectionLive(Connection):
 
     def _renew_session(self) -> None:
         self.session.close()
-        self.session = Session()
-        self.session.headers["User-Agent"] = f"DSP-TOOLS/{version('dsp-tools')}"
+        self.session = make_session()
         if self.authenticationClient and (token := self.authenticationClient.get_token()):
             self.session.headers["Authorization"] = f"Bearer {token}"
@@ -1,17 +1,19 @@
 from dataclasses import dataclass
+from dataclasses import field
 from http import HTTPStatus
 from typing import Any
 from typing import cast
 from urllib.parse import quote_plus
 
-import requests
 from requests import RequestException
+from requests import Session
 
 from dsp_tools.clients.authentication_client import AuthenticationClient
 from dsp_tools.clients.exceptions import FatalNonOkApiResponseCode
 from dsp_tools.clients.group_user_clients import GroupClient
 from dsp_tools.clients.group_user_clients import UserClient
 from dsp_tools.error.exceptions import BadCredentialsError
+from dsp_tools.utils.http_session import make_session
 from dsp_tools.utils.request_utils import RequestParameters
 from dsp_tools.utils.request_utils import log_and_raise_request_exception
 from dsp_tools.utils.request_utils import log_and_warn_unexpected_non_ok_response
@@ -25,6 +27,7 @@ TIMEOUT_30 = 30
 class UserClientLive(UserClient):
     api_url: str
     auth: AuthenticationClient
+    _session: Session = field(init=False, default_factory=make_session)
 
     def get_user_iri_by_username(self, username: str) -> str | None:
         url = f"{self.api_url}/admin/users/username/{username}"
@@ -32,10 +35,10 @@ class UserClientLive(UserClient):
         params = RequestParameters("GET", url, TIMEOUT_30, headers=headers)
         log_request(params)
         try:
-            response = requests.get(url=params.url, headers=params.headers, timeout=params.timeout)
+            response = self._session.get(url=params.url, headers=params.headers, timeout=params.timeout)
         except RequestException as err:
             log_and_raise_request_exception(err)
-        log_response(response, status_code=response.status_code)
+        log_response(response, status_code=response.status_code, request=params)
         if response.ok:
             result = response.json()
             return cast(str, result["user"]["id"])
@@ -55,12 +58,12 @@ class UserClientLive(UserClient):
         params = RequestParameters("POST", url, TIMEOUT_30, data=user_dict, headers=headers)
         log_request(params)
         try:
-            response = requests.post(
+            response = self._session.post(
                 url=params.url, headers=params.headers, data=params.data_serialized, timeout=params.timeout
             )
         except RequestException as err:
             log_and_raise_request_exception(err)
-        log_response(response, status_code=response.status_code)
+        log_response(response, status_code=response.status_code, request=params)
         if response.ok:
             result = response.json()
             return cast(str, result["user"]["id"])
@@ -80,10 +83,10 @@ class UserClientLive(UserClient):
         params = RequestParameters("POST", url, TIMEOUT_30, headers=headers)
         log_request(params)
         try:
-            response = requests.post(url=params.url, headers=params.headers, timeout=params.timeout)
+            response = self._session.post(url=params.url, headers=params.headers, timeout=params.timeout)
         except RequestException as err:
             log_and_raise_request_exception(err)
-        log_response(response, status_code=response.status_code)
+        log_response(response, status_code=response.status_code, request=params)
         if response.ok:
             return True
         if response.status_code == HTTPStatus.FORBIDDEN:
@@ -99,10 +102,10 @@ class UserClientLive(UserClient):
         params = RequestParameters("POST", url, TIMEOUT_30, headers=headers)
         log_request(params)
         try:
-            response = requests.post(url=params.url, headers=params.headers, timeout=params.timeout)
+            response = self._session.post(url=params.url, headers=params.headers, timeout=params.timeout)
         except RequestException as err:
             log_and_raise_request_exception(err)
-        log_response(response, status_code=response.status_code)
+        log_response(response, status_code=response.status_code, request=params)
         if response.ok:
             return True
         if response.status_code == HTTPStatus.FORBIDDEN:
@@ -125,10 +128,10 @@ class UserClientLive(UserClient):
         params = RequestParameters("POST", url, TIMEOUT_30, headers=headers)
         log_request(params)
         try:
-            response = requests.post(url=params.url, headers=params.headers, timeout=params.timeout)
+            response = self._session.post(url=params.url, headers=params.headers, timeout=params.timeout)
         except RequestException as err:
             log_and_raise_request_exception(err)
-        log_response(response, status_code=response.status_code)
+        log_response(response, status_code=response.status_code, request=params)
         if response.ok:
             return True
         if response.status_code == HTTPStatus.FORBIDDEN:
@@ -141,16 +144,17 @@ class UserClientLive(UserClient):
 class GroupClientLive(GroupClient):
     api_url: str
     auth: AuthenticationClient
+    _session: Session = field(init=False, default_factory=make_session)
 
     def get_all_groups(self) -> list[dict[str, Any]]:
         url = f"{self.api_url}/admin/groups"
         params = RequestParameters("GET", url, TIMEOUT_30)
         log_request(params)
         try:
-            response = requests.get(params.url, timeout=params.timeout)
+            response = self._session.get(params.url, timeout=params.timeout)
         except RequestException as err:
             log_and_raise_request_exception(err)
-        log_response(response, status_code=response.status_code)
+        log_response(response, status_code=response.status_code, request=params)
         if response.ok:
             result = response.json()
             return cast(list[dict[str, Any]], result["groups"])
@@ -163,12 +167,12 @@ class GroupClientLive(GroupClient):
         params = RequestParameters("POST", url, TIMEOUT_30, headers=headers, data=group_dict)
         log_request(params)
         try:
-            response = requests.post(
+            response = self._session.post(
                 params.url, data=params.data_serialized, timeout=params.timeout, headers=params.headers
             )
         except RequestException as err:
             log_and_raise_request_exception(err)
-        log_response(response, status_code=response.status_code)
+        log_response(response, status_code=response.status_code, request=params)
         if response.ok:
             result = response.json()
             return cast(str, result["group"]["id"])
@@ -10,7 +10,6 @@ from typing import Protocol
 import requests
 from loguru import logger
 from requests import Session
-from requests.adapters import HTTPAdapter
 from requests.adapters import Retry
 
 from dsp_tools.clients.authentication_client import AuthenticationClient
@@ -20,7 +19,10 @@ from dsp_tools.commands.xmlupload.models.permission import Permissions
 from dsp_tools.commands.xmlupload.models.processed.file_values import ProcessedFileBitstream
 from dsp_tools.error.exceptions import BadCredentialsError
 from dsp_tools.error.exceptions import PermanentConnectionError
+from dsp_tools.utils.http_session import make_session
+from dsp_tools.utils.rate_control import get_rate_controller
 from dsp_tools.utils.request_utils import RequestParameters
+from dsp_tools.utils.request_utils import is_server_error
 from dsp_tools.utils.request_utils import log_request
 from dsp_tools.utils.request_utils import log_response
 
@@ -58,7 +60,6 @@ class DspIngestClientLive(AssetClient):
 
     def __post_init__(self) -> None:
         retries = 6
-        self.session = Session()
         retry = Retry(
             total=retries,
             read=retries,
@@ -67,9 +68,7 @@ class DspIngestClientLive(AssetClient):
             allowed_methods=None,  # means all methods
             status_forcelist=[HTTPStatus.INTERNAL_SERVER_ERROR.value],
         )
-        adapter = HTTPAdapter(max_retries=retry)
-        self.session.mount("http://", adapter)
-        self.session.mount("https://", adapter)
+        self.session = make_session(max_retries=retry)
 
     def _ingest(self, filepath: Path) -> IngestResponse:
         """Uploads a file to the ingest server and returns the IngestResponse.
@@ -102,6 +101,8 @@ class DspIngestClientLive(AssetClient):
         }
         timeout = 9 * 60
         params = RequestParameters(method="POST", url=url, timeout=timeout, headers=headers)
+        # the file uploads do not take a slot of the rate controller of DSP-API,
+        # because their number is limited by the worker pool of the prefetcher
         with open(filepath, "rb") as binary_io:
             try:
                 log_request(params)
@@ -111,7 +112,7 @@ class DspIngestClientLive(AssetClient):
                     data=binary_io,
                     timeout=params.timeout,
                 )
-                log_response(res, status_code=res.status_code)
+                log_response(res, status_code=res.status_code, request=params)
             except requests.exceptions.RequestException as e:
                 logger.exception(f"Ingest request failed: {url}")
                 raise PermanentConnectionError() from e
@@ -125,6 +126,25 @@ class DspIngestClientLive(AssetClient):
             else:
                 raise PermanentConnectionError()
 
+    def asset_exists(self, internal_filename: str) -> bool:
+        """Checks if the asset with the given internal filename still exists on the ingest server."""
+        asset_id = Path(internal_filename).stem
+        url = f"{self.dsp_ingest_url}/projects/{self.shortcode}/assets/{urllib.parse.quote(asset_id)}"
+        headers = {"Authorization": f"Bearer {self.auth.get_token()}"}
+        params = RequestParameters(method="GET", url=url, timeout=30, headers=headers)
+        log_request(params)
+        with get_rate_controller().request_slot() as slot:
+            try:
+                res = self.session.get(url=params.url, headers=params.headers, timeout=params.timeout)
+            except requests.exceptions.RequestException:
+                slot.record_error()
+                logger.exception(f"Unable to check if the asset '{asset_id}' exists, the file is uploaded again")
+                return False
+            if is_server_error(res.status_code):
+                slot.record_error()
+        log_response(res, status_code=res.status_code, request=params)
+        return res.ok
+
     def get_bitstream_info(
         self, file_info: ProcessedFileBitstream, permissions: Permissions | None
     ) -> BitstreamInfo | None:
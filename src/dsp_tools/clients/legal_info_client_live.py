@@ -1,16 +1,19 @@
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from dataclasses import field
 from http import HTTPStatus
 from typing import Any
 
-import requests
 from loguru import logger
 from requests import RequestException
 from requests import Response
+from requests import Session
 
 from dsp_tools.clients.authentication_client import AuthenticationClient
 from dsp_tools.clients.exceptions import FatalNonOkApiResponseCode
 from dsp_tools.clients.legal_info_client import LegalInfoClient
 from dsp_tools.error.exceptions import BadCredentialsError
+from dsp_tools.utils.http_session import make_session
 from dsp_tools.utils.request_utils import RequestParameters
 from dsp_tools.utils.request_utils import log_and_raise_request_exception
 from dsp_tools.utils.request_utils import log_request
@@ -18,12 +21,15 @@ from dsp_tools.utils.request_utils import log_response
 
 TIMEOUT_60 = 60
 
+MAX_CONCURRENT_REQUESTS = 8
+
 
 @dataclass
 class LegalInfoClientLive(LegalInfoClient):
     server: str
     project_shortcode: str
     auth: AuthenticationClient
+    _session: Session = field(init=False, default_factory=make_session)
 
     def post_copyright_holders(self, copyright_holders: list[str]) -> None:
         """Send a list of new copyright holders to the API"""
@@ -49,13 +55,13 @@ class LegalInfoClientLive(LegalInfoClient):
         }
         params = RequestParameters("POST", url, TIMEOUT_60, {"data": data}, headers)
         log_request(params)
-        response = requests.post(
+        response = self._session.post(
             url=params.url,
             headers=params.headers,
             data=params.data_serialized,
             timeout=params.timeout,
         )
-        log_response(response, status_code=response.status_code)
+        log_response(response, status_code=response.status_code, request=params)
         return response
 
     def set_resource_side_legal_info(self, legal_info: dict[str, Any]) -> None:
@@ -69,7 +75,7 @@ class LegalInfoClientLive(LegalInfoClient):
         params = RequestParameters("PUT", url, TIMEOUT_60, legal_info, headers)
         log_request(params)
         try:
-            response = requests.put(
+            response = self._session.put(
                 url=params.url,
                 headers=params.headers,
                 data=params.data_serialized,
@@ -77,7 +83,7 @@ class LegalInfoClientLive(LegalInfoClient):
             )
         except RequestException as err:
             log_and_raise_request_exception(err)
-        log_response(response, status_code=response.status_code)
+        log_response(response, status_code=response.status_code, request=params)
         if response.ok:
             return
         if response.status_code == HTTPStatus.FORBIDDEN:
@@ -89,14 +95,13 @@ class LegalInfoClientLive(LegalInfoClient):
 
     def get_licenses_of_a_project(self, enabled_only: bool = True) -> list[dict[str, Any]]:
         logger.debug("GET enabled licenses of the project.")
-        page_num = 1
-        all_data = []
-        is_last_page = False
-        while not is_last_page:
-            response = self._get_one_license_page(page_num, enabled_only)
-            response_dict = response.json()
-            all_data.extend(response_dict["data"])
-            is_last_page = _is_last_page(response_dict)
+        first_page = self._get_one_license_page(1, enabled_only).json()
+        all_data = list(first_page["data"])
+        # the number of pages is known from the first page, so the other pages can be requested at the same time
+        other_page_nums = range(2, _get_total_pages(first_page) + 1)
+        with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_REQUESTS, thread_name_prefix="licenses") as executor:
+            for response in executor.map(lambda x: self._get_one_license_page(x, enabled_only), other_page_nums):
+                all_data.extend(response.json()["data"])
         return all_data
 
     def _get_one_license_page(self, page_num: int, enabled_only: bool) -> Response:
@@ -112,12 +117,12 @@ class LegalInfoClientLive(LegalInfoClient):
         params = RequestParameters(method="GET", url=url, timeout=TIMEOUT_60, headers=headers)
         log_request(params)
         try:
-            response = requests.get(
+            response = self._session.get(
                 url=params.url,
                 headers=params.headers,
                 timeout=params.timeout,
             )
-            log_response(response, status_code=response.status_code)
+            log_response(response, status_code=response.status_code, request=params)
         except RequestException as err:
             log_and_raise_request_exception(err)
         if response.ok:
@@ -125,7 +130,5 @@ class LegalInfoClientLive(LegalInfoClient):
         raise FatalNonOkApiResponseCode(url, response.status_code, response.text)
 
 
-def _is_last_page(response: dict[str, Any]) -> bool:
-    current_page = response["pagination"]["currentPage"]
-    total_page = response["pagination"]["totalPages"]
-    return bool(current_page == total_page)
+def _get_total_pages(response: dict[str, Any]) -> int:
+    return int(response["pagination"]["totalPages"])
@@ -1,19 +1,26 @@
+import json
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from dataclasses import field
 from http import HTTPStatus
 from typing import Any
 from typing import cast
 from urllib.parse import quote_plus
 
-import requests
+from loguru import logger
 from requests import RequestException
 from requests import Response
+from requests import Session
 
+from dsp_tools.clients.api_response_cache import ApiResponseCache
+from dsp_tools.clients.api_response_cache import CachedResponse
 from dsp_tools.clients.authentication_client import AuthenticationClient
 from dsp_tools.clients.exceptions import FatalNonOkApiResponseCode
 from dsp_tools.clients.list_client import ListCreateClient
 from dsp_tools.clients.list_client import ListGetClient
 from dsp_tools.clients.list_client import ListInfo
 from dsp_tools.error.exceptions import BadCredentialsError
+from dsp_tools.utils.http_session import make_session
 from dsp_tools.utils.request_utils import RequestParameters
 from dsp_tools.utils.request_utils import log_and_raise_request_exception
 from dsp_tools.utils.request_utils import log_and_warn_unexpected_non_ok_response
@@ -24,6 +31,11 @@ TIMEOUT_10 = 10
 TIMEOUT_30 = 30
 TIMEOUT_60 = 60
 
+MAX_CONCURRENT_REQUESTS = 8
+
+# the response headers that identify the version of a list, and the request headers to send them back
+_CONDITIONAL_REQUEST_HEADERS = {"ETag": "If-None-Match", "Last-Modified": "If-Modified-Since"}
+
 
 @dataclass
 class ListGetClientLive(ListGetClient):
@@ -31,11 +43,14 @@ class ListGetClientLive(ListGetClient):
 
     api_url: str
     shortcode: str
+    cache: ApiResponseCache | None = None
+    _session: Session = field(init=False, default_factory=make_session)
 
     def get_all_lists_and_nodes(self) -> list[ListInfo]:
         list_json = self._get_all_list_iris()
         all_iris = self._extract_list_iris(list_json)
-        all_lists = [self._get_one_list(iri) for iri in all_iris]
+        with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_REQUESTS, thread_name_prefix="lists") as executor:
+            all_lists = list(executor.map(self._get_one_list, all_iris))
         return [self._reformat_one_list(lst) for lst in all_lists]
 
     def get_all_list_iris_and_names(self) -> dict[str, str]:
@@ -46,13 +61,14 @@ class ListGetClientLive(ListGetClient):
 
     def _get_all_list_iris(self) -> dict[str, Any]:
         url = f"{self.api_url}/admin/lists?projectShortcode={self.shortcode}"
-        log_request(RequestParameters("GET", url, TIMEOUT_10))
+        params = RequestParameters("GET", url, TIMEOUT_10)
+        log_request(params)
         try:
-            response = requests.get(url=url, timeout=TIMEOUT_10)
+            response = self._session.get(url=url, timeout=TIMEOUT_10)
         except RequestException as err:
             log_and_raise_request_exception(err)
 
-        log_response(response, status_code=response.status_code)
+        log_response(response, status_code=response.status_code, request=params)
         if response.ok:
             json_response = cast(dict[str, Any], response.json())
             return json_response
@@ -64,14 +80,22 @@ class ListGetClientLive(ListGetClient):
     def _get_one_list(self, list_iri: str) -> dict[str, Any]:
         encoded_list_iri = quote_plus(list_iri)
         url = f"{self.api_url}/admin/lists/{encoded_list_iri}"
-        log_request(RequestParameters("GET", url, TIMEOUT_30))
+        cached = self.cache.get(self.api_url, list_iri) if self.cache else None
+        headers = _get_conditional_request_headers(cached) if cached else None
+        params = RequestParameters("GET", url, TIMEOUT_30, headers=headers)
+        log_request(params)
         try:
-            response = requests.get(url=url, timeout=TIMEOUT_30)
+            response = self._session.get(url=url, headers=headers, timeout=TIMEOUT_30)
         except RequestException as err:
             log_and_raise_request_exception(err)
 
-        log_response(response, status_code=response.status_code, include_response_content=False)
+        log_response(response, status_code=response.status_code, include_response_content=False, request=params)
+        if cached and response.status_code == HTTPStatus.NOT_MODIFIED:
+            logger.debug(f"Using the cached list {list_iri}, because it has not been modified")
+            return cast(dict[str, Any], json.loads(cached.content))
         if response.ok:
+            if self.cache and (validator := _get_validator(response)):
+                self.cache.put(self.api_url, list_iri, CachedResponse(content=response.text, validator=validator))
             response_json = cast(dict[str, Any], response.json())
             return response_json
         raise FatalNonOkApiResponseCode(url, response.status_code, response.text)
@@ -80,17 +104,34 @@ class ListGetClientLive(ListGetClient):
         return ListInfo(response_json["list"]["listinfo"], response_json["list"]["children"])
 
 
+def _get_validator(response: Response) -> str | None:
+    """
+    The lists have no modification date,
+    so they can only be cached if the server identifies their version in the response headers.
+    """
+    for header in _CONDITIONAL_REQUEST_HEADERS:
+        if value := response.headers.get(header):
+            return json.dumps({header: value})
+    return None
+
+
+def _get_conditional_request_headers(cached: CachedResponse) -> dict[str, str]:
+    response_headers = cast(dict[str, str], json.loads(cached.validator))
+    return {_CONDITIONAL_REQUEST_HEADERS[k]: v for k, v in response_headers.items()}
+
+
 @dataclass
 class ListCreateClientLive(ListCreateClient):
     api_url: str
     project_iri: str
     auth: AuthenticationClient
+    _session: Session = field(init=False, default_factory=make_session)
 
     def create_new_list(self, list_info: dict[str, Any]) -> str | None:
         url = f"{self.api_url}/admin/lists"
         headers = self._get_request_header()
         try:
-            response = _post_and_log_request(url, list_info, headers)
+            response = _post_and_log_request(self._session, url, list_info, headers)
         except RequestException as err:
             log_and_raise_request_exception(err)
 
@@ -111,7 +152,7 @@ class ListCreateClientLive(ListCreateClient):
         url = f"{self.api_url}/admin/lists/{encoded_parent_iri}"
         headers = self._get_request_header()
         try:
-            response = _post_and_log_request(url, node_info, headers)
+            response = _post_and_log_request(self._session, url, node_info, headers)
         except RequestException as err:
             log_and_raise_request_exception(err)
 
@@ -135,17 +176,18 @@ class ListCreateClientLive(ListCreateClient):
 
 
 def _post_and_log_request(
+    session: Session,
     url: str,
     data: dict[str, Any],
     headers: dict[str, str] | None = None,
 ) -> Response:
     params = RequestParameters("POST", url, TIMEOUT_60, data, headers)
     log_request(params)
-    response = requests.post(
+    response = session.post(
         url=params.url,
         headers=params.headers,
         data=params.data_serialized,
         timeout=params.timeout,
     )
-    log_response(response, status_code=response.status_code)
+    log_response(response, status_code=response.status_code, request=params)
     return response
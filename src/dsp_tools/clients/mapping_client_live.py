@@ -1,13 +1,15 @@
 from dataclasses import dataclass
+from dataclasses import field
 from http import HTTPStatus
 from urllib.parse import quote_plus
 
-import requests
 from requests import RequestException
+from requests import Session
 
 from dsp_tools.clients.authentication_client import AuthenticationClient
 from dsp_tools.clients.mapping_client import MappingClient
 from dsp_tools.error.exceptions import BadCredentialsError
+from dsp_tools.utils.http_session import make_session
 from dsp_tools.utils.request_utils import RequestParameters
 from dsp_tools.utils.request_utils import ResponseCodeAndText
 from dsp_tools.utils.request_utils import log_and_raise_request_exception
@@ -23,6 +25,7 @@ class MappingClientLive(MappingClient):
     server: str
     encoded_ontology_iri: str
     auth: AuthenticationClient
+    _session: Session = field(init=False, default_factory=make_session)
 
     def put_class_mapping(self, class_iri: str, mapping_iris: list[str]) -> ResponseCodeAndText | None:
         encoded_class = quote_plus(class_iri)
@@ -52,7 +55,7 @@ class MappingClientLive(MappingClient):
         params = RequestParameters("PUT", url, TIMEOUT_30, {"mappings": external_iris}, headers)
         log_request(params)
         try:
-            response = requests.put(
+            response = self._session.put(
                 url=params.url,
                 headers=params.headers,
                 data=params.data_serialized,
@@ -61,7 +64,7 @@ class MappingClientLive(MappingClient):
         except RequestException as err:
             log_and_raise_request_exception(err)
 
-        log_response(response, status_code=response.status_code)
+        log_response(response, status_code=response.status_code, request=params)
 
         match response.status_code:
             case HTTPStatus.OK:
@@ -82,7 +85,7 @@ class MappingClientLive(MappingClient):
         params = RequestParameters("DELETE", url_with_query, TIMEOUT_30, headers=headers)
         log_request(params)
         try:
-            response = requests.delete(
+            response = self._session.delete(
                 url=params.url,
                 headers=params.headers,
                 timeout=params.timeout,
@@ -90,7 +93,7 @@ class MappingClientLive(MappingClient):
         except RequestException as err:
             log_and_raise_request_exception(err)
 
-        log_response(response, status_code=response.status_code)
+        log_response(response, status_code=response.status_code, request=params)
 
         match response.status_code:
             case HTTPStatus.OK:
@@ -1,13 +1,15 @@
 from dataclasses import dataclass
+from dataclasses import field
 from http import HTTPStatus
 
-import requests
 from loguru import logger
 from requests import RequestException
+from requests import Session
 
 from dsp_tools.clients.authentication_client import AuthenticationClient
 from dsp_tools.clients.metadata_client import ExistingResourcesRetrieved
 from dsp_tools.clients.metadata_client import MetadataClient
+from dsp_tools.utils.http_session import make_session
 from dsp_tools.utils.request_utils import RequestParameters
 from dsp_tools.utils.request_utils import log_and_warn_unexpected_non_ok_response
 from dsp_tools.utils.request_utils import log_request
@@ -20,6 +22,7 @@ TIMEOUT_120 = 120
 class MetadataClientLive(MetadataClient):
     server: str
     auth: AuthenticationClient
+    _session: Session = field(init=False, default_factory=make_session)
 
     def get_resource_metadata(self, shortcode: str) -> tuple[ExistingResourcesRetrieved, list[dict[str, str | None]]]:
         url = f"{self.server}/v2/metadata/projects/{shortcode}/resources?format=JSON"
@@ -28,7 +31,7 @@ class MetadataClientLive(MetadataClient):
         logger.debug("GET Resource Metadata")
         log_request(params)
         try:
-            response = requests.get(
+            response = self._session.get(
                 url=params.url,
                 headers=params.headers,
                 timeout=params.timeout,
@@ -37,7 +40,7 @@ class MetadataClientLive(MetadataClient):
             logger.exception(err)
             return ExistingResourcesRetrieved.FALSE, []
         if response.ok:
-            log_response(response, status_code=response.status_code, include_response_content=False)
+            log_response(response, status_code=response.status_code, include_response_content=False, request=params)
             logger.debug(f"{len(response.json())} NUMBER OF RESOURCES RETRIEVED")
             return ExistingResourcesRetrieved.TRUE, response.json()
         if response.status_code != HTTPStatus.FORBIDDEN:
@@ -1,12 +1,13 @@
 from dataclasses import dataclass
+from dataclasses import field
 from http import HTTPStatus
 from pathlib import Path
 from typing import Literal
 from typing import cast
 from urllib.parse import quote
 
-import requests
 from requests import RequestException
+from requests import Session
 
 from dsp_tools.clients.authentication_client import AuthenticationClient
 from dsp_tools.clients.exceptions import FatalNonOkApiResponseCode
@@ -19,6 +20,7 @@ from dsp_tools.clients.migration_clients import ImportId
 from dsp_tools.clients.migration_clients import MigrationExportClient
 from dsp_tools.clients.migration_clients import MigrationImportClient
 from dsp_tools.error.exceptions import BadCredentialsError
+from dsp_tools.utils.http_session import make_session
 from dsp_tools.utils.request_utils import RequestParameters
 from dsp_tools.utils.request_utils import log_and_raise_request_exception
 from dsp_tools.utils.request_utils import log_request
@@ -40,6 +42,7 @@ class MigrationExportClientLive(MigrationExportClient):
     server: str
     project_iri: str
     auth: AuthenticationClient
+    _session: Session = field(init=False, default_factory=make_session)
 
     def post_export(self, skip_assets: bool) -> ExportId:
         encoded_iri = quote(self.project_iri, safe="")
@@ -49,10 +52,10 @@ class MigrationExportClientLive(MigrationExportClient):
         log_request(params)
 
         try:
-            response = requests.post(url=params.url, headers=params.headers, timeout=params.timeout)
+            response = self._session.post(url=params.url, headers=params.headers, timeout=params.timeout)
         except RequestException as err:
             log_and_raise_request_exception(err)
-        log_response(response, status_code=response.status_code)
+        log_response(response, status_code=response.status_code, request=params)
 
         match response.status_code:
             case HTTPStatus.ACCEPTED:
@@ -69,7 +72,7 @@ class MigrationExportClientLive(MigrationExportClient):
         url = f"{self.server}/v3/projects/{encoded_iri}/exports/{export_id.id_}"
         headers = {"Authorization": f"Bearer {self.auth.get_token()}"}
         params = RequestParameters("GET", url, TIMEOUT_60, headers=headers)
-        return _make_status_check_call(params)
+        return _make_status_check_call(self._session, params)
 
     def get_download(self, export_id: ExportId, destination: Path) -> None:
         encoded_iri = quote(self.project_iri, safe="")
@@ -79,10 +82,10 @@ class MigrationExportClientLive(MigrationExportClient):
         log_request(params)
 
         try:
-            response = requests.get(url=params.url, headers=params.headers, timeout=params.timeout)
+            response = self._session.get(url=params.url, headers=params.headers, timeout=params.timeout)
         except RequestException as err:
             log_and_raise_request_exception(err)
-        log_response(response, status_code=response.status_code, include_response_content=False)
+        log_response(response, status_code=response.status_code, include_response_content=False, request=params)
 
         match response.status_code:
             case HTTPStatus.OK:
@@ -102,7 +105,7 @@ class MigrationExportClientLive(MigrationExportClient):
         url = f"{self.server}/v3/projects/{encoded_iri}/exports/{export_id.id_}"
         headers = {"Authorization": f"Bearer {self.auth.get_token()}"}
         params = RequestParameters("DELETE", url, TIMEOUT_60, headers=headers)
-        _make_delete_call(params, "export")
+        _make_delete_call(self._session, params, "export")
 
 
 @dataclass
@@ -110,6 +113,7 @@ class MigrationImportClientLive(MigrationImportClient):
     server: str
     project_iri: str
     auth: AuthenticationClient
+    _session: Session = field(init=False, default_factory=make_session)
 
     def post_import(self, zip_path: Path) -> ImportId:
         encoded_iri = quote(self.project_iri, safe="")
@@ -123,7 +127,7 @@ class MigrationImportClientLive(MigrationImportClient):
 
         try:
             with open(zip_path, "rb") as binary_io:
-                response = requests.post(
+                response = self._session.post(
                     url=params.url,
                     headers=params.headers,
                     data=binary_io,
@@ -131,7 +135,7 @@ class MigrationImportClientLive(MigrationImportClient):
                 )
         except RequestException as err:
             log_and_raise_request_exception(err)
-        log_response(response, status_code=response.status_code)
+        log_response(response, status_code=response.status_code, request=params)
 
         match response.status_code:
             case HTTPStatus.ACCEPTED:
@@ -148,23 +152,23 @@ class MigrationImportClientLive(MigrationImportClient):
         url = f"{self.server}/v3/projects/{encoded_iri}/imports/{import_id.id_}"
         headers = {"Authorization": f"Bearer {self.auth.get_token()}"}
         params = RequestParameters("GET", url, TIMEOUT_60, headers=headers)
-        return _make_status_check_call(params)
+        return _make_status_check_call(self._session, params)
 
     def delete_import(self, import_id: ImportId) -> None:
         encoded_iri = quote(self.project_iri, safe="")
         url = f"{self.server}/v3/projects/{encoded_iri}/imports/{import_id.id_}"
         headers = {"Authorization": f"Bearer {self.auth.get_token()}"}
         params = RequestParameters("DELETE", url, TIMEOUT_60, headers=headers)
-        _make_delete_call(params, "import")
+        _make_delete_call(self._session, params, "import")
 
 
-def _make_status_check_call(params: RequestParameters) -> ExportImportStatus:
+def _make_status_check_call(session: Session, params: RequestParameters) -> ExportImportStatus:
     log_request(params)
     try:
-        response = requests.get(url=params.url, headers=params.headers, timeout=params.timeout)
+        response = session.get(url=params.url, headers=params.headers, timeout=params.timeout)
     except RequestException as err:
         log_and_raise_request_exception(err)
-    log_response(response, status_code=response.status_code)
+    log_response(response, status_code=response.status_code, request=params)
 
     match response.status_code:
         case HTTPStatus.OK:
@@ -175,13 +179,13 @@ def _make_status_check_call(params: RequestParameters) -> ExportImportStatus:
             raise FatalNonOkApiResponseCode(params.url, response.status_code, response.text)
 
 
-def _make_delete_call(params: RequestParameters, process: Literal["import", "export"]) -> None:
+def _make_delete_call(session: Session, params: RequestParameters, process: Literal["import", "export"]) -> None:
     log_request(params)
     try:
-        response = requests.delete(url=params.url, headers=params.headers, timeout=params.timeout)
+        response = session.delete(url=params.url, headers=params.headers, timeout=params.timeout)
     except RequestException as err:
         log_and_raise_request_exception(err)
-    log_response(response, status_code=response.status_code)
+    log_response(response, status_code=response.status_code, request=params)
 
     match response.status_code:
         case HTTPStatus.NO_CONTENT:
@@ -1,19 +1,21 @@
 from dataclasses import dataclass
+from dataclasses import field
 from http import HTTPStatus
 from typing import Any
 from typing import cast
 
-import requests
 from rdflib import Graph
 from rdflib import Literal
 from rdflib import URIRef
 from requests import RequestException
 from requests import Response
+from requests import Session
 
 from dsp_tools.clients.authentication_client import AuthenticationClient
 from dsp_tools.clients.exceptions import FatalNonOkApiResponseCode
 from dsp_tools.clients.ontology_clients import OntologyCreateClient
 from dsp_tools.error.exceptions import BadCredentialsError
+from dsp_tools.utils.http_session import make_session
 from dsp_tools.utils.rdf_constants import KNORA_API
 from dsp_tools.utils.request_utils import RequestParameters
 from dsp_tools.utils.request_utils import ResponseCodeAndText
@@ -32,6 +34,7 @@ class OntologyCreateClientLive(OntologyCreateClient):
 
     server: str
     auth: AuthenticationClient
+    _session: Session = field(init=False, default_factory=make_session)
 
     def get_last_modification_date(self, project_iri: str, onto_iri: str) -> Literal:
         url = f"{self.server}/v2/ontologies/metadata"
@@ -119,13 +122,13 @@ class OntologyCreateClientLive(OntologyCreateClient):
         data_dict, generic_headers = self._prepare_request(data, headers)
         params = RequestParameters("POST", url, TIMEOUT_60, data_dict, generic_headers)
         log_request(params)
-        response = requests.post(
+        response = self._session.post(
             url=params.url,
             headers=params.headers,
             data=params.data_serialized,
             timeout=params.timeout,
         )
-        log_response(response, status_code=response.status_code)
+        log_response(response, status_code=response.status_code, request=params)
         return response
 
     def _get_and_log_request(
@@ -136,12 +139,12 @@ class OntologyCreateClientLive(OntologyCreateClient):
         _, generic_headers = self._prepare_request({}, headers)
         params = RequestParameters(method="GET", url=url, timeout=TIMEOUT_60, headers=generic_headers)
         log_request(params)
-        response = requests.get(
+        response = self._session.get(
             url=params.url,
             headers=params.headers,
             timeout=params.timeout,
         )
-        log_response(response, status_code=response.status_code)
+        log_response(response, status_code=response.status_code, request=params)
         return response
 
     def _prepare_request(
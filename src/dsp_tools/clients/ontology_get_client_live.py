@@ -1,13 +1,21 @@
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from dataclasses import field
 from typing import Any
 from typing import cast
 
-import requests
+from loguru import logger
+from rdflib import Graph
 from requests import RequestException
+from requests import Session
 
+from dsp_tools.clients.api_response_cache import ApiResponseCache
+from dsp_tools.clients.api_response_cache import CachedResponse
 from dsp_tools.clients.exceptions import FatalNonOkApiResponseCode
 from dsp_tools.clients.exceptions import ProjectOntologyNotFound
 from dsp_tools.clients.ontology_clients import OntologyGetClient
+from dsp_tools.utils.http_session import make_session
+from dsp_tools.utils.rdf_constants import KNORA_API
 from dsp_tools.utils.request_utils import RequestParameters
 from dsp_tools.utils.request_utils import log_and_raise_request_exception
 from dsp_tools.utils.request_utils import log_request
@@ -17,22 +25,40 @@ TIMEOUT_10 = 10
 TIMEOUT_30 = 30
 TIMEOUT_60 = 60
 
+MAX_CONCURRENT_REQUESTS = 8
+
 
 @dataclass
 class OntologyGetClientLive(OntologyGetClient):
     api_url: str
     shortcode: str
+    cache: ApiResponseCache | None = None
+    _session: Session = field(init=False, default_factory=make_session)
 
     def get_knora_api(self) -> str:
+        if not self.cache:
+            return self._download_knora_api()
+        # knora-api is built into the server, so it only changes if another version of the server is deployed
+        if not (server_version := self._get_server_version()):
+            return self._download_knora_api()
+        iri = f"{self.api_url}/ontology/knora-api/v2"
+        if (cached := self.cache.get(self.api_url, iri)) and cached.validator == server_version:
+            logger.debug(f"Using the cached knora-api ontology of the server version {server_version}")
+            return cached.content
+        knora_api = self._download_knora_api()
+        self.cache.put(self.api_url, iri, CachedResponse(content=knora_api, validator=server_version))
+        return knora_api
+
+    def _download_knora_api(self) -> str:
         url = f"{self.api_url}/ontology/knora-api/v2#"
         headers = {"Accept": "text/turtle"}
         params = RequestParameters("GET", url, timeout=TIMEOUT_60, headers=headers)
         log_request(params)
         try:
-            response = requests.get(url=params.url, headers=params.headers, timeout=params.timeout)
+            response = self._session.get(url=params.url, headers=params.headers, timeout=params.timeout)
         except RequestException as err:
             log_and_raise_request_exception(err)
-        log_response(response, status_code=response.status_code, include_response_content=False)
+        log_response(response, status_code=response.status_code, include_response_content=False, request=params)
         if response.ok:
             return response.text
         raise FatalNonOkApiResponseCode(params.url, response.status_code, response.text)
@@ -45,37 +71,94 @@ class OntologyGetClientLive(OntologyGetClient):
         Returns:
             list of ontologies and IRIs
         """
-        ontology_iris = self._get_ontology_iris()
-        ontologies = [self._get_one_ontology(x) for x in ontology_iris]
+        project = self._get_project()
+        ontology_iris = self._extract_ontology_iris(project)
+        last_modification_dates = self._get_last_modification_dates(project["id"]) if self.cache else {}
+        with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_REQUESTS, thread_name_prefix="ontologies") as executor:
+            ontologies = list(
+                executor.map(
+                    lambda x: self._get_one_ontology_with_cache(x, last_modification_dates.get(x)), ontology_iris
+                )
+            )
         return ontologies, ontology_iris
 
-    def _get_ontology_iris(self) -> list[str]:
+    def _get_one_ontology_with_cache(self, ontology_iri: str, last_modification_date: str | None) -> str:
+        if not self.cache or not last_modification_date:
+            return self._get_one_ontology(ontology_iri)
+        if (cached := self.cache.get(self.api_url, ontology_iri)) and cached.validator == last_modification_date:
+            logger.debug(f"Using the cached ontology {ontology_iri}, last modified on {last_modification_date}")
+            return cached.content
+        onto = self._get_one_ontology(ontology_iri)
+        self.cache.put(self.api_url, ontology_iri, CachedResponse(content=onto, validator=last_modification_date))
+        return onto
+
+    def _get_project(self) -> dict[str, Any]:
         url = f"{self.api_url}/admin/projects/shortcode/{self.shortcode}"
         params = RequestParameters("GET", url, timeout=TIMEOUT_10)
         log_request(params)
         try:
-            response = requests.get(url=params.url, timeout=params.timeout)
+            response = self._session.get(url=params.url, timeout=params.timeout)
         except RequestException as err:
             log_and_raise_request_exception(err)
-        log_response(response, status_code=response.status_code)
+        log_response(response, status_code=response.status_code, request=params)
         if not response.ok:
             raise FatalNonOkApiResponseCode(params.url, response.status_code, response.text)
         response_json = cast(dict[str, Any], response.json())
-        if not (ontos := response_json.get("project", {}).get("ontologies")):
+        return cast(dict[str, Any], response_json.get("project", {}))
+
+    def _extract_ontology_iris(self, project: dict[str, Any]) -> list[str]:
+        if not (ontos := project.get("ontologies")):
             raise ProjectOntologyNotFound(self.shortcode)
         output = cast(list[str], ontos)
         return output
 
+    def _get_last_modification_dates(self, project_iri: str) -> dict[str, str]:
+        url = f"{self.api_url}/v2/ontologies/metadata"
+        headers = {"X-Knora-Accept-Project": project_iri}
+        params = RequestParameters("GET", url, timeout=TIMEOUT_10, headers=headers)
+        log_request(params)
+        try:
+            response = self._session.get(url=params.url, headers=params.headers, timeout=params.timeout)
+        except RequestException:
+            logger.exception("Unable to get the last modification dates, the ontologies are not cached")
+            return {}
+        log_response(response, status_code=response.status_code, request=params)
+        if not response.ok:
+            logger.warning(f"Unable to get the last modification dates, the ontologies are not cached: {url}")
+            return {}
+        return _parse_last_modification_dates(response.text)
+
+    def _get_server_version(self) -> str | None:
+        url = f"{self.api_url}/version"
+        params = RequestParameters("GET", url, timeout=TIMEOUT_10)
+        log_request(params)
+        try:
+            response = self._session.get(url=params.url, timeout=params.timeout)
+        except RequestException:
+            logger.exception("Unable to get the version of the server, the knora-api ontology is not cached")
+            return None
+        log_response(response, status_code=response.status_code, request=params)
+        if not response.ok:
+            logger.warning(f"Unable to get the version of the server, the knora-api ontology is not cached: {url}")
+            return None
+        return response.text
+
     def _get_one_ontology(self, ontology_iri: str) -> str:
         url = ontology_iri
         headers = {"Accept": "text/turtle"}
         params = RequestParameters("GET", url, timeout=TIMEOUT_30, headers=headers)
         log_request(params)
         try:
-            response = requests.get(url=params.url, headers=params.headers, timeout=params.timeout)
+            response = self._session.get(url=params.url, headers=params.headers, timeout=params.timeout)
         except RequestException as err:
             log_and_raise_request_exception(err)
-        log_response(response, status_code=response.status_code, include_response_content=False)
+        log_response(response, status_code=response.status_code, include_response_content=False, request=params)
         if response.ok:
             return response.text
         raise FatalNonOkApiResponseCode(params.url, response.status_code, response.text)
+
+
+def _parse_last_modification_dates(response_text: str) -> dict[str, str]:
+    g = Graph()
+    g.parse(data=response_text, format="json-ld")
+    return {str(onto): str(date) for onto, date in g.subject_objects(KNORA_API.lastModificationDate)}
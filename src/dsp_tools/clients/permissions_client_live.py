@@ -1,14 +1,16 @@
 from dataclasses import dataclass
+from dataclasses import field
 from http import HTTPStatus
 from typing import Any
 from urllib.parse import quote_plus
 
-import requests
 from requests import RequestException
+from requests import Session
 
 from dsp_tools.clients.authentication_client import AuthenticationClient
 from dsp_tools.clients.permissions_client import PermissionsClient
 from dsp_tools.error.exceptions import BadCredentialsError
+from dsp_tools.utils.http_session import make_session
 from dsp_tools.utils.request_utils import RequestParameters
 from dsp_tools.utils.request_utils import ResponseCodeAndText
 from dsp_tools.utils.request_utils import log_and_raise_request_exception
@@ -23,6 +25,7 @@ class PermissionsClientLive(PermissionsClient):
     server: str
     auth: AuthenticationClient
     project_iri: str
+    _session: Session = field(init=False, default_factory=make_session)
 
     def get_project_doaps(self) -> list[dict[str, Any]] | ResponseCodeAndText:
         url = f"{self.server}/admin/permissions/doap/{quote_plus(self.project_iri)}"
@@ -33,14 +36,14 @@ class PermissionsClientLive(PermissionsClient):
         params = RequestParameters("GET", url, TIMEOUT_10, headers=headers)
         log_request(params)
         try:
-            response = requests.get(
+            response = self._session.get(
                 url=params.url,
                 timeout=params.timeout,
                 headers=params.headers,
             )
         except RequestException as err:
             log_and_raise_request_exception(err)
-        log_response(response, status_code=response.status_code)
+        log_response(response, status_code=response.status_code, request=params)
         if response.ok:
             response_json: dict[str, list[dict[str, Any]]] = response.json()
             return response_json["default_object_access_permissions"]
@@ -57,14 +60,14 @@ class PermissionsClientLive(PermissionsClient):
         params = RequestParameters("DELETE", url, TIMEOUT_10, headers=headers)
         log_request(params)
         try:
-            response = requests.delete(
+            response = self._session.delete(
                 url=params.url,
                 timeout=params.timeout,
                 headers=params.headers,
             )
         except RequestException as err:
             log_and_raise_request_exception(err)
-        log_response(response, status_code=response.status_code)
+        log_response(response, status_code=response.status_code, request=params)
         if response.ok:
             return True
         if response.status_code == HTTPStatus.FORBIDDEN:
@@ -83,7 +86,7 @@ class PermissionsClientLive(PermissionsClient):
         params = RequestParameters("POST", url, TIMEOUT_10, data=payload, headers=headers)
         log_request(params)
         try:
-            response = requests.post(
+            response = self._session.post(
                 url=params.url,
                 timeout=params.timeout,
                 headers=params.headers,
@@ -91,7 +94,7 @@ class PermissionsClientLive(PermissionsClient):
             )
         except RequestException as err:
             log_and_raise_request_exception(err)
-        log_response(response, status_code=response.status_code)
+        log_response(response, status_code=response.status_code, request=params)
         if response.ok:
             return True
         if response.status_code == HTTPStatus.FORBIDDEN:
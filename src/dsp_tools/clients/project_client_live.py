@@ -1,16 +1,18 @@
 from dataclasses import dataclass
+from dataclasses import field
 from http import HTTPStatus
 from typing import Any
 from typing import cast
 
-import requests
 from requests import RequestException
+from requests import Session
 
 from dsp_tools.clients.authentication_client import AuthenticationClient
 from dsp_tools.clients.exceptions import FatalNonOkApiResponseCode
 from dsp_tools.clients.exceptions import ProjectNotFoundError
 from dsp_tools.clients.project_client import ProjectClient
 from dsp_tools.error.exceptions import BadCredentialsError
+from dsp_tools.utils.http_session import make_session
 from dsp_tools.utils.request_utils import RequestParameters
 from dsp_tools.utils.request_utils import ResponseCodeAndText
 from dsp_tools.utils.request_utils import log_and_raise_request_exception
@@ -24,17 +26,18 @@ TIMEOUT_30 = 30
 class ProjectClientLive(ProjectClient):
     server: str
     auth: AuthenticationClient
+    _session: Session = field(init=False, default_factory=make_session)
 
     def get_project_iri(self, shortcode: str) -> str:
         url = f"{self.server}/admin/projects/shortcode/{shortcode}"
         params = RequestParameters("GET", url, TIMEOUT_30)
         log_request(params)
         try:
-            response = requests.get(url, timeout=TIMEOUT_30)
+            response = self._session.get(url, timeout=TIMEOUT_30)
         except RequestException as err:
             log_and_raise_request_exception(err)
 
-        log_response(response, status_code=response.status_code)
+        log_response(response, status_code=response.status_code, request=params)
         if response.ok:
             result = response.json()
             return cast(str, result["project"]["id"])
@@ -47,11 +50,11 @@ class ProjectClientLive(ProjectClient):
         params = RequestParameters("GET", url, TIMEOUT_30)
         log_request(params)
         try:
-            response = requests.get(url, timeout=TIMEOUT_30)
+            response = self._session.get(url, timeout=TIMEOUT_30)
         except RequestException as err:
             log_and_raise_request_exception(err)
 
-        log_response(response, status_code=response.status_code)
+        log_response(response, status_code=response.status_code, request=params)
         if response.ok:
             result = response.json()
             return cast(list[str], result["project"].get("defaultDataAuthorship", []))
@@ -65,13 +68,13 @@ class ProjectClientLive(ProjectClient):
         params = RequestParameters("POST", url, TIMEOUT_30, headers=headers, data=project_info)
         log_request(params)
         try:
-            response = requests.post(
+            response = self._session.post(
                 params.url, timeout=params.timeout, headers=params.headers, data=params.data_serialized
             )
         except RequestException as err:
             log_and_raise_request_exception(err)
 
-        log_response(response, status_code=response.status_code)
+        log_response(response, status_code=response.status_code, request=params)
         if response.ok:
             result = response.json()
             return cast(str, result["project"]["id"])
@@ -9,9 +9,11 @@ class ResourceClient(Protocol):
     server: str
     auth: AuthenticationClient
 
-    def post_resource(self, resource_json: dict[str, Any], resource_has_bitstream: bool) -> str | ResponseCodeAndText:
+    def post_resource(
+        self, resource_json: dict[str, Any], resource_has_bitstream: bool
+    ) -> dict[str, Any] | ResponseCodeAndText:
         """
-        POST a JSON-LD resource payload to /v2/resources.
+        POST a JSON-LD resource payload to /v2/resources, and return the created resource as returned by the API.
         """
 
     def get_resource(self, resource_iri: str) -> dict[str, Any] | ResponseCodeAndText:
@@ -1,12 +1,10 @@
 from dataclasses import dataclass
 from dataclasses import field
 from http import HTTPStatus
-from importlib.metadata import version
 from typing import Any
 from typing import cast
 from urllib.parse import quote_plus
 
-import requests
 from requests import ReadTimeout
 from requests import RequestException
 from requests import Session
@@ -14,6 +12,7 @@ from requests import Session
 from dsp_tools.clients.authentication_client import AuthenticationClient
 from dsp_tools.clients.resource_client import ResourceClient
 from dsp_tools.error.exceptions import BadCredentialsError
+from dsp_tools.utils.http_session import make_session
 from dsp_tools.utils.request_utils import RequestParameters
 from dsp_tools.utils.request_utils import ResponseCodeAndText
 from dsp_tools.utils.request_utils import log_and_raise_request_exception
@@ -29,12 +28,11 @@ TIMEOUT_30 = 30
 class ResourceClientLive(ResourceClient):
     server: str
     auth: AuthenticationClient
-    _session: Session = field(init=False, default_factory=Session)
+    _session: Session = field(init=False, default_factory=make_session)
 
-    def __post_init__(self) -> None:
-        self._session.headers["User-Agent"] = f"DSP-TOOLS/{version('dsp-tools')}"
-
-    def post_resource(self, resource_json: dict[str, Any], resource_has_bitstream: bool) -> str | ResponseCodeAndText:
+    def post_resource(
+        self, resource_json: dict[str, Any], resource_has_bitstream: bool
+    ) -> dict[str, Any] | ResponseCodeAndText:
         url = f"{self.server}/v2/resources"
         headers: dict[str, str] = {
             "Content-Type": "application/json",
@@ -56,11 +54,11 @@ class ResourceClientLive(ResourceClient):
             log_and_raise_timeouts(err)
         except RequestException as err:
             log_and_raise_request_exception(err)
-        log_response(response, status_code=response.status_code)
+        log_response(response, status_code=response.status_code, request=params)
 
         match response.status_code:
             case HTTPStatus.OK:
-                return cast(str, response.json()["@id"])
+                return cast(dict[str, Any], response.json())
             case HTTPStatus.UNAUTHORIZED:
                 raise BadCredentialsError(
                     "Authentication failed. Your credentials may be invalid or your token may have expired."
@@ -78,10 +76,10 @@ class ResourceClientLive(ResourceClient):
         params = RequestParameters("GET", url, TIMEOUT_30, headers=headers)
         log_request(params)
         try:
-            response = requests.get(params.url, timeout=params.timeout, headers=params.headers)
+            response = self._session.get(params.url, timeout=params.timeout, headers=params.headers)
         except RequestException as err:
             log_and_raise_request_exception(err)
-        log_response(response, status_code=response.status_code)
+        log_response(response, status_code=response.status_code, request=params)
 
         match response.status_code:
             case HTTPStatus.OK:
@@ -1,13 +1,15 @@
 from dataclasses import dataclass
+from dataclasses import field
 from http import HTTPStatus
 from typing import Any
 
-import requests
 from requests import RequestException
+from requests import Session
 
 from dsp_tools.clients.authentication_client import AuthenticationClient
 from dsp_tools.clients.value_client import ValueClient
 from dsp_tools.error.exceptions import BadCredentialsError
+from dsp_tools.utils.http_session import make_session
 from dsp_tools.utils.request_utils import RequestParameters
 from dsp_tools.utils.request_utils import ResponseCodeAndText
 from dsp_tools.utils.request_utils import log_and_raise_request_exception
@@ -21,6 +23,7 @@ TIMEOUT_600 = 600
 class ValueClientLive(ValueClient):
     server: str
     auth: AuthenticationClient
+    _session: Session = field(init=False, default_factory=make_session)
 
     def post_new_value(self, value_json: dict[str, Any]) -> ResponseCodeAndText | None:
         url = f"{self.server}/v2/values"
@@ -32,7 +35,7 @@ class ValueClientLive(ValueClient):
 
         log_request(params)
         try:
-            response = requests.post(
+            response = self._session.post(
                 url=params.url,
                 headers=params.headers,
                 data=params.data_serialized,
@@ -40,7 +43,7 @@ class ValueClientLive(ValueClient):
             )
         except RequestException as err:
             log_and_raise_request_exception(err)
-        log_response(response, status_code=response.status_code)
+        log_response(response, status_code=response.status_code, request=params)
 
         match response.status_code:
             case HTTPStatus.OK:
@@ -64,7 +67,7 @@ class ValueClientLive(ValueClient):
 
         log_request(params)
         try:
-            response = requests.put(
+            response = self._session.put(
                 url=params.url,
                 headers=params.headers,
                 data=params.data_serialized,
@@ -72,7 +75,7 @@ class ValueClientLive(ValueClient):
             )
         except RequestException as err:
             log_and_raise_request_exception(err)
-        log_response(response, status_code=response.status_code)
+        log_response(response, status_code=response.status_code, request=params)
 
         match response.status_code:
             case HTTPStatus.OK:
@@ -1,16 +1,18 @@
+import os
 import urllib.parse
 from collections.abc import Iterator
 from dataclasses import dataclass
 from dataclasses import field
 from http import HTTPStatus
 from pathlib import Path
+from typing import BinaryIO
 
 import regex
 from loguru import logger
 from requests import JSONDecodeError
 from requests import RequestException
+from requests import Response
 from requests import Session
-from requests.adapters import HTTPAdapter
 from requests.adapters import Retry
 
 from dsp_tools.clients.authentication_client import AuthenticationClient
@@ -20,10 +22,16 @@ from dsp_tools.commands.ingest_xmlupload.upload_files.upload_failures import Upl
 from dsp_tools.error.exceptions import BadCredentialsError
 from dsp_tools.error.exceptions import PermanentConnectionError
 from dsp_tools.setup.logger_config import LOGGER_SAVEPATH
+from dsp_tools.utils.bandwidth_limit import BandwidthLimiter
+from dsp_tools.utils.bandwidth_limit import ThrottledReader
+from dsp_tools.utils.http_session import make_session
 from dsp_tools.utils.request_utils import RequestParameters
 from dsp_tools.utils.request_utils import log_request
 from dsp_tools.utils.request_utils import log_response
 
+MAPPING_CSV_HEADER = b"original,derivative"
+MAPPING_DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+
 
 @dataclass
 class BulkIngestClient:
@@ -33,12 +41,12 @@ class BulkIngestClient:
     auth: AuthenticationClient
     shortcode: str
     imgdir: Path = field(default=Path.cwd())
+    bandwidth_limiter: BandwidthLimiter | None = None
     session: Session = field(init=False)
     retrieval_failures = 0
 
     def __post_init__(self) -> None:
         retries = 6
-        self.session = Session()
         retry = Retry(
             total=retries,
             read=retries,
@@ -47,9 +55,7 @@ class BulkIngestClient:
             allowed_methods=None,  # means all methods
             status_forcelist=[HTTPStatus.INTERNAL_SERVER_ERROR, HTTPStatus.SERVICE_UNAVAILABLE],
         )
-        adapter = HTTPAdapter(max_retries=retry)
-        self.session.mount("http://", adapter)
-        self.session.mount("https://", adapter)
+        self.session = make_session(max_retries=retry)
 
     def upload_file(
         self,
@@ -75,13 +81,17 @@ class BulkIngestClient:
         log_request(params)
         try:
             with open(self.imgdir / filepath, "rb") as binary_io:
+                data: BinaryIO | ThrottledReader = binary_io
+                if self.bandwidth_limiter:
+                    size = os.fstat(binary_io.fileno()).st_size
+                    data = ThrottledReader(binary_io, self.bandwidth_limiter, size)
                 res = self.session.post(
                     url=params.url,
                     headers=params.headers,
-                    data=binary_io,  # https://requests.readthedocs.io/en/latest/user/advanced/#streaming-uploads
+                    data=data,  # https://requests.readthedocs.io/en/latest/user/advanced/#streaming-uploads
                     timeout=params.timeout,
                 )
-            log_response(res, status_code=res.status_code)
+            log_response(res, status_code=res.status_code, request=params)
         except RequestException as e:
             logger.exception(err_msg)
             return UploadFailure(filepath, f"Exception of requests library: {e}")
@@ -117,7 +127,7 @@ class BulkIngestClient:
         params = RequestParameters("POST", url, timeout, headers=headers)
         log_request(params)
         res = self.session.post(params.url, timeout=params.timeout, headers=params.headers)
-        log_response(res, status_code=res.status_code)
+        log_response(res, status_code=res.status_code, request=params)
         if res.status_code == HTTPStatus.FORBIDDEN:
             raise BadCredentialsError("Only ProjectAdmins or SystemAdmins can start the ingest process.")
         if res.status_code == HTTPStatus.NOT_FOUND:
@@ -145,14 +155,18 @@ class BulkIngestClient:
         print(f"Kicked off the ingest process on the server {self.dsp_ingest_url}. Wait until it completes...")
         logger.info(f"Kicked off the ingest process on the server {self.dsp_ingest_url}. Wait until it completes...")
 
-    def retrieve_mapping_generator(self) -> Iterator[str | bool]:
+    def retrieve_mapping_generator(self, download_path: Path) -> Iterator[Path | bool]:
         """
         Try to retrieve the mapping CSV from the server.
+        The CSV is streamed to the given file in chunks, because it can be too big to be held in memory.
+
+        Args:
+            download_path: file to which the mapping CSV is written
 
         Yields:
             True if the ingest process is still running.
             False if there is a server error.
-            The mapping CSV if the ingest process has completed.
+            The path of the downloaded mapping CSV if the ingest process has completed.
 
         Raises:
             PermanentConnectionError: if there are too many server errors in a row.
@@ -163,22 +177,41 @@ class BulkIngestClient:
             headers = {"Authorization": f"Bearer {self.auth.get_token()}"}
             params = RequestParameters("GET", url, timeout, headers=headers)
             log_request(params)
-            res = self.session.get(params.url, timeout=params.timeout, headers=params.headers)
-            log_response(res, status_code=res.status_code)
-            if res.status_code == HTTPStatus.CONFLICT:
+            with self.session.get(params.url, timeout=params.timeout, headers=params.headers, stream=True) as res:
+                is_ok = res.status_code == HTTPStatus.OK
+                log_response(res, status_code=res.status_code, include_response_content=not is_ok, request=params)
+                is_running = res.status_code == HTTPStatus.CONFLICT
+                is_downloaded = is_ok and _download_mapping(res, download_path)
+            if is_downloaded:
+                logger.info("Ingest process completed.")
+                break
+            if is_running:
                 self.retrieval_failures = 0
                 logger.info("Ingest process is still running. Wait until it completes...")
                 yield True
-            elif res.status_code != HTTPStatus.OK or not res.text.startswith("original,derivative"):
-                self.retrieval_failures += 1
-                if self.retrieval_failures > 15:
-                    raise PermanentConnectionError(
-                        f"There were too many server errors. Please check the logs at {LOGGER_SAVEPATH}."
-                    )
-                msg = "While retrieving the mapping CSV, the server responded with an unexpected status code/content."
-                logger.error(msg)
-                yield False
-            else:
-                logger.info("Ingest process completed.")
-                break
-        yield res.content.decode("utf-8")
+                continue
+            self.retrieval_failures += 1
+            if self.retrieval_failures > 15:
+                raise PermanentConnectionError(
+                    f"There were too many server errors. Please check the logs at {LOGGER_SAVEPATH}."
+                )
+            msg = "While retrieving the mapping CSV, the server responded with an unexpected status code/content."
+            logger.error(msg)
+            yield False
+        yield download_path
+
+
+def _download_mapping(res: Response, download_path: Path) -> bool:
+    chunks = res.iter_content(chunk_size=MAPPING_DOWNLOAD_CHUNK_SIZE)
+    try:
+        first_chunk = next(chunks, b"")
+        if not first_chunk.startswith(MAPPING_CSV_HEADER):
+            return False
+        with open(download_path, "wb") as f:
+            f.write(first_chunk)
+            for chunk in chunks:
+                f.write(chunk)
+    except RequestException:
+        logger.exception("The download of the mapping CSV was interrupted")
+        return False
+    return True
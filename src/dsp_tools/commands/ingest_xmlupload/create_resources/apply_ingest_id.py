@@ -1,10 +1,10 @@
 from __future__ import annotations
 
+import csv
 from copy import deepcopy
 from pathlib import Path
 from typing import cast
 
-import pandas as pd
 from loguru import logger
 from lxml import etree
 
@@ -28,11 +28,12 @@ def get_mapping_dict_from_file(shortcode: str) -> dict[str, str]:
     filepath = Path(f"mapping-{shortcode}.csv")
     if not filepath.is_file():
         raise UserFilepathNotFoundError(f"No mapping CSV file was found at {filepath}.")
-    df = pd.read_csv(filepath)
     msg = f"The file '{filepath}' is used to map the internal original filepaths to the internal image IDs."
     print(msg)
     logger.info(msg)
-    return dict(zip(df["original"].tolist(), df["derivative"].tolist()))
+    # the file is read row by row, because it can contain millions of rows
+    with open(filepath, encoding="utf-8", newline="") as f:
+        return {row["original"]: row["derivative"] for row in csv.DictReader(f)}
 
 
 def replace_filepath_with_internal_filename(
@@ -8,6 +8,7 @@ from lxml import etree
 from dsp_tools.cli.args import ServerCredentials
 from dsp_tools.cli.args import ValidateDataConfig
 from dsp_tools.cli.args import ValidationSeverity
+from dsp_tools.clients.api_response_cache import ApiResponseCache
 from dsp_tools.clients.authentication_client import AuthenticationClient
 from dsp_tools.clients.authentication_client_live import AuthenticationClientLive
 from dsp_tools.clients.ingest import BulkIngestedAssetClient
@@ -41,6 +42,7 @@ def ingest_xmlupload(
     skip_ontology_validation: bool = False,
     id2iri_file: str | None = None,
     do_not_request_resource_metadata_from_db: bool = False,
+    use_api_cache: bool = True,
 ) -> bool:
     """
     This function reads an XML file
@@ -59,6 +61,7 @@ def ingest_xmlupload(
         id2iri_file: to replace internal IDs of an XML file by IRIs provided in this mapping file
         do_not_request_resource_metadata_from_db: if true do not request metadata information from the api
                                                   for existing resources
+        use_api_cache: reuse the ontologies and lists of earlier runs, if they have not changed on the server
 
     Returns:
         True if all resources could be uploaded without errors; False if one of the resources could not be
@@ -75,6 +78,7 @@ def ingest_xmlupload(
     config = UploadConfig(
         media_previously_uploaded=True,
         interrupt_after=interrupt_after,
+        use_api_cache=use_api_cache,
     ).with_server_info(
         server=creds.server,
         shortcode=shortcode,
@@ -119,6 +123,7 @@ def ingest_xmlupload(
                 is_on_prod_server=is_on_prod_like_server,
                 skip_ontology_validation=skip_ontology_validation,
                 do_not_request_resource_metadata_from_db=do_not_request_resource_metadata_from_db,
+                use_api_cache=config.use_api_cache,
             ),
             auth=auth,
         )
@@ -128,7 +133,7 @@ def ingest_xmlupload(
         logger.debug("SHACL validation was skipped.")
 
     if not config.skip_iiif_validation:
-        validate_iiif_uris(root)
+        validate_iiif_uris(parsed_resources)
 
     processed_resources = get_processed_resources(parsed_resources, lookups, is_on_prod_like_server)
 
@@ -157,6 +162,7 @@ def _replace_filepaths_with_internal_filename_from_ingest(root: etree._Element,
 
 def _get_live_clients(config: UploadConfig, auth: AuthenticationClient) -> UploadClients:
     ingest_client = BulkIngestedAssetClient()
-    list_client = ListGetClientLive(auth.server, config.shortcode)
+    api_cache = ApiResponseCache() if config.use_api_cache else None
+    list_client = ListGetClientLive(auth.server, config.shortcode, cache=api_cache)
     legal_info_client = LegalInfoClientLive(config.server, config.shortcode, auth)
     return UploadClients(ingest_client, list_client, legal_info_client)
@@ -1,6 +1,6 @@
+from collections.abc import Iterator
 from pathlib import Path
 from time import sleep
-from typing import cast
 
 from loguru import logger
 from tqdm import tqdm
@@ -8,6 +8,13 @@ from tqdm import tqdm
 from dsp_tools.cli.args import ServerCredentials
 from dsp_tools.clients.authentication_client_live import AuthenticationClientLive
 from dsp_tools.commands.ingest_xmlupload.bulk_ingest_client import BulkIngestClient
+from dsp_tools.commands.ingest_xmlupload.upload_files.upload_manifest import get_manifest_location
+
+# The mapping CSV is first polled shortly after the start of the ingest, so that small ingests finish quickly.
+# The interval grows with every poll, so that the server is not flooded with requests during long ingests.
+INITIAL_POLLING_SECONDS = 2
+MAX_POLLING_SECONDS = 60
+POLLING_BACKOFF_FACTOR = 2
 
 
 def ingest_files(creds: ServerCredentials, shortcode: str) -> bool:
@@ -25,18 +32,34 @@ def ingest_files(creds: ServerCredentials, shortcode: str) -> bool:
     auth = AuthenticationClientLive(creds.server, creds.user, creds.password)
     bulk_ingest_client = BulkIngestClient(creds.dsp_ingest_url, auth, shortcode)
     bulk_ingest_client.trigger_ingest_process()
-    sleep(5)
-    mapping = _retrieve_mapping(bulk_ingest_client)
-    _save_mapping(mapping, shortcode)
+    download_path = Path(f"mapping-{shortcode}.csv.part")
+    try:
+        _retrieve_mapping(bulk_ingest_client, download_path)
+        _save_mapping(download_path, shortcode)
+    finally:
+        download_path.unlink(missing_ok=True)
+    # the ingested files were removed from the upload area, so they have to be uploaded again next time
+    get_manifest_location(creds.dsp_ingest_url, shortcode).unlink(missing_ok=True)
     return True
 
 
-def _retrieve_mapping(bulk_ingest_client: BulkIngestClient) -> str:
-    sleeping_time = 60
-    desc = f"Wait until mapping CSV is ready. Ask server every {sleeping_time} seconds "
+def _get_polling_intervals() -> Iterator[float]:
+    interval: float = INITIAL_POLLING_SECONDS
+    while True:
+        yield interval
+        interval = min(interval * POLLING_BACKOFF_FACTOR, MAX_POLLING_SECONDS)
+
+
+def _retrieve_mapping(bulk_ingest_client: BulkIngestClient, download_path: Path) -> None:
+    desc = "Wait until mapping CSV is ready "
     progress_bar = tqdm(
-        bulk_ingest_client.retrieve_mapping_generator(), desc=desc, bar_format="{desc}{elapsed}", dynamic_ncols=True
+        bulk_ingest_client.retrieve_mapping_generator(download_path),
+        desc=desc,
+        bar_format="{desc}{elapsed}",
+        dynamic_ncols=True,
     )
+    polling_intervals = _get_polling_intervals()
+    sleep(next(polling_intervals))
     num_of_attempts = 0
     num_of_server_errors = 0
     for result in progress_bar:
@@ -45,20 +68,19 @@ def _retrieve_mapping(bulk_ingest_client: BulkIngestClient) -> str:
             num_of_server_errors += 1
         elif result is True:
             num_of_attempts += 1
-        elif isinstance(result, str):
+        else:
             break
         progress_bar.set_description(f"{desc}(attempts: {num_of_attempts}, server errors: {num_of_server_errors})")
-        sleep(sleeping_time)
-    return cast(str, result)
+        sleep(next(polling_intervals))
 
 
-def _save_mapping(mapping: str, shortcode: str) -> None:
+def _save_mapping(download_path: Path, shortcode: str) -> None:
     filepath = Path(f"mapping-{shortcode}.csv")
     if filepath.exists():
         i = 1
         while (new_name_for_existing := Path(f"mapping-{shortcode}-{i}.csv")).exists():
             i += 1
         filepath.rename(new_name_for_existing)
-    filepath.write_text(mapping, encoding="utf-8")
+    download_path.replace(filepath)
     print(f"Saved mapping CSV to '{filepath}'")
     logger.info(f"Saved mapping CSV to '{filepath}'")
@@ -4,6 +4,7 @@ from collections.abc import Iterable
 from pathlib import Path
 
 from dsp_tools.commands.ingest_xmlupload.upload_files.input_error import FileProblems
+from dsp_tools.utils.file_check import find_missing_files
 
 SUPPORTED_EXTENSIONS = (
     "zip,tar,gz,z,tgz,gzip,7z,mp3,wav,pdf,doc,docx,xls,xlsx,ppt,pptx,epub,"
@@ -11,10 +12,13 @@ SUPPORTED_EXTENSIONS = (
 ).split(",")
 
 
-def check_files(files: Iterable[Path]) -> FileProblems | None:
-    """Check if the files exist and have supported extensions."""
+def check_files(files: Iterable[Path], imgdir: Path = Path()) -> FileProblems | None:
+    """Check if the files exist (relative to the imgdir) and have supported extensions."""
     unsupported_files = [file for file in files if file.suffix[1:].casefold() not in SUPPORTED_EXTENSIONS]
-    non_existing_files = [file for file in files if not file.exists() and file not in unsupported_files]
+    unsupported = set(unsupported_files)
+    supported_files = [file for file in files if file not in unsupported]
+    missing_files = find_missing_files(supported_files, imgdir)
+    non_existing_files = [file for file in supported_files if file in missing_files]
     if non_existing_files or unsupported_files:
         return FileProblems(non_existing_files, unsupported_files)
     return None
@@ -1,3 +1,5 @@
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import as_completed
 from pathlib import Path
 
 from loguru import logger
@@ -11,6 +13,9 @@ from dsp_tools.commands.ingest_xmlupload.exceptions import InvalidIngestInputFil
 from dsp_tools.commands.ingest_xmlupload.upload_files.filechecker import check_files
 from dsp_tools.commands.ingest_xmlupload.upload_files.upload_failures import UploadFailure
 from dsp_tools.commands.ingest_xmlupload.upload_files.upload_failures import UploadFailures
+from dsp_tools.commands.ingest_xmlupload.upload_files.upload_manifest import UploadManifest
+from dsp_tools.commands.ingest_xmlupload.upload_files.upload_manifest import get_manifest_location
+from dsp_tools.utils.bandwidth_limit import BandwidthLimiter
 from dsp_tools.utils.xml_parsing.parse_clean_validate_xml import parse_and_clean_xml_file
 
 
@@ -18,37 +23,48 @@ def upload_files(
     xml_file: Path,
     creds: ServerCredentials,
     imgdir: Path = Path.cwd(),
+    num_of_workers: int = 1,
+    max_bytes_per_second: int | None = None,
 ) -> bool:
     """
     Upload all files referenced in an XML file to the ingest server.
     This involves no processing/ingesting of the files, just uploading them.
 
+    The successfully uploaded files are recorded in a local manifest,
+    so that they are skipped if the command is executed again (e.g. after a connection loss).
+
     Args:
         xml_file: XML file containing the resources and the references to the files to upload
         creds: credentials to connect to the ingest server
         imgdir: the bitstreams in the XML file are relative to this directory
+        num_of_workers: number of files that are uploaded at the same time
+        max_bytes_per_second: limit of the bandwidth used by all uploads together
 
     Returns:
         success status
     """
     root = parse_and_clean_xml_file(xml_file)
     shortcode = root.attrib["shortcode"]
-    paths = _get_validated_paths(root)
+    paths = _get_validated_paths(root, imgdir)
     print(f"Found {len(paths)} files to upload onto server {creds.dsp_ingest_url}.")
     logger.info(f"Found {len(paths)} files to upload onto server {creds.dsp_ingest_url}.")
 
+    manifest = UploadManifest(get_manifest_location(creds.dsp_ingest_url, shortcode))
+    to_upload = sorted(x for x in paths if not manifest.is_uploaded(x, imgdir))
+    if skipped := len(paths) - len(to_upload):
+        msg = f"Skipping {skipped} files that were already uploaded (according to {manifest.location})."
+        print(msg)
+        logger.info(msg)
+
     auth = AuthenticationClientLive(creds.server, creds.user, creds.password)
-    ingest_client = BulkIngestClient(creds.dsp_ingest_url, auth, shortcode, imgdir)
+    limiter = BandwidthLimiter(max_bytes_per_second) if max_bytes_per_second else None
+    ingest_client = BulkIngestClient(creds.dsp_ingest_url, auth, shortcode, imgdir, limiter)
 
-    failures: list[UploadFailure] = []
-    progress_bar = tqdm(paths, desc="Uploading files", unit="file(s)", dynamic_ncols=True)
-    for path in progress_bar:
-        if res := ingest_client.upload_file(path):
-            failures.append(res)
-            progress_bar.set_description(f"Uploading files (failed: {len(failures)})")
+    failures = _upload_all(to_upload, ingest_client, manifest, max(num_of_workers, 1))
     if failures:
         aggregated_failures = UploadFailures(failures, len(paths), shortcode, creds.dsp_ingest_url)
         msg = aggregated_failures.execute_error_protocol()
+        msg += "\nIf you execute the command again, only the failed files are uploaded."
         logger.error(msg)
         print(msg)
         return False
@@ -59,9 +75,34 @@ def upload_files(
         return True
 
 
-def _get_validated_paths(root: etree._Element) -> set[Path]:
+def _upload_all(
+    paths: list[Path], ingest_client: BulkIngestClient, manifest: UploadManifest, num_of_workers: int
+) -> list[UploadFailure]:
+    failures: list[UploadFailure] = []
+    progress_bar = tqdm(total=len(paths), desc="Uploading files", unit="file(s)", dynamic_ncols=True)
+    with ThreadPoolExecutor(max_workers=num_of_workers, thread_name_prefix="upload") as executor:
+        futures = {executor.submit(ingest_client.upload_file, path): path for path in paths}
+        try:
+            for future in as_completed(futures):
+                # only the main thread writes to the manifest
+                if res := future.result():
+                    failures.append(res)
+                    progress_bar.set_description(f"Uploading files (failed: {len(failures)})")
+                else:
+                    manifest.add(futures[future], ingest_client.imgdir)
+                progress_bar.update()
+        except BaseException:
+            # e.g. Ctrl + C: the uploads that are already running are finished, but no new ones are started
+            executor.shutdown(wait=False, cancel_futures=True)
+            raise
+        finally:
+            progress_bar.close()
+    return failures
+
+
+def _get_validated_paths(root: etree._Element, imgdir: Path) -> set[Path]:
     paths = {Path(x.text.strip()) for x in root.xpath("//bitstream")}
-    if problems := check_files(paths):
+    if problems := check_files(paths, imgdir):
         msg = problems.execute_error_protocol()
         raise InvalidIngestInputFilesError(msg)
     return paths
@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from dataclasses import field
+from pathlib import Path
+
+import regex
+
+from dsp_tools.utils.file_utils import append_json_line
+from dsp_tools.utils.file_utils import read_json_lines
+
+
+def get_manifest_location(dsp_ingest_url: str, shortcode: str) -> Path:
+    server_as_foldername = regex.sub(r"[^\w.-]", "_", regex.sub(r"https?://", "", dsp_ingest_url).rstrip("/"))
+    return Path.home() / ".dsp-tools" / "upload-files" / server_as_foldername / f"{shortcode}.jsonl"
+
+
+@dataclass
+class UploadManifest:
+    """
+    Local record of the files that were uploaded successfully with `upload-files`,
+    so that a rerun of an interrupted upload does not upload these files again.
+
+    A file is only skipped if its size and modification time have not changed since its upload.
+    Every upload is appended as one JSON record per line, so that no upload is lost if the process is killed.
+    The manifest is deleted as soon as the uploaded files have been ingested with `ingest-files`,
+    because the files are removed from the upload area of the server by the ingest.
+    """
+
+    location: Path
+    _uploaded: dict[str, tuple[int, int]] = field(init=False, default_factory=dict)
+
+    def __post_init__(self) -> None:
+        for record in read_json_lines(self.location):
+            self._uploaded[record["path"]] = record["size"], record["mtime_ns"]
+
+    def is_uploaded(self, filepath: Path, imgdir: Path) -> bool:
+        """Whether the file was uploaded earlier, and has not changed since."""
+        if (recorded := self._uploaded.get(str(filepath))) is None:
+            return False
+        try:
+            return recorded == _get_size_and_mtime(imgdir / filepath)
+        except OSError:
+            return False
+
+    def add(self, filepath: Path, imgdir: Path) -> None:
+        """Record that the file has been uploaded successfully."""
+        try:
+            size, mtime_ns = _get_size_and_mtime(imgdir / filepath)
+        except OSError:
+            return
+        self._uploaded[str(filepath)] = size, mtime_ns
+        self.location.parent.mkdir(parents=True, exist_ok=True)
+        append_json_line(self.location, {"path": str(filepath), "size": size, "mtime_ns": mtime_ns})
+
+
+def _get_size_and_mtime(path: Path) -> tuple[int, int]:
+    stat = path.stat()
+    return stat.st_size, stat.st_mtime_ns
@@ -1,5 +1,6 @@
 import pickle
 import sys
+from collections import defaultdict
 
 from loguru import logger
 
@@ -14,11 +15,14 @@ from dsp_tools.clients.list_client import ListGetClient
 from dsp_tools.clients.list_client_live import ListGetClientLive
 from dsp_tools.commands.xmlupload.execute_upload import execute_upload
 from dsp_tools.commands.xmlupload.models.upload_clients import UploadClients
+from dsp_tools.commands.xmlupload.models.upload_journal import JournalEvent
 from dsp_tools.commands.xmlupload.models.upload_state import UploadState
+from dsp_tools.commands.xmlupload.stash.stash_models import Stash
 from dsp_tools.commands.xmlupload.upload_config import UploadConfig
 from dsp_tools.setup.ansi_colors import RED
 from dsp_tools.setup.ansi_colors import RESET_TO_DEFAULT
 from dsp_tools.utils.interactive import prompt_until_valid_answer
+from dsp_tools.utils.telemetry import reset_telemetry
 
 
 def resume_xmlupload(creds: ServerCredentials, skip_first_resource: bool = False) -> bool:
@@ -33,8 +37,10 @@ def resume_xmlupload(creds: ServerCredentials, skip_first_resource: bool = False
         True if all resources could be uploaded without errors; False if one of the resources could not be
         uploaded because there is an error in it
     """
+    reset_telemetry()
     server = creds.server
     upload_state = _read_upload_state_from_disk(server)
+    _replay_upload_journal(upload_state)
     if skip_first_resource:
         _skip_first_resource(upload_state)
 
@@ -62,9 +68,69 @@ def _read_upload_state_from_disk(server: str) -> UploadState:
     return saved_state
 
 
+def _replay_upload_journal(upload_state: UploadState) -> None:
+    """
+    Bring the upload state that was saved at the start of the upload up to date,
+    by applying the progress recorded in its journal.
+    Applying the same journal twice has no further effect.
+    """
+    if not upload_state.journal:
+        return
+    finished_res_ids: set[str] = set()
+    failed_res_ids = set(upload_state.failed_uploads)
+    moved_to_front: list[str] = []
+    applied_stash_items: defaultdict[str, set[tuple[str, str]]] = defaultdict(set)
+    num_of_records = 0
+    for record in upload_state.journal.read_records():
+        num_of_records += 1
+        res_id = record["res_id"]
+        match record["event"]:
+            case JournalEvent.RESOURCE_CREATED:
+                upload_state.iri_resolver.lookup[res_id] = record["iri"]
+                finished_res_ids.add(res_id)
+            case JournalEvent.RESOURCE_FAILED:
+                if res_id not in failed_res_ids:
+                    upload_state.failed_uploads.append(res_id)
+                    failed_res_ids.add(res_id)
+                finished_res_ids.add(res_id)
+            case JournalEvent.RESOURCE_SKIPPED:
+                finished_res_ids.add(res_id)
+            case JournalEvent.RESOURCE_MOVED_TO_FRONT:
+                if res_id in moved_to_front:
+                    moved_to_front.remove(res_id)
+                moved_to_front.insert(0, res_id)
+            case event:
+                applied_stash_items[event].add((res_id, record["value_uuid"]))
+    logger.info(f"Replayed {num_of_records} records from the journal {upload_state.journal.path}")
+
+    pending = [x for x in upload_state.pending_resources if x.res_id not in finished_res_ids]
+    front_positions = {res_id: i for i, res_id in enumerate(moved_to_front)}
+    front = sorted((x for x in pending if x.res_id in front_positions), key=lambda x: front_positions[x.res_id])
+    upload_state.pending_resources = front + [x for x in pending if x.res_id not in front_positions]
+    if upload_state.pending_stash:
+        _remove_applied_stash_items(upload_state.pending_stash, applied_stash_items)
+
+
+def _remove_applied_stash_items(stash: Stash, applied_stash_items: defaultdict[str, set[tuple[str, str]]]) -> None:
+    if stash.standoff_stash:
+        applied = applied_stash_items[JournalEvent.STANDOFF_STASH_ITEM_APPLIED]
+        for res_id, standoff_items in list(stash.standoff_stash.res_2_stash_items.items()):
+            standoff_items[:] = [x for x in standoff_items if (res_id, x.value.value_uuid) not in applied]
+            if not standoff_items:
+                del stash.standoff_stash.res_2_stash_items[res_id]
+    if stash.link_value_stash:
+        applied = applied_stash_items[JournalEvent.LINK_VALUE_STASH_ITEM_APPLIED]
+        for res_id, link_items in list(stash.link_value_stash.res_2_stash_items.items()):
+            link_items[:] = [x for x in link_items if (res_id, x.value.value_uuid) not in applied]
+            if not link_items:
+                del stash.link_value_stash.res_2_stash_items[res_id]
+
+
 def _skip_first_resource(upload_state: UploadState) -> None:
     if len(upload_state.pending_resources) > 0:
-        upload_state.pending_resources.pop(0)
+        skipped = upload_state.pending_resources.pop(0)
+        if upload_state.journal:
+            upload_state.journal.record_resource_skipped(skipped.res_id)
     else:
         msg = (
             "The list of pending resources is empty.\n"
@@ -1,4 +1,5 @@
 import importlib.resources
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any
 
@@ -9,13 +10,13 @@ from rdflib import RDF
 from rdflib import Graph
 from rdflib import URIRef
 
+from dsp_tools.clients.api_response_cache import ApiResponseCache
 from dsp_tools.clients.authentication_client import AuthenticationClient
 from dsp_tools.clients.legal_info_client_live import LegalInfoClientLive
 from dsp_tools.clients.list_client import ListInfo
 from dsp_tools.clients.list_client_live import ListGetClientLive
 from dsp_tools.clients.metadata_client import ExistingResourcesRetrieved
 from dsp_tools.clients.metadata_client_live import MetadataClientLive
-from dsp_tools.clients.ontology_clients import OntologyGetClient
 from dsp_tools.clients.ontology_get_client_live import OntologyGetClientLive
 from dsp_tools.commands.validate_data.models.api_responses import EnabledLicenseIris
 from dsp_tools.commands.validate_data.models.api_responses import InfoForResourceInDB
@@ -34,19 +35,21 @@ from dsp_tools.utils.rdf_constants import KNORA_API_PREFIX
 from dsp_tools.utils.rdf_constants import SALSAH_GUI_PREFIX
 from dsp_tools.utils.replace_id_with_iri import use_id2iri_mapping_to_replace_ids
 from dsp_tools.utils.xml_parsing.get_lookups import get_authorship_lookup
-from dsp_tools.utils.xml_parsing.get_parsed_resources import get_parsed_resources
 from dsp_tools.utils.xml_parsing.models.parsed_resource import ParsedResource
-from dsp_tools.utils.xml_parsing.parse_clean_validate_xml import parse_and_clean_xml_file
+from dsp_tools.utils.xml_parsing.parsed_xml_cache import get_parsed_xml_file
+
+# lists, licenses, project ontologies and knora-api are requested at the same time
+PROJECT_INFO_WORKERS = 4
 
 
 def get_info_and_parsed_resources_from_file(
-    file: Path, api_url: str, id2iri_file: str | None
+    file: Path, api_url: str, id2iri_file: str | None, use_xml_cache: bool = False
 ) -> tuple[list[ParsedResource], str, dict[str, list[str]], list[str]]:
-    root = parse_and_clean_xml_file(file)
-    shortcode = root.attrib["shortcode"]
-    authorship_lookup = get_authorship_lookup(root)
-    permission_ids = [perm.attrib["id"] for perm in root.findall("permissions")]
-    parsed_resources = get_parsed_resources(root, api_url)
+    parsed_xml = get_parsed_xml_file(file, api_url, use_cache=use_xml_cache)
+    shortcode = parsed_xml.shortcode
+    authorship_lookup = get_authorship_lookup(parsed_xml.header)
+    permission_ids = [perm.attrib["id"] for perm in parsed_xml.header.findall("permissions")]
+    parsed_resources = parsed_xml.parsed_resources
     if id2iri_file:
         parsed_resources = use_id2iri_mapping_to_replace_ids(parsed_resources, Path(id2iri_file))
     return parsed_resources, shortcode, authorship_lookup, permission_ids
@@ -59,14 +62,24 @@ def prepare_data_for_validation_from_parsed_resource(
     auth: AuthenticationClient,
     shortcode: str,
     do_not_request_resource_metadata_from_db: bool,
+    use_api_cache: bool = True,
 ) -> tuple[RDFGraphs, TripleStores, set[str], ExistingResourcesRetrieved]:
     used_iris = {x.res_type for x in parsed_resources}
-    proj_info, existing_resources_retrieved = _get_project_specific_information_from_api(
-        auth, shortcode, do_not_request_resource_metadata_from_db
-    )
-    list_lookup = _make_list_lookup(proj_info.all_lists)
-    data_rdf = _make_data_graph_from_parsed_resources(parsed_resources, authorship_lookup, list_lookup)
-    rdf_graphs, triple_stores = _create_graphs(data_rdf, shortcode, auth, proj_info, permission_ids)
+    api_cache = ApiResponseCache() if use_api_cache else None
+    onto_client = OntologyGetClientLive(auth.server, shortcode, cache=api_cache)
+    with ThreadPoolExecutor(max_workers=PROJECT_INFO_WORKERS, thread_name_prefix="project-info") as executor:
+        # the ontologies are downloaded while the information about the project is requested and the data graph is built
+        logger.debug("Get project ontologies from server.")
+        ontologies_future = executor.submit(onto_client.get_ontologies)
+        knora_api_future = executor.submit(onto_client.get_knora_api)
+        proj_info, existing_resources_retrieved = _get_project_specific_information_from_api(
+            auth, shortcode, do_not_request_resource_metadata_from_db, executor, api_cache
+        )
+        list_lookup = _make_list_lookup(proj_info.all_lists)
+        data_rdf = _make_data_graph_from_parsed_resources(parsed_resources, authorship_lookup, list_lookup)
+        onto_ttls, onto_iris = ontologies_future.result()
+        knora_ttl = knora_api_future.result()
+    rdf_graphs, triple_stores = _create_graphs(data_rdf, proj_info, permission_ids, onto_ttls, onto_iris, knora_ttl)
     return rdf_graphs, triple_stores, used_iris, existing_resources_retrieved
 
 
@@ -80,17 +93,22 @@ def _make_list_lookup(project_lists: list[OneList]) -> ListLookup:
 
 
 def _get_project_specific_information_from_api(
-    auth: AuthenticationClient, shortcode: str, do_not_request_resource_metadata_from_db: bool
+    auth: AuthenticationClient,
+    shortcode: str,
+    do_not_request_resource_metadata_from_db: bool,
+    executor: ThreadPoolExecutor,
+    api_cache: ApiResponseCache | None = None,
 ) -> tuple[ProjectDataFromApi, ExistingResourcesRetrieved]:
-    list_client = ListGetClientLive(auth.server, shortcode)
-    all_lists = _get_reformatted_lists(list_client)
-    enabled_licenses = _get_license_iris(shortcode, auth)
+    list_client = ListGetClientLive(auth.server, shortcode, cache=api_cache)
+    lists_future = executor.submit(_get_reformatted_lists, list_client)
+    licenses_future = executor.submit(_get_license_iris, shortcode, auth)
     if do_not_request_resource_metadata_from_db:
         existing_resources_retrieved = ExistingResourcesRetrieved.FALSE
         formatted_metadata: list[InfoForResourceInDB] = []
     else:
         existing_resources_retrieved, formatted_metadata = _get_metadata_info(auth, shortcode)
-    return ProjectDataFromApi(all_lists, enabled_licenses, formatted_metadata), existing_resources_retrieved
+    proj_info = ProjectDataFromApi(lists_future.result(), licenses_future.result(), formatted_metadata)
+    return proj_info, existing_resources_retrieved
 
 
 def _get_reformatted_lists(list_client: ListGetClientLive) -> list[OneList]:
@@ -145,15 +163,14 @@ def _make_data_graph_from_parsed_resources(
 
 def _create_graphs(
     data_rdf: Graph,
-    shortcode: str,
-    auth: AuthenticationClient,
     proj_info: ProjectDataFromApi,
     permission_ids: list[str],
+    onto_ttls: list[str],
+    onto_iris: list[str],
+    knora_ttl: str,
 ) -> tuple[RDFGraphs, TripleStores]:
     logger.debug("Create all graphs.")
-    onto_client = OntologyGetClientLive(auth.server, shortcode)
-    ontologies, onto_stores, onto_iris = _get_project_ontos(onto_client)
-    knora_ttl = onto_client.get_knora_api()
+    ontologies, onto_stores = _get_project_ontos(onto_ttls)
     knora_api = Graph(store="Oxigraph")
     knora_api.parse(data=knora_ttl, format="ttl")
     knora_api_store = Store()
@@ -203,17 +220,15 @@ def _bind_prefixes_to_graph(g: Graph, project_ontos: list[str]) -> Graph:
     return g
 
 
-def _get_project_ontos(onto_client: OntologyGetClient) -> tuple[Graph, Store, list[str]]:
-    logger.debug("Get project ontologies from server.")
-    all_ontos, onto_iris = onto_client.get_ontologies()
+def _get_project_ontos(onto_ttls: list[str]) -> tuple[Graph, Store]:
     onto_g = Graph(store="Oxigraph")
     onto_stores = Store()
-    for onto in all_ontos:
+    for onto in onto_ttls:
         og = Graph(store="Oxigraph")
         og.parse(data=onto, format="ttl")
         onto_g += og
         onto_stores.load(input=onto, format=RdfFormat.TURTLE)
-    return onto_g, onto_stores, onto_iris
+    return onto_g, onto_stores
 
 
 def _get_license_iris(shortcode: str, auth: AuthenticationClient) -> EnabledLicenseIris:
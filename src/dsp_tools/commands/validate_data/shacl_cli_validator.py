@@ -1,20 +1,69 @@
 import importlib.resources
+import io
 import os
+import shutil
 import subprocess
 from pathlib import Path
 
+import pyoxigraph as ox
 import yaml
 from loguru import logger
 from rdflib import SH
 from rdflib import Graph
 
+from dsp_tools.commands.validate_data.constants import CARDINALITY_DATA_TTL
+from dsp_tools.commands.validate_data.constants import CARDINALITY_REPORT_TTL
+from dsp_tools.commands.validate_data.constants import CARDINALITY_SHACL_TTL
+from dsp_tools.commands.validate_data.constants import CONTENT_DATA_TTL
+from dsp_tools.commands.validate_data.constants import CONTENT_REPORT_TTL
+from dsp_tools.commands.validate_data.constants import CONTENT_SHACL_TTL
+from dsp_tools.commands.validate_data.constants import ONTOLOGIES_DATA_TTL
+from dsp_tools.commands.validate_data.constants import ONTOLOGIES_REPORT_TTL
+from dsp_tools.commands.validate_data.constants import ONTOLOGIES_SHACL_TTL
 from dsp_tools.commands.validate_data.exceptions import ShaclValidationCliError
 from dsp_tools.commands.validate_data.exceptions import ShaclValidationError
 from dsp_tools.commands.validate_data.models.api_responses import SHACLValidationReport
+from dsp_tools.commands.validate_data.models.validation import RDFGraphs
 from dsp_tools.commands.validate_data.models.validation import ValidationFilePaths
+from dsp_tools.commands.validate_data.utils import merge_validation_reports
 
 
 class ShaclCliValidator:
+    """Validates with the SHACL CLI in a Docker container, which reads the graphs from turtle files."""
+
+    def validate_data(self, rdf_graphs: RDFGraphs, tmp_path: Path) -> SHACLValidationReport:
+        """Writes the graphs into turtle files and validates the cardinalities and the content of the data."""
+        _create_and_write_graphs(rdf_graphs, tmp_path)
+        card_files = ValidationFilePaths(
+            directory=tmp_path,
+            data_file=CARDINALITY_DATA_TTL,
+            shacl_file=CARDINALITY_SHACL_TTL,
+            report_file=CARDINALITY_REPORT_TTL,
+        )
+        card_result = self.validate(card_files)
+        content_files = ValidationFilePaths(
+            directory=tmp_path,
+            data_file=CONTENT_DATA_TTL,
+            shacl_file=CONTENT_SHACL_TTL,
+            report_file=CONTENT_REPORT_TTL,
+        )
+        content_result = self.validate(content_files)
+        return merge_validation_reports(card_result, content_result)
+
+    def validate_ontology(self, onto_graph: Graph, tmp_path: Path) -> SHACLValidationReport:
+        """Writes the ontologies into a turtle file and validates them."""
+        shacl_file = importlib.resources.files("dsp_tools").joinpath("resources/validate_data/validate-ontology.ttl")
+        with importlib.resources.as_file(shacl_file) as shacl_file_path:
+            shutil.copy(shacl_file_path, tmp_path / ONTOLOGIES_SHACL_TTL)
+        onto_graph.serialize(tmp_path / ONTOLOGIES_DATA_TTL, format="ox-ttl")
+        paths = ValidationFilePaths(
+            directory=tmp_path,
+            data_file=ONTOLOGIES_DATA_TTL,
+            shacl_file=ONTOLOGIES_SHACL_TTL,
+            report_file=ONTOLOGIES_REPORT_TTL,
+        )
+        return self.validate(paths)
+
     def validate(self, file_paths: ValidationFilePaths) -> SHACLValidationReport:
         try:
             self._run_validate_cli(file_paths)
@@ -66,3 +115,54 @@ class ShaclCliValidator:
         graph.parse(filepath)
         conforms = bool(next(graph.objects(None, SH.conforms)))
         return SHACLValidationReport(conforms=conforms, validation_graph=graph)
+
+
+def _create_and_write_graphs(rdf_graphs: RDFGraphs, tmp_path: Path) -> None:
+    logger.debug("Serialise RDF graphs into turtle files")
+    rdf_graphs.data.serialize(destination=tmp_path / CARDINALITY_DATA_TTL, format="ox-ttl")
+    shutil.copy(tmp_path / CARDINALITY_DATA_TTL, tmp_path / CONTENT_DATA_TTL)
+    _append_serialised_graphs(
+        tmp_path / CONTENT_DATA_TTL,
+        rdf_graphs.ontos,
+        rdf_graphs.knora_api,
+        rdf_graphs.resources_in_db_graph,
+    )
+    _write_serialised_graphs(
+        tmp_path / CARDINALITY_SHACL_TTL,
+        rdf_graphs.cardinality_shapes,
+        rdf_graphs.ontos,
+        rdf_graphs.knora_api,
+    )
+    _write_serialised_graphs(
+        tmp_path / CONTENT_SHACL_TTL,
+        rdf_graphs.content_shapes,
+        rdf_graphs.ontos,
+        rdf_graphs.knora_api,
+    )
+
+
+def _write_serialised_graphs(dest: Path, *graphs: Graph) -> None:
+    store = _merge_into_ox_store(*graphs)
+    with open(dest, "wb") as f:
+        store.dump(f, format=ox.RdfFormat.TURTLE, from_graph=ox.DefaultGraph())
+
+
+def _append_serialised_graphs(dest: Path, *graphs: Graph) -> None:
+    store = _merge_into_ox_store(*graphs)
+    with open(dest, "ab") as f:
+        store.dump(f, format=ox.RdfFormat.TURTLE, from_graph=ox.DefaultGraph())
+
+
+def _merge_into_ox_store(*graphs: Graph) -> ox.Store:
+    # Each graph is serialised separately to avoid merging via rdflib's in-memory backend
+    # (Graph.__add__ / +=), which bypasses the Oxigraph store and is slow.
+    # Graphs cannot be concatenated as raw strings: oxrdflib re-uses blank node labels
+    # per serialisation, so merging serialised strings would conflate distinct blank nodes.
+    # Serialising into one shared Store preserves blank node identity correctly.
+    store = ox.Store()
+    for g in graphs:
+        buf = io.BytesIO()
+        g.serialize(buf, format="ox-ttl")
+        buf.seek(0)
+        store.load(buf, format=ox.RdfFormat.TURTLE)
+    return store
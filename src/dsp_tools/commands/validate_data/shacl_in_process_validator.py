@@ -0,0 +1,117 @@
+import importlib.resources
+from pathlib import Path
+
+from loguru import logger
+from pyshacl import validate
+from rdflib import SH
+from rdflib import BNode
+from rdflib import Graph
+
+from dsp_tools.commands.validate_data.constants import CARDINALITY_REPORT_TTL
+from dsp_tools.commands.validate_data.constants import CONTENT_REPORT_TTL
+from dsp_tools.commands.validate_data.constants import ONTOLOGIES_REPORT_TTL
+from dsp_tools.commands.validate_data.exceptions import ShaclValidationError
+from dsp_tools.commands.validate_data.models.api_responses import SHACLValidationReport
+from dsp_tools.commands.validate_data.models.validation import RDFGraphs
+from dsp_tools.commands.validate_data.utils import merge_validation_reports
+from dsp_tools.utils.rdf_constants import DASH
+
+SHAPE_PATHS_QUERY = """
+PREFIX sh: <http://www.w3.org/ns/shacl#>
+
+CONSTRUCT {
+    ?shape sh:property ?propShape .
+    ?propShape sh:path ?path .
+} WHERE {
+    ?shape sh:property ?propShape .
+    ?propShape sh:path ?path .
+}
+"""
+
+
+class ShaclInProcessValidator:
+    """
+    Validates with pyshacl in the running Python process, without Docker and without turtle files.
+
+    pyshacl does not implement the DASH constraint components that the shapes use,
+    therefore they are defined in `dash-constraint-components.ttl`, which is added to every shapes graph.
+    Only the validation reports are written into the temporary directory, so that they can be saved for debugging.
+
+    pyshacl evaluates the SPARQL-based constraints with the SPARQL engine of rdflib,
+    which validates only a few resources per second, so this validator is only suitable for small files.
+    """
+
+    def __init__(self) -> None:
+        self._dash_components = _parse_resource("resources/validate_data/dash-constraint-components.ttl")
+
+    def validate_data(self, rdf_graphs: RDFGraphs, tmp_path: Path) -> SHACLValidationReport:
+        """Validates the cardinalities and the content of the data and writes the reports into the temp directory."""
+        logger.debug("Validate the cardinalities of the data in-process")
+        card_result = self._validate(
+            data_graphs=[rdf_graphs.data],
+            shapes_graphs=[rdf_graphs.cardinality_shapes, rdf_graphs.ontos, rdf_graphs.knora_api],
+        )
+        card_result.validation_graph.serialize(tmp_path / CARDINALITY_REPORT_TTL, format="ox-ttl")
+        logger.debug("Validate the content of the data in-process")
+        content_result = self._validate(
+            data_graphs=[rdf_graphs.data, rdf_graphs.ontos, rdf_graphs.knora_api, rdf_graphs.resources_in_db_graph],
+            shapes_graphs=[rdf_graphs.content_shapes, rdf_graphs.ontos, rdf_graphs.knora_api],
+        )
+        content_result.validation_graph.serialize(tmp_path / CONTENT_REPORT_TTL, format="ox-ttl")
+        return merge_validation_reports(card_result, content_result)
+
+    def validate_ontology(self, onto_graph: Graph, tmp_path: Path) -> SHACLValidationReport:
+        """Validates the ontologies and writes the report into the temporary directory."""
+        logger.debug("Validate the ontologies in-process")
+        onto_shapes = _parse_resource("resources/validate_data/validate-ontology.ttl")
+        result = self._validate(data_graphs=[onto_graph], shapes_graphs=[onto_shapes])
+        result.validation_graph.serialize(tmp_path / ONTOLOGIES_REPORT_TTL, format="ox-ttl")
+        return result
+
+    def _validate(self, data_graphs: list[Graph], shapes_graphs: list[Graph]) -> SHACLValidationReport:
+        shapes = _merge_graphs(*shapes_graphs, self._dash_components)
+        # dash:closedByTypes looks up the paths of the shapes in the data graph, see dash-constraint-components.ttl
+        shape_paths = shapes.query(SHAPE_PATHS_QUERY).graph
+        if shape_paths is None:
+            raise ShaclValidationError("The paths of the SHACL shapes could not be queried.")
+        data = _merge_graphs(*data_graphs, shape_paths)
+        conforms, report, _ = validate(data, shacl_graph=shapes, inference="none", inplace=True)
+        _add_values_of_closed_by_types_results(report, data)
+        validation_graph = Graph(store="Oxigraph")
+        validation_graph += report
+        return SHACLValidationReport(conforms=conforms, validation_graph=validation_graph)
+
+
+def _parse_resource(resource: str) -> Graph:
+    g = Graph()
+    g.parse(str(importlib.resources.files("dsp_tools").joinpath(resource)), format="ttl")
+    return g
+
+
+def _merge_graphs(*graphs: Graph) -> Graph:
+    # pyshacl pre-binds the parameters of the SPARQL-based constraints with initBindings,
+    # which the Oxigraph store does not support, therefore rdflib's in-memory store is used
+    merged = Graph()
+    for g in graphs:
+        merged += g
+    return merged
+
+
+def _add_values_of_closed_by_types_results(report: Graph, data: Graph) -> None:
+    # pyshacl cannot return the values of dash:closedByTypes, and reports the focus node as value instead.
+    # Like the SHACL CLI, one result per value of the prohibited property is reported.
+    for result in list(report.subjects(SH.sourceConstraintComponent, DASH.ClosedByTypesConstraintComponent)):
+        validation_report = report.value(predicate=SH.result, object=result)
+        if validation_report is None:
+            continue
+        focus_node = report.value(result, SH.focusNode)
+        path = report.value(result, SH.resultPath)
+        result_triples = [(p, o) for p, o in report.predicate_objects(result) if p != SH.value]
+        report.remove((validation_report, SH.result, result))
+        report.remove((result, None, None))
+        for value in data.objects(focus_node, path):
+            value_result = BNode()
+            report.add((validation_report, SH.result, value_result))
+            report.add((value_result, SH.value, value))
+            for p, o in result_triples:
+                report.add((value_result, p, o))
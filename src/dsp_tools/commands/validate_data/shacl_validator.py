@@ -0,0 +1,59 @@
+import os
+from pathlib import Path
+from typing import Protocol
+
+from rdflib import Graph
+
+from dsp_tools.commands.validate_data.models.api_responses import SHACLValidationReport
+from dsp_tools.commands.validate_data.models.validation import RDFGraphs
+from dsp_tools.commands.validate_data.shacl_cli_validator import ShaclCliValidator
+from dsp_tools.commands.validate_data.shacl_in_process_validator import ShaclInProcessValidator
+from dsp_tools.error.exceptions import UserError
+
+SHACL_VALIDATOR_ENV_VAR = "DSP_TOOLS_SHACL_VALIDATOR"
+
+DOCKER_VALIDATOR = "docker"
+IN_PROCESS_VALIDATOR = "in-process"
+
+
+class ShaclValidator(Protocol):
+    """Validates the data and the ontologies of a project against the SHACL shapes."""
+
+    def validate_data(self, rdf_graphs: RDFGraphs, tmp_path: Path) -> SHACLValidationReport:
+        """
+        Validate the data against the cardinality shapes and against the content shapes,
+        and merge the results of both validations into one report.
+        The files that are needed for the validation or for debugging are written into the temporary directory.
+        """
+
+    def validate_ontology(self, onto_graph: Graph, tmp_path: Path) -> SHACLValidationReport:
+        """Validate the project ontologies against the shapes for ontologies."""
+
+
+def get_shacl_validator() -> ShaclValidator:
+    """
+    Returns the SHACL validator that is selected with the environment variable `DSP_TOOLS_SHACL_VALIDATOR`:
+    `docker` (default) runs the SHACL CLI in a Docker container, `in-process` validates with pyshacl.
+
+    Returns:
+        The selected SHACL validator
+
+    Raises:
+        UserError: if the environment variable has an unknown value
+    """
+    if shacl_validator_requires_docker():
+        return ShaclCliValidator()
+    return ShaclInProcessValidator()
+
+
+def shacl_validator_requires_docker() -> bool:
+    """Whether the selected SHACL validator runs in a Docker container."""
+    validator = os.getenv(SHACL_VALIDATOR_ENV_VAR, DOCKER_VALIDATOR).lower()
+    if validator == DOCKER_VALIDATOR:
+        return True
+    if validator == IN_PROCESS_VALIDATOR:
+        return False
+    raise UserError(
+        f"The environment variable {SHACL_VALIDATOR_ENV_VAR} has the unknown value '{validator}'. "
+        f"Valid values are '{DOCKER_VALIDATOR}' and '{IN_PROCESS_VALIDATOR}'."
+    )
@@ -80,7 +80,7 @@ def _get_defined_permissions_shape(permission_ids: list[str]) -> Graph:
      @prefix api-shapes: <http://api.knora.org/ontology/knora-api/shapes/v2#> .
      
      api-shapes:hasPermissions_Shape
-       a              sh:NodeShape ;
+       a              sh:PropertyShape ;
        sh:targetClass knora-api:Value , knora-api:Resource ;
        sh:path        knora-api:hasPermissions ;
        sh:in          ( {permissions} ) ;
@@ -2,6 +2,9 @@ import shutil
 from pathlib import Path
 from tempfile import TemporaryDirectory
 
+from rdflib import Graph
+
+from dsp_tools.commands.validate_data.models.api_responses import SHACLValidationReport
 from dsp_tools.utils.rdf_constants import SubjectObjectTypeAlias
 
 
@@ -23,6 +26,17 @@ def clean_up_temp_directory(temp_dir: TemporaryDirectory[str], save_graphs_dir:
     temp_dir.cleanup()
 
 
+def merge_validation_reports(*reports: SHACLValidationReport) -> SHACLValidationReport:
+    """Merges the reports of several validations, only the graphs of the non-conforming reports are needed."""
+    results_graph = Graph(store="Oxigraph")
+    conforms = True
+    for report in reports:
+        if not report.conforms:
+            results_graph += report.validation_graph
+            conforms = False
+    return SHACLValidationReport(conforms=conforms, validation_graph=results_graph)
+
+
 def reformat_any_iri(iri: SubjectObjectTypeAlias | str) -> str:
     """
     Reformats any kind of IRI, if it starts with data then it treats is like a data IRI.
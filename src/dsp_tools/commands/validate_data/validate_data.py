@@ -28,7 +28,7 @@ from dsp_tools.commands.validate_data.prepare_data.prepare_data import prepare_d
 from dsp_tools.commands.validate_data.process_validation_report.get_user_validation_message import get_user_message
 from dsp_tools.commands.validate_data.process_validation_report.get_user_validation_message import sort_user_problems
 from dsp_tools.commands.validate_data.process_validation_report.query_validation_result import reformat_validation_graph
-from dsp_tools.commands.validate_data.shacl_cli_validator import ShaclCliValidator
+from dsp_tools.commands.validate_data.shacl_validator import get_shacl_validator
 from dsp_tools.commands.validate_data.validation.check_for_unknown_classes import check_for_unknown_resource_classes
 from dsp_tools.commands.validate_data.validation.check_for_unknown_classes import get_msg_str_unknown_classes_in_data
 from dsp_tools.commands.validate_data.validation.get_validation_report import get_validation_report
@@ -53,7 +53,7 @@ VALIDATION_ERRORS_FOUND_MSG = BACKGROUND_BOLD_RED + "\n   Validation errors foun
 NO_VALIDATION_ERRORS_FOUND_MSG = BACKGROUND_BOLD_GREEN + "No validation errors found!   " + RESET_TO_DEFAULT
 
 
-def validate_data(
+def validate_data(  # noqa: PLR0913 (the options of the CLI command)
     filepath: Path,
     creds: ServerCredentials,
     ignore_duplicate_files_warning: bool,
@@ -61,6 +61,9 @@ def validate_data(
     skip_ontology_validation: bool,
     id2iri_file: str | None,
     do_not_request_resource_metadata_from_db: bool,
+    *,
+    use_xml_cache: bool = False,
+    use_api_cache: bool = True,
 ) -> bool:
     """
     Takes a file and project information and validates it against the ontologies on the server.
@@ -73,6 +76,8 @@ def validate_data(
         skip_ontology_validation: skip the ontology validation
         id2iri_file: to replace internal IDs of an XML file by IRIs provided in this mapping file
         do_not_request_resource_metadata_from_db: true if no metadata for existing resources should be requested
+        use_xml_cache: reuse the parsed XML file of an earlier run on the same file
+        use_api_cache: reuse the ontologies and lists of earlier runs, if they have not changed on the server
 
     Returns:
         True if no errors that impede an xmlupload were found.
@@ -90,6 +95,7 @@ def validate_data(
         is_on_prod_server=is_prod_like_server(creds.server),
         skip_ontology_validation=skip_ontology_validation,
         do_not_request_resource_metadata_from_db=do_not_request_resource_metadata_from_db,
+        use_api_cache=use_api_cache,
     )
     auth = AuthenticationClientLive(server=creds.server, email=creds.user, password=creds.password)
 
@@ -97,6 +103,7 @@ def validate_data(
         file=filepath,
         api_url=auth.server,
         id2iri_file=id2iri_file,
+        use_xml_cache=use_xml_cache,
     )
     return validate_parsed_resources(
         parsed_resources=parsed_resources,
@@ -132,6 +139,7 @@ def validate_parsed_resources(
                 auth=auth,
                 shortcode=shortcode,
                 do_not_request_resource_metadata_from_db=config.do_not_request_resource_metadata_from_db,
+                use_api_cache=config.use_api_cache,
             )
         )
         validation_result = _validate_data(
@@ -191,7 +199,7 @@ def _validate_data(
             cardinalities_with_potential_circle=potential_circles,
             report_graphs=None,
         )
-    shacl_validator = ShaclCliValidator()
+    shacl_validator = get_shacl_validator()
     if not config.skip_ontology_validation:
         # Validation of the ontology
         onto_validation_result = validate_ontology(graphs.ontos, shacl_validator, config)
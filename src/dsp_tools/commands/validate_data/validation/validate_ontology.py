@@ -1,6 +1,3 @@
-import shutil
-from importlib.resources import as_file
-from importlib.resources import files
 from pathlib import Path
 
 from loguru import logger
@@ -9,14 +6,10 @@ from rdflib import SH
 from rdflib import Graph
 
 from dsp_tools.cli.args import ValidateDataConfig
-from dsp_tools.commands.validate_data.constants import ONTOLOGIES_DATA_TTL
-from dsp_tools.commands.validate_data.constants import ONTOLOGIES_REPORT_TTL
-from dsp_tools.commands.validate_data.constants import ONTOLOGIES_SHACL_TTL
 from dsp_tools.commands.validate_data.exceptions import ShaclValidationError
 from dsp_tools.commands.validate_data.models.input_problems import OntologyResourceProblem
 from dsp_tools.commands.validate_data.models.input_problems import OntologyValidationProblem
-from dsp_tools.commands.validate_data.models.validation import ValidationFilePaths
-from dsp_tools.commands.validate_data.shacl_cli_validator import ShaclCliValidator
+from dsp_tools.commands.validate_data.shacl_validator import ShaclValidator
 from dsp_tools.commands.validate_data.utils import clean_up_temp_directory
 from dsp_tools.commands.validate_data.utils import get_temp_directory
 from dsp_tools.commands.validate_data.utils import reformat_onto_iri
@@ -26,7 +19,7 @@ LIST_SEPARATOR = "\n    - "
 
 
 def validate_ontology(
-    onto_graph: Graph, shacl_validator: ShaclCliValidator, config: ValidateDataConfig
+    onto_graph: Graph, shacl_validator: ShaclValidator, config: ValidateDataConfig
 ) -> OntologyValidationProblem | None:
     """
     The API accepts erroneous cardinalities in the ontology.
@@ -35,7 +28,7 @@ def validate_ontology(
 
     Args:
         onto_graph: the graph of the project ontologies
-        shacl_validator: SHACL CLI validator
+        shacl_validator: SHACL validator
         config: The configuration where to save the information to
 
     Returns:
@@ -61,19 +54,9 @@ def validate_ontology(
 
 
 def _get_ontology_validation_result(
-    onto_graph: Graph, shacl_validator: ShaclCliValidator, tmp_path: Path
+    onto_graph: Graph, shacl_validator: ShaclValidator, tmp_path: Path
 ) -> OntologyValidationProblem | None:
-    with as_file(files("dsp_tools").joinpath("resources/validate_data/validate-ontology.ttl")) as shacl_file_path:
-        shacl_file = Path(shacl_file_path)
-        shutil.copy(shacl_file, tmp_path / ONTOLOGIES_SHACL_TTL)
-    onto_graph.serialize(tmp_path / ONTOLOGIES_DATA_TTL, format="ox-ttl")
-    paths = ValidationFilePaths(
-        directory=tmp_path,
-        data_file=ONTOLOGIES_DATA_TTL,
-        shacl_file=ONTOLOGIES_SHACL_TTL,
-        report_file=ONTOLOGIES_REPORT_TTL,
-    )
-    validation_result = shacl_validator.validate(paths)
+    validation_result = shacl_validator.validate_ontology(onto_graph, tmp_path)
     if validation_result.conforms:
         return None
     return OntologyValidationProblem(_reformat_ontology_validation_result(validation_result.validation_graph))
@@ -0,0 +1,212 @@
+from __future__ import annotations
+
+from collections import deque
+from collections.abc import Callable
+from concurrent.futures import FIRST_COMPLETED
+from concurrent.futures import Future
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import wait
+from dataclasses import dataclass
+from dataclasses import field
+
+from loguru import logger
+from requests import ReadTimeout
+from tqdm import tqdm
+
+from dsp_tools.commands.xmlupload.exceptions import XmlUploadInterruptedError
+from dsp_tools.commands.xmlupload.handle_errors import handle_keyboard_interrupt
+from dsp_tools.commands.xmlupload.handle_errors import handle_permanent_connection_error
+from dsp_tools.commands.xmlupload.handle_errors import handle_permanent_timeout_or_keyboard_interrupt
+from dsp_tools.commands.xmlupload.handle_errors import inform_about_resource_creation_failure
+from dsp_tools.commands.xmlupload.handle_errors import interrupt_if_indicated
+from dsp_tools.commands.xmlupload.handle_errors import tidy_up_resource_creation_idempotent
+from dsp_tools.commands.xmlupload.models.processed.res import ProcessedResource
+from dsp_tools.commands.xmlupload.models.processed.values import ProcessedLink
+from dsp_tools.commands.xmlupload.models.processed.values import ProcessedRegionPreview
+from dsp_tools.commands.xmlupload.models.processed.values import ProcessedRichtext
+from dsp_tools.commands.xmlupload.models.upload_state import UploadState
+from dsp_tools.commands.xmlupload.richtext_id2iri import find_internal_ids
+from dsp_tools.error.exceptions import BaseError
+from dsp_tools.error.exceptions import PermanentConnectionError
+from dsp_tools.utils.data_formats.iri_util import is_resource_iri
+
+# How many resources beyond the next one may be inspected for readiness.
+# The upload order is topological, so a blocked resource only waits for resources that are already in flight;
+# a bounded window keeps the scheduling cost independent of the total number of resources.
+LOOKAHEAD_PER_WORKER = 50
+
+type UploadOneResource = Callable[[ProcessedResource], str | None]
+
+
+@dataclass
+class _SchedulerState:
+    """Book-keeping of the concurrent upload, owned exclusively by the main thread."""
+
+    upcoming: deque[ProcessedResource]
+    blocked: list[ProcessedResource] = field(default_factory=list)
+    unfinished_ids: set[str] = field(default_factory=set)
+    in_flight: dict[Future[str | None], ProcessedResource] = field(default_factory=dict)
+    dependencies: dict[str, set[str]] = field(default_factory=dict)
+    max_dispatches: int | None = None
+    dispatches: int = 0
+    creation_attempts: int = 0
+    fatal_error: BaseException | None = None
+    uncertain_resources: list[ProcessedResource] = field(default_factory=list)
+
+
+def upload_resources_concurrently(
+    upload_state: UploadState,
+    upload_one_resource: UploadOneResource,
+    num_of_workers: int,
+) -> None:
+    """
+    Create the pending resources of the upload state with a bounded pool of worker threads.
+
+    The resources are dispatched in the order of `upload_state.pending_resources`
+    (as produced by `generate_upload_order`),
+    but a resource is only handed to a worker once all the resources it links to have been dealt with.
+    The worker threads only talk to the server;
+    all changes to the upload state are made on the calling thread,
+    so that the state is consistent whenever the upload is interrupted.
+
+    Args:
+        upload_state: the current state of the upload
+        upload_one_resource: uploads a single resource (incl. its bitstream) and returns its IRI,
+            or None if the resource could not be created
+        num_of_workers: maximum number of resources that are created at the same time
+
+    Raises:
+        XmlUploadInterruptedError: if the upload must be interrupted
+    """
+    resources = upload_state.pending_resources.copy()
+    state = _SchedulerState(
+        upcoming=deque(resources),
+        unfinished_ids={res.res_id for res in resources},
+        dependencies={res.res_id: _get_referenced_ids(res) for res in resources},
+        max_dispatches=upload_state.config.interrupt_after,
+    )
+    lookahead = num_of_workers * LOOKAHEAD_PER_WORKER
+    progress_bar = tqdm(total=len(resources), desc="Creating Resources", dynamic_ncols=True)
+    with ThreadPoolExecutor(max_workers=num_of_workers, thread_name_prefix="xmlupload") as executor:
+        try:
+            while state.fatal_error is None and (state.upcoming or state.blocked or state.in_flight):
+                _dispatch_ready_resources(state, executor, upload_one_resource, num_of_workers, lookahead)
+                done, _ = wait(state.in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    _handle_finished_future(future, state, upload_state)
+                    progress_bar.update(1)
+                progress_bar.set_description(f"Creating Resources (failed: {len(upload_state.failed_uploads)})")
+        except KeyboardInterrupt as err:
+            state.fatal_error = err
+        _drain_in_flight(state, upload_state)
+    progress_bar.close()
+    if state.fatal_error is not None:
+        _raise_fatal_error(state, upload_state)
+
+
+def _get_referenced_ids(resource: ProcessedResource) -> set[str]:
+    referenced: set[str] = set()
+    for val in resource.values:
+        match val:
+            case ProcessedLink() | ProcessedRegionPreview():
+                referenced.add(val.value)
+            case ProcessedRichtext():
+                # The text is inspected instead of `resource_references`,
+                # because a stashed text only contains its UUID and has no references left.
+                referenced.update(find_internal_ids(val.value.xmlstr))
+    return {x for x in referenced if not is_resource_iri(x) and x != resource.res_id}
+
+
+def _dispatch_ready_resources(
+    state: _SchedulerState,
+    executor: ThreadPoolExecutor,
+    upload_one_resource: UploadOneResource,
+    num_of_workers: int,
+    lookahead: int,
+) -> None:
+    while len(state.in_flight) < num_of_workers:
+        if state.max_dispatches is not None and state.dispatches >= state.max_dispatches:
+            break
+        resource = _pop_next_ready_resource(state, lookahead)
+        if resource is None:
+            break
+        state.in_flight[executor.submit(upload_one_resource, resource)] = resource
+        state.dispatches += 1
+
+
+def _pop_next_ready_resource(state: _SchedulerState, lookahead: int) -> ProcessedResource | None:
+    for i, res in enumerate(state.blocked):
+        if _is_ready(res, state):
+            return state.blocked.pop(i)
+    while state.upcoming and len(state.blocked) < lookahead:
+        res = state.upcoming.popleft()
+        if _is_ready(res, state):
+            return res
+        state.blocked.append(res)
+    if not state.in_flight and state.blocked:
+        # Nothing can finish anymore that would unblock a resource, e.g. because the upload order is not
+        # topological. The first resource is dispatched anyway, so that it fails like in a sequential upload.
+        return state.blocked.pop(0)
+    return None
+
+
+def _is_ready(resource: ProcessedResource, state: _SchedulerState) -> bool:
+    return state.dependencies[resource.res_id].isdisjoint(state.unfinished_ids)
+
+
+def _handle_finished_future(future: Future[str | None], state: _SchedulerState, upload_state: UploadState) -> None:
+    # The future is only removed from the in-flight resources at the very end,
+    # so that a KeyboardInterrupt in between leaves it to be handled (idempotently) when draining.
+    resource = state.in_flight[future]
+    iri = None
+    try:
+        iri = future.result()
+    except (TimeoutError, ReadTimeout, PermanentConnectionError) as err:
+        if not isinstance(err, PermanentConnectionError) and resource not in state.uncertain_resources:
+            # It is unclear whether the resource was created, so it must stay pending.
+            state.uncertain_resources.append(resource)
+        state.fatal_error = state.fatal_error or err
+        del state.in_flight[future]
+        return
+    except Exception as err:  # noqa: BLE001 (blind-except)
+        err_msg = err.message if isinstance(err, BaseError) else None
+        inform_about_resource_creation_failure(resource, err_msg)
+
+    tidy_up_resource_creation_idempotent(upload_state, iri, resource)
+    state.unfinished_ids.discard(resource.res_id)
+    try:
+        interrupt_if_indicated(upload_state, state.creation_attempts)
+    except XmlUploadInterruptedError as err:
+        state.fatal_error = state.fatal_error or err
+    state.creation_attempts += 1
+    del state.in_flight[future]
+
+
+def _drain_in_flight(state: _SchedulerState, upload_state: UploadState) -> None:
+    """Wait for the resources that are being created, so that their result is reflected in the upload state."""
+    if state.in_flight:
+        logger.info(f"Waiting for {len(state.in_flight)} resources that are being created, then exit...")
+    while state.in_flight:
+        done, _ = wait(state.in_flight)
+        for future in done:
+            _handle_finished_future(future, state, upload_state)
+
+
+def _raise_fatal_error(state: _SchedulerState, upload_state: UploadState) -> None:
+    # Resources of uncertain outcome are moved to the front of the pending resources,
+    # so that 'resume-xmlupload --skip-first-resource' refers to the resource mentioned in the message.
+    for res in reversed(state.uncertain_resources):
+        if res in upload_state.pending_resources:
+            upload_state.pending_resources.remove(res)
+            upload_state.pending_resources.insert(0, res)
+            if upload_state.journal:
+                upload_state.journal.record_resource_moved_to_front(res.res_id)
+    match state.fatal_error:
+        case KeyboardInterrupt():
+            handle_keyboard_interrupt()
+        case TimeoutError() | ReadTimeout() as err:
+            handle_permanent_timeout_or_keyboard_interrupt(err, state.uncertain_resources[0].res_id)
+        case PermanentConnectionError() as err:
+            handle_permanent_connection_error(err)
+        case BaseException() as err:
+            raise err
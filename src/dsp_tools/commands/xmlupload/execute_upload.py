@@ -1,6 +1,10 @@
 from __future__ import annotations
 
 from datetime import datetime
+from functools import partial
+from pathlib import Path
+from typing import Any
+from typing import cast
 
 from loguru import logger
 from rdflib import URIRef
@@ -9,12 +13,15 @@ from tqdm import tqdm
 
 from dsp_tools.clients.fuseki_metrics import FusekiMetrics
 from dsp_tools.clients.ingest import AssetClient
+from dsp_tools.clients.ingest import DspIngestClientLive
 from dsp_tools.clients.legal_info_client import LegalInfoClient
 from dsp_tools.clients.project_client_live import ProjectClientLive
 from dsp_tools.clients.resource_client import ResourceClient
 from dsp_tools.clients.resource_client_live import ResourceClientLive
 from dsp_tools.clients.value_client_live import ValueClientLive
+from dsp_tools.commands.xmlupload.concurrent_upload import upload_resources_concurrently
 from dsp_tools.commands.xmlupload.exceptions import XmlUploadInterruptedError
+from dsp_tools.commands.xmlupload.handle_errors import delete_upload_state
 from dsp_tools.commands.xmlupload.handle_errors import handle_keyboard_interrupt
 from dsp_tools.commands.xmlupload.handle_errors import handle_permanent_connection_error
 from dsp_tools.commands.xmlupload.handle_errors import handle_permanent_timeout_or_keyboard_interrupt
@@ -22,9 +29,12 @@ from dsp_tools.commands.xmlupload.handle_errors import handle_upload_error
 from dsp_tools.commands.xmlupload.handle_errors import inform_about_resource_creation_failure
 from dsp_tools.commands.xmlupload.handle_errors import interrupt_if_indicated
 from dsp_tools.commands.xmlupload.handle_errors import save_upload_state
+from dsp_tools.commands.xmlupload.handle_errors import start_upload_journal
 from dsp_tools.commands.xmlupload.handle_errors import tidy_up_resource_creation_idempotent
-from dsp_tools.commands.xmlupload.make_rdf_graph.jsonld_utils import serialise_jsonld_for_resource
-from dsp_tools.commands.xmlupload.make_rdf_graph.make_resource_and_values import create_resource_with_values
+from dsp_tools.commands.xmlupload.ingest_cache import CachingAssetClient
+from dsp_tools.commands.xmlupload.ingest_prefetch import PrefetchingAssetClient
+from dsp_tools.commands.xmlupload.make_rdf_graph.make_jsonld import make_resource_jsonld
+from dsp_tools.commands.xmlupload.media_cache import MediaCache
 from dsp_tools.commands.xmlupload.models.bitstream_info import BitstreamInfo
 from dsp_tools.commands.xmlupload.models.lookup_models import IRILookups
 from dsp_tools.commands.xmlupload.models.processed.file_values import ProcessedFileBitstream
@@ -32,16 +42,19 @@ from dsp_tools.commands.xmlupload.models.processed.res import ProcessedResource
 from dsp_tools.commands.xmlupload.models.upload_clients import UploadClients
 from dsp_tools.commands.xmlupload.models.upload_state import UploadState
 from dsp_tools.commands.xmlupload.stash.upload_stashed_resptr_props import upload_stashed_resptr_props
+from dsp_tools.commands.xmlupload.stash.upload_stashed_xml_texts import get_value_iris_of_stashed_texts
 from dsp_tools.commands.xmlupload.stash.upload_stashed_xml_texts import upload_stashed_xml_texts
 from dsp_tools.commands.xmlupload.write_diagnostic_info import write_id2iri_mapping
+from dsp_tools.commands.xmlupload.write_diagnostic_info import write_performance_report
 from dsp_tools.error.exceptions import BadCredentialsError
 from dsp_tools.error.exceptions import BaseError
 from dsp_tools.error.exceptions import PermanentConnectionError
 from dsp_tools.setup.logger_config import WARNINGS_SAVEPATH
 from dsp_tools.utils.exceptions import DspToolsRequestException
 from dsp_tools.utils.fuseki_bloating import communicate_fuseki_bloating
-from dsp_tools.utils.request_utils import log_request_failure_and_sleep
+from dsp_tools.utils.rate_control import get_rate_controller
 from dsp_tools.utils.request_utils import should_retry_request
+from dsp_tools.utils.telemetry import get_telemetry
 
 
 def execute_upload(clients: UploadClients, upload_state: UploadState) -> bool:
@@ -60,6 +73,7 @@ def execute_upload(clients: UploadClients, upload_state: UploadState) -> bool:
         db_metrics = FusekiMetrics()
         db_metrics.try_get_start_size()
     upload_copyright_holders(upload_state.pending_resources, clients.legal_info_client)
+    start_upload_journal(upload_state)
     _upload_all_resources(clients, upload_state)
     if db_metrics is not None:
         db_metrics.try_get_end_size()
@@ -91,25 +105,110 @@ def _upload_all_resources(clients: UploadClients, upload_state: UploadState) ->
     )
 
     resource_client = ResourceClientLive(clients.legal_info_client.server, clients.legal_info_client.auth)
+    caching_client = _start_media_caching(clients.asset_client, upload_state)
+    prefetcher = _start_ingest_prefetching(caching_client or clients.asset_client, upload_state)
+    asset_client = prefetcher or caching_client or clients.asset_client
 
-    progress_bar = tqdm(upload_state.pending_resources.copy(), desc="Creating Resources", dynamic_ncols=True)
     try:
-        for creation_attempts_of_this_round, resource in enumerate(progress_bar):
-            _execute_one_resource_upload(
-                resource=resource,
-                upload_state=upload_state,
-                resource_client=resource_client,
-                asset_client=clients.asset_client,
-                iri_lookups=iri_lookup,
-                creation_attempts_of_this_round=creation_attempts_of_this_round,
-            )
-            progress_bar.set_description(f"Creating Resources (failed: {len(upload_state.failed_uploads)})")
+        try:
+            if upload_state.config.num_of_workers > 1:
+                upload_resources_concurrently(
+                    upload_state=upload_state,
+                    upload_one_resource=partial(
+                        _upload_one_resource_in_worker,
+                        resource_client=resource_client,
+                        asset_client=asset_client,
+                        iri_lookups=iri_lookup,
+                    ),
+                    num_of_workers=upload_state.config.num_of_workers,
+                )
+            else:
+                _upload_resources_sequentially(upload_state, resource_client, asset_client, iri_lookup)
+        finally:
+            # whatever happened, no more files may be ingested or hashed in the background
+            _shutdown_background_work(prefetcher, caching_client)
         if upload_state.pending_stash:
-            _upload_stash(upload_state, resource_client)
+            with get_telemetry().measure("stash"):
+                _upload_stash(upload_state, resource_client, iri_lookup.value_uuid_to_iri)
     except XmlUploadInterruptedError as err:
         handle_upload_error(err, upload_state)
 
 
+def _start_media_caching(asset_client: AssetClient, upload_state: UploadState) -> CachingAssetClient | None:
+    config = upload_state.config
+    if not config.use_media_cache or not isinstance(asset_client, DspIngestClientLive):
+        return None
+    caching_client = CachingAssetClient(
+        asset_client=asset_client,
+        imgdir=Path(asset_client.imgdir),
+        media_cache=MediaCache(),
+        check_cached_assets=config.check_cached_media,
+    )
+    caching_client.start(upload_state.pending_resources)
+    return caching_client
+
+
+def _start_ingest_prefetching(asset_client: AssetClient, upload_state: UploadState) -> PrefetchingAssetClient | None:
+    config = upload_state.config
+    if config.num_of_ingest_workers < 1 or not isinstance(asset_client, DspIngestClientLive | CachingAssetClient):
+        return None
+    prefetcher = PrefetchingAssetClient(
+        asset_client=asset_client,
+        imgdir=Path(asset_client.imgdir),
+        num_of_workers=config.num_of_ingest_workers,
+        max_bytes_in_flight=config.max_ingest_bytes_in_flight,
+    )
+    prefetcher.start(upload_state.pending_resources)
+    return prefetcher
+
+
+def _shutdown_background_work(
+    prefetcher: PrefetchingAssetClient | None, caching_client: CachingAssetClient | None
+) -> None:
+    if prefetcher:
+        prefetcher.shutdown()
+    if caching_client:
+        caching_client.shutdown()
+
+
+def _upload_resources_sequentially(
+    upload_state: UploadState,
+    resource_client: ResourceClient,
+    asset_client: AssetClient,
+    iri_lookups: IRILookups,
+) -> None:
+    progress_bar = tqdm(upload_state.pending_resources.copy(), desc="Creating Resources", dynamic_ncols=True)
+    for creation_attempts_of_this_round, resource in enumerate(progress_bar):
+        _execute_one_resource_upload(
+            resource=resource,
+            upload_state=upload_state,
+            resource_client=resource_client,
+            asset_client=asset_client,
+            iri_lookups=iri_lookups,
+            creation_attempts_of_this_round=creation_attempts_of_this_round,
+        )
+        progress_bar.set_description(f"Creating Resources (failed: {len(upload_state.failed_uploads)})")
+
+
+def _upload_one_resource_in_worker(
+    resource: ProcessedResource,
+    resource_client: ResourceClient,
+    asset_client: AssetClient,
+    iri_lookups: IRILookups,
+) -> str | None:
+    """
+    Ingest the bitstream (if any) and create the resource, without touching the upload state.
+    Runs on a worker thread: errors are raised and handled by the thread that owns the upload state.
+    """
+    media_info = None
+    if (file_found := resource.file_value) and isinstance(file_found.value, ProcessedFileBitstream):
+        with get_telemetry().measure("ingest"):
+            media_info = asset_client.get_bitstream_info(file_found.value, file_found.metadata.permissions)
+        if not media_info:
+            return None
+    return _execute_one_resource_data_upload(resource, media_info, resource_client, iri_lookups)
+
+
 def _execute_one_resource_upload(
     resource: ProcessedResource,
     upload_state: UploadState,
@@ -122,13 +221,14 @@ def _execute_one_resource_upload(
     if file_found := resource.file_value:
         if isinstance(file_found.value, ProcessedFileBitstream):
             try:
-                ingest_result = asset_client.get_bitstream_info(file_found.value, file_found.metadata.permissions)
+                with get_telemetry().measure("ingest"):
+                    ingest_result = asset_client.get_bitstream_info(file_found.value, file_found.metadata.permissions)
             except PermanentConnectionError as err:
                 handle_permanent_connection_error(err)
             except KeyboardInterrupt:
                 handle_keyboard_interrupt()
             if not ingest_result:
-                upload_state.failed_uploads.append(resource.res_id)
+                tidy_up_resource_creation_idempotent(upload_state, None, resource)
                 return
             media_info = ingest_result
 
@@ -157,36 +257,57 @@ def _execute_one_resource_data_upload(
     resource_client: ResourceClient,
     iri_lookups: IRILookups,
 ) -> str | None:
-    resource_graph = create_resource_with_values(
-        resource=resource,
-        bitstream_information=media_info,
-        lookups=iri_lookups,
-    )
-    resource_dict = serialise_jsonld_for_resource(resource_graph)
+    telemetry = get_telemetry()
+    with telemetry.measure("graph_build"):
+        resource_dict = make_resource_jsonld(
+            resource=resource,
+            bitstream_information=media_info,
+            lookups=iri_lookups,
+        )
     logger.info(f"Attempting to create resource {resource.res_id} (label: {resource.label})...")
+    with telemetry.measure("resource_creation"):
+        return _create_resource(resource, resource_dict, bool(media_info), resource_client, iri_lookups)
+
+
+def _create_resource(
+    resource: ProcessedResource,
+    resource_dict: dict[str, Any],
+    has_bitstream: bool,
+    resource_client: ResourceClient,
+    iri_lookups: IRILookups,
+) -> str | None:
     num_of_retries = 24
+    rate_controller = get_rate_controller()
     for retry_counter in range(num_of_retries):
-        try:
-            creation_result = resource_client.post_resource(resource_dict, bool(media_info))
-        except BadCredentialsError as err:
-            raise err from None
-        except DspToolsRequestException:
-            log_request_failure_and_sleep("Connection Error", retry_counter, exc_info=True)
-            continue
-        if isinstance(creation_result, str):
-            return creation_result
-        if should_retry_request(creation_result):
-            log_request_failure_and_sleep("Transient Error", retry_counter, exc_info=False)
-            continue
-        return None  # non-retryable error (4xx etc.)
+        with rate_controller.request_slot() as slot:
+            try:
+                creation_result = resource_client.post_resource(resource_dict, has_bitstream)
+            except BadCredentialsError as err:
+                raise err from None
+            except (TimeoutError, ReadTimeout):
+                # it is unclear if the resource was created, so it must not be retried
+                slot.record_timeout()
+                raise
+            except DspToolsRequestException:
+                slot.record_failure("Connection Error", retry_counter, exc_info=True)
+                continue
+            if isinstance(creation_result, dict):
+                iri_lookups.value_uuid_to_iri.update(get_value_iris_of_stashed_texts(resource, creation_result))
+                return cast(str, creation_result["@id"])
+            if should_retry_request(creation_result):
+                slot.record_failure("Transient Error", retry_counter, exc_info=False)
+                continue
+            return None  # non-retryable error (4xx etc.)
     msg = f"Permanently unable to execute the network action. See {WARNINGS_SAVEPATH} for more information."
     raise PermanentConnectionError(msg)
 
 
-def _upload_stash(upload_state: UploadState, resource_client: ResourceClient) -> None:
+def _upload_stash(
+    upload_state: UploadState, resource_client: ResourceClient, value_uuid_to_iri: dict[str, str]
+) -> None:
     val_client = ValueClientLive(resource_client.server, resource_client.auth)
     if upload_state.pending_stash and upload_state.pending_stash.standoff_stash:
-        upload_stashed_xml_texts(upload_state, val_client, resource_client)
+        upload_stashed_xml_texts(upload_state, val_client, resource_client, value_uuid_to_iri)
     if upload_state.pending_stash and upload_state.pending_stash.link_value_stash:
         upload_stashed_resptr_props(upload_state, val_client)
 
@@ -211,13 +332,18 @@ def cleanup_upload(upload_state: UploadState) -> bool:
         shortcode=upload_state.config.shortcode,
         diagnostics=upload_state.config.diagnostics,
     )
+    write_performance_report(
+        summary=get_telemetry().summary(),
+        shortcode=upload_state.config.shortcode,
+        diagnostics=upload_state.config.diagnostics,
+    )
     has_failures = len(upload_state.failed_uploads) > 0
     has_stash = bool(upload_state.pending_stash and not upload_state.pending_stash.is_empty())
 
     if not has_failures and not has_stash:
         print(f"{datetime.now()}: All resources have successfully been uploaded.")
         logger.info("All resources have successfully been uploaded.")
-        upload_state.config.diagnostics.save_location.unlink(missing_ok=True)
+        delete_upload_state(upload_state)
         return True
 
     _report_incomplete_upload(upload_state, has_failures=has_failures, has_stash=has_stash)
@@ -248,4 +374,4 @@ def _report_incomplete_upload(upload_state: UploadState, *, has_failures: bool,
     if save_pickle:
         print(save_upload_state(upload_state))
     else:
-        upload_state.config.diagnostics.save_location.unlink(missing_ok=True)
+        delete_upload_state(upload_state)
@@ -1,9 +1,12 @@
 from __future__ import annotations
 
+import hashlib
 import pickle
 import sys
 import warnings
 from datetime import datetime
+from importlib.metadata import version
+from pathlib import Path
 from typing import Never
 
 from loguru import logger
@@ -11,10 +14,14 @@ from requests import ReadTimeout
 
 from dsp_tools.commands.xmlupload.exceptions import XmlUploadInterruptedError
 from dsp_tools.commands.xmlupload.models.processed.res import ProcessedResource
+from dsp_tools.commands.xmlupload.models.upload_journal import UploadJournal
 from dsp_tools.commands.xmlupload.models.upload_state import UploadState
+from dsp_tools.commands.xmlupload.upload_config import UploadConfig
 from dsp_tools.error.custom_warnings import DspToolsUserWarning
 from dsp_tools.error.exceptions import PermanentConnectionError
 from dsp_tools.setup.logger_config import WARNINGS_SAVEPATH
+from dsp_tools.utils.file_utils import hash_file
+from dsp_tools.utils.file_utils import write_atomically
 
 
 def handle_permanent_connection_error(err: PermanentConnectionError) -> Never:
@@ -67,12 +74,16 @@ def tidy_up_resource_creation_idempotent(
     total_res = previous_successful + previous_failed + upcoming
     if iri:
         # resource creation succeeded: update the iri_resolver
+        if upload_state.journal and upload_state.iri_resolver.lookup.get(resource.res_id) != iri:
+            upload_state.journal.record_resource_created(resource.res_id, iri)
         upload_state.iri_resolver.lookup[resource.res_id] = iri
         msg = f"Created resource {current_res}/{total_res}: '{resource.label}' (ID: '{resource.res_id}', IRI: '{iri}')"
         logger.info(msg)
     else:  # noqa: PLR5501
         # resource creation failed gracefully: register it as failed
         if resource.res_id not in upload_state.failed_uploads:
+            if upload_state.journal:
+                upload_state.journal.record_resource_failed(resource.res_id)
             upload_state.failed_uploads.append(resource.res_id)
 
     if resource in upload_state.pending_resources:
@@ -127,11 +138,84 @@ def handle_upload_error(err: BaseException, upload_state: UploadState) -> None:
     sys.exit(exit_code)
 
 
+def start_upload_journal(upload_state: UploadState) -> None:
+    """
+    Make sure that the progress of the upload is written to a journal while the upload is running,
+    so that the upload can be resumed even if the process is killed.
+
+    A new upload saves a snapshot of its initial state, and the journal records the progress from there on.
+    If the snapshot of an earlier upload of the same input is still there, it is not written again.
+    A resumed upload keeps appending to the journal of the snapshot it was loaded from.
+
+    Args:
+        upload_state: the initial state of the upload
+    """
+    if upload_state.journal:
+        return
+    upload_state.journal = UploadJournal(upload_state.config.diagnostics.journal_location)
+    if _snapshot_matches_input(upload_state):
+        logger.debug("The snapshot of the upload state of an earlier upload of the same input is reused")
+        upload_state.journal.reset()
+    else:
+        _write_snapshot(upload_state, is_initial_state=True)
+
+
+def get_input_fingerprint(xml_file: Path, config: UploadConfig, *other_input: object) -> str:
+    """
+    Identifies the input of an upload,
+    so that the snapshot of its initial state can be reused by a new upload of the same input.
+
+    Args:
+        xml_file: the XML file of the upload
+        config: the configuration of the upload
+        other_input: everything else the resources were processed with, e.g. the lookups retrieved from the server
+
+    Returns:
+        the fingerprint, which changes as soon as any part of the input changes
+    """
+    sha256 = hashlib.sha256(hash_file(xml_file).encode())
+    for x in [version("dsp-tools"), config, *other_input]:
+        sha256.update(f"\n{x!r}".encode())
+    return sha256.hexdigest()
+
+
 def save_upload_state(upload_state: UploadState) -> str:
     save_location = upload_state.config.diagnostics.save_location
-    save_location.unlink(missing_ok=True)
-    save_location.touch(exist_ok=True)
-    with open(save_location, "wb") as file:
-        pickle.dump(upload_state, file)
+    if upload_state.journal and save_location.is_file():
+        # the snapshot from the start of the upload and the journal already describe the current state
+        upload_state.journal.flush()
+    else:
+        _write_snapshot(upload_state)
     logger.info(f"Saved the current upload state to {save_location}")
     return f"Saved the current upload state to {save_location}.\n"
+
+
+def _snapshot_matches_input(upload_state: UploadState) -> bool:
+    diagnostics = upload_state.config.diagnostics
+    if not upload_state.input_fingerprint or not diagnostics.save_location.is_file():
+        return False
+    try:
+        return diagnostics.input_fingerprint_location.read_text(encoding="utf-8") == upload_state.input_fingerprint
+    except OSError:
+        return False
+
+
+def _write_snapshot(upload_state: UploadState, is_initial_state: bool = False) -> None:
+    diagnostics = upload_state.config.diagnostics
+    # a snapshot that is not the initial state must never be taken for the initial state of another upload
+    diagnostics.input_fingerprint_location.unlink(missing_ok=True)
+    write_atomically(diagnostics.save_location, pickle.dumps(upload_state))
+    if is_initial_state and upload_state.input_fingerprint:
+        diagnostics.input_fingerprint_location.write_text(upload_state.input_fingerprint, encoding="utf-8")
+    if upload_state.journal:
+        # the snapshot contains everything the journal has recorded so far
+        upload_state.journal.reset()
+
+
+def delete_upload_state(upload_state: UploadState) -> None:
+    upload_state.config.diagnostics.input_fingerprint_location.unlink(missing_ok=True)
+    upload_state.config.diagnostics.save_location.unlink(missing_ok=True)
+    if upload_state.journal:
+        upload_state.journal.delete()
+    else:
+        upload_state.config.diagnostics.journal_location.unlink(missing_ok=True)
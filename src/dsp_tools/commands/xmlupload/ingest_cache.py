@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from pathlib import Path
+
+from loguru import logger
+
+from dsp_tools.clients.ingest import AssetClient
+from dsp_tools.clients.ingest import DspIngestClientLive
+from dsp_tools.commands.xmlupload.media_cache import MediaCache
+from dsp_tools.commands.xmlupload.models.bitstream_info import BitstreamInfo
+from dsp_tools.commands.xmlupload.models.permission import Permissions
+from dsp_tools.commands.xmlupload.models.processed.file_values import ProcessedFileBitstream
+from dsp_tools.commands.xmlupload.models.processed.res import ProcessedResource
+
+
+@dataclass
+class CachingAssetClient(AssetClient):
+    """
+    Reuses the files that were ingested earlier with the same content,
+    if they are in the media cache (and still exist on the ingest server, if `check_cached_assets` is set).
+    All other files are ingested by the wrapped client, and added to the media cache.
+
+    The hashes of the files of upcoming resources are computed in the background, see `start()`.
+    """
+
+    asset_client: DspIngestClientLive
+    imgdir: Path
+    media_cache: MediaCache
+    check_cached_assets: bool = True
+
+    def start(self, resources: list[ProcessedResource]) -> None:
+        """Start computing the hashes of the bitstreams of the given resources in the background."""
+        self.media_cache.start_hashing(
+            self.imgdir / res.file_value.value.value
+            for res in resources
+            if res.file_value and isinstance(res.file_value.value, ProcessedFileBitstream)
+        )
+
+    def shutdown(self) -> None:
+        """Stop computing hashes in the background."""
+        self.media_cache.stop_hashing()
+
+    def get_bitstream_info(
+        self, file_info: ProcessedFileBitstream, permissions: Permissions | None
+    ) -> BitstreamInfo | None:
+        """Returns the file that was ingested earlier with the same content, or ingests the file now."""
+        filepath = self.imgdir / file_info.value
+        try:
+            content_hash = self.media_cache.get_hash(filepath)
+        except OSError:
+            logger.exception(f"Unable to compute the hash of '{filepath}', it is uploaded without the media cache")
+            return self.asset_client.get_bitstream_info(file_info, permissions)
+        server, shortcode = self.asset_client.dsp_ingest_url, self.asset_client.shortcode
+        cached = self.media_cache.get_internal_filename(server, shortcode, content_hash)
+        if cached and (not self.check_cached_assets or self.asset_client.asset_exists(cached)):
+            logger.info(f"The file '{filepath}' was already ingested as '{cached}', it is not uploaded again")
+            return BitstreamInfo(cached, permissions)
+        if bitstream_info := self.asset_client.get_bitstream_info(file_info, permissions):
+            self.media_cache.add_internal_filename(server, shortcode, content_hash, bitstream_info.internal_file_name)
+        return bitstream_info
@@ -0,0 +1,131 @@
+from __future__ import annotations
+
+import threading
+from concurrent.futures import Future
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from dataclasses import field
+from functools import partial
+from pathlib import Path
+
+from loguru import logger
+
+from dsp_tools.clients.ingest import AssetClient
+from dsp_tools.commands.xmlupload.models.bitstream_info import BitstreamInfo
+from dsp_tools.commands.xmlupload.models.permission import Permissions
+from dsp_tools.commands.xmlupload.models.processed.file_values import ProcessedFileBitstream
+from dsp_tools.commands.xmlupload.models.processed.res import ProcessedResource
+
+# How many ingested files may wait for their resource to be created, per ingest worker.
+# This bounds how far the ingest stage can run ahead of the resource creation.
+PREFETCHED_FILES_PER_WORKER = 4
+
+
+@dataclass
+class PrefetchingAssetClient(AssetClient):
+    """
+    Ingests the bitstreams of upcoming resources on its own pool of worker threads,
+    so that the upload of the files overlaps with the creation of the resources.
+
+    The files are ingested in the order of the resources passed to `start()`.
+    `get_bitstream_info()` hands out the result of the prefetched ingest, waiting for it if necessary.
+    At most `max_bytes_in_flight` bytes are uploaded at the same time (a single bigger file is uploaded alone),
+    and at most `max_prefetched_files` ingested files wait for their resource to be created.
+    """
+
+    asset_client: AssetClient
+    imgdir: Path
+    num_of_workers: int
+    max_bytes_in_flight: int | None = None
+    max_prefetched_files: int = field(init=False)
+    _executor: ThreadPoolExecutor = field(init=False)
+    _condition: threading.Condition = field(init=False, default_factory=threading.Condition)
+    _futures: dict[str, Future[BitstreamInfo | None]] = field(init=False, default_factory=dict)
+    _scheduled_res_ids: set[str] = field(init=False, default_factory=set)
+    _bytes_in_flight: int = field(init=False, default=0)
+    _num_prefetched: int = field(init=False, default=0)
+    _feeder_done: bool = field(init=False, default=False)
+    _stopped: bool = field(init=False, default=False)
+
+    def __post_init__(self) -> None:
+        self.max_prefetched_files = self.num_of_workers * PREFETCHED_FILES_PER_WORKER
+        self._executor = ThreadPoolExecutor(max_workers=self.num_of_workers, thread_name_prefix="ingest")
+
+    def start(self, resources: list[ProcessedResource]) -> None:
+        """Start ingesting the bitstreams of the given resources in the background, in the given order."""
+        to_ingest: list[tuple[ProcessedFileBitstream, Permissions | None]] = []
+        for res in resources:
+            if (file_val := res.file_value) and isinstance(file_val.value, ProcessedFileBitstream):
+                to_ingest.append((file_val.value, file_val.metadata.permissions))
+        self._scheduled_res_ids = {x.res_id for x, _ in to_ingest}
+        logger.debug(f"Prefetching the ingest of {len(to_ingest)} files with {self.num_of_workers} workers")
+        feeder = threading.Thread(target=self._feed, args=(to_ingest,), name="ingest-feeder", daemon=True)
+        feeder.start()
+
+    def shutdown(self) -> None:
+        """Stop scheduling further ingests. Ingests that are already running are finished in the background."""
+        with self._condition:
+            self._stopped = True
+            self._condition.notify_all()
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def get_bitstream_info(
+        self, file_info: ProcessedFileBitstream, permissions: Permissions | None
+    ) -> BitstreamInfo | None:
+        """Returns the result of the prefetched ingest, or ingests the file now if it was not scheduled."""
+        with self._condition:
+            if file_info.res_id in self._scheduled_res_ids:
+                self._condition.wait_for(lambda: file_info.res_id in self._futures or self._feeder_done)
+            future = self._futures.pop(file_info.res_id, None)
+        if future is None:
+            return self.asset_client.get_bitstream_info(file_info, permissions)
+        try:
+            return future.result()
+        finally:
+            with self._condition:
+                self._num_prefetched -= 1
+                self._condition.notify_all()
+
+    def _feed(self, to_ingest: list[tuple[ProcessedFileBitstream, Permissions | None]]) -> None:
+        try:
+            for file_info, permissions in to_ingest:
+                size = self._get_file_size(file_info)
+                with self._condition:
+                    self._condition.wait_for(partial(self._may_schedule, size))
+                    if self._stopped:
+                        return
+                    self._bytes_in_flight += size
+                    self._num_prefetched += 1
+                    future = self._executor.submit(self._ingest_one, file_info, permissions, size)
+                    self._futures[file_info.res_id] = future
+                    self._condition.notify_all()
+        finally:
+            with self._condition:
+                self._feeder_done = True
+                self._condition.notify_all()
+
+    def _may_schedule(self, size: int) -> bool:
+        if self._stopped:
+            return True
+        if self._num_prefetched >= self.max_prefetched_files:
+            return False
+        if self.max_bytes_in_flight is None or self._bytes_in_flight == 0:
+            return True
+        return self._bytes_in_flight + size <= self.max_bytes_in_flight
+
+    def _ingest_one(
+        self, file_info: ProcessedFileBitstream, permissions: Permissions | None, size: int
+    ) -> BitstreamInfo | None:
+        try:
+            return self.asset_client.get_bitstream_info(file_info, permissions)
+        finally:
+            with self._condition:
+                self._bytes_in_flight -= size
+                self._condition.notify_all()
+
+    def _get_file_size(self, file_info: ProcessedFileBitstream) -> int:
+        try:
+            return (self.imgdir / file_info.value).stat().st_size
+        except OSError:
+            # the ingest itself reports the problem, the file does not need to count against the budget
+            return 0
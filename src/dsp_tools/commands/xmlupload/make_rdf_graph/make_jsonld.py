@@ -0,0 +1,235 @@
+from typing import Any
+
+from rdflib import RDFS
+from rdflib import XSD
+from rdflib import URIRef
+
+from dsp_tools.commands.xmlupload.iri_resolver import IriResolver
+from dsp_tools.commands.xmlupload.make_rdf_graph.constants import LINK_PROP_TYPE_INFO
+from dsp_tools.commands.xmlupload.make_rdf_graph.constants import LIST_PROP_TYPE_INFO
+from dsp_tools.commands.xmlupload.make_rdf_graph.constants import RDF_LITERAL_PROP_TYPE_MAPPER
+from dsp_tools.commands.xmlupload.make_rdf_graph.constants import REGION_PREVIEW_PROP_TYPE_INFO
+from dsp_tools.commands.xmlupload.make_rdf_graph.constants import RICHTEXT_PROP_TYPE_INFO
+from dsp_tools.commands.xmlupload.make_rdf_graph.make_resource_and_values import get_abstract_file_value
+from dsp_tools.commands.xmlupload.make_rdf_graph.make_values import resolve_id_to_iri
+from dsp_tools.commands.xmlupload.models.bitstream_info import BitstreamInfo
+from dsp_tools.commands.xmlupload.models.lookup_models import IRILookups
+from dsp_tools.commands.xmlupload.models.permission import Permissions
+from dsp_tools.commands.xmlupload.models.processed.res import ProcessedResource
+from dsp_tools.commands.xmlupload.models.processed.values import ProcessedBoolean
+from dsp_tools.commands.xmlupload.models.processed.values import ProcessedColor
+from dsp_tools.commands.xmlupload.models.processed.values import ProcessedDate
+from dsp_tools.commands.xmlupload.models.processed.values import ProcessedDecimal
+from dsp_tools.commands.xmlupload.models.processed.values import ProcessedGeometry
+from dsp_tools.commands.xmlupload.models.processed.values import ProcessedGeoname
+from dsp_tools.commands.xmlupload.models.processed.values import ProcessedInt
+from dsp_tools.commands.xmlupload.models.processed.values import ProcessedInterval
+from dsp_tools.commands.xmlupload.models.processed.values import ProcessedLink
+from dsp_tools.commands.xmlupload.models.processed.values import ProcessedList
+from dsp_tools.commands.xmlupload.models.processed.values import ProcessedRegionPreview
+from dsp_tools.commands.xmlupload.models.processed.values import ProcessedRichtext
+from dsp_tools.commands.xmlupload.models.processed.values import ProcessedSimpleText
+from dsp_tools.commands.xmlupload.models.processed.values import ProcessedTime
+from dsp_tools.commands.xmlupload.models.processed.values import ProcessedUri
+from dsp_tools.commands.xmlupload.models.processed.values import ProcessedValue
+from dsp_tools.commands.xmlupload.models.rdf_models import AbstractFileValue
+from dsp_tools.commands.xmlupload.models.rdf_models import RDFPropTypeInfo
+from dsp_tools.commands.xmlupload.richtext_id2iri import prepare_richtext_string_for_upload
+from dsp_tools.error.exceptions import UnreachableCodeError
+from dsp_tools.utils.data_formats.date_util import DayMonthYearEra
+from dsp_tools.utils.data_formats.date_util import SingleDate
+from dsp_tools.utils.data_formats.date_util import StartEnd
+from dsp_tools.utils.rdf_constants import KNORA_API_PREFIX
+
+# The JSON-LD payloads built here are identical to the ones that result from building an rdflib graph
+# and framing its JSON-LD serialisation (see `jsonld_utils.py`), which is verified by the golden tests.
+# rdflib serialises literals of these datatypes as native JSON values, all others as their lexical form.
+NATIVE_JSON_DATATYPES = {XSD.boolean, XSD.integer, XSD.double, XSD.string}
+STANDARD_MAPPING_IRI = "http://rdfh.ch/standoff/mappings/StandardMapping"
+
+type JsonLdNode = dict[str, Any]
+
+
+def make_resource_jsonld(
+    resource: ProcessedResource,
+    bitstream_information: BitstreamInfo | None,
+    lookups: IRILookups,
+) -> JsonLdNode:
+    """
+    Build the JSON-LD payload to create a resource with its values, without building an intermediate RDF graph.
+
+    Args:
+        resource: the resource to create
+        bitstream_information: if the resource has a FileValue
+        lookups: lookups to resolve IRIs, etc.
+
+    Returns:
+        the payload that can be sent to the API
+    """
+    res: JsonLdNode = {"@type": resource.type_iri}
+    if migration := resource.migration_metadata:
+        if migration.iri_str:
+            res["@id"] = migration.iri_str
+        if date := migration.creation_date:
+            _add_object(res, f"{KNORA_API_PREFIX}creationDate", _make_literal(str(date), XSD.dateTimeStamp))
+    _add_object(res, str(RDFS.label), _make_literal(resource.label, XSD.string))
+    _add_object(res, f"{KNORA_API_PREFIX}attachedToProject", {"@id": str(lookups.project_iri)})
+    if resource.permissions:
+        _add_object(res, f"{KNORA_API_PREFIX}hasPermissions", _make_literal(str(resource.permissions), XSD.string))
+    for author in resource.data_authorship or []:
+        _add_object(res, f"{KNORA_API_PREFIX}hasResourceAuthorship", _make_literal(author, XSD.string))
+    for val in resource.values:
+        _add_object(res, val.prop_iri, _make_one_value(val, lookups))
+    if file_found := resource.file_value:
+        file_value = get_abstract_file_value(file_found, bitstream_information)
+        _add_object(res, str(file_value.prop_type_info.knora_prop), _make_file_value(file_value))
+    return res
+
+
+def make_value_jsonld(res_iri: str, res_type: str, prop_iri: str, value: JsonLdNode) -> JsonLdNode:
+    """Build the JSON-LD payload to create or update a single value of an existing resource."""
+    return {"@id": res_iri, "@type": res_type, prop_iri: value}
+
+
+def make_link_value_jsonld(val: ProcessedLink, target_iri: str) -> JsonLdNode:
+    node = _make_base_value(val, LINK_PROP_TYPE_INFO)
+    node[str(LINK_PROP_TYPE_INFO.knora_prop)] = {"@id": target_iri}
+    return node
+
+
+def make_region_preview_value_jsonld(val: ProcessedRegionPreview, target_iri: str) -> JsonLdNode:
+    node = _make_base_value(val, REGION_PREVIEW_PROP_TYPE_INFO)
+    node[str(REGION_PREVIEW_PROP_TYPE_INFO.knora_prop)] = {"@id": target_iri}
+    return node
+
+
+def make_richtext_value_jsonld(val: ProcessedRichtext, iri_resolver: IriResolver) -> JsonLdNode:
+    node = _make_base_value(val, RICHTEXT_PROP_TYPE_INFO)
+    val_str = prepare_richtext_string_for_upload(val.value.xmlstr, iri_resolver)
+    node[str(RICHTEXT_PROP_TYPE_INFO.knora_prop)] = _make_literal(val_str, XSD.string)
+    node[f"{KNORA_API_PREFIX}textValueHasMapping"] = {"@id": STANDARD_MAPPING_IRI}
+    return node
+
+
+def _make_one_value(val: ProcessedValue, iri_lookups: IRILookups) -> JsonLdNode:
+    match val:
+        case (
+            ProcessedBoolean()
+            | ProcessedColor()
+            | ProcessedDecimal()
+            | ProcessedGeometry()
+            | ProcessedGeoname()
+            | ProcessedInt()
+            | ProcessedTime()
+            | ProcessedUri()
+            | ProcessedSimpleText()
+        ):
+            literal_info = RDF_LITERAL_PROP_TYPE_MAPPER[type(val)]
+            node = _make_base_value(val, literal_info)
+            node[str(literal_info.knora_prop)] = _make_literal(val.value, literal_info.xsd_type)
+        case ProcessedList():
+            node = _make_base_value(val, LIST_PROP_TYPE_INFO)
+            node[str(LIST_PROP_TYPE_INFO.knora_prop)] = {"@id": val.value}
+        case ProcessedLink():
+            node = make_link_value_jsonld(val, str(resolve_id_to_iri(val.value, iri_lookups.id_to_iri)))
+        case ProcessedRegionPreview():
+            node = make_region_preview_value_jsonld(val, str(resolve_id_to_iri(val.value, iri_lookups.id_to_iri)))
+        case ProcessedRichtext():
+            node = make_richtext_value_jsonld(val, iri_lookups.id_to_iri)
+        case ProcessedDate():
+            node = _make_date_value(val)
+        case ProcessedInterval():
+            node = _make_optional_properties(val.permissions, val.comment, val.value_order)
+            node["@type"] = f"{KNORA_API_PREFIX}IntervalValue"
+            node[f"{KNORA_API_PREFIX}intervalValueHasStart"] = _make_literal(val.value.start, XSD.decimal)
+            node[f"{KNORA_API_PREFIX}intervalValueHasEnd"] = _make_literal(val.value.end, XSD.decimal)
+        case _:
+            raise UnreachableCodeError(f"Unknown value type: {type(val).__name__}")
+    return node
+
+
+def _make_base_value(val: ProcessedValue, prop_type_info: RDFPropTypeInfo) -> JsonLdNode:
+    node = _make_optional_properties(val.permissions, val.comment, val.value_order)
+    node["@type"] = str(prop_type_info.knora_type)
+    return node
+
+
+def _make_optional_properties(
+    permissions: Permissions | None,
+    comment: str | None,
+    value_order: int | None,
+) -> JsonLdNode:
+    node: JsonLdNode = {}
+    if permissions is not None:
+        node[f"{KNORA_API_PREFIX}hasPermissions"] = _make_literal(str(permissions), XSD.string)
+    if comment is not None:
+        node[f"{KNORA_API_PREFIX}valueHasComment"] = _make_literal(comment, XSD.string)
+    if value_order is not None:
+        node[f"{KNORA_API_PREFIX}valueHasOrder"] = _make_literal(value_order, XSD.integer)
+    return node
+
+
+def _make_date_value(val: ProcessedDate) -> JsonLdNode:
+    date = val.value
+    node = _make_optional_properties(val.permissions, val.comment, val.value_order)
+    node["@type"] = f"{KNORA_API_PREFIX}DateValue"
+    if cal := date.calendar:
+        node[f"{KNORA_API_PREFIX}dateValueHasCalendar"] = _make_literal(cal.value, XSD.string)
+    node.update(_make_single_date(date.start, StartEnd.START))
+    if date.end:
+        node.update(_make_single_date(date.end, StartEnd.END))
+    return node
+
+
+def _make_single_date(date: SingleDate, start_end: StartEnd) -> JsonLdNode:
+    def get_prop(precision: DayMonthYearEra) -> str:
+        return f"{KNORA_API_PREFIX}dateValueHas{start_end.value}{precision.value}"
+
+    node: JsonLdNode = {}
+    if yr := date.year:
+        node[get_prop(DayMonthYearEra.YEAR)] = _make_literal(yr, XSD.integer)
+    if mnt := date.month:
+        node[get_prop(DayMonthYearEra.MONTH)] = _make_literal(mnt, XSD.integer)
+    if day := date.day:
+        node[get_prop(DayMonthYearEra.DAY)] = _make_literal(day, XSD.integer)
+    if era := date.era:
+        node[get_prop(DayMonthYearEra.ERA)] = _make_literal(era.value, XSD.string)
+    return node
+
+
+def _make_file_value(file_value: AbstractFileValue) -> JsonLdNode:
+    metadata = file_value.metadata
+    node: JsonLdNode = {
+        "@type": str(file_value.prop_type_info.knora_type),
+        f"{KNORA_API_PREFIX}hasLicense": {"@id": metadata.license_iri},
+        f"{KNORA_API_PREFIX}hasCopyrightHolder": _make_literal(metadata.copyright_holder, XSD.string),
+        str(file_value.prop_to_filename): _make_literal(file_value.value, XSD.string),
+    }
+    for auth in metadata.authorships:
+        _add_object(node, f"{KNORA_API_PREFIX}hasAuthorship", _make_literal(auth, XSD.string))
+    if metadata.permissions:
+        node[f"{KNORA_API_PREFIX}hasPermissions"] = _make_literal(metadata.permissions, XSD.string)
+    return node
+
+
+def _make_literal(value: str | bool | int | float, datatype: URIRef | None) -> JsonLdNode:
+    if datatype is None:
+        return {"@value": str(value)}
+    if datatype in NATIVE_JSON_DATATYPES:
+        return {"@type": str(datatype), "@value": value}
+    return {"@type": str(datatype), "@value": str(value)}
+
+
+def _add_object(node: JsonLdNode, prop: str, obj: JsonLdNode) -> None:
+    # In RDF, the same literal or IRI can only be the object of a property once,
+    # whereas every value is a node of its own, even if it has the same content as another one.
+    is_term = "@value" in obj or obj.keys() == {"@id"}
+    match node.get(prop):
+        case None:
+            node[prop] = obj
+        case list() as objects:
+            if not (is_term and obj in objects):
+                objects.append(obj)
+        case existing:
+            if not (is_term and obj == existing):
+                node[prop] = [existing, obj]
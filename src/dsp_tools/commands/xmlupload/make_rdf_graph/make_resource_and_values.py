@@ -69,7 +69,7 @@ def _make_values_graph_from_resource(
     properties_graph = make_values(resource.values, res_node, lookups)
 
     if file_found := resource.file_value:
-        abstract_value = _get_abstract_file_value(file_found, bitstream_information)
+        abstract_value = get_abstract_file_value(file_found, bitstream_information)
         properties_graph += make_abstract_file_value_graph(
             file_value=abstract_value,
             res_node=res_node,
@@ -77,7 +77,7 @@ def _make_values_graph_from_resource(
     return properties_graph
 
 
-def _get_abstract_file_value(
+def get_abstract_file_value(
     file_val: ProcessedFileValue, bitstream_information: BitstreamInfo | None
 ) -> AbstractFileValue:
     metadata = _make_file_value_metadata(file_val.metadata)
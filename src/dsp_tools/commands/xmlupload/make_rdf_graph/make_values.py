@@ -96,7 +96,7 @@ def _make_one_value_graph(val: ProcessedValue, res_node: BNode | URIRef, iri_loo
         case ProcessedList():
             properties_graph = _make_list_value_graph(val=val, res_node=res_node, prop_type_info=LIST_PROP_TYPE_INFO)
         case ProcessedLink():
-            target_iri = _resolve_id_to_iri(val.value, iri_lookups.id_to_iri)
+            target_iri = resolve_id_to_iri(val.value, iri_lookups.id_to_iri)
             properties_graph = make_link_value_graph(
                 val=val,
                 val_node=BNode(),
@@ -104,7 +104,7 @@ def _make_one_value_graph(val: ProcessedValue, res_node: BNode | URIRef, iri_loo
                 target_iri=URIRef(target_iri),
             )
         case ProcessedRegionPreview():
-            target_iri = _resolve_id_to_iri(val.value, iri_lookups.id_to_iri)
+            target_iri = resolve_id_to_iri(val.value, iri_lookups.id_to_iri)
             properties_graph = make_region_preview_value_graph(
                 val=val,
                 val_node=BNode(),
@@ -208,7 +208,7 @@ def make_region_preview_value_graph(
     return g
 
 
-def _resolve_id_to_iri(value: str, iri_resolver: IriResolver) -> URIRef:
+def resolve_id_to_iri(value: str, iri_resolver: IriResolver) -> URIRef:
     if is_resource_iri(value):
         return URIRef(value)
     elif resolved_iri := iri_resolver.get(value):
@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+import threading
+from collections.abc import Iterable
+from concurrent.futures import CancelledError
+from concurrent.futures import Future
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from dataclasses import field
+from pathlib import Path
+
+from dsp_tools.utils.file_utils import append_json_line
+from dsp_tools.utils.file_utils import hash_file
+from dsp_tools.utils.file_utils import read_json_lines
+
+INGESTED_FILES_FILENAME = "ingested_files.jsonl"
+FILE_HASHES_FILENAME = "file_hashes.jsonl"
+
+HASHING_WORKERS = 4
+
+# (resolved path, size, modification time): a file is only hashed again if one of them changes
+type _FileKey = tuple[str, int, int]
+
+
+@dataclass
+class MediaCache:
+    """
+    Persistent record of the files that were ingested on a DSP server, identified by the hash of their content,
+    so that an identical file does not have to be uploaded again to the same project on the same server.
+
+    Both the ingested files and the hashes of the local files are kept in append-only files
+    with one JSON record per line.
+    A record that is lost if the machine crashes only means that a file is hashed or ingested again.
+    The hashes are computed on a pool of worker threads, ahead of the upload of the files.
+    """
+
+    directory: Path = field(default_factory=lambda: Path.home() / ".dsp-tools" / "media-cache")
+    num_of_workers: int = HASHING_WORKERS
+    _internal_filenames: dict[tuple[str, str, str], str] = field(init=False, default_factory=dict)
+    _hashes: dict[_FileKey, str] = field(init=False, default_factory=dict)
+    _pending_hashes: dict[_FileKey, Future[str]] = field(init=False, default_factory=dict)
+    _executor: ThreadPoolExecutor | None = field(init=False, default=None)
+    _lock: threading.Lock = field(init=False, default_factory=threading.Lock)
+
+    def __post_init__(self) -> None:
+        self.directory.mkdir(parents=True, exist_ok=True)
+        for rec in read_json_lines(self.directory / INGESTED_FILES_FILENAME):
+            self._internal_filenames[rec["server"], rec["shortcode"], rec["sha256"]] = rec["internal_filename"]
+        for rec in read_json_lines(self.directory / FILE_HASHES_FILENAME):
+            self._hashes[rec["path"], rec["size"], rec["mtime_ns"]] = rec["sha256"]
+
+    def start_hashing(self, filepaths: Iterable[Path]) -> None:
+        """Compute the hashes of the given files in the background, unless they are already known."""
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.num_of_workers, thread_name_prefix="hashing")
+            for filepath in filepaths:
+                try:
+                    key = _get_file_key(filepath)
+                except OSError:
+                    continue  # the missing file is reported when it is uploaded
+                if key not in self._hashes and key not in self._pending_hashes:
+                    self._pending_hashes[key] = self._executor.submit(self._compute_hash, key)
+
+    def stop_hashing(self) -> None:
+        """Cancel the hashes that have not been started yet. They are computed when they are requested."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+            self._pending_hashes = {k: v for k, v in self._pending_hashes.items() if not v.cancel()}
+        if executor:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def get_hash(self, filepath: Path) -> str:
+        """Returns the SHA-256 hash of the content of the file, computing it if it is not known yet."""
+        key = _get_file_key(filepath)
+        with self._lock:
+            if known := self._hashes.get(key):
+                return known
+            pending = self._pending_hashes.get(key)
+        if pending:
+            try:
+                return pending.result()
+            except CancelledError:
+                pass
+        return self._compute_hash(key)
+
+    def get_internal_filename(self, server: str, shortcode: str, content_hash: str) -> str | None:
+        with self._lock:
+            return self._internal_filenames.get((server, shortcode, content_hash))
+
+    def add_internal_filename(self, server: str, shortcode: str, content_hash: str, internal_filename: str) -> None:
+        record = {
+            "server": server,
+            "shortcode": shortcode,
+            "sha256": content_hash,
+            "internal_filename": internal_filename,
+        }
+        with self._lock:
+            self._internal_filenames[server, shortcode, content_hash] = internal_filename
+            append_json_line(self.directory / INGESTED_FILES_FILENAME, record)
+
+    def _compute_hash(self, key: _FileKey) -> str:
+        content_hash = hash_file(Path(key[0]))
+        record = {"path": key[0], "size": key[1], "mtime_ns": key[2], "sha256": content_hash}
+        with self._lock:
+            self._hashes[key] = content_hash
+            self._pending_hashes.pop(key, None)
+            append_json_line(self.directory / FILE_HASHES_FILENAME, record)
+        return content_hash
+
+
+def _get_file_key(filepath: Path) -> _FileKey:
+    resolved = filepath.resolve()
+    stat = resolved.stat()
+    return str(resolved), stat.st_size, stat.st_mtime_ns
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from dataclasses import field
 
 from rdflib import URIRef
 
@@ -19,3 +20,5 @@ class XmlReferenceLookups:
 class IRILookups:
     project_iri: URIRef
     id_to_iri: IriResolver
+    # IRIs of the placeholder values of stashed texts, by their UUID, as returned when the resource was created
+    value_uuid_to_iri: dict[str, str] = field(default_factory=dict)
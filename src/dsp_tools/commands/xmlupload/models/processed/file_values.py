@@ -8,7 +8,7 @@ from dsp_tools.utils.rdf_constants import URN_DASCH_PLACEHOLDER
 from dsp_tools.utils.xml_parsing.models.parsed_resource import KnoraFileValueType
 
 
-@dataclass
+@dataclass(slots=True)
 class ProcessedFileMetadata:
     license_iri: str
     copyright_holder: str
@@ -16,31 +16,31 @@ class ProcessedFileMetadata:
     permissions: Permissions | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ProcessedFileValue:
     value: ProcessedFileValueValue
     value_type: KnoraFileValueType
     metadata: ProcessedFileMetadata
 
 
-@dataclass
+@dataclass(slots=True)
 class ProcessedFileValueValue(ABC):
     value: str
 
 
-@dataclass
+@dataclass(slots=True)
 class ProcessedFileBitstream(ProcessedFileValueValue):
     """Used for bitstream files, that require upload through ingest."""
 
     res_id: str
 
 
-@dataclass
+@dataclass(slots=True)
 class ProcessedFileIIIFUri(ProcessedFileValueValue):
     """Used for the IIIF-URI, that do not require separate upload."""
 
 
-@dataclass
+@dataclass(slots=True)
 class ProcessedFilePlaceholder(ProcessedFileValueValue):
     """Placeholder type"""
 
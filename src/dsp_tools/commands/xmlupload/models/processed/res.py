@@ -8,7 +8,7 @@ from dsp_tools.commands.xmlupload.models.processed.values import ProcessedValue
 from dsp_tools.legacy_models.datetimestamp import DateTimeStamp
 
 
-@dataclass
+@dataclass(slots=True)
 class ProcessedResource:
     res_id: str
     type_iri: str
@@ -20,7 +20,7 @@ class ProcessedResource:
     data_authorship: list[str] | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class MigrationMetadata:
     iri_str: str | None
     creation_date: DateTimeStamp | None
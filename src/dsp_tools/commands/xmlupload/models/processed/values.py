@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import sys
+from collections.abc import Set
 from dataclasses import dataclass
 from typing import Union
 
@@ -8,7 +10,7 @@ from dsp_tools.commands.xmlupload.models.permission import Permissions
 from dsp_tools.utils.data_formats.date_util import Date
 
 
-@dataclass
+@dataclass(slots=True)
 class IntervalFloats:
     start: float
     end: float
@@ -17,7 +19,7 @@ class IntervalFloats:
 type ProcessedValueTypes = Union[bool, str, float, int, FormattedTextValue, Date, IntervalFloats]
 
 
-@dataclass
+@dataclass(slots=True)
 class ProcessedValue:
     value: ProcessedValueTypes
     prop_iri: str
@@ -26,83 +28,83 @@ class ProcessedValue:
     value_order: int | None
 
 
-@dataclass
+@dataclass(slots=True)
 class ProcessedBoolean(ProcessedValue):
     value: bool
 
 
-@dataclass
+@dataclass(slots=True)
 class ProcessedColor(ProcessedValue):
     value: str
 
 
-@dataclass
+@dataclass(slots=True)
 class ProcessedDate(ProcessedValue):
     value: Date
 
 
-@dataclass
+@dataclass(slots=True)
 class ProcessedDecimal(ProcessedValue):
     value: float
 
 
-@dataclass
+@dataclass(slots=True)
 class ProcessedGeoname(ProcessedValue):
     value: str
 
 
-@dataclass
+@dataclass(slots=True)
 class ProcessedGeometry(ProcessedValue):
     value: str
 
 
-@dataclass
+@dataclass(slots=True)
 class ProcessedInt(ProcessedValue):
     value: int
 
 
-@dataclass
+@dataclass(slots=True)
 class ProcessedInterval(ProcessedValue):
     value: IntervalFloats
 
 
-@dataclass
+@dataclass(slots=True)
 class ProcessedLink(ProcessedValue):
     value: str
     value_uuid: str
 
     def __post_init__(self) -> None:
-        self.prop_iri = f"{self.prop_iri}Value"
+        self.prop_iri = sys.intern(f"{self.prop_iri}Value")
 
 
-@dataclass
+@dataclass(slots=True)
 class ProcessedList(ProcessedValue):
     value: str
 
 
-@dataclass
+@dataclass(slots=True)
 class ProcessedRegionPreview(ProcessedValue):
     value: str
     value_uuid: str
 
 
-@dataclass
+@dataclass(slots=True)
 class ProcessedSimpleText(ProcessedValue):
     value: str
 
 
-@dataclass
+@dataclass(slots=True)
 class ProcessedRichtext(ProcessedValue):
     value: FormattedTextValue
-    resource_references: set[str]
+    resource_references: Set[str]
     value_uuid: str
 
 
-@dataclass
+@dataclass(slots=True)
 class ProcessedTime(ProcessedValue):
     value: str
 
 
-@dataclass
+@dataclass(slots=True)
 class ProcessedUri(ProcessedValue):
     value: str
@@ -0,0 +1,152 @@
+from __future__ import annotations
+
+import json
+import os
+import threading
+from collections.abc import Iterator
+from dataclasses import dataclass
+from dataclasses import field
+from enum import StrEnum
+from pathlib import Path
+from typing import Any
+from typing import TextIO
+
+from loguru import logger
+
+from dsp_tools.commands.xmlupload.stash.stash_models import LinkValueStashItem
+from dsp_tools.commands.xmlupload.stash.stash_models import StandoffStashItem
+
+# Every record is handed to the operating system immediately, so that it survives if the process is killed.
+# Forcing it to the disk is more expensive, so it is only done every so many records.
+FSYNC_BATCH_SIZE = 100
+
+
+class JournalEvent(StrEnum):
+    """The kinds of progress that are recorded in the journal."""
+
+    RESOURCE_CREATED = "resource_created"
+    RESOURCE_FAILED = "resource_failed"
+    RESOURCE_SKIPPED = "resource_skipped"
+    RESOURCE_MOVED_TO_FRONT = "resource_moved_to_front"
+    STANDOFF_STASH_ITEM_APPLIED = "standoff_stash_item_applied"
+    LINK_VALUE_STASH_ITEM_APPLIED = "link_value_stash_item_applied"
+
+
+@dataclass
+class UploadJournal:
+    """
+    Append-only log of the progress of an xmlupload, with one JSON record per line.
+
+    Together with the snapshot of the upload state taken at the start of the upload,
+    it allows to resume an upload, even if the process was killed before it could save its state.
+    """
+
+    path: Path
+    fsync_batch_size: int = FSYNC_BATCH_SIZE
+    _file: TextIO | None = field(init=False, default=None, repr=False)
+    _unsynced_records: int = field(init=False, default=0, repr=False)
+    _lock: threading.Lock = field(init=False, default_factory=threading.Lock, repr=False)
+
+    def __getstate__(self) -> dict[str, Any]:
+        # the open file and the lock cannot be pickled: only the location of the journal is persisted
+        return {"path": self.path, "fsync_batch_size": self.fsync_batch_size}
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self.path = state["path"]
+        self.fsync_batch_size = state["fsync_batch_size"]
+        self._file = None
+        self._unsynced_records = 0
+        self._lock = threading.Lock()
+
+    def record_resource_created(self, res_id: str, iri: str) -> None:
+        """The resource was created in DSP."""
+        self._append({"event": JournalEvent.RESOURCE_CREATED, "res_id": res_id, "iri": iri})
+
+    def record_resource_failed(self, res_id: str) -> None:
+        """The resource could not be created, and will not be retried."""
+        self._append({"event": JournalEvent.RESOURCE_FAILED, "res_id": res_id})
+
+    def record_resource_skipped(self, res_id: str) -> None:
+        """The resource was removed from the pending resources without being uploaded."""
+        self._append({"event": JournalEvent.RESOURCE_SKIPPED, "res_id": res_id})
+
+    def record_resource_moved_to_front(self, res_id: str) -> None:
+        """The resource was moved to the front of the pending resources."""
+        self._append({"event": JournalEvent.RESOURCE_MOVED_TO_FRONT, "res_id": res_id})
+
+    def record_stash_item_applied(self, item: StandoffStashItem | LinkValueStashItem) -> None:
+        """The stashed value was applied to its resource in DSP."""
+        if isinstance(item, StandoffStashItem):
+            event = JournalEvent.STANDOFF_STASH_ITEM_APPLIED
+        else:
+            event = JournalEvent.LINK_VALUE_STASH_ITEM_APPLIED
+        self._append({"event": event, "res_id": item.res_id, "value_uuid": item.value.value_uuid})
+
+    def read_records(self) -> Iterator[dict[str, Any]]:
+        """
+        Yield the records of the journal in the order they were written.
+        A record that was only partially written (because the process was killed) is ignored.
+        """
+        if not self.path.is_file():
+            return
+        with open(self.path, encoding="utf-8") as file:
+            for line_number, line in enumerate(file, start=1):
+                try:
+                    yield json.loads(line)
+                except json.JSONDecodeError:
+                    logger.warning(f"Ignoring the incomplete record in line {line_number} of the journal {self.path}")
+                    continue
+
+    def flush(self) -> None:
+        """Force all records written so far to the disk."""
+        with self._lock:
+            self._sync()
+
+    def reset(self) -> None:
+        """Start an empty journal, e.g. because a full snapshot of the upload state has just been written."""
+        with self._lock:
+            self._close()
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self.path.write_text("", encoding="utf-8")
+
+    def delete(self) -> None:
+        """Remove the journal, e.g. because the upload is complete."""
+        with self._lock:
+            self._close()
+            self.path.unlink(missing_ok=True)
+
+    def _append(self, record: dict[str, Any]) -> None:
+        line = json.dumps(record, ensure_ascii=False) + "\n"
+        with self._lock:
+            if self._file is None:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                needs_line_break = _ends_with_partial_record(self.path)
+                self._file = open(self.path, "a", encoding="utf-8")
+                if needs_line_break:
+                    # a partially written record must not swallow the next one
+                    self._file.write("\n")
+            self._file.write(line)
+            self._file.flush()
+            self._unsynced_records += 1
+            if self._unsynced_records >= self.fsync_batch_size:
+                self._sync()
+
+    def _sync(self) -> None:
+        if self._file is not None and self._unsynced_records > 0:
+            self._file.flush()
+            os.fsync(self._file.fileno())
+        self._unsynced_records = 0
+
+    def _close(self) -> None:
+        if self._file is not None:
+            self._sync()
+            self._file.close()
+            self._file = None
+
+
+def _ends_with_partial_record(path: Path) -> bool:
+    if not path.is_file() or path.stat().st_size == 0:
+        return False
+    with open(path, "rb") as file:
+        file.seek(-1, os.SEEK_END)
+        return file.read(1) != b"\n"
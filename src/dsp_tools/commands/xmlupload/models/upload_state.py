@@ -3,6 +3,7 @@ from dataclasses import field
 
 from dsp_tools.commands.xmlupload.iri_resolver import IriResolver
 from dsp_tools.commands.xmlupload.models.processed.res import ProcessedResource
+from dsp_tools.commands.xmlupload.models.upload_journal import UploadJournal
 from dsp_tools.commands.xmlupload.stash.stash_models import Stash
 from dsp_tools.commands.xmlupload.upload_config import UploadConfig
 
@@ -18,3 +19,6 @@ class UploadState:
     config: UploadConfig
     failed_uploads: list[str] = field(default_factory=list)
     iri_resolver: IriResolver = field(default_factory=IriResolver)
+    journal: UploadJournal | None = field(default=None, compare=False)
+    # identifies the input of a new upload, so that the snapshot of its initial state can be reused
+    input_fingerprint: str | None = field(default=None, compare=False)
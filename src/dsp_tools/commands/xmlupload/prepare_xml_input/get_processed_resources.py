@@ -59,6 +59,9 @@ from dsp_tools.utils.xml_parsing.models.parsed_resource import ParsedMigrationMe
 from dsp_tools.utils.xml_parsing.models.parsed_resource import ParsedResource
 from dsp_tools.utils.xml_parsing.models.parsed_resource import ParsedValue
 
+# most texts do not reference other resources, and an empty set would take up more memory than the text itself
+_NO_RESOURCE_REFERENCES: frozenset[str] = frozenset()
+
 TYPE_TRANSFORMER_MAPPER: dict[KnoraValueType, TypeTransformerMapper] = {
     KnoraValueType.BOOLEAN_VALUE: TypeTransformerMapper(ProcessedBoolean, transform_boolean),
     KnoraValueType.COLOR_VALUE: TypeTransformerMapper(ProcessedColor, assert_is_string),
@@ -272,7 +275,7 @@ def _get_richtext_value(val: ParsedValue, lookups: XmlReferenceLookups) -> Proce
         comment=val.comment,
         permissions=permission_val,
         value_order=val.value_order,
-        resource_references=find_internal_ids(transformed_value.xmlstr),
+        resource_references=find_internal_ids(transformed_value.xmlstr) or _NO_RESOURCE_REFERENCES,
         value_uuid=str(uuid4()),
     )
     return richtext
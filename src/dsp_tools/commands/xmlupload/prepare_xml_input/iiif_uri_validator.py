@@ -1,39 +1,130 @@
+from __future__ import annotations
+
+import json
+import threading
+import time
+from collections import defaultdict
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from dataclasses import field
+from pathlib import Path
+from urllib.parse import urlparse
 
-import requests
+from loguru import logger
+from requests import Response
+from requests import Session
+from tqdm import tqdm
 
 from dsp_tools.commands.xmlupload.models.input_problems import IIIFUriProblem
 from dsp_tools.utils.data_formats.uri_util import is_iiif_uri
+from dsp_tools.utils.file_utils import write_atomically
+from dsp_tools.utils.http_session import make_session
+
+IIIF_VALIDATION_WORKERS = 32
+# IIIF-servers are often run by small institutions, which should not be flooded with requests
+MAX_REQUESTS_PER_HOST = 4
+CACHE_TTL_SECONDS = 24 * 60 * 60
+
+
+@dataclass
+class IIIFValidationCache:
+    """
+    The info.json URLs that were successfully checked, with the time of the check.
+    They are kept across runs, so that the same IIIF-URIs are not checked again before the TTL has expired.
+    Failed checks are not cached, so that they are repeated in the next run.
+    """
+
+    location: Path = field(default_factory=lambda: Path.home() / ".dsp-tools" / "iiif-validation-cache.json")
+    ttl_seconds: float = CACHE_TTL_SECONDS
+    _checked: dict[str, float] = field(init=False, default_factory=dict)
+    _lock: threading.Lock = field(init=False, default_factory=threading.Lock)
+
+    def __post_init__(self) -> None:
+        if not self.location.is_file():
+            return
+        try:
+            checked = json.loads(self.location.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError):
+            logger.warning(f"Ignoring the invalid IIIF validation cache {self.location}")
+            return
+        now = time.time()
+        self._checked = {url: ts for url, ts in checked.items() if now - ts < self.ttl_seconds}
+
+    def is_valid(self, info_json_uri: str) -> bool:
+        with self._lock:
+            checked = self._checked.get(info_json_uri)
+        return checked is not None and time.time() - checked < self.ttl_seconds
+
+    def add(self, info_json_uri: str) -> None:
+        with self._lock:
+            self._checked[info_json_uri] = time.time()
+
+    def save(self) -> None:
+        """Write the cache to its location, so that the next run can use it."""
+        with self._lock:
+            content = json.dumps(self._checked)
+        write_atomically(self.location, content)
 
 
 @dataclass(frozen=True)
 class IIIFUriValidator:
     """Client handling communication with external IIIF-servers to do a health check."""
 
-    def validate_one_uri(self, uri: str) -> IIIFUriProblem | None:
-        """Check if the IIIF-server is reachable. If not, it returns information for error message."""
-        regex_has_passed = is_iiif_uri(uri)
-        response = self._make_network_call(uri)
-        if isinstance(response, Exception):
-            return IIIFUriProblem(
-                uri=uri,
-                regex_has_passed=regex_has_passed,
-                raised_exception_name=response.__class__.__name__,
-            )
-        match response.ok, regex_has_passed:
-            case True, True:
-                return None
-            case _:
-                return IIIFUriProblem(
-                    uri=uri,
-                    regex_has_passed=regex_has_passed,
-                    status_code=response.status_code,
-                )
-
-    def _make_network_call(self, uri: str) -> requests.Response | Exception:
-        info_json_uri = self._make_info_json_uri(uri)
+    cache: IIIFValidationCache | None = None
+    num_of_workers: int = IIIF_VALIDATION_WORKERS
+    max_requests_per_host: int = MAX_REQUESTS_PER_HOST
+    _session: Session = field(init=False, default_factory=make_session)
+
+    def validate_uris(self, uris: Iterable[str], progress_desc: str | None = None) -> list[IIIFUriProblem]:
+        """
+        Check the IIIF-URIs concurrently.
+
+        URIs that point to the same image share one request to its info.json,
+        at most `max_requests_per_host` requests are sent to the same server at the same time,
+        and images that were successfully checked in a recent run (according to the cache) are not checked again.
+
+        Args:
+            uris: the IIIF-URIs to check
+            progress_desc: if given, a progress bar with this description is shown
+
+        Returns:
+            the problems of the URIs that did not pass the check (one per distinct URI)
+        """
+        uris_by_target: defaultdict[str, list[str]] = defaultdict(list)
+        for uri in dict.fromkeys(uris):
+            uris_by_target[self._make_info_json_uri(uri)].append(uri)
+        to_check = [x for x in uris_by_target if not (self.cache and self.cache.is_valid(x))]
+        logger.debug(f"Checking {len(to_check)} of {len(uris_by_target)} info.json URLs (the rest is cached)")
+        host_limits = {urlparse(x).netloc: threading.BoundedSemaphore(self.max_requests_per_host) for x in to_check}
+
+        def check(info_json_uri: str) -> _CheckResult:
+            with host_limits[urlparse(info_json_uri).netloc]:
+                return _CheckResult.from_response(self._make_network_call_to_info_json(info_json_uri))
+
+        with ThreadPoolExecutor(max_workers=self.num_of_workers, thread_name_prefix="iiif") as executor:
+            results: Iterable[_CheckResult] = executor.map(check, to_check)
+            if progress_desc:
+                results = tqdm(results, total=len(to_check), desc=progress_desc, dynamic_ncols=True)
+            result_by_target = dict(zip(to_check, results))
+
+        problems: list[IIIFUriProblem] = []
+        for target, target_uris in uris_by_target.items():
+            # targets that are not checked are cached as valid, their timestamp must not be renewed
+            if (checked_result := result_by_target.get(target)) is None:
+                result = _CheckResult(ok=True)
+            else:
+                result = checked_result
+                if result.ok and self.cache:
+                    self.cache.add(target)
+            problems.extend(x for uri in target_uris if (x := _to_problem(uri, result)))
+        if self.cache:
+            self.cache.save()
+        return problems
+
+    def _make_network_call_to_info_json(self, info_json_uri: str) -> Response | Exception:
         try:
-            return requests.get(
+            return self._session.get(
                 url=info_json_uri,
                 headers={"Content-Type": "application/ld+json"},
                 timeout=10,
@@ -48,3 +139,30 @@ class IIIFUriValidator:
         else:
             info_uri = "/".join(splt[:-4])
         return f"{info_uri}/info.json"
+
+
+@dataclass(frozen=True)
+class _CheckResult:
+    """Outcome of a request to an info.json (without its content, which is not needed)."""
+
+    ok: bool
+    status_code: int | None = None
+    raised_exception_name: str | None = None
+
+    @staticmethod
+    def from_response(response: Response | Exception) -> _CheckResult:
+        if isinstance(response, Exception):
+            return _CheckResult(ok=False, raised_exception_name=response.__class__.__name__)
+        return _CheckResult(ok=response.ok, status_code=response.status_code)
+
+
+def _to_problem(uri: str, result: _CheckResult) -> IIIFUriProblem | None:
+    regex_has_passed = is_iiif_uri(uri)
+    if result.ok and regex_has_passed:
+        return None
+    return IIIFUriProblem(
+        uri=uri,
+        regex_has_passed=regex_has_passed,
+        status_code=result.status_code,
+        raised_exception_name=result.raised_exception_name,
+    )
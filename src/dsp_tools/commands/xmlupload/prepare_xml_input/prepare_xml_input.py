@@ -35,12 +35,12 @@ def get_parsed_resources_and_mappers(
     sp = get_default_spinner("Parsing XML file for upload.")
     with sp:
         parsed_resources = get_parsed_resources(root, clients.legal_info_client.server)
-        processed_lookups = _get_xml_reference_lookups(root=root, clients=clients)
+        processed_lookups = get_xml_reference_lookups(root=root, clients=clients)
         sp.ok("✔")
         return parsed_resources, processed_lookups
 
 
-def _get_xml_reference_lookups(root: etree._Element, clients: UploadClients) -> XmlReferenceLookups:
+def get_xml_reference_lookups(root: etree._Element, clients: UploadClients) -> XmlReferenceLookups:
     con = ConnectionLive(clients.legal_info_client.server, clients.legal_info_client.auth)
     proj_context = _get_project_context_from_server(connection=con, shortcode=root.attrib["shortcode"])
     permissions_lookup = get_permissions_lookup(root, proj_context)
@@ -4,57 +4,57 @@ import warnings
 from pathlib import Path
 
 from loguru import logger
-from lxml import etree
-from tqdm import tqdm
 
 from dsp_tools.commands.xmlupload.exceptions import MultimediaFileNotFound
 from dsp_tools.commands.xmlupload.models.input_problems import AllIIIFUriProblems
 from dsp_tools.commands.xmlupload.models.input_problems import MultimediaFileNotFoundProblem
 from dsp_tools.commands.xmlupload.prepare_xml_input.iiif_uri_validator import IIIFUriValidator
+from dsp_tools.commands.xmlupload.prepare_xml_input.iiif_uri_validator import IIIFValidationCache
 from dsp_tools.error.custom_warnings import DspToolsUserWarning
-
-
-def validate_iiif_uris(root: etree._Element) -> None:
-    uris = [uri.strip() for node in root.iter(tag="iiif-uri") if (uri := node.text)]
-    if (num := len(uris)) > 1001:
-        warnings.warn(
-            DspToolsUserWarning(
-                f"Your data contains {num} IIIF-URIs. "
-                f"Each validation makes a server call. "
-                f"Due to the large number, the validation of the IIIF-URIs has to be skipped."
-            )
-        )
+from dsp_tools.utils.file_check import find_missing_files
+from dsp_tools.utils.xml_parsing.models.parsed_resource import ParsedFileBitstream
+from dsp_tools.utils.xml_parsing.models.parsed_resource import ParsedFileIiifUri
+from dsp_tools.utils.xml_parsing.models.parsed_resource import ParsedResource
+
+
+def validate_iiif_uris(parsed_resources: list[ParsedResource]) -> None:
+    uris = [
+        uri
+        for res in parsed_resources
+        if res.file_value
+        and isinstance(res.file_value.value, ParsedFileIiifUri)
+        and (uri := res.file_value.value.value)
+    ]
+    if not uris:
         return
-    progress_bar = tqdm(uris, desc="Checking IIIF-URIs", dynamic_ncols=True)
-    validator = IIIFUriValidator()
-    problems = []
-    for uri in progress_bar:
-        if result := validator.validate_one_uri(uri):
-            problems.append(result)
-    if problems:
+    validator = IIIFUriValidator(cache=IIIFValidationCache())
+    if problems := validator.validate_uris(uris, progress_desc="Checking IIIF-URIs"):
         msg = AllIIIFUriProblems(problems).get_msg()
         warnings.warn(DspToolsUserWarning(msg))
         logger.warning(msg)
 
 
-def check_if_bitstreams_exist(root: etree._Element, imgdir: Path) -> None:
+def check_if_bitstreams_exist(parsed_resources: list[ParsedResource], imgdir: Path) -> None:
     """
     Make sure that all bitstreams referenced in the XML file exist in the imgdir.
 
     Args:
-        root: parsed XML file
+        parsed_resources: resources of the XML file
         imgdir: path to the folder where the bitstreams are stored
 
     Raises:
         InputError: if a bitstream does not exist in the imgdir
     """
     logger.debug("Checking if filepaths exist.")
-    multimedia_resources = [x for x in root if any(y.tag == "bitstream" and not len(y) for y in x.iter())]
-    progress_bar = tqdm(multimedia_resources, desc="Checking multimedia filepaths", dynamic_ncols=True)
-    all_problems = []
-    for res in progress_bar:
-        pth = next(Path(x.text.strip()) for x in res.iter() if x.tag == "bitstream" and x.text and x.text.strip())
-        if not Path(imgdir / pth).is_file():
-            all_problems.append(MultimediaFileNotFoundProblem(res.attrib["id"], str(pth)))
+    # a bitstream with a placeholder instead of a filepath has no file
+    res_id_to_path = {
+        res.res_id: Path(filepath)
+        for res in parsed_resources
+        if res.file_value
+        and isinstance(res.file_value.value, ParsedFileBitstream)
+        and (filepath := res.file_value.value.value)
+    }
+    missing = find_missing_files(set(res_id_to_path.values()), imgdir, progress_desc="Checking multimedia filepaths")
+    all_problems = [MultimediaFileNotFoundProblem(k, str(v)) for k, v in res_id_to_path.items() if v in missing]
     if all_problems:
         raise MultimediaFileNotFound(str(imgdir), all_problems)
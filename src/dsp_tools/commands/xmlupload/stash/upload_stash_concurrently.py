@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+from collections.abc import Callable
+from concurrent.futures import Future
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import as_completed
+
+from tqdm import tqdm
+
+from dsp_tools.commands.xmlupload.models.upload_state import UploadState
+from dsp_tools.commands.xmlupload.stash.stash_models import LinkValueStashItem
+from dsp_tools.commands.xmlupload.stash.stash_models import StandoffStashItem
+
+
+def upload_stash_concurrently[T: (StandoffStashItem, LinkValueStashItem)](
+    res_2_stash_items: dict[str, list[T]],
+    upload_items_of_resource: Callable[[str, list[T]], list[T]],
+    upload_state: UploadState,
+    desc: str,
+) -> None:
+    """
+    Apply the stashed values of several resources at the same time.
+
+    The stashed values of one resource are applied one after the other, by the same worker thread.
+    The worker threads only talk to the server;
+    the applied values are removed from the stash (and recorded in the journal) on the calling thread,
+    so that the stash is consistent whenever the upload is interrupted.
+    Resources that could not be created are skipped: their stashed values remain in the stash.
+
+    Args:
+        res_2_stash_items: the stashed values, organized by resource
+        upload_items_of_resource: applies the given stashed values of a resource (identified by its IRI),
+            and returns the ones that were applied successfully
+        upload_state: the current state of the upload
+        desc: description of the progress bar
+    """
+    to_upload = {res_id: res_iri for res_id in res_2_stash_items if (res_iri := upload_state.iri_resolver.get(res_id))}
+    progress_bar = tqdm(total=len(to_upload), desc=desc, dynamic_ncols=True)
+    executor = ThreadPoolExecutor(max_workers=upload_state.config.num_of_workers, thread_name_prefix="stash")
+    pending: dict[Future[list[T]], str] = {
+        executor.submit(upload_items_of_resource, res_iri, res_2_stash_items[res_id].copy()): res_id
+        for res_id, res_iri in to_upload.items()
+    }
+    try:
+        for future in as_completed(pending):
+            res_id = pending.pop(future)
+            _remove_applied_items(res_2_stash_items, res_id, future.result(), upload_state)
+            progress_bar.update(1)
+    finally:
+        # If the upload is interrupted, the resources that are being worked on are finished,
+        # so that their applied values are removed from the stash.
+        executor.shutdown(wait=True, cancel_futures=True)
+        for future, res_id in pending.items():
+            if not future.cancelled() and future.exception() is None:
+                _remove_applied_items(res_2_stash_items, res_id, future.result(), upload_state)
+        progress_bar.close()
+
+
+def _remove_applied_items[T: (StandoffStashItem, LinkValueStashItem)](
+    res_2_stash_items: dict[str, list[T]], res_id: str, applied: list[T], upload_state: UploadState
+) -> None:
+    for stash_item in applied:
+        res_2_stash_items[res_id].remove(stash_item)
+        if upload_state.journal:
+            upload_state.journal.record_stash_item_applied(stash_item)
+    if not res_2_stash_items[res_id]:
+        del res_2_stash_items[res_id]
@@ -1,25 +1,26 @@
 from __future__ import annotations
 
 from datetime import datetime
+from functools import partial
+from typing import Any
 from typing import cast
 
 from loguru import logger
-from rdflib import RDF
-from rdflib import BNode
-from rdflib import Graph
-from rdflib import URIRef
-from tqdm import tqdm
 
 from dsp_tools.clients.value_client import ValueClient
-from dsp_tools.commands.xmlupload.make_rdf_graph.jsonld_utils import serialise_jsonld_for_value
-from dsp_tools.commands.xmlupload.make_rdf_graph.make_values import make_link_value_graph
-from dsp_tools.commands.xmlupload.make_rdf_graph.make_values import make_region_preview_value_graph
+from dsp_tools.commands.xmlupload.iri_resolver import IriResolver
+from dsp_tools.commands.xmlupload.make_rdf_graph.make_jsonld import make_link_value_jsonld
+from dsp_tools.commands.xmlupload.make_rdf_graph.make_jsonld import make_region_preview_value_jsonld
+from dsp_tools.commands.xmlupload.make_rdf_graph.make_jsonld import make_value_jsonld
 from dsp_tools.commands.xmlupload.models.processed.values import ProcessedRegionPreview
 from dsp_tools.commands.xmlupload.models.upload_state import UploadState
 from dsp_tools.commands.xmlupload.stash.stash_models import LinkValueStash
 from dsp_tools.commands.xmlupload.stash.stash_models import LinkValueStashItem
 from dsp_tools.commands.xmlupload.stash.stash_models import Stash
+from dsp_tools.commands.xmlupload.stash.upload_stash_concurrently import upload_stash_concurrently
 from dsp_tools.utils.exceptions import DspToolsRequestException
+from dsp_tools.utils.rate_control import get_rate_controller
+from dsp_tools.utils.request_utils import should_retry_request
 
 
 def upload_stashed_resptr_props(
@@ -37,27 +38,32 @@ def upload_stashed_resptr_props(
     logger.info("Upload the stashed links...")
     upload_state.pending_stash = cast(Stash, upload_state.pending_stash)
     link_value_stash = cast(LinkValueStash, upload_state.pending_stash.link_value_stash)
-    progress_bar = tqdm(
-        link_value_stash.res_2_stash_items.copy().items(), desc="Upload the stashed links", dynamic_ncols=True
+    upload_stash_concurrently(
+        res_2_stash_items=link_value_stash.res_2_stash_items,
+        upload_items_of_resource=partial(
+            _upload_stash_items_of_resource, iri_resolver=upload_state.iri_resolver, val_client=val_client
+        ),
+        upload_state=upload_state,
+        desc="Upload the stashed links",
     )
-    for res_id, stash_items in progress_bar:
-        res_iri = upload_state.iri_resolver.get(res_id)
-        if not res_iri:
-            # resource could not be uploaded to DSP, so the stash cannot be uploaded either
-            # no action necessary: this resource will remain in nonapplied_resptr_props,
-            # which will be handled by the caller
+
+
+def _upload_stash_items_of_resource(
+    res_iri: str,
+    stash_items: list[LinkValueStashItem],
+    iri_resolver: IriResolver,
+    val_client: ValueClient,
+) -> list[LinkValueStashItem]:
+    logger.info(f"  Upload resptrs of resource '{stash_items[0].res_id}'...")
+    applied = []
+    for stash_item in stash_items:
+        target_iri = iri_resolver.get(stash_item.value.value)
+        if not target_iri:
+            # no action necessary: this stash item will remain in the stash, which will be handled by the caller
             continue
-        logger.info(f"  Upload resptrs of resource '{res_id}'...")
-        for stash_item in reversed(stash_items):
-            # reversed avoids any problems caused by removing from the list we loop over at the same time
-            target_iri = upload_state.iri_resolver.get(stash_item.value.value)
-            if not target_iri:
-                continue
-            if _upload_stash_item(stash_item, res_iri, target_iri, val_client):
-                link_value_stash.res_2_stash_items[res_id].remove(stash_item)
-        # remove res_id if all stash items were uploaded
-        if not link_value_stash.res_2_stash_items[res_id]:
-            del link_value_stash.res_2_stash_items[res_id]
+        if _upload_stash_item(stash_item, res_iri, target_iri, val_client):
+            applied.append(stash_item)
+    return applied
 
 
 def _upload_stash_item(
@@ -78,13 +84,16 @@ def _upload_stash_item(
     Returns:
         True, if the upload was successful, False otherwise
     """
-    graph = _make_link_value_create_graph(stash, res_iri, target_iri)
-    payload = serialise_jsonld_for_value(graph, res_iri)
-    try:
-        upload_problem = val_client.post_new_value(payload)
-    except DspToolsRequestException as err:
-        _log_unable_to_upload_link_value(err.message, stash.res_id, stash.value.prop_iri)
-        return False
+    payload = _make_link_value_create_payload(stash, res_iri, target_iri)
+    with get_rate_controller().request_slot() as slot:
+        try:
+            upload_problem = val_client.post_new_value(payload)
+        except DspToolsRequestException as err:
+            slot.record_error()
+            _log_unable_to_upload_link_value(err.message, stash.res_id, stash.value.prop_iri)
+            return False
+        if upload_problem and should_retry_request(upload_problem):
+            slot.record_error()
     if upload_problem:
         _log_unable_to_upload_link_value(upload_problem.text, stash.res_id, stash.value.prop_iri)
         return False
@@ -92,20 +101,17 @@ def _upload_stash_item(
     return True
 
 
-def _make_link_value_create_graph(
+def _make_link_value_create_payload(
     stash: LinkValueStashItem,
-    res_iri_str: str,
+    res_iri: str,
     target_iri: str,
-) -> Graph:
+) -> dict[str, Any]:
     """This function creates a JSON object that can be sent as an update request to the DSP-API."""
-    val_bn = BNode()
-    res_iri = URIRef(res_iri_str)
     if isinstance(stash.value, ProcessedRegionPreview):
-        graph = make_region_preview_value_graph(stash.value, val_bn, res_iri, URIRef(target_iri))
+        value = make_region_preview_value_jsonld(stash.value, target_iri)
     else:
-        graph = make_link_value_graph(stash.value, val_bn, res_iri, URIRef(target_iri))
-    graph.add((res_iri, RDF.type, URIRef(stash.res_type)))
-    return graph
+        value = make_link_value_jsonld(stash.value, target_iri)
+    return make_value_jsonld(res_iri, stash.res_type, stash.value.prop_iri, value)
 
 
 def _log_unable_to_upload_link_value(msg: str, res_id: str, prop_name: str) -> None:
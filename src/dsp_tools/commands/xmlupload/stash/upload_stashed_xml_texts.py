@@ -1,30 +1,35 @@
 from __future__ import annotations
 
 from datetime import datetime
+from functools import partial
 from typing import Any
 from typing import cast
 
 from loguru import logger
-from rdflib import RDF
-from rdflib import Graph
-from rdflib import URIRef
-from tqdm import tqdm
 
 from dsp_tools.clients.resource_client import ResourceClient
 from dsp_tools.clients.value_client import ValueClient
 from dsp_tools.commands.xmlupload.iri_resolver import IriResolver
-from dsp_tools.commands.xmlupload.make_rdf_graph.jsonld_utils import serialise_jsonld_for_value
-from dsp_tools.commands.xmlupload.make_rdf_graph.make_values import make_richtext_value_graph
+from dsp_tools.commands.xmlupload.make_rdf_graph.make_jsonld import make_richtext_value_jsonld
+from dsp_tools.commands.xmlupload.make_rdf_graph.make_jsonld import make_value_jsonld
+from dsp_tools.commands.xmlupload.models.processed.res import ProcessedResource
+from dsp_tools.commands.xmlupload.models.processed.values import ProcessedRichtext
 from dsp_tools.commands.xmlupload.models.upload_state import UploadState
 from dsp_tools.commands.xmlupload.stash.stash_models import StandoffStash
 from dsp_tools.commands.xmlupload.stash.stash_models import StandoffStashItem
 from dsp_tools.commands.xmlupload.stash.stash_models import Stash
+from dsp_tools.commands.xmlupload.stash.upload_stash_concurrently import upload_stash_concurrently
 from dsp_tools.utils.exceptions import DspToolsRequestException
+from dsp_tools.utils.rate_control import get_rate_controller
 from dsp_tools.utils.request_utils import ResponseCodeAndText
+from dsp_tools.utils.request_utils import should_retry_request
 
 
 def upload_stashed_xml_texts(
-    upload_state: UploadState, val_client: ValueClient, resource_client: ResourceClient
+    upload_state: UploadState,
+    val_client: ValueClient,
+    resource_client: ResourceClient,
+    value_uuid_to_iri: dict[str, str],
 ) -> None:
     """
     After all resources are uploaded, the stashed xml texts must be applied to their resources in DSP.
@@ -34,48 +39,88 @@ def upload_stashed_xml_texts(
         upload_state: the current state of the upload
         val_client: value Client
         resource_client: Resource Client
+        value_uuid_to_iri: IRIs of the placeholder values that are known from the creation of the resources;
+            the resources with other stashed texts are retrieved from DSP to find them
     """
     logger.info("Upload the stashed XML texts...")
     upload_state.pending_stash = cast(Stash, upload_state.pending_stash)
     standoff_stash = cast(StandoffStash, upload_state.pending_stash.standoff_stash)
-
-    progress_bar = tqdm(
-        standoff_stash.res_2_stash_items.copy().items(), desc="Upload stashed XML texts", dynamic_ncols=True
+    upload_stash_concurrently(
+        res_2_stash_items=standoff_stash.res_2_stash_items,
+        upload_items_of_resource=partial(
+            _upload_stash_items_of_resource,
+            iri_resolver=upload_state.iri_resolver,
+            val_client=val_client,
+            resource_client=resource_client,
+            value_uuid_to_iri=value_uuid_to_iri,
+        ),
+        upload_state=upload_state,
+        desc="Upload stashed XML texts",
     )
-    for res_id, stash_items in progress_bar:
-        res_iri = upload_state.iri_resolver.get(res_id)
-        if not res_iri:
-            # resource could not be uploaded to DSP, so the stash cannot be uploaded either
-            # no action necessary: this resource will remain in the list of not uploaded stash items,
-            # which will be handled by the caller
-            continue
 
+
+def get_value_iris_of_stashed_texts(resource: ProcessedResource, created_resource: dict[str, Any]) -> dict[str, str]:
+    """
+    Returns the IRIs of the placeholder values of the stashed texts of a resource, by their UUID,
+    as far as they are contained in the response to the creation of the resource.
+    """
+    value_iris = {}
+    for val in resource.values:
+        # the text of a stashed value was replaced by its UUID
+        if isinstance(val, ProcessedRichtext) and val.value.xmlstr == val.value_uuid:
+            if value_iri := _get_value_iri(val.prop_iri, created_resource, val.value_uuid):
+                value_iris[val.value_uuid] = value_iri
+    return value_iris
+
+
+def _upload_stash_items_of_resource(
+    res_iri: str,
+    stash_items: list[StandoffStashItem],
+    iri_resolver: IriResolver,
+    val_client: ValueClient,
+    resource_client: ResourceClient,
+    value_uuid_to_iri: dict[str, str],
+) -> list[StandoffStashItem]:
+    res_id = stash_items[0].res_id
+    value_iris = {x.value.value_uuid: iri for x in stash_items if (iri := value_uuid_to_iri.get(x.value.value_uuid))}
+    if unknown := [x for x in stash_items if x.value.value_uuid not in value_iris]:
+        if resource_in_triplestore := _retrieve_resource(res_id, res_iri, resource_client):
+            for stash_item in unknown:
+                value = stash_item.value
+                if value_iri := _get_value_iri(value.prop_iri, resource_in_triplestore, value.value_uuid):
+                    value_iris[value.value_uuid] = value_iri
+
+    logger.info(f"  Upload XML text(s) of resource '{res_id}'...")
+    applied = []
+    for stash_item in stash_items:
+        value_iri = value_iris.get(stash_item.value.value_uuid)
+        if not value_iri:
+            continue
+        if _upload_stash_item(
+            stash_item=stash_item,
+            res_iri=res_iri,
+            value_iri=value_iri,
+            iri_resolver=iri_resolver,
+            val_client=val_client,
+        ):
+            applied.append(stash_item)
+    return applied
+
+
+def _retrieve_resource(res_id: str, res_iri: str, resource_client: ResourceClient) -> dict[str, Any] | None:
+    with get_rate_controller().request_slot() as slot:
         try:
             request_result = resource_client.get_resource(res_iri)
-            if isinstance(request_result, ResponseCodeAndText):
-                _log_unable_to_retrieve_resource(resource=res_id, msg=request_result.text)
-                continue
-            else:
-                resource_in_triplestore = request_result
         except DspToolsRequestException as err:
+            slot.record_error()
             _log_unable_to_retrieve_resource(resource=res_id, msg=err.message)
-            continue
-
-        logger.info(f"  Upload XML text(s) of resource '{res_id}'...")
-        for stash_item in stash_items:
-            value_iri = _get_value_iri(stash_item.value.prop_iri, resource_in_triplestore, stash_item.value.value_uuid)
-            if not value_iri:
-                continue
-            if _upload_stash_item(
-                stash_item=stash_item,
-                res_iri=res_iri,
-                value_iri=value_iri,
-                iri_resolver=upload_state.iri_resolver,
-                val_client=val_client,
-            ):
-                standoff_stash.res_2_stash_items[res_id].remove(stash_item)
-        if not standoff_stash.res_2_stash_items[res_id]:
-            standoff_stash.res_2_stash_items.pop(res_id)
+            return None
+        if isinstance(request_result, ResponseCodeAndText) and should_retry_request(request_result):
+            slot.record_error()
+    if isinstance(request_result, ResponseCodeAndText):
+        _log_unable_to_retrieve_resource(resource=res_id, msg=request_result.text)
+        return None
+    return request_result
 
 
 def _get_value_iri(
@@ -84,12 +129,12 @@ def _get_value_iri(
     uuid: str,
 ) -> str | None:
     prefixed_prop = _make_prefixed_prop_from_absolute_iri(property_name)
-    values_on_server = resource.get(prefixed_prop)
+    values_on_server = resource.get(prefixed_prop, [])
     if not isinstance(values_on_server, list):
         values_on_server = [values_on_server]
 
     # get the IRI of the value that contains the UUID in its text
-    text_and_iris = ((v["knora-api:textValueAsXml"], v["@id"]) for v in values_on_server)
+    text_and_iris = ((v.get("knora-api:textValueAsXml", ""), v["@id"]) for v in values_on_server)
     value_iri: str | None = next((iri for text, iri in text_and_iris if uuid in text), None)
     # in case that "value_iri" is None, the value that contains the UUID in its text does not exist in DSP
     # no action necessary: this resource will remain in nonapplied_xml_texts,
@@ -129,11 +174,15 @@ def _upload_stash_item(
         res_iri_str=res_iri,
         iri_resolver=iri_resolver,
     )
-    try:
-        upload_problem = val_client.replace_existing_value(payload)
-    except DspToolsRequestException as err:
-        _log_unable_to_upload_xml_resource(err.message, stash_item.res_id, stash_item.value.prop_iri)
-        return False
+    with get_rate_controller().request_slot() as slot:
+        try:
+            upload_problem = val_client.replace_existing_value(payload)
+        except DspToolsRequestException as err:
+            slot.record_error()
+            _log_unable_to_upload_xml_resource(err.message, stash_item.res_id, stash_item.value.prop_iri)
+            return False
+        if upload_problem and should_retry_request(upload_problem):
+            slot.record_error()
     if upload_problem:
         _log_unable_to_upload_xml_resource(upload_problem.text, stash_item.res_id, stash_item.value.prop_iri)
         return False
@@ -144,28 +193,9 @@ def _upload_stash_item(
 def _serialise_richtext_for_update(
     stash_item: StandoffStashItem, value_iri_str: str, res_iri_str: str, iri_resolver: IriResolver
 ) -> dict[str, Any]:
-    graph = _make_richtext_update_graph(
-        stash_item=stash_item,
-        value_iri_str=value_iri_str,
-        res_iri_str=res_iri_str,
-        iri_resolver=iri_resolver,
-    )
-    return serialise_jsonld_for_value(graph, res_iri_str)
-
-
-def _make_richtext_update_graph(
-    stash_item: StandoffStashItem, value_iri_str: str, res_iri_str: str, iri_resolver: IriResolver
-) -> Graph:
-    res_iri = URIRef(res_iri_str)
-    value_iri = URIRef(value_iri_str)
-    val_graph = make_richtext_value_graph(
-        val=stash_item.value,
-        val_node=value_iri,
-        res_node=res_iri,
-        iri_resolver=iri_resolver,
-    )
-    val_graph.add((res_iri, RDF.type, URIRef(stash_item.res_type)))
-    return val_graph
+    value = make_richtext_value_jsonld(stash_item.value, iri_resolver)
+    value["@id"] = value_iri_str
+    return make_value_jsonld(res_iri_str, stash_item.res_type, stash_item.value.prop_iri, value)
 
 
 def _log_unable_to_retrieve_resource(
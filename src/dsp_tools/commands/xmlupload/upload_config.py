@@ -40,6 +40,16 @@ class DiagnosticsConfig:
     server_as_foldername: str = "unknown"
     save_location: Path = field(default=Path.home() / ".dsp-tools" / "xmluploads")
 
+    @property
+    def journal_location(self) -> Path:
+        """The journal of the upload progress is kept next to the snapshot of the upload state."""
+        return self.save_location.with_suffix(".journal")
+
+    @property
+    def input_fingerprint_location(self) -> Path:
+        """The fingerprint of the input of the upload is kept next to the snapshot of its initial state."""
+        return self.save_location.with_suffix(".input")
+
 
 @dataclass(frozen=True)
 class UploadConfig:
@@ -50,6 +60,13 @@ class UploadConfig:
     shortcode: str = "unknown"
     diagnostics: DiagnosticsConfig = field(default_factory=DiagnosticsConfig)
     interrupt_after: int | None = None
+    num_of_workers: int = 1
+    num_of_ingest_workers: int = 0
+    max_ingest_bytes_in_flight: int | None = None
+    use_media_cache: bool = True
+    check_cached_media: bool = True
+    use_xml_cache: bool = False
+    use_api_cache: bool = True
     skip_iiif_validation: bool = False
     skip_validation: bool = False
     skip_ontology_validation: bool = False
@@ -7,6 +7,8 @@ from pathlib import Path
 from loguru import logger
 
 from dsp_tools.commands.xmlupload.upload_config import DiagnosticsConfig
+from dsp_tools.utils.telemetry import TelemetrySummary
+from dsp_tools.utils.telemetry import write_prometheus_textfile
 
 
 def write_id2iri_mapping(id2iri_mapping: dict[str, str], shortcode: str, diagnostics: DiagnosticsConfig) -> None:
@@ -25,3 +27,20 @@ def write_id2iri_mapping(id2iri_mapping: dict[str, str], shortcode: str, diagnos
     id2iri_filename_for_user_home = f"id2iri_{timestamp}_{shortcode}_{servername}.json"
     with open(id_2_iri_folder / id2iri_filename_for_user_home, "w", encoding="utf-8") as f:
         f.write(json_str)
+
+
+def write_performance_report(summary: TelemetrySummary, shortcode: str, diagnostics: DiagnosticsConfig) -> None:
+    """
+    Writes the time spent in the phases of the upload to a file in the user's home directory,
+    and to the Prometheus text file, if one is configured.
+    """
+    timestamp = datetime.now().strftime("%Y-%m-%d_%H%M%S")
+    servername = diagnostics.server_as_foldername
+    performance_folder = Path.home() / ".dsp-tools" / "performance"
+    performance_folder.mkdir(parents=True, exist_ok=True)
+    report_file = performance_folder / f"performance_{timestamp}_{shortcode}_{servername}.json"
+    with open(report_file, "w", encoding="utf-8") as f:
+        f.write(json.dumps(summary.to_dict(), ensure_ascii=False, indent=4))
+    logger.info(f"The performance report of the upload was written to {report_file}")
+    if prometheus_file := write_prometheus_textfile(summary):
+        logger.info(f"The performance metrics of the upload were written to {prometheus_file}")
@@ -8,6 +8,7 @@ from lxml import etree
 from dsp_tools.cli.args import ServerCredentials
 from dsp_tools.cli.args import ValidateDataConfig
 from dsp_tools.cli.args import ValidationSeverity
+from dsp_tools.clients.api_response_cache import ApiResponseCache
 from dsp_tools.clients.authentication_client import AuthenticationClient
 from dsp_tools.clients.authentication_client_live import AuthenticationClientLive
 from dsp_tools.clients.ingest import AssetClient
@@ -21,12 +22,13 @@ from dsp_tools.clients.project_client_live import ProjectClientLive
 from dsp_tools.commands.validate_data.validate_data import validate_parsed_resources
 from dsp_tools.commands.xmlupload.exceptions import MissingProjectDefaultAuthorshipError
 from dsp_tools.commands.xmlupload.execute_upload import execute_upload
+from dsp_tools.commands.xmlupload.handle_errors import get_input_fingerprint
 from dsp_tools.commands.xmlupload.models.lookup_models import XmlReferenceLookups
 from dsp_tools.commands.xmlupload.models.upload_clients import UploadClients
 from dsp_tools.commands.xmlupload.models.upload_state import UploadState
 from dsp_tools.commands.xmlupload.prepare_xml_input.get_processed_resources import get_processed_resources
-from dsp_tools.commands.xmlupload.prepare_xml_input.prepare_xml_input import get_parsed_resources_and_mappers
 from dsp_tools.commands.xmlupload.prepare_xml_input.prepare_xml_input import get_stash_and_upload_order
+from dsp_tools.commands.xmlupload.prepare_xml_input.prepare_xml_input import get_xml_reference_lookups
 from dsp_tools.commands.xmlupload.prepare_xml_input.read_validate_xml_file import check_if_bitstreams_exist
 from dsp_tools.commands.xmlupload.prepare_xml_input.read_validate_xml_file import validate_iiif_uris
 from dsp_tools.commands.xmlupload.upload_config import UploadConfig
@@ -35,8 +37,9 @@ from dsp_tools.setup.ansi_colors import RESET_TO_DEFAULT
 from dsp_tools.utils.data_formats.uri_util import is_prod_like_server
 from dsp_tools.utils.interactive import prompt_until_valid_answer
 from dsp_tools.utils.replace_id_with_iri import use_id2iri_mapping_to_replace_ids
+from dsp_tools.utils.telemetry import reset_telemetry
 from dsp_tools.utils.xml_parsing.models.parsed_resource import ParsedResource
-from dsp_tools.utils.xml_parsing.parse_clean_validate_xml import parse_and_clean_xml_file
+from dsp_tools.utils.xml_parsing.parsed_xml_cache import get_parsed_xml_file
 
 
 def xmlupload(
@@ -64,8 +67,11 @@ def xmlupload(
         uploaded because there is an error in it
     """
 
-    root = parse_and_clean_xml_file(input_file)
-    shortcode = root.attrib["shortcode"]
+    telemetry = reset_telemetry()
+    with telemetry.measure("parse"):
+        parsed_xml = get_parsed_xml_file(input_file, creds.server, use_cache=config.use_xml_cache)
+    root = parsed_xml.header
+    shortcode = parsed_xml.shortcode
 
     auth = AuthenticationClientLive(server=creds.server, email=creds.user, password=creds.password)
 
@@ -75,38 +81,55 @@ def xmlupload(
     project_default_authorship = _resolve_project_default_authorship(root, project_client, shortcode)
 
     config = config.with_server_info(server=creds.server, shortcode=shortcode)
-    clients = _get_live_clients(auth, creds, shortcode, imgdir)
+    clients = _get_live_clients(auth, creds, shortcode, imgdir, config)
 
-    parsed_resources, lookups = get_parsed_resources_and_mappers(root, clients)
+    with telemetry.measure("lookups"):
+        lookups = get_xml_reference_lookups(root, clients)
+    parsed_resources = parsed_xml.parsed_resources
     if config.id2iri_file:
         parsed_resources = use_id2iri_mapping_to_replace_ids(parsed_resources, Path(config.id2iri_file))
 
     is_on_prod_like_server = is_prod_like_server(creds.server)
 
-    validation_ok = _handle_validation(
-        parsed_resources=parsed_resources,
-        lookups=lookups,
-        config=config,
-        is_on_prod_like_server=is_on_prod_like_server,
-        auth=auth,
-        input_file=input_file,
-    )
+    with telemetry.measure("validation"):
+        validation_ok = _handle_validation(
+            parsed_resources=parsed_resources,
+            lookups=lookups,
+            config=config,
+            is_on_prod_like_server=is_on_prod_like_server,
+            auth=auth,
+            input_file=input_file,
+        )
     if not validation_ok:
         return False
 
-    check_if_bitstreams_exist(root, Path(imgdir))
-    if not config.skip_iiif_validation:
-        validate_iiif_uris(root)
+    with telemetry.measure("file_checks"):
+        check_if_bitstreams_exist(parsed_resources, Path(imgdir))
+        if not config.skip_iiif_validation:
+            validate_iiif_uris(parsed_resources)
 
-    processed_resources = get_processed_resources(
-        parsed_resources, lookups, is_on_prod_like_server, project_default_authorship
-    )
+    with telemetry.measure("get_processed_resources"):
+        processed_resources = get_processed_resources(
+            parsed_resources, lookups, is_on_prod_like_server, project_default_authorship
+        )
 
-    sorted_resources, stash = get_stash_and_upload_order(processed_resources)
+    with telemetry.measure("get_stash_and_upload_order"):
+        sorted_resources, stash = get_stash_and_upload_order(processed_resources)
+    input_fingerprint = get_input_fingerprint(
+        input_file,
+        config,
+        {perm_id: str(perm) for perm_id, perm in lookups.permissions.items()},
+        lookups.listnodes,
+        lookups.authorships,
+        project_default_authorship,
+        is_on_prod_like_server,
+        Path(config.id2iri_file).read_text(encoding="utf-8") if config.id2iri_file else None,
+    )
     state = UploadState(
         pending_resources=sorted_resources,
         pending_stash=stash,
         config=config,
+        input_fingerprint=input_fingerprint,
     )
 
     return execute_upload(clients, state)
@@ -194,6 +217,7 @@ def _handle_validation(
                 is_on_prod_server=is_on_prod_like_server,
                 skip_ontology_validation=config.skip_ontology_validation,
                 do_not_request_resource_metadata_from_db=config.do_not_request_resource_metadata_from_db,
+                use_api_cache=config.use_api_cache,
             ),
             auth=auth,
         )
@@ -209,10 +233,13 @@ def _get_live_clients(
     creds: ServerCredentials,
     shortcode: str,
     imgdir: str,
+    config: UploadConfig,
 ) -> UploadClients:
     ingest_client: AssetClient
     ingest_client = DspIngestClientLive(creds.dsp_ingest_url, auth, shortcode, imgdir)
-    list_client: ListGetClient = ListGetClientLive(auth.server, shortcode)
+    list_client: ListGetClient = ListGetClientLive(
+        auth.server, shortcode, cache=ApiResponseCache() if config.use_api_cache else None
+    )
     legal_info_client: LegalInfoClient = LegalInfoClientLive(creds.server, shortcode, auth)
     return UploadClients(
         asset_client=ingest_client,
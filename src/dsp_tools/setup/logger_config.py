@@ -30,6 +30,10 @@ def logger_config() -> None:
     - warnings.log in the cwd only with level warning and higher for the user (no stack-trace)
       OR a complete logging.log file with the stack-trace if configured in the .env
     - print output on the terminal, formatted the same as the warnings.log
+
+    The log files are written by a background thread,
+    so that writing them does not slow down the requests of an upload.
+    The messages that are still queued are written when the program exits.
     """
     # If this is not removed, the default formatting is also printed out on the terminal
     logger.remove()
@@ -45,6 +49,7 @@ def logger_config() -> None:
         backtrace=True,
         diagnose=True,
         delay=True,
+        enqueue=True,
         rotation=rotation_size_main_log,
     )
 
@@ -58,6 +63,7 @@ def logger_config() -> None:
             rotation=rotation_size,
             retention=2,
             delay=True,
+            enqueue=True,
         )
     else:
         logger.add(
@@ -69,4 +75,5 @@ def logger_config() -> None:
             rotation=rotation_size,
             retention=2,
             delay=True,
+            enqueue=True,
         )
@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+import threading
+import time
+from dataclasses import dataclass
+from dataclasses import field
+from typing import BinaryIO
+
+
+@dataclass
+class BandwidthLimiter:
+    """
+    Token bucket that limits the number of bytes per second that are sent by several threads together.
+
+    A thread that wants to send more bytes than are currently available reserves them nevertheless,
+    and waits until the bucket has been refilled, so that the threads are served in the order they asked.
+    At most one second worth of bandwidth can be saved up while nothing is sent.
+    """
+
+    bytes_per_second: int
+    _available: float = field(init=False)
+    _last_refill: float = field(init=False, default_factory=time.monotonic)
+    _lock: threading.Lock = field(init=False, default_factory=threading.Lock)
+
+    def __post_init__(self) -> None:
+        if self.bytes_per_second <= 0:
+            raise ValueError("The bandwidth limit must be a positive number of bytes per second")
+        self._available = self.bytes_per_second
+
+    def acquire(self, num_bytes: int) -> None:
+        """Wait until the given number of bytes may be sent."""
+        with self._lock:
+            now = time.monotonic()
+            refilled = (now - self._last_refill) * self.bytes_per_second
+            self._available = min(self._available + refilled, self.bytes_per_second)
+            self._last_refill = now
+            self._available -= num_bytes
+            wait_seconds = -self._available / self.bytes_per_second
+        if wait_seconds > 0:
+            time.sleep(wait_seconds)
+
+
+@dataclass
+class ThrottledReader:
+    """
+    Wrapper around a binary file that is streamed as the body of a request,
+    which hands out the content of the file only as fast as the bandwidth limiter allows.
+    """
+
+    file: BinaryIO
+    limiter: BandwidthLimiter
+    size: int
+
+    def read(self, size: int = -1) -> bytes:
+        chunk = self.file.read(size)
+        if chunk:
+            self.limiter.acquire(len(chunk))
+        return chunk
+
+    def __len__(self) -> int:
+        # requests uses the length for the Content-Length header, instead of a chunked transfer encoding
+        return self.size
@@ -82,7 +82,7 @@ class StartEnd(Enum):
     END = "End"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SingleDate:
     """Information about a single date."""
 
@@ -92,7 +92,7 @@ class SingleDate:
     day: int | None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Date:
     """Information about a date."""
 
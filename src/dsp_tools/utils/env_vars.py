@@ -0,0 +1,50 @@
+import os
+
+from loguru import logger
+
+
+def get_positive_int_from_env(env_var: str, default: int) -> int:
+    """
+    Read a positive integer from an environment variable.
+
+    Args:
+        env_var: name of the environment variable
+        default: used if the variable is not set, or if it is not a positive integer (with a warning)
+
+    Returns:
+        the value of the environment variable, or the default
+    """
+    if (value := os.getenv(env_var)) is None:
+        return default
+    try:
+        parsed = int(value)
+    except ValueError:
+        parsed = 0
+    if parsed < 1:
+        logger.warning(f"{env_var}={value!r} is not a positive integer, using the default of {default} instead")
+        return default
+    return parsed
+
+
+def get_share_from_env(env_var: str, default: float) -> float:
+    """
+    Read a share (a number between 0 and 1) from an environment variable.
+
+    Args:
+        env_var: name of the environment variable
+        default: used if the variable is not set, or if it is not a number (with a warning)
+
+    Returns:
+        the value of the environment variable (clamped to 0 and 1), or the default
+    """
+    if (value := os.getenv(env_var)) is None:
+        return default
+    try:
+        parsed = float(value)
+    except ValueError:
+        logger.warning(f"{env_var}={value!r} is not a number, using the default of {default} instead")
+        return default
+    clamped = min(max(parsed, 0.0), 1.0)
+    if clamped != parsed:
+        logger.warning(f"{env_var}={value!r} is not between 0 and 1, using {clamped} instead")
+    return clamped
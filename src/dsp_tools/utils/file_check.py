@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+import os
+from collections import defaultdict
+from collections.abc import Collection
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
+from enum import Enum
+from pathlib import Path
+
+from tqdm import tqdm
+
+# file checks are waiting for the filesystem, which can be slow on network filesystems (NFS, SMB)
+FILE_CHECK_WORKERS = 16
+
+# below this number of files, each file is checked on its own,
+# because listing the directories could take longer if they contain many other files
+INDEX_MODE_MIN_FILES = 500
+
+
+class FileCheckMode(Enum):
+    """
+    How to find out if files exist.
+
+    - INDEX: list the directories that contain the files once, and look the files up in these listings
+    - STAT: check each file on its own
+    - AUTO: INDEX for many files, STAT for few files
+    """
+
+    INDEX = "index"
+    STAT = "stat"
+    AUTO = "auto"
+
+
+def find_missing_files(
+    filepaths: Collection[Path],
+    basedir: Path = Path(),
+    mode: FileCheckMode = FileCheckMode.AUTO,
+    progress_desc: str | None = None,
+) -> set[Path]:
+    """
+    Find the files that do not exist (or are not regular files), checking them in parallel.
+
+    Args:
+        filepaths: paths of the files, relative to the base directory (or absolute)
+        basedir: the directory to which the paths are relative
+        mode: how to check the files
+        progress_desc: if given, a progress bar with this description is shown
+
+    Returns:
+        the paths (as given) of the files that do not exist
+    """
+    if mode == FileCheckMode.AUTO:
+        mode = FileCheckMode.INDEX if len(filepaths) >= INDEX_MODE_MIN_FILES else FileCheckMode.STAT
+    if mode == FileCheckMode.INDEX:
+        candidates = _find_unindexed_files(filepaths, basedir, progress_desc)
+    else:
+        candidates = set(filepaths)
+    # Files that are not in the index are checked on their own,
+    # e.g. because the filesystem is case-insensitive, or the path points to a symlink that is broken
+    return _find_missing_files_with_stat(candidates, basedir, progress_desc if mode == FileCheckMode.STAT else None)
+
+
+def _find_unindexed_files(filepaths: Collection[Path], basedir: Path, progress_desc: str | None) -> set[Path]:
+    by_directory: defaultdict[Path, list[Path]] = defaultdict(list)
+    for filepath in filepaths:
+        by_directory[(basedir / filepath).parent].append(filepath)
+    directories = list(by_directory)
+    with ThreadPoolExecutor(max_workers=FILE_CHECK_WORKERS, thread_name_prefix="file-check") as executor:
+        listings: Iterable[set[str]] = executor.map(_list_files, directories)
+        if progress_desc:
+            listings = tqdm(listings, total=len(directories), desc=progress_desc, unit="dir", dynamic_ncols=True)
+        index = dict(zip(directories, listings))
+    return {x for directory, files in by_directory.items() for x in files if x.name not in index[directory]}
+
+
+def _list_files(directory: Path) -> set[str]:
+    try:
+        with os.scandir(directory) as entries:
+            return {entry.name for entry in entries if entry.is_file()}
+    except OSError:
+        return set()
+
+
+def _find_missing_files_with_stat(filepaths: Collection[Path], basedir: Path, progress_desc: str | None) -> set[Path]:
+    if not filepaths:
+        return set()
+    ordered = list(filepaths)
+    with ThreadPoolExecutor(max_workers=FILE_CHECK_WORKERS, thread_name_prefix="file-check") as executor:
+        results: Iterable[bool] = executor.map(lambda x: (basedir / x).is_file(), ordered)
+        if progress_desc:
+            results = tqdm(results, total=len(ordered), desc=progress_desc, unit="file", dynamic_ncols=True)
+        return {x for x, exists in zip(ordered, results) if not exists}
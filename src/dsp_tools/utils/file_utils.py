@@ -0,0 +1,87 @@
+import hashlib
+import json
+import uuid
+from pathlib import Path
+from typing import Any
+
+from loguru import logger
+
+_CHUNK_SIZE = 1024 * 1024
+
+
+def write_atomically(path: Path, content: str | bytes) -> None:
+    """
+    Write a file by writing a temporary file next to it first, and then moving it to its location,
+    so that a concurrent process never reads a half-written file.
+    The name of the temporary file is unique, so that concurrent processes can write the same file.
+
+    Args:
+        path: location of the file (its parent directory is created if necessary)
+        content: the content of the file (a string is encoded as UTF-8)
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f".{path.name}.{uuid.uuid4().hex}.tmp")
+    try:
+        if isinstance(content, bytes):
+            tmp_path.write_bytes(content)
+        else:
+            tmp_path.write_text(content, encoding="utf-8")
+        tmp_path.replace(path)
+    finally:
+        tmp_path.unlink(missing_ok=True)
+
+
+def hash_file(path: Path) -> str:
+    """
+    Compute the SHA-256 hash of the content of a file, reading it in chunks to keep the memory usage low.
+
+    Args:
+        path: the file
+
+    Returns:
+        the hexadecimal digest
+
+    Raises:
+        OSError: if the file cannot be read
+    """
+    sha256 = hashlib.sha256()
+    with open(path, "rb") as f:
+        while chunk := f.read(_CHUNK_SIZE):
+            sha256.update(chunk)
+    return sha256.hexdigest()
+
+
+def read_json_lines(path: Path) -> list[Any]:
+    """
+    Read a file with one JSON record per line.
+    Invalid lines are ignored with a warning,
+    because the last line may be incomplete if the process was killed while appending it.
+
+    Args:
+        path: the file
+
+    Returns:
+        the records, or an empty list if the file does not exist
+    """
+    if not path.is_file():
+        return []
+    records = []
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            try:
+                records.append(json.loads(line))
+            except json.JSONDecodeError:
+                logger.warning(f"Ignoring an invalid line of {path}")
+    return records
+
+
+def append_json_line(path: Path, record: dict[str, Any]) -> None:
+    """
+    Append a record as one JSON line to a file.
+
+    Args:
+        path: the file (it is created if it does not exist, but not its parent directory)
+        record: the record
+    """
+    with open(path, "a", encoding="utf-8") as f:
+        f.write(json.dumps(record, ensure_ascii=False) + "\n")
@@ -0,0 +1,171 @@
+from __future__ import annotations
+
+import os
+import socket
+import threading
+import time
+from dataclasses import dataclass
+from importlib.metadata import version
+from typing import TYPE_CHECKING
+from typing import Any
+
+from loguru import logger
+from requests import PreparedRequest
+from requests import Response
+from requests import Session
+from requests.adapters import HTTPAdapter
+from urllib3 import HTTPConnectionPool
+from urllib3 import HTTPSConnectionPool
+from urllib3.connection import HTTPConnection
+from urllib3.util.retry import Retry
+
+from dsp_tools.utils.env_vars import get_positive_int_from_env
+from dsp_tools.utils.telemetry import BYTES_SENT
+from dsp_tools.utils.telemetry import get_telemetry
+
+if TYPE_CHECKING:
+    from urllib3._base_connection import BaseHTTPConnection
+    from urllib3._base_connection import BaseHTTPSConnection
+
+MAX_HOSTS_ENV_VAR = "DSP_TOOLS_HTTP_POOL_MAX_HOSTS"
+MAX_CONNECTIONS_PER_HOST_ENV_VAR = "DSP_TOOLS_HTTP_POOL_MAX_CONNECTIONS_PER_HOST"
+KEEP_ALIVE_ENV_VAR = "DSP_TOOLS_HTTP_KEEP_ALIVE"
+
+_KEEP_ALIVE_SOCKET_OPTION = (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+
+
+@dataclass(frozen=True)
+class HttpPoolConfig:
+    """
+    Configuration of the connection pool that is shared by all HTTP sessions.
+
+    Attributes:
+        max_hosts: number of hosts for which open connections are kept
+        max_connections_per_host: number of open connections that are kept per host
+            (more connections are opened if needed, but they are closed after use)
+        keep_alive: whether idle connections are kept open with TCP keep-alive probes
+    """
+
+    max_hosts: int = 10
+    max_connections_per_host: int = 32
+    keep_alive: bool = True
+
+    @staticmethod
+    def from_env() -> HttpPoolConfig:
+        default = HttpPoolConfig()
+        return HttpPoolConfig(
+            max_hosts=get_positive_int_from_env(MAX_HOSTS_ENV_VAR, default.max_hosts),
+            max_connections_per_host=get_positive_int_from_env(
+                MAX_CONNECTIONS_PER_HOST_ENV_VAR, default.max_connections_per_host
+            ),
+            keep_alive=str(os.getenv(KEEP_ALIVE_ENV_VAR, default.keep_alive)).lower() == "true",
+        )
+
+
+@dataclass
+class ConnectionStats:
+    """Number of requests sent over the shared connection pool, and of connections opened for them."""
+
+    requests: int = 0
+    new_connections: int = 0
+
+    @property
+    def reused_connections(self) -> int:
+        return max(self.requests - self.new_connections, 0)
+
+
+_lock = threading.Lock()
+_stats = ConnectionStats()
+_shared_adapter: _PooledAdapter | None = None
+
+
+def make_session(max_retries: Retry | None = None) -> Session:
+    """
+    Create a session whose connections are taken from the connection pool shared by all sessions.
+
+    Every client should have its own session, so that headers (e.g. the authorization) are not shared.
+    A session with its own retry strategy gets its own pool, configured like the shared one.
+
+    Args:
+        max_retries: retry strategy of the session, if it should retry on the level of the connection
+
+    Returns:
+        the session
+    """
+    session = Session()
+    session.headers["User-Agent"] = f"DSP-TOOLS/{version('dsp-tools')}"
+    adapter = _PooledAdapter(HttpPoolConfig.from_env(), max_retries) if max_retries else _get_shared_adapter()
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+def get_connection_stats() -> ConnectionStats:
+    with _lock:
+        return ConnectionStats(_stats.requests, _stats.new_connections)
+
+
+def log_connection_stats() -> None:
+    stats = get_connection_stats()
+    if stats.requests:
+        logger.debug(
+            f"HTTP connections: {stats.requests} requests, {stats.new_connections} new connections, "
+            f"{stats.reused_connections} requests over a reused connection"
+        )
+
+
+def _get_shared_adapter() -> _PooledAdapter:
+    global _shared_adapter  # noqa: PLW0603 (global-statement)
+    with _lock:
+        if _shared_adapter is None:
+            _shared_adapter = _PooledAdapter(HttpPoolConfig.from_env())
+        return _shared_adapter
+
+
+def _count(requests: int = 0, new_connections: int = 0) -> None:
+    with _lock:
+        _stats.requests += requests
+        _stats.new_connections += new_connections
+
+
+class _CountingHTTPConnectionPool(HTTPConnectionPool):
+    def _new_conn(self) -> BaseHTTPConnection:
+        _count(new_connections=1)
+        return super()._new_conn()
+
+
+class _CountingHTTPSConnectionPool(HTTPSConnectionPool):
+    def _new_conn(self) -> BaseHTTPSConnection:
+        _count(new_connections=1)
+        return super()._new_conn()
+
+
+class _PooledAdapter(HTTPAdapter):
+    __attrs__ = [*HTTPAdapter.__attrs__, "pool_config"]  # noqa: RUF012 (mutable-class-default)
+
+    def __init__(self, config: HttpPoolConfig, max_retries: Retry | None = None) -> None:
+        self.pool_config = config
+        super().__init__(
+            pool_connections=config.max_hosts,
+            pool_maxsize=config.max_connections_per_host,
+            max_retries=max_retries or 0,
+        )
+
+    def init_poolmanager(self, connections: int, maxsize: int, block: bool = False, **pool_kwargs: Any) -> None:
+        if self.pool_config.keep_alive:
+            pool_kwargs["socket_options"] = [*HTTPConnection.default_socket_options, _KEEP_ALIVE_SOCKET_OPTION]
+        super().init_poolmanager(connections, maxsize, block, **pool_kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            "http": _CountingHTTPConnectionPool,
+            "https": _CountingHTTPSConnectionPool,
+        }
+
+    def send(self, request: PreparedRequest, *args: Any, **kwargs: Any) -> Response:
+        _count(requests=1)
+        telemetry = get_telemetry()
+        telemetry.add(BYTES_SENT, int(request.headers.get("Content-Length", 0)))
+        start = time.monotonic()
+        try:
+            return super().send(request, *args, **kwargs)
+        finally:
+            telemetry.record("http", time.monotonic() - start)
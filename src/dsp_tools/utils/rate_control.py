@@ -0,0 +1,188 @@
+from __future__ import annotations
+
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from dataclasses import field
+from datetime import datetime
+
+from loguru import logger
+
+MAX_BACKOFF_SECONDS = 300
+
+# The latency is smoothed with this weight of the latest request,
+# and the API counts as degraded if the smoothed latency exceeds the best one seen so far by this factor.
+LATENCY_SMOOTHING = 0.2
+LATENCY_DEGRADATION_FACTOR = 4
+MIN_LATENCY_SAMPLES = 10
+
+
+@dataclass(frozen=True)
+class RateControlConfig:
+    """
+    Limits of the number of requests that are sent to the DSP servers at the same time.
+
+    Attributes:
+        initial_limit: number of concurrent requests at the start
+        min_limit: the limit is never reduced below this number
+        max_limit: the limit is never increased above this number
+        decrease_factor: factor by which the limit is reduced if the API degrades
+    """
+
+    initial_limit: int = 4
+    min_limit: int = 1
+    max_limit: int = 32
+    decrease_factor: float = 0.5
+
+
+@dataclass
+class RequestSlot:
+    """Permission to send one request, which is returned to the controller when the request is done."""
+
+    started: float
+    backoff: int = 0
+    degraded: bool = False
+
+    def record_failure(self, reason: str, retry_counter: int, exc_info: bool) -> None:
+        """
+        The request failed with a transient error (e.g. a 5xx or a connection error) and will be retried.
+        The slot is kept for the time of the backoff, so that the retry does not add to the load on the API.
+
+        =============  ================  =============================
+        retry_counter  seconds to sleep  cumulative waiting time (min)
+        =============  ================  =============================
+        0              1                 0
+        1              2                 0
+        2              4                 0
+        3              8                 0
+        4              16                0
+        5              32                1
+        6              64                2
+        7              128               4
+        8              256               9
+        9              300               14
+        12             300               29
+        18             300               59
+        24             300               89
+        =============  ================  =============================
+        """
+        self.degraded = True
+        self.backoff = min(2**retry_counter, MAX_BACKOFF_SECONDS)
+        msg = f"{reason}: Try reconnecting to DSP server, next attempt in {self.backoff} seconds..."
+        print(f"{datetime.now()}: {msg}")
+        if exc_info:
+            logger.exception(f"{msg} ({retry_counter=:})")
+        else:
+            logger.error(f"{msg} ({retry_counter=:})")
+
+    def record_timeout(self) -> None:
+        """The request timed out and will not be retried."""
+        self.degraded = True
+
+    def record_error(self) -> None:
+        """The request failed with a transient error (e.g. a 5xx or a connection error), and will not be retried."""
+        self.degraded = True
+
+
+@dataclass
+class AdaptiveRateController:
+    """
+    Shared view on the health of the DSP servers, which limits how many requests are sent at the same time.
+
+    While the API responds normally, the limit grows additively (by 1 per round of `limit` requests).
+    If the API degrades (5xx responses, connection errors, timeouts or rising latency),
+    the limit is cut multiplicatively.
+    All the requests that were already in flight when the API degraded count as a single signal,
+    so that a burst of failures of concurrent requests does not collapse the limit at once.
+    """
+
+    config: RateControlConfig = field(default_factory=RateControlConfig)
+    limit: float = field(init=False)
+    _in_flight: int = field(init=False, default=0)
+    _condition: threading.Condition = field(init=False, default_factory=threading.Condition)
+    _last_decrease: float = field(init=False, default=float("-inf"))
+    _latency: float | None = field(init=False, default=None)
+    _best_latency: float | None = field(init=False, default=None)
+    _latency_samples: int = field(init=False, default=0)
+
+    def __post_init__(self) -> None:
+        self.limit = float(self.config.initial_limit)
+
+    @contextmanager
+    def request_slot(self) -> Iterator[RequestSlot]:
+        """
+        Wait until a request may be sent, and report its outcome when the block is left.
+        A request that leaves the block with an exception gives no signal about the health of the API,
+        unless its failure or timeout was recorded on the slot.
+
+        Yields:
+            the slot, on which failures are recorded
+        """
+        self._acquire()
+        slot = RequestSlot(started=time.monotonic())
+        completed = False
+        try:
+            yield slot
+            completed = True
+        finally:
+            try:
+                self._report(slot, completed)
+                if slot.backoff:
+                    time.sleep(slot.backoff)
+            finally:
+                self._release()
+
+    def _acquire(self) -> None:
+        with self._condition:
+            while self._in_flight >= int(self.limit):
+                self._condition.wait()
+            self._in_flight += 1
+
+    def _release(self) -> None:
+        with self._condition:
+            self._in_flight -= 1
+            self._condition.notify_all()
+
+    def _report(self, slot: RequestSlot, completed: bool) -> None:
+        now = time.monotonic()
+        with self._condition:
+            if not slot.degraded and completed:
+                slot.degraded = self._is_latency_degraded(now - slot.started)
+            if slot.degraded:
+                if slot.started > self._last_decrease:
+                    self._decrease(now)
+            elif completed and self._in_flight >= int(self.limit):
+                # the limit is only raised if it is actually used
+                self.limit = min(self.limit + 1 / self.limit, float(self.config.max_limit))
+
+    def _decrease(self, now: float) -> None:
+        self._last_decrease = now
+        self.limit = max(self.limit * self.config.decrease_factor, float(self.config.min_limit))
+        logger.debug(f"The DSP server is degraded: reduced the number of concurrent requests to {int(self.limit)}")
+
+    def _is_latency_degraded(self, latency: float) -> bool:
+        if self._latency is None:
+            self._latency = latency
+        else:
+            self._latency = LATENCY_SMOOTHING * latency + (1 - LATENCY_SMOOTHING) * self._latency
+        self._latency_samples += 1
+        if self._latency_samples < MIN_LATENCY_SAMPLES:
+            return False
+        if self._best_latency is None or self._latency < self._best_latency:
+            self._best_latency = self._latency
+        return self._latency > LATENCY_DEGRADATION_FACTOR * self._best_latency
+
+
+_lock = threading.Lock()
+_shared_controller: AdaptiveRateController | None = None
+
+
+def get_rate_controller() -> AdaptiveRateController:
+    """Returns the controller that is shared by all requests to the DSP servers."""
+    global _shared_controller  # noqa: PLW0603 (global-statement)
+    with _lock:
+        if _shared_controller is None:
+            _shared_controller = AdaptiveRateController()
+        return _shared_controller
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import json
 import os
-import time
+import random
 import warnings
 from dataclasses import dataclass
 from dataclasses import field
@@ -23,7 +23,15 @@ from dsp_tools.commands.get.legacy_models.context import Context
 from dsp_tools.commands.get.legacy_models.helpers import OntoIri
 from dsp_tools.error.custom_warnings import DspToolsUnexpectedStatusCodeWarning
 from dsp_tools.setup.logger_config import LOGGER_SAVEPATH
+from dsp_tools.utils.env_vars import get_positive_int_from_env
+from dsp_tools.utils.env_vars import get_share_from_env
 from dsp_tools.utils.exceptions import DspToolsRequestException
+from dsp_tools.utils.telemetry import get_telemetry
+
+REQUEST_LOG_MAX_CHARS_ENV_VAR = "DSP_TOOLS_REQUEST_LOG_MAX_CHARS"
+REQUEST_LOG_SAMPLE_RATE_ENV_VAR = "DSP_TOOLS_REQUEST_LOG_SAMPLE_RATE"
+
+_SUCCESS_STATUS_CODES = (HTTPStatus.OK, HTTPStatus.ACCEPTED, HTTPStatus.NO_CONTENT)
 
 
 @dataclass
@@ -87,7 +95,8 @@ class RequestParameters:
     files: PostFiles | None = None
 
     def __post_init__(self) -> None:
-        self.data_serialized = self._serialize_payload(self.data)
+        with get_telemetry().measure("serialisation"):
+            self.data_serialized = self._serialize_payload(self.data)
 
     def _serialize_payload(self, payload: dict[str, Any] | None) -> bytes | None:
         # If data is not encoded as bytes, issues can occur with non-ASCII characters,
@@ -107,9 +116,49 @@ class RequestParameters:
         return kwargs
 
 
+@dataclass(frozen=True)
+class RequestLogConfig:
+    """
+    Configuration of the logging of requests and responses.
+    Failed requests and their responses are always logged in full.
+
+    Attributes:
+        max_body_chars: payloads of requests and contents of successful responses are truncated to this length
+        success_sample_rate: share of the successful responses that are logged (between 0 and 1)
+    """
+
+    max_body_chars: int = 1000
+    success_sample_rate: float = 0.1
+
+    @staticmethod
+    def from_env() -> RequestLogConfig:
+        default = RequestLogConfig()
+        return RequestLogConfig(
+            max_body_chars=get_positive_int_from_env(REQUEST_LOG_MAX_CHARS_ENV_VAR, default.max_body_chars),
+            success_sample_rate=get_share_from_env(REQUEST_LOG_SAMPLE_RATE_ENV_VAR, default.success_sample_rate),
+        )
+
+
+# the .env file has already been read when the logger config was imported
+_log_config = RequestLogConfig.from_env()
+
+
 def log_request(params: RequestParameters, extra_headers: dict[str, Any] | None = None) -> None:
-    """Logs the request."""
-    dumpobj = {
+    """Logs the request, with its payload truncated."""
+    dumpobj = _make_request_dumpobj(params, extra_headers, _log_config.max_body_chars)
+    logger.debug(f"REQUEST: {json.dumps(dumpobj, cls=SetEncoder)}")
+
+
+def log_failed_request(params: RequestParameters, extra_headers: dict[str, Any] | None = None) -> None:
+    """Logs the request in full, because it failed."""
+    dumpobj = _make_request_dumpobj(params, extra_headers, max_body_chars=None)
+    logger.warning(f"FAILED REQUEST: {json.dumps(dumpobj, cls=SetEncoder)}")
+
+
+def _make_request_dumpobj(
+    params: RequestParameters, extra_headers: dict[str, Any] | None, max_body_chars: int | None
+) -> dict[str, Any]:
+    dumpobj: dict[str, Any] = {
         "method": params.method,
         "url": params.url,
         "timeout": params.timeout,
@@ -121,17 +170,49 @@ def log_request(params: RequestParameters, extra_headers: dict[str, Any] | None
         headers_to_log = headers_to_log | params.headers
     dumpobj["headers"] = sanitize_headers(headers_to_log)
     if params.data:
-        data = params.data.copy()
-        if "password" in data:
-            data["password"] = "***"
-        dumpobj["data"] = data
+        dumpobj["data"] = _get_data_to_log(params, max_body_chars)
     if params.files:
         dumpobj["files"] = [x.file_name for x in params.files.files]
-    logger.debug(f"REQUEST: {json.dumps(dumpobj, cls=SetEncoder)}")
-
-
-def log_response(response: Response, status_code: int, include_response_content: bool = True) -> None:
-    """Log the response of a request."""
+    return dumpobj
+
+
+def _get_data_to_log(params: RequestParameters, max_body_chars: int | None) -> Any:
+    data = params.data or {}
+    if "password" in data:
+        return data | {"password": "***"}
+    serialized = params.data_serialized or b""
+    if max_body_chars is None or len(serialized) <= max_body_chars:
+        return data
+    # the payload has already been serialized for the request, so it does not need to be serialized again
+    return _truncate(serialized[:max_body_chars].decode("utf-8", errors="ignore"), len(serialized))
+
+
+def log_response(
+    response: Response,
+    status_code: int,
+    include_response_content: bool = True,
+    request: RequestParameters | None = None,
+    extra_headers: dict[str, Any] | None = None,
+) -> None:
+    """
+    Log the response of a request.
+    Only a sample of the successful responses is logged, with their content truncated.
+    A failed response is logged in full, together with its request (if it is given).
+    """
+    if status_code in _SUCCESS_STATUS_CODES:
+        if random.random() < _log_config.success_sample_rate:  # noqa: S311 (not used for cryptography)
+            dumpobj = _make_response_dumpobj(response, include_response_content, _log_config.max_body_chars)
+            logger.debug(f"RESPONSE: {json.dumps(dumpobj)}")
+        return
+    if request:
+        log_failed_request(request, extra_headers)
+    dumpobj = _make_response_dumpobj(response, include_response_content, max_body_chars=None)
+    logger.warning(f"RESPONSE: {json.dumps(dumpobj)}")
+
+
+def _make_response_dumpobj(
+    response: Response, include_response_content: bool, max_body_chars: int | None
+) -> dict[str, Any]:
     dumpobj: dict[str, Any] = {
         "status_code": response.status_code,
         "headers": sanitize_headers(dict(response.headers)) if response.headers else "",
@@ -143,14 +224,13 @@ def log_response(response: Response, status_code: int, include_response_content:
             dumpobj["content"] = response.text
     else:
         dumpobj["content"] = "too big to be logged"
-    log_str = f"RESPONSE: {json.dumps(dumpobj)}"
+    if max_body_chars is not None and len(content := json.dumps(dumpobj["content"])) > max_body_chars:
+        dumpobj["content"] = _truncate(content[:max_body_chars], len(content))
+    return dumpobj
 
-    debug_log_levels = [HTTPStatus.OK, HTTPStatus.ACCEPTED, HTTPStatus.NO_CONTENT]
 
-    if status_code in debug_log_levels:
-        logger.debug(log_str)
-    else:
-        logger.warning(log_str)
+def _truncate(start: str, total_length: int) -> str:
+    return f"{start}... [truncated, {total_length} in total]"
 
 
 def sanitize_headers(headers: dict[str, str | bytes]) -> dict[str, str]:
@@ -168,42 +248,6 @@ def sanitize_headers(headers: dict[str, str | bytes]) -> dict[str, str]:
     return {k: _mask(k, v) for k, v in headers.items()}
 
 
-def log_request_failure_and_sleep(reason: str, retry_counter: int, exc_info: bool) -> None:
-    """
-    Log the reason for a request failure and sleep.
-
-    =============  ================  =============================
-    retry_counter  seconds to sleep  cumulative waiting time (min)
-    =============  ================  =============================
-    0              1                 0
-    1              2                 0
-    2              4                 0
-    3              8                 0
-    4              16                0
-    5              32                1
-    6              64                2
-    7              128               4
-    8              256               9
-    9              300               14
-    10             300               19
-    11             300               24
-    12             300               29
-    15             300               44
-    18             300               59
-    24             300               89
-    30             300               119
-    =============  ================  =============================
-    """
-    sleep_time = min(2**retry_counter, 300)
-    msg = f"{reason}: Try reconnecting to DSP server, next attempt in {sleep_time} seconds..."
-    print(f"{datetime.now()}: {msg}")
-    if exc_info:
-        logger.exception(f"{msg} ({retry_counter=:})")
-    else:
-        logger.error(f"{msg} ({retry_counter=:})")
-    time.sleep(sleep_time)
-
-
 def log_and_raise_timeouts(error: TimeoutError | ReadTimeout) -> Never:
     msg = f"A '{error.__class__.__name__}' occurred during the connection to the DSP server."
     print(f"{datetime.now()}: {msg}")
@@ -0,0 +1,214 @@
+from __future__ import annotations
+
+import math
+import os
+import random
+import threading
+import time
+from collections import defaultdict
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from dataclasses import field
+from pathlib import Path
+from typing import Any
+
+from dsp_tools.utils.file_utils import write_atomically
+
+PROMETHEUS_TEXTFILE_ENV_VAR = "DSP_TOOLS_PROMETHEUS_TEXTFILE"
+
+BYTES_SENT = "bytes_sent"
+
+_PROMETHEUS_PREFIX = "dsp_tools_xmlupload"
+_QUANTILES = (0.5, 0.95, 0.99)
+# Above this number of executions of a phase, its percentiles are estimated from a random sample of this size
+MAX_SAMPLES_PER_PHASE = 10_000
+
+
+@dataclass(frozen=True)
+class PhaseSummary:
+    """
+    Timings of one phase of a run.
+
+    Attributes:
+        count: how many times the phase was executed (e.g. once per resource)
+        total_seconds: time spent in the phase, summed over all executions (and over all threads)
+        throughput_per_second: executions per second of the whole run
+        p50_seconds: median duration of one execution
+        p95_seconds: 95th percentile of the duration of one execution
+        p99_seconds: 99th percentile of the duration of one execution
+
+    If a phase was executed more than `MAX_SAMPLES_PER_PHASE` times,
+    the percentiles are estimated from a random sample of the executions.
+    """
+
+    count: int
+    total_seconds: float
+    throughput_per_second: float
+    p50_seconds: float
+    p95_seconds: float
+    p99_seconds: float
+
+
+@dataclass(frozen=True)
+class TelemetrySummary:
+    """Timings of all phases of a run, and its counters (e.g. the number of bytes sent)."""
+
+    elapsed_seconds: float
+    phases: dict[str, PhaseSummary]
+    counters: dict[str, int]
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "elapsed_seconds": round(self.elapsed_seconds, 3),
+            "counters": dict(self.counters),
+            "phases": {
+                name: {k: round(v, 6) if isinstance(v, float) else v for k, v in vars(phase).items()}
+                for name, phase in self.phases.items()
+            },
+        }
+
+    def to_prometheus(self) -> str:
+        """Serialise the summary in the text-based exposition format of Prometheus."""
+        lines = [
+            f"# HELP {_PROMETHEUS_PREFIX}_elapsed_seconds Duration of the run.",
+            f"# TYPE {_PROMETHEUS_PREFIX}_elapsed_seconds gauge",
+            f"{_PROMETHEUS_PREFIX}_elapsed_seconds {self.elapsed_seconds}",
+        ]
+        for name, value in self.counters.items():
+            lines.extend(
+                [
+                    f"# TYPE {_PROMETHEUS_PREFIX}_{name}_total counter",
+                    f"{_PROMETHEUS_PREFIX}_{name}_total {value}",
+                ]
+            )
+        metric = f"{_PROMETHEUS_PREFIX}_phase_duration_seconds"
+        lines.extend(
+            [
+                f"# HELP {metric} Duration of one execution of a phase.",
+                f"# TYPE {metric} summary",
+            ]
+        )
+        for name, phase in self.phases.items():
+            quantiles = zip(_QUANTILES, (phase.p50_seconds, phase.p95_seconds, phase.p99_seconds))
+            lines.extend(f'{metric}{{phase="{name}",quantile="{q}"}} {value}' for q, value in quantiles)
+            lines.append(f'{metric}_sum{{phase="{name}"}} {phase.total_seconds}')
+            lines.append(f'{metric}_count{{phase="{name}"}} {phase.count}')
+        return "\n".join(lines) + "\n"
+
+
+@dataclass
+class _PhaseDurations:
+    """
+    The number and the sum of the durations of a phase, and a uniform random sample of the durations,
+    so that the memory does not grow with the number of executions (reservoir sampling).
+    """
+
+    max_samples: int
+    count: int = 0
+    total_seconds: float = 0.0
+    samples: list[float] = field(default_factory=list)
+
+    def add(self, seconds: float, rng: random.Random) -> None:
+        self.count += 1
+        self.total_seconds += seconds
+        if len(self.samples) < self.max_samples:
+            self.samples.append(seconds)
+        elif (index := rng.randrange(self.count)) < self.max_samples:
+            self.samples[index] = seconds
+
+
+@dataclass
+class Telemetry:
+    """
+    Timers and counters of a run, which may be fed from several threads.
+
+    Per phase, at most `max_samples_per_phase` durations are kept, from which the percentiles are computed at the end.
+    """
+
+    started: float = field(default_factory=time.monotonic)
+    max_samples_per_phase: int = MAX_SAMPLES_PER_PHASE
+    _durations: dict[str, _PhaseDurations] = field(init=False, default_factory=dict)
+    _rng: random.Random = field(init=False, default_factory=random.Random)  # noqa: S311 (not used for security)
+    _counters: defaultdict[str, int] = field(init=False, default_factory=lambda: defaultdict(int))
+    _lock: threading.Lock = field(init=False, default_factory=threading.Lock)
+
+    @contextmanager
+    def measure(self, phase: str) -> Iterator[None]:
+        """Measure the time spent in the block, and record it as one execution of the phase."""
+        start = time.monotonic()
+        try:
+            yield
+        finally:
+            self.record(phase, time.monotonic() - start)
+
+    def record(self, phase: str, seconds: float) -> None:
+        with self._lock:
+            if (durations := self._durations.get(phase)) is None:
+                durations = self._durations[phase] = _PhaseDurations(self.max_samples_per_phase)
+            durations.add(seconds, self._rng)
+
+    def add(self, counter: str, amount: int = 1) -> None:
+        with self._lock:
+            self._counters[counter] += amount
+
+    def summary(self) -> TelemetrySummary:
+        elapsed = time.monotonic() - self.started
+        with self._lock:
+            durations = {name: (x.count, x.total_seconds, sorted(x.samples)) for name, x in self._durations.items()}
+            counters = dict(self._counters)
+        phases = {name: _summarise_phase(*values, elapsed=elapsed) for name, values in durations.items()}
+        return TelemetrySummary(elapsed_seconds=elapsed, phases=phases, counters=counters)
+
+
+def _summarise_phase(count: int, total_seconds: float, sorted_samples: list[float], elapsed: float) -> PhaseSummary:
+    p50, p95, p99 = (_percentile(sorted_samples, q) for q in _QUANTILES)
+    return PhaseSummary(
+        count=count,
+        total_seconds=total_seconds,
+        throughput_per_second=count / elapsed if elapsed > 0 else 0.0,
+        p50_seconds=p50,
+        p95_seconds=p95,
+        p99_seconds=p99,
+    )
+
+
+def _percentile(sorted_values: list[float], quantile: float) -> float:
+    # nearest-rank method: the smallest value that is greater than or equal to the given share of the values
+    if not sorted_values:
+        return 0.0
+    rank = max(math.ceil(quantile * len(sorted_values)), 1)
+    return sorted_values[rank - 1]
+
+
+def write_prometheus_textfile(summary: TelemetrySummary) -> Path | None:
+    """
+    Write the summary to the file configured in the environment, if any,
+    so that it can be picked up by the textfile collector of the Prometheus node exporter.
+
+    Returns:
+        the path of the file, if one was written
+    """
+    if not (location := os.getenv(PROMETHEUS_TEXTFILE_ENV_VAR)):
+        return None
+    path = Path(location)
+    write_atomically(path, summary.to_prometheus())
+    return path
+
+
+_lock = threading.Lock()
+_current = Telemetry()
+
+
+def get_telemetry() -> Telemetry:
+    """Returns the telemetry of the current run."""
+    with _lock:
+        return _current
+
+
+def reset_telemetry() -> Telemetry:
+    """Start the telemetry of a new run, and return it."""
+    global _current  # noqa: PLW0603 (global-statement)
+    with _lock:
+        _current = Telemetry()
+        return _current
@@ -1,3 +1,4 @@
+import sys
 from pathlib import Path
 
 import regex
@@ -19,35 +20,50 @@ from dsp_tools.utils.xml_parsing.models.parsed_resource import ParsedMigrationMe
 from dsp_tools.utils.xml_parsing.models.parsed_resource import ParsedResource
 from dsp_tools.utils.xml_parsing.models.parsed_resource import ParsedValue
 
+# the order of the tags determines the order of the parsed resources
+_RESOURCE_TAGS = ("resource", "region", "link", "video-segment", "audio-segment")
+
 
 def get_parsed_resources(root: etree._Element, api_url: str) -> list[ParsedResource]:
     api_url = convert_api_url_for_correct_iri_namespace_construction(api_url)
-    iri_lookup = _create_from_local_name_to_absolute_iri_lookup(root, api_url)
-    all_res: list[ParsedResource] = []
-    for res in root.iterdescendants(tag="resource"):
-        res_type = iri_lookup[res.attrib["restype"]]
-        all_res.append(_parse_one_resource(res, res_type, iri_lookup))
-    for res in root.iterdescendants(tag="region"):
-        res_type = f"{KNORA_API_PREFIX}Region"
-        all_res.append(_parse_one_resource(res, res_type, iri_lookup))
-    for res in root.iterdescendants(tag="link"):
-        res_type = f"{KNORA_API_PREFIX}LinkObj"
-        all_res.append(_parse_one_resource(res, res_type, iri_lookup))
-    for res in root.iterdescendants(tag="video-segment"):
-        all_res.append(_parse_segment(res, "Video"))
-    for res in root.iterdescendants(tag="audio-segment"):
-        all_res.append(_parse_segment(res, "Audio"))
-    return all_res
-
-
-def _create_from_local_name_to_absolute_iri_lookup(root: etree._Element, api_url: str) -> dict[str, str]:
-    shortcode = root.attrib["shortcode"]
-    default_ontology = root.attrib["default-ontology"]
-    local_names = {ele.attrib["restype"] for ele in root.iterdescendants(tag="resource")}
-    props = {ele.attrib["name"] for ele in root.iter() if "name" in ele.attrib}
-    local_names.update(props)
-    lookup = {local: _get_one_absolute_iri(local, shortcode, default_ontology, api_url) for local in local_names}
-    return lookup
+    iri_lookup = _AbsoluteIriLookup(root.attrib["shortcode"], root.attrib["default-ontology"], api_url)
+    by_tag: dict[str, list[ParsedResource]] = {tag: [] for tag in _RESOURCE_TAGS}
+    for res in root.iterdescendants(tag=_RESOURCE_TAGS):
+        by_tag[str(res.tag)].append(_parse_resource_element(res, iri_lookup))
+    return [res for tag in _RESOURCE_TAGS for res in by_tag[tag]]
+
+
+def _parse_resource_element(res: etree._Element, iri_lookup: dict[str, str]) -> ParsedResource:
+    match res.tag:
+        case "resource":
+            return _parse_one_resource(res, iri_lookup[res.attrib["restype"]], iri_lookup)
+        case "region":
+            return _parse_one_resource(res, f"{KNORA_API_PREFIX}Region", iri_lookup)
+        case "link":
+            return _parse_one_resource(res, f"{KNORA_API_PREFIX}LinkObj", iri_lookup)
+        case "video-segment":
+            return _parse_segment(res, "Video")
+        case _:
+            return _parse_segment(res, "Audio")
+
+
+class _AbsoluteIriLookup(dict[str, str]):
+    """
+    Lookup from the prefixed names of classes and properties (as used in the XML file) to their absolute IRIs.
+    The IRI of a name is constructed when it is looked up for the first time,
+    so that the XML file does not need to be traversed beforehand to collect all names.
+    """
+
+    def __init__(self, shortcode: str, default_ontology: str, api_url: str) -> None:
+        super().__init__()
+        self.shortcode = shortcode
+        self.default_ontology = default_ontology
+        self.api_url = api_url
+
+    def __missing__(self, local_name: str) -> str:
+        iri = _get_one_absolute_iri(local_name, self.shortcode, self.default_ontology, self.api_url)
+        self[local_name] = iri
+        return iri
 
 
 def _get_one_absolute_iri(local_name: str, shortcode: str, default_ontology: str, api_url: str) -> str:
@@ -75,13 +91,13 @@ def _parse_segment(segment: etree._Element, segment_type: str) -> ParsedResource
     migration_metadata = _parse_migration_metadata(segment)
     return ParsedResource(
         res_id=segment.attrib["id"],
-        res_type=f"{KNORA_API_PREFIX}{segment_type}Segment",
+        res_type=sys.intern(f"{KNORA_API_PREFIX}{segment_type}Segment"),
         label=segment.attrib["label"],
-        permissions_id=segment.attrib.get("permissions"),
+        permissions_id=_get_interned(segment.attrib, "permissions"),
         values=values,
         file_value=None,
         migration_metadata=migration_metadata,
-        authorship_id=segment.attrib.get("authorship-id"),
+        authorship_id=_get_interned(segment.attrib, "authorship-id"),
     )
 
 
@@ -89,11 +105,11 @@ def _parse_segment_values(segment: etree._Element, segment_type: str) -> list[Pa
     values: list[ParsedValue] = []
     value: str | tuple[str, str] | None
     for val in segment.iterchildren():
-        prop = f"{KNORA_API_PREFIX}{val.tag!s}"
+        prop = sys.intern(f"{KNORA_API_PREFIX}{val.tag!s}")
         match val.tag:
             case "isSegmentOf":
                 val_type = KnoraValueType.LINK_VALUE
-                prop = f"{KNORA_API_PREFIX}is{segment_type}SegmentOf"
+                prop = sys.intern(f"{KNORA_API_PREFIX}is{segment_type}SegmentOf")
                 value = val.text.strip() if val.text else None
             case "hasSegmentBounds":
                 val_type = KnoraValueType.INTERVAL_VALUE
@@ -112,7 +128,7 @@ def _parse_segment_values(segment: etree._Element, segment_type: str) -> list[Pa
                 prop_name=prop,
                 value=value,
                 value_type=val_type,
-                permissions_id=val.attrib.get("permissions"),
+                permissions_id=_get_interned(val.attrib, "permissions"),
                 comment=val.attrib.get("comment"),
                 value_order=_get_value_order(val.attrib),
             )
@@ -127,11 +143,11 @@ def _parse_one_resource(resource: etree._Element, res_type: str, iri_lookup: dic
         res_id=resource.attrib["id"],
         res_type=res_type,
         label=resource.attrib["label"],
-        permissions_id=resource.attrib.get("permissions"),
+        permissions_id=_get_interned(resource.attrib, "permissions"),
         values=values,
         file_value=file_value,
         migration_metadata=migration_metadata,
-        authorship_id=resource.attrib.get("authorship-id"),
+        authorship_id=_get_interned(resource.attrib, "authorship-id"),
     )
 
 
@@ -182,7 +198,7 @@ def _parse_generic_values(values: etree._Element, prop_name: str) -> list[Parsed
                 prop_name=prop_name,
                 value=val.text.strip() if val.text else None,
                 value_type=value_type,
-                permissions_id=val.attrib.get("permissions"),
+                permissions_id=_get_interned(val.attrib, "permissions"),
                 comment=val.attrib.get("comment"),
                 value_order=_get_value_order(val.attrib),
             )
@@ -192,15 +208,16 @@ def _parse_generic_values(values: etree._Element, prop_name: str) -> list[Parsed
 
 def _parse_list_value(values: etree._Element, prop_name: str) -> list[ParsedValue]:
     parsed_values = []
-    list_name = values.attrib["list"]
+    list_name = sys.intern(values.attrib["list"])
     for val in values:
-        list_node = val.text.strip() if val.text else None
+        # the same list nodes are used by many values
+        list_node = sys.intern(val.text.strip()) if val.text else None
         parsed_values.append(
             ParsedValue(
                 prop_name=prop_name,
                 value=(list_name, list_node),
                 value_type=KnoraValueType.LIST_VALUE,
-                permissions_id=val.attrib.get("permissions"),
+                permissions_id=_get_interned(val.attrib, "permissions"),
                 comment=val.attrib.get("comment"),
                 value_order=_get_value_order(val.attrib),
             )
@@ -222,7 +239,7 @@ def _parse_text_value(values: etree._Element, prop_name: str) -> list[ParsedValu
                 prop_name=prop_name,
                 value=value,
                 value_type=val_type,
-                permissions_id=val.attrib.get("permissions"),
+                permissions_id=_get_interned(val.attrib, "permissions"),
                 comment=val.attrib.get("comment"),
                 value_order=_get_value_order(val.attrib),
             )
@@ -319,10 +336,10 @@ def _parse_bitstream_tag(file_value: etree._Element) -> ParsedFileValue:
 
 def _parse_file_metadata(file_value: etree._Element) -> ParsedFileValueMetadata:
     return ParsedFileValueMetadata(
-        license_iri=file_value.attrib.get("license"),
-        copyright_holder=file_value.attrib.get("copyright-holder"),
-        authorship_id=file_value.attrib.get("authorship-id"),
-        permissions_id=file_value.attrib.get("permissions"),
+        license_iri=_get_interned(file_value.attrib, "license"),
+        copyright_holder=_get_interned(file_value.attrib, "copyright-holder"),
+        authorship_id=_get_interned(file_value.attrib, "authorship-id"),
+        permissions_id=_get_interned(file_value.attrib, "permissions"),
     )
 
 
@@ -350,5 +367,10 @@ def _get_file_value_type(file_name: str | None) -> KnoraFileValueType | None:  #
             return None
 
 
+def _get_interned(attribs: etree._Attrib, name: str) -> str | None:
+    # The same IDs and IRIs are used by many elements, but lxml creates a new string every time an attribute is read.
+    return sys.intern(found) if (found := attribs.get(name)) is not None else None
+
+
 def _get_value_order(attribs: etree._Attrib) -> int | None:
     return int(found) if (found := attribs.get("order")) is not None else None
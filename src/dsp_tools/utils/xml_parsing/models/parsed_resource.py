@@ -8,7 +8,7 @@ from enum import auto
 from dsp_tools.utils.rdf_constants import URN_DASCH_PLACEHOLDER
 
 
-@dataclass
+@dataclass(slots=True)
 class ParsedResource:
     res_id: str
     res_type: str
@@ -20,14 +20,14 @@ class ParsedResource:
     authorship_id: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ParsedMigrationMetadata:
     iri: str | None
     ark: str | None
     creation_date: str | None
 
 
-@dataclass
+@dataclass(slots=True)
 class ParsedValue:
     prop_name: str
     value: str | tuple[str | None, str | None] | None
@@ -37,24 +37,24 @@ class ParsedValue:
     value_order: int | None
 
 
-@dataclass
+@dataclass(slots=True)
 class ParsedFileValue:
     value: ParsedFileValueValue
     value_type: KnoraFileValueType | None
     metadata: ParsedFileValueMetadata
 
 
-@dataclass
+@dataclass(slots=True)
 class ParsedFileValueValue(ABC):
     value: str | None
 
 
-@dataclass
+@dataclass(slots=True)
 class ParsedFileBitstream(ParsedFileValueValue):
     """Content of the bitstream tag, i.e. the filepath."""
 
 
-@dataclass
+@dataclass(slots=True)
 class ParsedFileIiifUri(ParsedFileValueValue):
     """Content of the iiif-uri tag, i.e. the IIIF-URI."""
 
@@ -62,11 +62,13 @@ class ParsedFileIiifUri(ParsedFileValueValue):
 class ParsedFilePlaceholder(ParsedFileValueValue):
     """Placeholder type"""
 
+    __slots__ = ()
+
     def __init__(self) -> None:
         self.value = URN_DASCH_PLACEHOLDER
 
 
-@dataclass
+@dataclass(slots=True)
 class ParsedFileValueMetadata:
     license_iri: str | None
     copyright_holder: str | None
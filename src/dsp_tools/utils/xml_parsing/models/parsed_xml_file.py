@@ -0,0 +1,23 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+from lxml import etree
+
+from dsp_tools.utils.xml_parsing.models.parsed_resource import ParsedResource
+
+
+@dataclass
+class ParsedXmlFile:
+    """
+    The content of a cleaned and validated XML data file:
+    the root element with the permissions and authorships (but without the resources),
+    and the parsed resources.
+    """
+
+    header: etree._Element
+    parsed_resources: list[ParsedResource]
+
+    @property
+    def shortcode(self) -> str:
+        return self.header.attrib["shortcode"]
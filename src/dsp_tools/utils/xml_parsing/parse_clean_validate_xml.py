@@ -1,7 +1,5 @@
 from __future__ import annotations
 
-import importlib.resources
-from copy import deepcopy
 from pathlib import Path
 
 import pandas as pd
@@ -15,6 +13,8 @@ from dsp_tools.setup.ansi_colors import BOLD_RED
 from dsp_tools.setup.ansi_colors import RESET_TO_DEFAULT
 from dsp_tools.utils.exceptions import XsdValidationError
 from dsp_tools.utils.spinners import get_default_spinner
+from dsp_tools.utils.xml_parsing.xsd_validation import XsdError
+from dsp_tools.utils.xml_parsing.xsd_validation import validate_against_data_schema
 from dsp_tools.utils.xsd_validation_error_msg import XSDValidationMessage
 from dsp_tools.utils.xsd_validation_error_msg import get_xsd_validation_message_str
 
@@ -23,10 +23,11 @@ list_separator = "\n    - "
 
 
 def parse_and_clean_xml_file(input_file: Path) -> etree._Element:
+    # Only one tree is kept in memory: the parser already removes comments and processing instructions,
+    # and the tags are renamed in place.
     sp = get_default_spinner("Parsing XML file")
     with sp:
         root = parse_xml_file(input_file)
-        root = _remove_comments_from_element_tree(root)
         if not validate_root_emit_user_message(root, Path(input_file).parent):
             raise XsdValidationError(
                 "The XML file contains validation errors."
@@ -37,8 +38,7 @@ def parse_and_clean_xml_file(input_file: Path) -> etree._Element:
 
 def parse_and_validate_xml_file(input_file: Path | str) -> bool:
     root = parse_xml_file(input_file)
-    data_xml = _remove_comments_from_element_tree(root)
-    return validate_root_emit_user_message(data_xml, Path(input_file).parent)
+    return validate_root_emit_user_message(root, Path(input_file).parent)
 
 
 def parse_xml_file(input_file: str | Path) -> etree._Element:
@@ -53,32 +53,12 @@ def parse_xml_file(input_file: str | Path) -> etree._Element:
 
 
 def transform_into_localnames(root: etree._Element) -> etree._Element:
-    """Removes the namespace of the tags."""
-    tree = deepcopy(root)
-    for elem in tree.iter():
+    """Removes the namespace of the tags, modifying the tree in place. Returns the same root element."""
+    for elem in root.iter(tag=etree.Element):
         elem.tag = etree.QName(elem).localname
-    return tree
-
-
-def _remove_comments_from_element_tree(input_tree: etree._Element) -> etree._Element:
-    """Removes comments and processing instructions."""
-    root = deepcopy(input_tree)
-    for c in root.xpath("//comment()"):
-        c.getparent().remove(c)
-    for c in root.xpath("//processing-instruction()"):
-        c.getparent().remove(c)
     return root
 
 
-def _validate_xml_tree_against_schema(data_xml: etree._Element) -> etree.XMLSchema | None:
-    schema_res = importlib.resources.files("dsp_tools").joinpath("resources/schema/data.xsd")
-    with schema_res.open(encoding="utf-8") as schema_file:
-        xmlschema = etree.XMLSchema(etree.parse(schema_file))
-    if not xmlschema.validate(data_xml):
-        return xmlschema
-    return None
-
-
 def validate_root_emit_user_message(root: etree._Element, save_path: Path) -> bool:
     validation_errors = _validate_root_get_validation_messages(root)
     if validation_errors:
@@ -88,8 +68,8 @@ def validate_root_emit_user_message(root: etree._Element, save_path: Path) -> bo
 
 
 def _validate_root_get_validation_messages(data_xml: etree._Element) -> list[XSDValidationMessage] | None:
-    if errors := _validate_xml_tree_against_schema(data_xml):
-        return _reformat_validation_errors(errors.error_log)
+    if errors := validate_against_data_schema(data_xml):
+        return _reformat_validation_errors(errors)
     if conflicts := _check_bitstream_placeholder_conflict(data_xml):
         return conflicts
     return None
@@ -134,8 +114,8 @@ def _emit_validation_errors(validation_errors: list[XSDValidationMessage], save_
             logger.error(msg_str)
 
 
-def _reformat_validation_errors(log: etree._ListErrorLog) -> list[XSDValidationMessage]:
-    res = [_reformat_error_message_str(err.message, err.line) for err in log]
+def _reformat_validation_errors(errors: list[XsdError]) -> list[XSDValidationMessage]:
+    res = [_reformat_error_message_str(err.message, err.line) for err in errors]
     return [x for x in res if x]
 
 
@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+import hashlib
+import pickle
+from dataclasses import dataclass
+from dataclasses import field
+from importlib.metadata import version
+from pathlib import Path
+
+from loguru import logger
+from lxml import etree
+
+from dsp_tools.utils.file_utils import hash_file
+from dsp_tools.utils.file_utils import write_atomically
+from dsp_tools.utils.xml_parsing.get_parsed_resources import get_parsed_resources
+from dsp_tools.utils.xml_parsing.models.parsed_xml_file import ParsedXmlFile
+from dsp_tools.utils.xml_parsing.parse_clean_validate_xml import parse_and_clean_xml_file
+from dsp_tools.utils.xml_parsing.parse_clean_validate_xml import transform_into_localnames
+
+PARSED_XML_CACHE_MAX_ENTRIES = 10
+
+_HEADER_TAGS = ("permissions", "authorship")
+
+
+def get_parsed_xml_file(xml_file: Path, api_url: str, use_cache: bool = False) -> ParsedXmlFile:
+    """
+    Parses, cleans and validates an XML data file, and parses its resources.
+
+    If the cache is used, the result is taken from an earlier run on the same file, if possible.
+    Otherwise, the result is stored in the cache for the next run.
+
+    Args:
+        xml_file: path to the XML file
+        api_url: URL of the DSP-API server, used to construct the IRIs of the classes and properties
+        use_cache: whether to use the cache in `~/.dsp-tools/cache/parsed-xml/`
+
+    Returns:
+        the root element with the permissions and authorships, and the parsed resources
+
+    Raises:
+        XsdValidationError: if the XML file is invalid
+    """
+    if not use_cache:
+        return _parse_xml_file(xml_file, api_url)
+    cache = ParsedXmlCache()
+    key = cache.get_key(xml_file, api_url)
+    if cached := cache.load(key):
+        logger.info(f"Using the parsed XML file from the cache, instead of parsing {xml_file} again")
+        return cached
+    parsed_xml = _parse_xml_file(xml_file, api_url)
+    cache.save(key, parsed_xml)
+    return parsed_xml
+
+
+def _parse_xml_file(xml_file: Path, api_url: str) -> ParsedXmlFile:
+    root = parse_and_clean_xml_file(xml_file)
+    parsed_resources = get_parsed_resources(root, api_url)
+    for elem in list(root.iterchildren()):
+        if elem.tag not in _HEADER_TAGS:
+            root.remove(elem)
+    return ParsedXmlFile(header=root, parsed_resources=parsed_resources)
+
+
+@dataclass
+class ParsedXmlCache:
+    """
+    Parsed XML files of earlier runs, so that a file that has not changed does not have to be parsed,
+    validated against the XSD schema, and transformed into ParsedResources again.
+
+    An entry is identified by the hash of the content of the XML file, the version of DSP-TOOLS, and the server,
+    because the IRIs of the parsed resources depend on the server.
+    Every entry is a pickle file, and only the most recently used entries are kept.
+    """
+
+    directory: Path = field(default_factory=lambda: Path.home() / ".dsp-tools" / "cache" / "parsed-xml")
+    max_entries: int = PARSED_XML_CACHE_MAX_ENTRIES
+
+    def get_key(self, xml_file: Path, api_url: str) -> str:
+        """The key of the entry of an XML file, which changes as soon as the content of the file changes."""
+        identifier = f"{hash_file(xml_file)}\n{version('dsp-tools')}\n{api_url}"
+        return hashlib.sha256(identifier.encode()).hexdigest()
+
+    def load(self, key: str) -> ParsedXmlFile | None:
+        """Returns the entry with the given key, or None if there is no valid entry."""
+        location = self.directory / f"{key}.pickle"
+        if not location.is_file():
+            return None
+        try:
+            with open(location, "rb") as f:
+                header, parsed_resources = pickle.load(f)  # noqa: S301 (deserialization of untrusted data)
+            location.touch()
+        except (OSError, EOFError, ValueError, pickle.UnpicklingError):
+            logger.warning(f"Ignoring the invalid entry {location} of the parsed XML cache")
+            return None
+        # the namespace declaration of the root is serialised with it, so the tags must be renamed again
+        header_root = transform_into_localnames(etree.fromstring(header))
+        return ParsedXmlFile(header=header_root, parsed_resources=parsed_resources)
+
+    def save(self, key: str, parsed_xml: ParsedXmlFile) -> None:
+        """Stores the entry, and removes the least recently used entries if there are too many."""
+        # lxml elements cannot be pickled, but the header is small enough to be serialised and parsed again
+        content = (etree.tostring(parsed_xml.header), parsed_xml.parsed_resources)
+        try:
+            write_atomically(self.directory / f"{key}.pickle", pickle.dumps(content, protocol=pickle.HIGHEST_PROTOCOL))
+            self._remove_least_recently_used()
+        except OSError:
+            logger.exception(f"Unable to store the parsed XML file in the cache {self.directory}")
+
+    def _remove_least_recently_used(self) -> None:
+        entries = sorted(self.directory.glob("*.pickle"), key=lambda x: x.stat().st_mtime_ns, reverse=True)
+        for entry in entries[self.max_entries :]:
+            entry.unlink(missing_ok=True)
@@ -0,0 +1,196 @@
+from __future__ import annotations
+
+import bisect
+import functools
+import importlib.resources
+import multiprocessing
+from collections import deque
+from collections.abc import Iterator
+from concurrent.futures import Future
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+
+from loguru import logger
+from lxml import etree
+
+from dsp_tools.utils.env_vars import get_positive_int_from_env
+
+XSD_VALIDATION_PROCESSES_ENV_VAR = "DSP_TOOLS_XSD_VALIDATION_PROCESSES"
+
+# Files with fewer resources are validated in one go,
+# because starting the processes would take longer than the validation itself.
+SHARDED_VALIDATION_MIN_RESOURCES = 20_000
+RESOURCES_PER_SHARD = 2_000
+
+_DSP_NAMESPACE = "https://dasch.swiss/schema"
+_HEADER_TAGS = ("permissions", "authorship")
+
+
+@dataclass(frozen=True)
+class XsdError:
+    """An error of the XSD validation, with the line number in the original XML file."""
+
+    message: str
+    line: int
+
+
+@functools.cache
+def get_data_schema() -> etree.XMLSchema:
+    """
+    The compiled XSD schema of the XML data files, which is parsed only once per process.
+    The error log of the schema belongs to its last validation, so it must not be validated from several threads.
+    """
+    schema_res = importlib.resources.files("dsp_tools").joinpath("resources/schema/data.xsd")
+    with schema_res.open(encoding="utf-8") as schema_file:
+        return etree.XMLSchema(etree.parse(schema_file))
+
+
+def validate_against_data_schema(root: etree._Element) -> list[XsdError] | None:
+    """
+    Validates the XML tree against the XSD schema of the XML data files.
+
+    If several processes are configured (see `DSP_TOOLS_XSD_VALIDATION_PROCESSES`),
+    big files are split into shards, which are validated in parallel by these processes.
+    Every shard contains the permissions and authorships, and a batch of the resources,
+    so that the references to the permissions and authorships can be validated within every shard.
+    The uniqueness of the IDs, IRIs and ARKs is checked across the shards.
+
+    Args:
+        root: root of the XML tree (with namespaces)
+
+    Returns:
+        the errors, or None if the tree is valid
+    """
+    num_of_processes = _get_num_of_validation_processes()
+    if num_of_processes > 1 and len(root) >= SHARDED_VALIDATION_MIN_RESOURCES:
+        errors = _validate_sharded(root, num_of_processes)
+    else:
+        errors = _validate_in_one_go(root)
+    return errors or None
+
+
+def _get_num_of_validation_processes() -> int:
+    # Every shard must be serialised and parsed again, which costs more than the validation itself.
+    # Therefore, the sharded validation is only faster with many CPU cores, and must be switched on explicitly.
+    return get_positive_int_from_env(XSD_VALIDATION_PROCESSES_ENV_VAR, 1)
+
+
+def _validate_in_one_go(root: etree._Element) -> list[XsdError]:
+    schema = get_data_schema()
+    if schema.validate(root):
+        return []
+    return [XsdError(err.message, err.line) for err in schema.error_log]
+
+
+def _validate_sharded(root: etree._Element, num_of_processes: int) -> list[XsdError]:
+    header, resources = _split_header_from_resources(root)
+    if any(etree.QName(x).localname in _HEADER_TAGS for x in resources):
+        # A permission or authorship after the first resource is only an error in the context of the whole file.
+        return _validate_in_one_go(root)
+    logger.debug(f"Validating the XML file in shards of {RESOURCES_PER_SHARD} resources")
+    shard_start, shard_end = _serialise_root_tags(root)
+    header_bytes, header_lines = _serialise_elements(header)
+    errors: list[XsdError] = []
+    # "spawn" is safe to use in a process that already runs other threads (e.g. the spinner)
+    with ProcessPoolExecutor(num_of_processes, mp_context=multiprocessing.get_context("spawn")) as executor:
+        # the shards are serialised while the previous ones are validated, so that not all of them are in memory
+        pending: deque[Future[list[XsdError]]] = deque()
+        for batch in _make_batches(resources):
+            batch_bytes, batch_lines = _serialise_elements(batch)
+            shard = shard_start + header_bytes + batch_bytes + shard_end
+            original_lines = [root.sourceline or 0, *header_lines, *batch_lines]
+            pending.append(executor.submit(_validate_shard, shard, original_lines))
+            if len(pending) >= 2 * num_of_processes:
+                errors.extend(pending.popleft().result())
+        errors.extend(_find_duplicate_ids(root))
+        errors.extend(_find_duplicate_attribute_values(root, "iri", "IRI_attribute_of_resource_must_be_unique"))
+        errors.extend(_find_duplicate_attribute_values(root, "ark", "ARK_attribute_of_resource_must_be_unique"))
+        while pending:
+            errors.extend(pending.popleft().result())
+    # The header is validated in every shard, and duplicates within a shard are also found across the shards.
+    unique_errors = dict.fromkeys(errors)
+    return sorted(unique_errors, key=lambda x: x.line)
+
+
+def _split_header_from_resources(root: etree._Element) -> tuple[list[etree._Element], list[etree._Element]]:
+    children = list(root.iterchildren(tag=etree.Element))
+    num_of_header_elements = next(
+        (i for i, x in enumerate(children) if etree.QName(x).localname not in _HEADER_TAGS), len(children)
+    )
+    return children[:num_of_header_elements], children[num_of_header_elements:]
+
+
+def _make_batches(resources: list[etree._Element]) -> Iterator[list[etree._Element]]:
+    for i in range(0, max(len(resources), 1), RESOURCES_PER_SHARD):
+        yield resources[i : i + RESOURCES_PER_SHARD]
+
+
+def _serialise_root_tags(root: etree._Element) -> tuple[bytes, bytes]:
+    empty_root = etree.tostring(etree.Element(root.tag, attrib=dict(root.attrib), nsmap=root.nsmap))
+    # e.g. b'<knora xmlns="https://dasch.swiss/schema" shortcode="4123"/>'
+    qualified_name = empty_root[1:].split(maxsplit=1)[0].removesuffix(b"/>")
+    return empty_root.removesuffix(b"/>") + b">\n", b"</" + qualified_name + b">"
+
+
+def _serialise_elements(elements: list[etree._Element]) -> tuple[bytes, list[int]]:
+    # Every top-level element starts on a new line, so that its line can be mapped back to the original file.
+    # Every element is serialised with the namespace declarations of its ancestors, so it does not need to be copied.
+    serialised = b"".join(etree.tostring(elem, with_tail=False) + b"\n" for elem in elements)
+    original_lines = [x.sourceline or 0 for elem in elements for x in elem.iter(tag=etree.Element)]
+    return serialised, original_lines
+
+
+def _validate_shard(shard: bytes, original_lines: list[int]) -> list[XsdError]:
+    """Runs in a separate process, and returns the errors with the line numbers of the original file."""
+    shard_root = etree.fromstring(shard)
+    schema = get_data_schema()
+    if schema.validate(shard_root):
+        return []
+    # The elements are in the same order as in the original file, but their lines can differ,
+    # e.g. because the serialisation puts all attributes of a tag on one line.
+    line_mapping: dict[int, int] = {}
+    for elem, original_line in zip(shard_root.iter(tag=etree.Element), original_lines):
+        line_mapping.setdefault(elem.sourceline or 0, original_line)
+    shard_lines = sorted(line_mapping)
+    return [XsdError(err.message, _map_line(err.line, shard_lines, line_mapping)) for err in schema.error_log]
+
+
+def _map_line(line: int, shard_lines: list[int], line_mapping: dict[int, int]) -> int:
+    index = bisect.bisect_right(shard_lines, line) - 1
+    if index < 0:
+        return line
+    start_of_element = shard_lines[index]
+    return line_mapping[start_of_element] + line - start_of_element
+
+
+def _find_duplicate_ids(root: etree._Element) -> list[XsdError]:
+    # the IDs of the permissions, authorships and resources must be unique in the entire file
+    seen = set()
+    errors = []
+    for elem in root.iterchildren(tag=etree.Element):
+        if (id_ := elem.get("id")) is None:
+            continue
+        if id_ in seen:
+            msg = (
+                f"Element '{etree.QName(elem).text}', attribute 'id': "
+                f"'{id_}' is not a valid value of the atomic type 'xs:ID'."
+            )
+            errors.append(XsdError(msg, elem.sourceline or 0))
+        seen.add(id_)
+    return errors
+
+
+def _find_duplicate_attribute_values(root: etree._Element, attribute: str, constraint: str) -> list[XsdError]:
+    seen = set()
+    errors = []
+    for elem in root.iter(tag=etree.Element):
+        if (value := elem.get(attribute)) is None:
+            continue
+        if value in seen:
+            msg = (
+                f"Element '{etree.QName(elem).text}': Duplicate key-sequence ['{value}'] "
+                f"in unique identity-constraint '{{{_DSP_NAMESPACE}}}{constraint}'."
+            )
+            errors.append(XsdError(msg, elem.sourceline or 0))
+        seen.add(value)
+    return errors
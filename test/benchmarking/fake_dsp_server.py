@@ -0,0 +1,393 @@
+"""
+A stand-in for DSP-API and DSP-INGEST, to measure the throughput of the client side without a Docker stack.
+
+It implements the routes that are used by the live clients during an xmlupload,
+keeps the created resources in memory (so that the stash can be applied),
+and records how many requests were received per route.
+Latency and server errors can be injected.
+"""
+
+from __future__ import annotations
+
+import json
+import random
+import re
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from dataclasses import field
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler
+from http.server import ThreadingHTTPServer
+from types import TracebackType
+from typing import Any
+from urllib.parse import unquote
+from urllib.parse import urlsplit
+from uuid import uuid4
+
+KNORA_API = "http://api.knora.org/ontology/knora-api/v2#"
+RDFS_LABEL = "http://www.w3.org/2000/01/rdf-schema#label"
+
+# these keys of a resource payload are not values of the resource
+_NON_VALUE_KEYS = {"@id", "@type", "@context", RDFS_LABEL, f"{KNORA_API}attachedToProject"}
+
+
+@dataclass(frozen=True)
+class FakeServerConfig:
+    """
+    Behaviour of the fake server.
+
+    Attributes:
+        shortcode: shortcode of the project that exists on the server
+        ontology_names: names of the ontologies of the project
+        latency_seconds: time that every response is delayed
+        latency_jitter_seconds: random additional delay of every response (uniformly distributed)
+        error_rate: share of the requests to the routes in `error_routes` that fail
+        error_status: status code of the failed requests
+        error_routes: names of the routes in which errors are injected
+        seed: seed of the random generator of the jitter and the errors, so that runs can be repeated
+        knora_api_turtle: response to the request for the knora-api ontology
+        ontology_turtle: response to the request for any ontology of the project
+    """
+
+    shortcode: str = "4123"
+    ontology_names: tuple[str, ...] = ("onto",)
+    latency_seconds: float = 0.0
+    latency_jitter_seconds: float = 0.0
+    error_rate: float = 0.0
+    error_status: int = HTTPStatus.SERVICE_UNAVAILABLE
+    error_routes: frozenset[str] = frozenset({"create_resource", "create_value", "update_value"})
+    seed: int = 0
+    knora_api_turtle: str = ""
+    ontology_turtle: str = ""
+
+
+@dataclass
+class RouteStats:
+    """Requests that were received on one route."""
+
+    requests: int = 0
+    injected_errors: int = 0
+    bytes_received: int = 0
+    seconds: float = 0.0
+
+
+@dataclass(frozen=True)
+class ServerStats:
+    """What the server received, from its start until the statistics were requested."""
+
+    elapsed_seconds: float
+    routes: dict[str, RouteStats]
+    max_concurrent_requests: int
+
+    @property
+    def requests(self) -> int:
+        return sum(x.requests for x in self.routes.values())
+
+    @property
+    def bytes_received(self) -> int:
+        return sum(x.bytes_received for x in self.routes.values())
+
+    def requests_per_second(self, route: str | None = None) -> float:
+        requests = self.routes[route].requests if route else self.requests
+        return requests / self.elapsed_seconds if self.elapsed_seconds > 0 else 0.0
+
+
+@dataclass
+class _Response:
+    status: int
+    body: bytes = b"{}"
+    content_type: str = "application/json"
+
+    @staticmethod
+    def json(payload: Any, status: int = HTTPStatus.OK) -> _Response:
+        return _Response(status, json.dumps(payload).encode("utf-8"))
+
+    @staticmethod
+    def text(text: str, status: int = HTTPStatus.OK, content_type: str = "text/plain") -> _Response:
+        return _Response(status, text.encode("utf-8"), content_type)
+
+
+type _Handler = Callable[[re.Match[str], bytes], _Response]
+
+
+@dataclass
+class FakeDspServer:
+    """
+    Serves the DSP-API and the DSP-INGEST routes on the same (random) port of localhost.
+
+    Usage:
+        with FakeDspServer(FakeServerConfig(latency_seconds=0.01)) as server:
+            xmlupload(..., ServerCredentials("root@example.com", "test", server.url, server.url))
+            print(server.get_stats())
+    """
+
+    config: FakeServerConfig = field(default_factory=FakeServerConfig)
+    resources: dict[str, dict[str, Any]] = field(init=False, default_factory=dict)
+    updated_values: int = field(init=False, default=0)
+    assets: set[str] = field(init=False, default_factory=set)
+    _routes: list[tuple[str, str, re.Pattern[str], _Handler]] = field(init=False, default_factory=list)
+    _stats: dict[str, RouteStats] = field(init=False, default_factory=dict)
+    _in_flight: int = field(init=False, default=0)
+    _max_in_flight: int = field(init=False, default=0)
+    _started: float = field(init=False, default=0.0)
+    _random: random.Random = field(init=False)
+    _lock: threading.Lock = field(init=False, default_factory=threading.Lock)
+    _server: ThreadingHTTPServer | None = field(init=False, default=None)
+    _thread: threading.Thread | None = field(init=False, default=None)
+
+    def __post_init__(self) -> None:
+        self._random = random.Random(self.config.seed)  # noqa: S311 (suspicious-non-cryptographic-random-usage)
+        shortcode = re.escape(self.config.shortcode)
+        self._routes = [
+            ("POST", "authentication", re.compile(r"/v2/authentication"), self._authenticate),
+            ("GET", "get_project", re.compile(rf"/admin/projects/shortcode/{shortcode}"), self._get_project),
+            ("GET", "get_projects", re.compile(r"/admin/projects"), self._get_projects),
+            ("GET", "get_groups", re.compile(r"/admin/groups"), lambda _m, _b: _Response.json({"groups": []})),
+            ("GET", "get_lists", re.compile(r"/admin/lists"), lambda _m, _b: _Response.json({"lists": []})),
+            (
+                "POST",
+                "create_copyright_holders",
+                re.compile(rf"/admin/projects/shortcode/{shortcode}/legal-info/copyright-holders"),
+                lambda _m, _b: _Response.json({}),
+            ),
+            (
+                "GET",
+                "get_licenses",
+                re.compile(rf"/admin/projects/shortcode/{shortcode}/legal-info/licenses"),
+                self._get_licenses,
+            ),
+            ("GET", "get_knora_api", re.compile(r"/ontology/knora-api/v2"), self._get_knora_api),
+            ("GET", "get_ontology", re.compile(rf"/ontology/{shortcode}/[^/]+/v2"), self._get_ontology),
+            ("POST", "create_resource", re.compile(r"/v2/resources"), self._create_resource),
+            ("GET", "get_resource", re.compile(r"/v2/resources/(?P<iri>[^/]+)"), self._get_resource),
+            ("POST", "create_value", re.compile(r"/v2/values"), self._create_or_update_value),
+            ("PUT", "update_value", re.compile(r"/v2/values"), self._create_or_update_value),
+            (
+                "POST",
+                "ingest",
+                re.compile(rf"/projects/{shortcode}/assets/ingest/(?P<filename>[^/]+)"),
+                self._ingest,
+            ),
+            ("GET", "get_asset", re.compile(rf"/projects/{shortcode}/assets/(?P<asset_id>[^/]+)"), self._get_asset),
+        ]
+
+    @property
+    def url(self) -> str:
+        if not self._server:
+            raise RuntimeError("The server has not been started")
+        host, port = self._server.server_address[:2]
+        return f"http://{host!s}:{port}"
+
+    @property
+    def project_iri(self) -> str:
+        return f"http://rdfh.ch/projects/{self.config.shortcode}"
+
+    def start(self) -> FakeDspServer:
+        """Start serving on a background thread."""
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), _make_request_handler(self))
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True, name="fake-dsp-server")
+        self._started = time.monotonic()
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        if self._server:
+            self._server.shutdown()
+            self._server.server_close()
+        if self._thread:
+            self._thread.join()
+
+    def __enter__(self) -> FakeDspServer:
+        return self.start()
+
+    def __exit__(
+        self, exc_type: type[BaseException] | None, exc: BaseException | None, traceback: TracebackType | None
+    ) -> None:
+        self.stop()
+
+    def get_stats(self) -> ServerStats:
+        """Returns the statistics of the requests received since the start of the server."""
+        with self._lock:
+            routes = {name: RouteStats(**vars(stats)) for name, stats in self._stats.items()}
+            return ServerStats(time.monotonic() - self._started, routes, self._max_in_flight)
+
+    def handle(self, method: str, path: str, body: bytes) -> _Response:
+        """Answer a request (after the configured latency), and record it in the statistics."""
+        start = time.monotonic()
+        route_name, response = self._dispatch(method, path, body)
+        self._delay()
+        with self._lock:
+            stats = self._stats.setdefault(route_name, RouteStats())
+            stats.requests += 1
+            stats.bytes_received += len(body)
+            stats.seconds += time.monotonic() - start
+            if response.status == self.config.error_status and route_name in self.config.error_routes:
+                stats.injected_errors += 1
+        return response
+
+    def enter_request(self) -> None:
+        with self._lock:
+            self._in_flight += 1
+            self._max_in_flight = max(self._max_in_flight, self._in_flight)
+
+    def exit_request(self) -> None:
+        with self._lock:
+            self._in_flight -= 1
+
+    def _dispatch(self, method: str, path: str, body: bytes) -> tuple[str, _Response]:
+        for route_method, name, pattern, handler in self._routes:
+            if route_method == method and (match := pattern.fullmatch(path)):
+                if name in self.config.error_routes and self._should_fail():
+                    return name, _Response.text("Service Unavailable, try again later", self.config.error_status)
+                return name, handler(match, body)
+        return "unknown", _Response.text(f"No route for {method} {path}", HTTPStatus.NOT_FOUND)
+
+    def _should_fail(self) -> bool:
+        if not self.config.error_rate:
+            return False
+        with self._lock:
+            return self._random.random() < self.config.error_rate
+
+    def _delay(self) -> None:
+        delay = self.config.latency_seconds
+        if self.config.latency_jitter_seconds:
+            with self._lock:
+                delay += self._random.uniform(0, self.config.latency_jitter_seconds)
+        if delay:
+            time.sleep(delay)
+
+    def _authenticate(self, _match: re.Match[str], _body: bytes) -> _Response:
+        return _Response.json({"token": "fake-token"})
+
+    def _project_json(self) -> dict[str, Any]:
+        return {
+            "id": self.project_iri,
+            "shortcode": self.config.shortcode,
+            "shortname": "benchmark",
+            "longname": "Benchmark project",
+            "description": [{"value": "Project of the fake DSP server", "language": "en"}],
+            "keywords": ["benchmark"],
+            "ontologies": [
+                f"{self.url}/ontology/{self.config.shortcode}/{name}/v2" for name in self.config.ontology_names
+            ],
+            "selfjoin": False,
+            "status": True,
+            "defaultDataAuthorship": [],
+        }
+
+    def _get_project(self, _match: re.Match[str], _body: bytes) -> _Response:
+        return _Response.json({"project": self._project_json()})
+
+    def _get_projects(self, _match: re.Match[str], _body: bytes) -> _Response:
+        return _Response.json({"projects": [self._project_json()]})
+
+    def _get_licenses(self, _match: re.Match[str], _body: bytes) -> _Response:
+        licenses = [
+            {"id": "http://rdfh.ch/licenses/cc-by-4.0", "uri": "https://creativecommons.org/licenses/by/4.0/"},
+            {
+                "id": "http://rdfh.ch/licenses/public-domain",
+                "uri": "https://creativecommons.org/publicdomain/mark/1.0/",
+            },
+        ]
+        return _Response.json({"data": licenses, "pagination": {"currentPage": 1, "totalPages": 1}})
+
+    def _get_knora_api(self, _match: re.Match[str], _body: bytes) -> _Response:
+        return _Response.text(self.config.knora_api_turtle, content_type="text/turtle")
+
+    def _get_ontology(self, _match: re.Match[str], _body: bytes) -> _Response:
+        return _Response.text(self.config.ontology_turtle, content_type="text/turtle")
+
+    def _create_resource(self, _match: re.Match[str], body: bytes) -> _Response:
+        payload = json.loads(body)
+        res_iri = f"http://rdfh.ch/{self.config.shortcode}/{uuid4()}"
+        resource = {"@id": res_iri, "@type": payload["@type"], "rdfs:label": payload[RDFS_LABEL]["@value"]}
+        for prop, values in payload.items():
+            if prop in _NON_VALUE_KEYS:
+                continue
+            value_list = values if isinstance(values, list) else [values]
+            resource[_compact_property(prop)] = [_make_value(res_iri, value) for value in value_list]
+        with self._lock:
+            self.resources[res_iri] = resource
+        # like DSP-API, the response only contains a preview of the created resource
+        return _Response.json({k: v for k, v in resource.items() if k in {"@id", "@type", "rdfs:label"}})
+
+    def _get_resource(self, match: re.Match[str], _body: bytes) -> _Response:
+        with self._lock:
+            resource = self.resources.get(unquote(match.group("iri")))
+        if resource is None:
+            return _Response.text("Resource not found", HTTPStatus.NOT_FOUND)
+        return _Response.json({**resource, "@context": {}})
+
+    def _create_or_update_value(self, _match: re.Match[str], body: bytes) -> _Response:
+        payload = json.loads(body)
+        with self._lock:
+            if payload["@id"] not in self.resources:
+                return _Response.text("Resource not found", HTTPStatus.NOT_FOUND)
+            self.updated_values += 1
+        return _Response.json({"@id": f"{payload['@id']}/values/{uuid4()}", "@type": f"{KNORA_API}Value"})
+
+    def _ingest(self, match: re.Match[str], _body: bytes) -> _Response:
+        suffix = "".join(f".{x}" for x in unquote(match.group("filename")).split(".")[1:][-1:])
+        asset_id = str(uuid4())
+        with self._lock:
+            self.assets.add(asset_id)
+        return _Response.json({"internalFilename": f"{asset_id}{suffix}"})
+
+    def _get_asset(self, match: re.Match[str], _body: bytes) -> _Response:
+        asset_id = unquote(match.group("asset_id"))
+        with self._lock:
+            if asset_id not in self.assets:
+                return _Response.text(f"Asset {asset_id} not found", HTTPStatus.NOT_FOUND)
+        return _Response.json({"id": asset_id})
+
+
+def _compact_property(prop: str) -> str:
+    # e.g. http://0.0.0.0:3333/ontology/4123/onto/v2#hasText -> onto:hasText
+    if prop.startswith(KNORA_API):
+        return f"knora-api:{prop.removeprefix(KNORA_API)}"
+    _, onto, local_name = prop.rsplit("/", 2)
+    return f"{onto}:{local_name.split('#')[-1]}"
+
+
+def _make_value(res_iri: str, value: dict[str, Any]) -> dict[str, Any]:
+    result: dict[str, Any] = {"@id": f"{res_iri}/values/{uuid4()}", "@type": value.get("@type")}
+    if xml := value.get(f"{KNORA_API}textValueAsXml"):
+        result["knora-api:textValueAsXml"] = xml["@value"]
+    return result
+
+
+def _make_request_handler(server: FakeDspServer) -> type[BaseHTTPRequestHandler]:
+    class _RequestHandler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+        # the headers and the body of a response are written separately
+        disable_nagle_algorithm = True
+
+        def do_GET(self) -> None:
+            self._handle("GET")
+
+        def do_POST(self) -> None:
+            self._handle("POST")
+
+        def do_PUT(self) -> None:
+            self._handle("PUT")
+
+        def _handle(self, method: str) -> None:
+            server.enter_request()
+            try:
+                body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+                response = server.handle(method, urlsplit(self.path).path, body)
+            finally:
+                server.exit_request()
+            self.send_response(response.status)
+            self.send_header("Content-Type", response.content_type)
+            self.send_header("Content-Length", str(len(response.body)))
+            self.end_headers()
+            self.wfile.write(response.body)
+
+        def log_message(self, *_args: object) -> None:
+            pass
+
+    return _RequestHandler
@@ -0,0 +1,99 @@
+import multiprocessing
+import os
+import tracemalloc
+from pathlib import Path
+
+import pytest
+
+from dsp_tools.commands.xmlupload.models.lookup_models import XmlReferenceLookups
+from dsp_tools.commands.xmlupload.models.permission import Permissions
+from dsp_tools.commands.xmlupload.models.permission import PermissionValue
+from dsp_tools.commands.xmlupload.prepare_xml_input.get_processed_resources import get_processed_resources
+from dsp_tools.setup.ansi_colors import RESET_TO_DEFAULT
+from dsp_tools.setup.ansi_colors import YELLOW
+from dsp_tools.utils.xml_parsing.get_parsed_resources import get_parsed_resources
+from dsp_tools.utils.xml_parsing.parse_clean_validate_xml import parse_xml_file
+from dsp_tools.utils.xml_parsing.parse_clean_validate_xml import transform_into_localnames
+
+# The default keeps the test fast enough for the CI.
+# To measure a big file, set e.g. DSP_TOOLS_BENCHMARK_XML_VALUES=1000000 (takes about 2 minutes).
+NUM_OF_VALUES_ENV_VAR = "DSP_TOOLS_BENCHMARK_XML_VALUES"
+DEFAULT_NUM_OF_VALUES = 100_000
+
+VALUES_PER_RESOURCE = 10
+
+# The parsed and the processed values are slotted classes, and the repeated strings (e.g. IRIs) are interned.
+# Without the slots and the interning, a value would take up far more memory than these limits allow.
+# The sizes of the objects depend on the Python version, the limits are meant for CPython 3.12.
+MAX_BYTES_PER_PARSED_VALUE = 200
+MAX_BYTES_PER_PROCESSED_VALUE = 180
+
+
+def _make_xml_with_values(num_of_values: int, directory: Path) -> Path:
+    xml_file = directory / "values.xml"
+    with open(xml_file, "w", encoding="utf-8") as f:
+        f.write(
+            '<?xml version="1.0" encoding="UTF-8"?>\n'
+            '<knora xmlns="https://dasch.swiss/schema" shortcode="4123" default-ontology="onto">\n'
+        )
+        for i in range(num_of_values // VALUES_PER_RESOURCE):
+            f.write(
+                f'<resource label="Resource {i}" restype=":Thing" id="res_{i}" permissions="public">\n'
+                f'<text-prop name=":hasSimpleText"><text encoding="utf8" permissions="public">Text {i}</text>'
+                f"</text-prop>\n"
+                f'<text-prop name=":hasRichtext"><text encoding="xml" permissions="public">Rich <strong>{i}</strong>'
+                f"</text></text-prop>\n"
+                f'<integer-prop name=":hasInteger"><integer permissions="public">{i}</integer></integer-prop>\n'
+                f'<decimal-prop name=":hasDecimal"><decimal permissions="public">{i}.5</decimal></decimal-prop>\n'
+                f'<boolean-prop name=":hasBoolean"><boolean permissions="public">true</boolean></boolean-prop>\n'
+                f'<list-prop list="list" name=":hasList"><list permissions="public">node_{i % 10}</list></list-prop>\n'
+                f'<resptr-prop name=":hasLink"><resptr permissions="public">res_{max(i - 1, 0)}</resptr>'
+                f"</resptr-prop>\n"
+                f'<date-prop name=":hasDate"><date permissions="public">GREGORIAN:CE:2024-01-{i % 28 + 1:02}</date>'
+                f"</date-prop>\n"
+                f'<uri-prop name=":hasUri"><uri permissions="public">https://example.org/{i}</uri></uri-prop>\n'
+                f'<geoname-prop name=":hasGeoname"><geoname permissions="public">{i}</geoname></geoname-prop>\n'
+                f"</resource>\n"
+            )
+        f.write("</knora>\n")
+    return xml_file
+
+
+def _measure_bytes_per_value(xml_file: Path) -> tuple[int, float, float]:
+    """Runs in a separate process, so that the memory of earlier tests does not influence the measurement."""
+    root = transform_into_localnames(parse_xml_file(xml_file))
+    permissions = Permissions({PermissionValue.V: ["knora-admin:UnknownUser"]})
+    lookups = XmlReferenceLookups(
+        permissions={"public": permissions},
+        listnodes={("list", f"node_{i}"): f"http://rdfh.ch/lists/4123/node_{i}" for i in range(10)},
+        authorships={},
+    )
+    tracemalloc.start()
+    parsed_resources = get_parsed_resources(root, "http://0.0.0.0:3333")
+    parsed_bytes = tracemalloc.get_traced_memory()[0]
+    processed_resources = get_processed_resources(parsed_resources, lookups, is_on_prod_like_server=False)
+    processed_bytes = tracemalloc.get_traced_memory()[0] - parsed_bytes
+    tracemalloc.stop()
+    num_of_values = sum(len(x.values) for x in processed_resources)
+    return num_of_values, parsed_bytes / num_of_values, processed_bytes / num_of_values
+
+
+def test_memory_per_value(tmp_path: Path) -> None:
+    num_of_values = int(os.getenv(NUM_OF_VALUES_ENV_VAR, DEFAULT_NUM_OF_VALUES))
+    xml_file = _make_xml_with_values(num_of_values, tmp_path)
+    with multiprocessing.get_context("spawn").Pool(1) as pool:
+        measured_values, per_parsed_value, per_processed_value = pool.apply(_measure_bytes_per_value, (xml_file,))
+    print_str = (
+        f"\n\n---------------------\n"
+        f"Values: {measured_values} ({xml_file.stat().st_size / 1024 / 1024:.1f} MB)\n"
+        f"Memory per parsed value: {per_parsed_value:.0f} bytes\n"
+        f"Memory per processed value: {per_processed_value:.0f} bytes"
+        f"\n---------------------\n"
+    )
+    print(YELLOW + print_str + RESET_TO_DEFAULT)
+    assert per_parsed_value <= MAX_BYTES_PER_PARSED_VALUE
+    assert per_processed_value <= MAX_BYTES_PER_PROCESSED_VALUE
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
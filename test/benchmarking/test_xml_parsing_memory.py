@@ -0,0 +1,74 @@
+import multiprocessing
+import os
+import resource
+from pathlib import Path
+
+import pytest
+
+from dsp_tools.setup.ansi_colors import RESET_TO_DEFAULT
+from dsp_tools.setup.ansi_colors import YELLOW
+from dsp_tools.utils.xml_parsing.parse_clean_validate_xml import parse_and_clean_xml_file
+from dsp_tools.utils.xml_parsing.parse_clean_validate_xml import parse_xml_file
+
+# e.g. DSP_TOOLS_BENCHMARK_XML_RESOURCES=1000000
+NUM_OF_RESOURCES_ENV_VAR = "DSP_TOOLS_BENCHMARK_XML_RESOURCES"
+
+# parsing and cleaning may use a little more memory than parsing alone (e.g. for the validation),
+# but not as much as a second copy of the tree
+MAX_MEMORY_RATIO = 1.5
+
+
+def _make_large_xml(num_of_resources: int, directory: Path) -> Path:
+    xml_file = directory / "large.xml"
+    with open(xml_file, "w", encoding="utf-8") as f:
+        f.write(
+            '<?xml version="1.0" encoding="UTF-8"?>\n'
+            '<knora xmlns="https://dasch.swiss/schema" shortcode="4123" default-ontology="onto">\n'
+        )
+        for i in range(num_of_resources):
+            f.write(
+                f'<resource label="Resource {i}" restype=":Thing" id="res_{i}">\n'
+                f"<!-- comment of resource {i} -->\n"
+                f'<text-prop name=":hasSimpleText"><text encoding="utf8">Text of resource {i}</text></text-prop>\n'
+                f'<integer-prop name=":hasInteger"><integer>{i}</integer></integer-prop>\n'
+                f"</resource>\n"
+            )
+        f.write("</knora>\n")
+    return xml_file
+
+
+def _measure_peak_memory_increase(function_name: str, xml_file: Path) -> int:
+    """Runs in a separate process, so that the peak memory of one function does not hide the peak of the other."""
+    function = {"parse": parse_xml_file, "parse_and_clean": parse_and_clean_xml_file}[function_name]
+    before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    root = function(xml_file)
+    after = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    assert len(root) > 0
+    return after - before
+
+
+def _peak_memory_increase_in_separate_process(function_name: str, xml_file: Path) -> int:
+    with multiprocessing.get_context("spawn").Pool(1) as pool:
+        return pool.apply(_measure_peak_memory_increase, (function_name, xml_file))
+
+
+def test_parse_and_clean_keeps_one_tree_in_memory(tmp_path: Path) -> None:
+    num_of_resources = int(os.getenv(NUM_OF_RESOURCES_ENV_VAR, "50000"))
+    xml_file = _make_large_xml(num_of_resources, tmp_path)
+    parse_only = _peak_memory_increase_in_separate_process("parse", xml_file)
+    parse_and_clean = _peak_memory_increase_in_separate_process("parse_and_clean", xml_file)
+    # ru_maxrss is in kilobytes on Linux, but in bytes on macOS
+    unit = 1024 * 1024 if os.uname().sysname == "Darwin" else 1024
+    print_str = (
+        f"\n\n---------------------\n"
+        f"Resources: {num_of_resources} ({xml_file.stat().st_size / 1024 / 1024:.1f} MB)\n"
+        f"Peak memory of parsing: {parse_only / unit:.1f} MB\n"
+        f"Peak memory of parsing, validating and cleaning: {parse_and_clean / unit:.1f} MB"
+        f"\n---------------------\n"
+    )
+    print(YELLOW + print_str + RESET_TO_DEFAULT)
+    assert parse_and_clean <= parse_only * MAX_MEMORY_RATIO
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,256 @@
+import os
+from collections.abc import Iterator
+from dataclasses import replace
+from pathlib import Path
+
+import pytest
+
+from dsp_tools import xmllib
+from dsp_tools.cli.args import ServerCredentials
+from dsp_tools.commands.ingest_xmlupload.create_resources.upload_xml import ingest_xmlupload
+from dsp_tools.commands.validate_data.shacl_validator import SHACL_VALIDATOR_ENV_VAR
+from dsp_tools.commands.validate_data.validate_data import validate_data
+from dsp_tools.commands.xmlupload.upload_config import UploadConfig
+from dsp_tools.commands.xmlupload.xmlupload import xmlupload
+from dsp_tools.setup.ansi_colors import RESET_TO_DEFAULT
+from dsp_tools.setup.ansi_colors import YELLOW
+from test.benchmarking.fake_dsp_server import FakeDspServer
+from test.benchmarking.fake_dsp_server import FakeServerConfig
+
+# e.g. DSP_TOOLS_BENCHMARK_SIZES=1000,10000,100000
+SIZES_ENV_VAR = "DSP_TOOLS_BENCHMARK_SIZES"
+# every n-th resource has a file, which is uploaded to the ingest server
+FILE_EVERY_NTH_RESOURCE = 10
+
+SHORTCODE = "4123"
+
+# absolute, because the tests run in a temporary cwd
+KNORA_API_TTL = Path("testdata/validate-data/knora-api-subset.ttl").absolute()
+
+# the ontology of the benchmark data, for the SHACL validation
+ONTOLOGY_TTL = """
+@prefix knora-api: <http://api.knora.org/ontology/knora-api/v2#> .
+@prefix salsah-gui: <http://api.knora.org/ontology/salsah-gui/v2#> .
+@prefix owl: <http://www.w3.org/2002/07/owl#> .
+@prefix rdfs: <http://www.w3.org/2000/01/rdf-schema#> .
+@prefix onto: <{server}/ontology/{shortcode}/onto/v2#> .
+
+<{server}/ontology/{shortcode}/onto/v2> a owl:Ontology ;
+    rdfs:label "onto" ;
+    knora-api:attachedToProject <http://rdfh.ch/projects/{shortcode}> .
+
+onto:BenchmarkThing a owl:Class ;
+    rdfs:label "Benchmark thing" ;
+    knora-api:canBeInstantiated true ;
+    knora-api:isResourceClass true ;
+    rdfs:subClassOf knora-api:Resource,
+        [ a owl:Restriction ; owl:maxCardinality 1 ; owl:onProperty onto:hasSimpleText ],
+        [ a owl:Restriction ; owl:maxCardinality 1 ; owl:onProperty onto:hasInteger ],
+        [ a owl:Restriction ; owl:maxCardinality 1 ; owl:onProperty onto:hasRichtext ],
+        [ a owl:Restriction ; owl:maxCardinality 1 ; owl:onProperty onto:hasLink ],
+        [ a owl:Restriction ; owl:maxCardinality 1 ; owl:onProperty onto:hasLinkValue ] .
+
+onto:hasSimpleText a owl:ObjectProperty ;
+    knora-api:isEditable true ;
+    knora-api:isResourceProperty true ;
+    knora-api:objectType knora-api:TextValue ;
+    salsah-gui:guiElement salsah-gui:SimpleText ;
+    rdfs:subPropertyOf knora-api:hasValue .
+
+onto:hasInteger a owl:ObjectProperty ;
+    knora-api:isEditable true ;
+    knora-api:isResourceProperty true ;
+    knora-api:objectType knora-api:IntValue ;
+    salsah-gui:guiElement salsah-gui:Spinbox ;
+    rdfs:subPropertyOf knora-api:hasValue .
+
+onto:hasRichtext a owl:ObjectProperty ;
+    knora-api:isEditable true ;
+    knora-api:isResourceProperty true ;
+    knora-api:objectType knora-api:TextValue ;
+    salsah-gui:guiElement salsah-gui:Richtext ;
+    rdfs:subPropertyOf knora-api:hasValue .
+
+onto:hasLink a owl:ObjectProperty ;
+    knora-api:isEditable true ;
+    knora-api:isLinkProperty true ;
+    knora-api:isResourceProperty true ;
+    knora-api:objectType onto:BenchmarkThing ;
+    salsah-gui:guiElement salsah-gui:Searchbox ;
+    rdfs:subPropertyOf knora-api:hasLinkTo .
+
+onto:hasLinkValue a owl:ObjectProperty ;
+    knora-api:isEditable true ;
+    knora-api:isLinkValueProperty true ;
+    knora-api:isResourceProperty true ;
+    knora-api:objectType knora-api:LinkValue ;
+    salsah-gui:guiElement salsah-gui:Searchbox ;
+    rdfs:subPropertyOf knora-api:hasLinkToValue .
+"""
+
+
+def _benchmark_sizes(default: str = "1000") -> list[int]:
+    return [int(x) for x in os.getenv(SIZES_ENV_VAR, default).split(",")]
+
+
+@pytest.fixture
+def fake_server() -> Iterator[FakeDspServer]:
+    with FakeDspServer(FakeServerConfig(shortcode=SHORTCODE)) as server:
+        yield server
+
+
+@pytest.fixture
+def tmp_home(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    # the id2iri mapping, the performance report and the upload state are written to the cwd and the home directory
+    monkeypatch.setenv("HOME", str(tmp_path))
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+
+def _make_benchmark_xml(num_of_resources: int, directory: Path, with_files: bool = True) -> Path:
+    """
+    Every resource has a simple text, an integer, a link to the previous resource,
+    and a rich text with a link to the next resource, which creates a stash that has to be applied at the end.
+    If `with_files` is set, every n-th resource has a file.
+    """
+    file = directory / "file.txt"
+    file.write_text("benchmark")
+    root = xmllib.XMLRoot.create_new(shortcode=SHORTCODE, default_ontology="onto")
+    for i in range(num_of_resources):
+        res = (
+            xmllib.Resource.create_new(res_id=f"res_{i}", restype=":BenchmarkThing", label=f"Resource {i}")
+            .add_simpletext(":hasSimpleText", f"Simple text of resource {i}")
+            .add_integer(":hasInteger", i)
+            .add_richtext(
+                ":hasRichtext", f'Text with a link to <a class="salsah-link" href="IRI:res_{i + 1}:IRI">i</a>'
+            )
+        )
+        if i > 0:
+            res.add_link(":hasLink", f"res_{i - 1}")
+        if with_files and i % FILE_EVERY_NTH_RESOURCE == 0:
+            res.add_file(
+                file.name,
+                license=xmllib.LicenseRecommended.DSP.PUBLIC_DOMAIN,
+                copyright_holder="DaSCH",
+                authorship=["Benchmark"],
+            )
+        root.add_resource(res)
+    # the last resource links to the first one, so that every rich text link can be resolved
+    last = xmllib.Resource.create_new(res_id=f"res_{num_of_resources}", restype=":BenchmarkThing", label="Last")
+    root.add_resource(last.add_link(":hasLink", "res_0"))
+    xml_file = directory / "benchmark.xml"
+    root.write_file(xml_file)
+    return xml_file
+
+
+@pytest.mark.parametrize("num_of_resources", _benchmark_sizes())
+def test_xmlupload_throughput(num_of_resources: int, fake_server: FakeDspServer, tmp_home: Path) -> None:
+    xml_file = _make_benchmark_xml(num_of_resources, tmp_home)
+    creds = ServerCredentials("root@example.com", "test", fake_server.url, fake_server.url)
+    # all files have the same content, so the media cache would upload only the first one
+    config = UploadConfig(skip_validation=True, num_of_workers=4, use_media_cache=False)
+    assert xmlupload(xml_file, creds, str(tmp_home), config)
+
+    stats = fake_server.get_stats()
+    num_of_files = len(range(0, num_of_resources, FILE_EVERY_NTH_RESOURCE))
+    assert len(fake_server.resources) == num_of_resources + 1
+    assert stats.routes["ingest"].requests == num_of_files
+    assert fake_server.updated_values > 0
+    print_str = (
+        f"\n\n---------------------\n"
+        f"Resources: {num_of_resources + 1} (with {num_of_files} files)\n"
+        f"Duration: {stats.elapsed_seconds:.1f}s\n"
+        f"Resources per second: {stats.requests_per_second('create_resource'):.1f}\n"
+        f"Requests: {stats.requests} ({stats.requests_per_second():.1f} per second)\n"
+        f"Stashed values applied: {fake_server.updated_values}\n"
+        f"Bytes received by the server: {stats.bytes_received}\n"
+        f"Max. concurrent requests: {stats.max_concurrent_requests}"
+        f"\n---------------------\n"
+    )
+    print(YELLOW + print_str + RESET_TO_DEFAULT)
+
+
+def test_repeated_xmlupload_with_media_cache(fake_server: FakeDspServer, tmp_home: Path) -> None:
+    num_of_resources = 100
+    xml_file = _make_benchmark_xml(num_of_resources, tmp_home)
+    creds = ServerCredentials("root@example.com", "test", fake_server.url, fake_server.url)
+    config = UploadConfig(skip_validation=True)
+    assert xmlupload(xml_file, creds, str(tmp_home), config)
+    ingested_by_first_upload = fake_server.get_stats().routes["ingest"].requests
+    assert xmlupload(xml_file, creds, str(tmp_home), config)
+
+    stats = fake_server.get_stats()
+    assert ingested_by_first_upload == 1
+    assert stats.routes["ingest"].requests == 1
+    assert len(fake_server.resources) == 2 * (num_of_resources + 1)
+    print_str = (
+        f"\n\n---------------------\n"
+        f"Files uploaded by the first upload: {ingested_by_first_upload}\n"
+        f"Existence checks of reused files: {stats.routes['get_asset'].requests}\n"
+        f"Duration of both uploads: {stats.elapsed_seconds:.1f}s"
+        f"\n---------------------\n"
+    )
+    print(YELLOW + print_str + RESET_TO_DEFAULT)
+
+
+@pytest.mark.parametrize("num_of_resources", _benchmark_sizes())
+def test_ingest_xmlupload_throughput(num_of_resources: int, fake_server: FakeDspServer, tmp_home: Path) -> None:
+    xml_file = _make_benchmark_xml(num_of_resources, tmp_home)
+    # the files were ingested beforehand, the mapping CSV is read from the cwd
+    (tmp_home / f"mapping-{SHORTCODE}.csv").write_text("original,derivative\nfile.txt,ingested.txt\n")
+    creds = ServerCredentials("root@example.com", "test", fake_server.url, fake_server.url)
+    assert ingest_xmlupload(xml_file, creds, skip_validation=True, use_api_cache=False)
+
+    stats = fake_server.get_stats()
+    assert len(fake_server.resources) == num_of_resources + 1
+    assert "ingest" not in stats.routes
+    assert fake_server.updated_values > 0
+    print_str = (
+        f"\n\n---------------------\n"
+        f"Resources (ingest-xmlupload): {num_of_resources + 1}\n"
+        f"Duration: {stats.elapsed_seconds:.1f}s\n"
+        f"Resources per second: {stats.requests_per_second('create_resource'):.1f}\n"
+        f"Requests: {stats.requests} ({stats.requests_per_second():.1f} per second)\n"
+        f"Max. concurrent requests: {stats.max_concurrent_requests}"
+        f"\n---------------------\n"
+    )
+    print(YELLOW + print_str + RESET_TO_DEFAULT)
+
+
+# pyshacl validated about 4 resources per second (measured with 1'000 resources, CPython 3.12)
+@pytest.mark.parametrize("num_of_resources", _benchmark_sizes(default="100"))
+def test_validate_data_duration(
+    num_of_resources: int, fake_server: FakeDspServer, tmp_home: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setenv(SHACL_VALIDATOR_ENV_VAR, "in-process")
+    # the IRIs of the ontology contain the URL of the server, which is only known after the start
+    ontology_turtle = ONTOLOGY_TTL.format(server=fake_server.url, shortcode=SHORTCODE)
+    fake_server.config = replace(
+        fake_server.config, knora_api_turtle=KNORA_API_TTL.read_text(), ontology_turtle=ontology_turtle
+    )
+    xml_file = _make_benchmark_xml(num_of_resources, tmp_home, with_files=False)
+    creds = ServerCredentials("root@example.com", "test", fake_server.url, fake_server.url)
+    assert validate_data(
+        xml_file,
+        creds,
+        ignore_duplicate_files_warning=True,
+        save_graphs=False,
+        skip_ontology_validation=False,
+        id2iri_file=None,
+        do_not_request_resource_metadata_from_db=True,
+        use_api_cache=False,
+    )
+
+    stats = fake_server.get_stats()
+    print_str = (
+        f"\n\n---------------------\n"
+        f"Resources (validate-data, SHACL in-process): {num_of_resources + 1}\n"
+        f"Duration: {stats.elapsed_seconds:.1f}s\n"
+        f"Resources per second: {(num_of_resources + 1) / stats.elapsed_seconds:.1f}"
+        f"\n---------------------\n"
+    )
+    print(YELLOW + print_str + RESET_TO_DEFAULT)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,58 @@
+import pytest
+
+from dsp_tools.commands.validate_data.models.input_problems import ProblemType
+from dsp_tools.commands.validate_data.shacl_in_process_validator import ShaclInProcessValidator
+from test.integration.commands.validate_data.util import get_rdf_graphs
+from test.integration.commands.validate_data.util import get_user_problems
+
+# Unlike the conformance tests, these tests do not need Docker.
+# The expected problems are the same as in the e2e tests of validate-data,
+# except where the ontology in the testdata lacks a cardinality of the generic project.
+
+
+@pytest.fixture(scope="module")
+def validator() -> ShaclInProcessValidator:
+    return ShaclInProcessValidator()
+
+
+def test_cardinality_correct(validator: ShaclInProcessValidator) -> None:
+    conforms, problems = get_user_problems(get_rdf_graphs("cardinality_correct.xml"), validator)
+    assert conforms
+    assert not problems
+
+
+def test_cardinality_violation(validator: ShaclInProcessValidator) -> None:
+    conforms, problems = get_user_problems(get_rdf_graphs("cardinality_violation.xml"), validator)
+    assert not conforms
+    assert [(res_id, problem_type) for res_id, _, problem_type, *_ in problems] == [
+        ("card_1_missing", str(ProblemType.MIN_CARD)),
+        ("card_inexistent_for_prop", str(ProblemType.MIN_CARD)),
+        ("is_super_prop_no_card", str(ProblemType.NON_EXISTING_CARD)),
+        ("max_card_violation", str(ProblemType.MAX_CARD)),
+        ("prop_does_not_have_card", str(ProblemType.NON_EXISTING_CARD)),
+    ]
+
+
+def test_value_type_violation(validator: ShaclInProcessValidator) -> None:
+    conforms, problems = get_user_problems(get_rdf_graphs("value_type_violation.xml"), validator)
+    assert not conforms
+    mismatches = [(res_id, expected, prop) for res_id, prop, _, _, expected, _ in problems]
+    assert mismatches == [
+        ("bool_wrong_value_type", "This property requires a BooleanValue", "onto:testBoolean"),
+        ("color_wrong_value_type", "This property requires a ColorValue", "onto:testColor"),
+        ("date_wrong_value_type", "This property requires a DateValue", "onto:testSubDate1"),
+        ("decimal_wrong_value_type", "This property requires a DecimalValue", "onto:testDecimalSimpleText"),
+        ("geoname_wrong_value_type", "This property requires a GeonameValue", "onto:testGeoname"),
+        ("integer_wrong_value_type", "This property requires a IntValue", "onto:testIntegerSimpleText"),
+        ("is_date_should_be_simpletext", "This property requires a TextValue", "onto:testTextarea"),
+        ("is_link_should_be_text", "TextValue without formatting", "onto:testTextarea"),
+        ("is_text_should_be_integer", "This property requires a IntValue", "onto:testIntegerSpinbox"),
+        ("link_wrong_value_type", "This property requires a LinkValue", "onto:testHasLinkTo"),
+        ("list_wrong_value_type", "This property requires a ListValue", "onto:testListProp"),
+        # the class in the testdata has no cardinality for onto:testHasRegionPreview
+        ("region_preview_wrong_type", None, "onto:testHasRegionPreview"),
+        ("richtext_wrong_value_type", "TextValue with formatting", "onto:testRichtext"),
+        ("simpletext_wrong_value_type", "TextValue without formatting", "onto:testTextarea"),
+        ("time_wrong_value_type", "This property requires a TimeValue", "onto:testTimeValue"),
+        ("uri_wrong_value_type", "This property requires a UriValue", "onto:testUriValue"),
+    ]
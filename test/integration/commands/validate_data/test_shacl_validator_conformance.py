@@ -0,0 +1,71 @@
+from pathlib import Path
+
+import pytest
+from rdflib import Graph
+
+from dsp_tools.commands.validate_data.shacl_cli_validator import ShaclCliValidator
+from dsp_tools.commands.validate_data.shacl_in_process_validator import ShaclInProcessValidator
+from test.integration.commands.validate_data.util import ONTO_TTL
+from test.integration.commands.validate_data.util import get_rdf_graphs
+from test.integration.commands.validate_data.util import get_user_problems
+
+# Both SHACL validators must find the same problems in the same data.
+# The validation graphs themselves may differ (e.g. pyshacl does not report sh:detail),
+# therefore the problems are compared as they are communicated to the user.
+
+XML_FILES = [
+    "cardinality_correct.xml",
+    "cardinality_violation.xml",
+    "content_correct.xml",
+    "content_violation.xml",
+    "dsp_inbuilt_violation.xml",
+    "file_value_violation.xml",
+    "value_type_violation.xml",
+]
+
+
+@pytest.fixture(scope="module")
+def cli_validator() -> ShaclCliValidator:
+    return ShaclCliValidator()
+
+
+@pytest.fixture(scope="module")
+def in_process_validator() -> ShaclInProcessValidator:
+    return ShaclInProcessValidator()
+
+
+@pytest.mark.parametrize("xml_file", XML_FILES)
+def test_validate_data_conformance(
+    xml_file: str, cli_validator: ShaclCliValidator, in_process_validator: ShaclInProcessValidator
+) -> None:
+    rdf_graphs = get_rdf_graphs(xml_file)
+    cli_conforms, cli_problems = get_user_problems(rdf_graphs, cli_validator)
+    in_process_conforms, in_process_problems = get_user_problems(rdf_graphs, in_process_validator)
+    assert in_process_conforms == cli_conforms
+    assert in_process_problems == cli_problems
+
+
+def test_validate_ontology_conformance(
+    cli_validator: ShaclCliValidator, in_process_validator: ShaclInProcessValidator, tmp_path: Path
+) -> None:
+    onto_graph = Graph()
+    onto_graph.parse(ONTO_TTL, format="ttl")
+    cli_report = cli_validator.validate_ontology(onto_graph, tmp_path)
+    in_process_report = in_process_validator.validate_ontology(onto_graph, tmp_path)
+    assert in_process_report.conforms == cli_report.conforms
+    cli_results = _get_ontology_results(cli_report.validation_graph)
+    in_process_results = _get_ontology_results(in_process_report.validation_graph)
+    assert in_process_results == cli_results
+
+
+def _get_ontology_results(validation_graph: Graph) -> set[tuple[str, str]]:
+    query = """
+    PREFIX sh: <http://www.w3.org/ns/shacl#>
+
+    SELECT ?focusNode ?message WHERE {
+        ?result a sh:ValidationResult ;
+                sh:focusNode ?focusNode ;
+                sh:resultMessage ?message .
+    }
+    """
+    return {(str(row[0]), str(row[1])) for row in validation_graph.query(query)}  # type: ignore[index]
@@ -0,0 +1,54 @@
+from pathlib import Path
+
+from dsp_tools.clients.metadata_client import ExistingResourcesRetrieved
+from dsp_tools.commands.validate_data.models.api_responses import EnabledLicenseIris
+from dsp_tools.commands.validate_data.models.api_responses import ListLookup
+from dsp_tools.commands.validate_data.models.api_responses import ProjectDataFromApi
+from dsp_tools.commands.validate_data.models.validation import RDFGraphs
+from dsp_tools.commands.validate_data.prepare_data.prepare_data import _create_graphs
+from dsp_tools.commands.validate_data.prepare_data.prepare_data import _make_data_graph_from_parsed_resources
+from dsp_tools.commands.validate_data.prepare_data.prepare_data import get_info_and_parsed_resources_from_file
+from dsp_tools.commands.validate_data.process_validation_report.get_user_validation_message import sort_user_problems
+from dsp_tools.commands.validate_data.process_validation_report.query_validation_result import reformat_validation_graph
+from dsp_tools.commands.validate_data.shacl_validator import ShaclValidator
+from dsp_tools.commands.validate_data.validation.get_validation_report import get_validation_report
+
+# The data is validated against the ontology and the subset of knora-api in the testdata,
+# so that no DSP-API is needed.
+
+API_URL = "http://0.0.0.0:3333"
+SHORTCODE = "9999"
+ONTO_IRI = f"{API_URL}/ontology/{SHORTCODE}/onto/v2"
+DATA_DIR = Path("testdata/validate-data/core_validation")
+ONTO_TTL = Path("testdata/validate-data/onto.ttl")
+KNORA_API_TTL = Path("testdata/validate-data/knora-api-subset.ttl")
+
+# resource ID, property, problem type, message, expected, input value
+ProblemKey = tuple[str | None, str, str, str | None, str | None, str | None]
+
+
+def get_rdf_graphs(xml_file: str) -> RDFGraphs:
+    parsed_resources, _, authorship_lookup, permission_ids = get_info_and_parsed_resources_from_file(
+        DATA_DIR / xml_file, API_URL, None
+    )
+    data_rdf = _make_data_graph_from_parsed_resources(parsed_resources, authorship_lookup, ListLookup({}))
+    proj_info = ProjectDataFromApi([], EnabledLicenseIris([]), [])
+    rdf_graphs, _ = _create_graphs(
+        data_rdf, proj_info, permission_ids, [ONTO_TTL.read_text()], [ONTO_IRI], KNORA_API_TTL.read_text()
+    )
+    return rdf_graphs
+
+
+def get_user_problems(rdf_graphs: RDFGraphs, validator: ShaclValidator) -> tuple[bool, list[ProblemKey]]:
+    """Returns if the data conforms, and the problems as they are communicated to the user (sorted)."""
+    report = get_validation_report(rdf_graphs, validator)
+    all_problems = reformat_validation_graph(report)
+    sorted_problems = sort_user_problems(all_problems, None, SHORTCODE, ExistingResourcesRetrieved.TRUE)
+    problems = [
+        *sorted_problems.unique_violations,
+        *sorted_problems.user_warnings,
+        *sorted_problems.user_info,
+    ]
+    keys = [(p.res_id, p.prop_name, str(p.problem_type), p.message, p.expected, p.input_value) for p in problems]
+    assert not sorted_problems.unexpected_shacl_validation_components
+    return report.conforms, sorted(keys, key=str)
@@ -66,7 +66,7 @@ class TestUploadLinkValueStashes:
 
         upload_state = UploadState([], stash, UploadConfig(), [], iri_resolver)
         with patch.object(ValueClientLive, "post_new_value", return_value=None):
-            _upload_stash(upload_state, resource_client)
+            _upload_stash(upload_state, resource_client, {})
         assert not upload_state.pending_stash or upload_state.pending_stash.is_empty()
 
     def test_upload_link_value_stash_multiple(
@@ -101,7 +101,7 @@ class TestUploadLinkValueStashes:
         )
         upload_state = UploadState([], stash, UploadConfig(), [], iri_resolver)
         with patch.object(ValueClientLive, "post_new_value", return_value=None):
-            _upload_stash(upload_state, resource_client)
+            _upload_stash(upload_state, resource_client, {})
         assert not upload_state.pending_stash or upload_state.pending_stash.is_empty()
 
 
@@ -143,7 +143,31 @@ class TestUploadTextValueStashes:
         }
         upload_state = UploadState([], stash, UploadConfig(), [], iri_resolver)
         with patch.object(ValueClientLive, "replace_existing_value", return_value=None):
-            _upload_stash(upload_state, resource_client)
+            _upload_stash(upload_state, resource_client, {})
+        assert not upload_state.pending_stash or upload_state.pending_stash.is_empty()
+
+    def test_upload_text_value_stash_with_known_value_iri(self, resource_client) -> None:
+        """Do not retrieve the resource, if the IRI of the value is known from the creation of the resource."""
+        val = ProcessedRichtext(
+            value=FormattedTextValue("<p>some text</p>"),
+            prop_iri=SOME_PROP_STR,
+            value_uuid=VALUE_UUID,
+            value_order=None,
+            resource_references=set(),
+            permissions=None,
+            comment=None,
+        )
+        stash = Stash.make(
+            standoff_stash=StandoffStash.make([StandoffStashItem("001", "sometype", val)]), link_value_stash=None
+        )
+        assert stash
+        iri_resolver = IriResolver({"001": "http://www.rdfh.ch/0001/001"})
+        upload_state = UploadState([], stash, UploadConfig(), [], iri_resolver)
+        value_uuid_to_iri = {VALUE_UUID: "http://www.rdfh.ch/0001/001/values/02"}
+        with patch.object(ValueClientLive, "replace_existing_value", return_value=None) as replace_mock:
+            _upload_stash(upload_state, resource_client, value_uuid_to_iri)
+        resource_client.get_resource.assert_not_called()
+        replace_mock.assert_called_once()
         assert not upload_state.pending_stash or upload_state.pending_stash.is_empty()
 
     def test_not_upload_text_value_stash_if_uuid_not_on_value(self, resource_client) -> None:
@@ -182,5 +206,5 @@ class TestUploadTextValueStashes:
         }
         upload_state = UploadState([], stash, UploadConfig(), [], iri_resolver)
         with patch.object(ValueClientLive, "replace_existing_value", return_value=None):
-            _upload_stash(upload_state, resource_client)
+            _upload_stash(upload_state, resource_client, {})
         assert upload_state.pending_stash == stash
@@ -21,8 +21,11 @@ LINK_PROP = f"{ONTO}hasCustomLink"
 
 @pytest.fixture(autouse=True)
 def _no_id2iri_files() -> Iterator[None]:
-    # cleanup_upload always writes an id2iri mapping to the cwd and home dir; suppress that side effect.
-    with patch("dsp_tools.commands.xmlupload.execute_upload.write_id2iri_mapping"):
+    # cleanup_upload always writes an id2iri mapping and a performance report to the cwd; suppress that side effect.
+    with (
+        patch("dsp_tools.commands.xmlupload.execute_upload.write_id2iri_mapping"),
+        patch("dsp_tools.commands.xmlupload.execute_upload.write_performance_report"),
+    ):
         yield
 
 
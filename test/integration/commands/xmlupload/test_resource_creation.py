@@ -12,6 +12,9 @@ from dsp_tools.clients.value_client_live import ValueClientLive
 from dsp_tools.commands.xmlupload.exceptions import XmlUploadInterruptedError
 from dsp_tools.commands.xmlupload.execute_upload import _upload_all_resources
 from dsp_tools.commands.xmlupload.iri_resolver import IriResolver
+from dsp_tools.commands.xmlupload.models.processed.file_values import ProcessedFileBitstream
+from dsp_tools.commands.xmlupload.models.processed.file_values import ProcessedFileMetadata
+from dsp_tools.commands.xmlupload.models.processed.file_values import ProcessedFileValue
 from dsp_tools.commands.xmlupload.models.processed.res import ProcessedResource
 from dsp_tools.commands.xmlupload.models.processed.values import ProcessedLink
 from dsp_tools.commands.xmlupload.models.processed.values import ProcessedSimpleText
@@ -22,7 +25,9 @@ from dsp_tools.commands.xmlupload.stash.stash_models import LinkValueStashItem
 from dsp_tools.commands.xmlupload.stash.stash_models import Stash
 from dsp_tools.commands.xmlupload.upload_config import UploadConfig
 from dsp_tools.error.custom_warnings import DspToolsUserWarning
+from dsp_tools.error.exceptions import BadCredentialsError
 from dsp_tools.utils.request_utils import ResponseCodeAndText
+from dsp_tools.utils.xml_parsing.models.parsed_resource import KnoraFileValueType
 from test.integration.commands.xmlupload.legal_info_client_mock import LegalInfoClientMockBase
 
 ONTO = "http://0.0.0.0:3333/ontology/9999/onto/v2#"
@@ -86,7 +91,7 @@ def test_one_resource_without_links(
     ]
     upload_state = UploadState(resources, None, UploadConfig())
     mock_resource_client = Mock()
-    mock_resource_client.post_resource = Mock(side_effect=[f"{RES_IRI_NAMESPACE_STR}foo_1_iri"])
+    mock_resource_client.post_resource = Mock(side_effect=[{"@id": f"{RES_IRI_NAMESPACE_STR}foo_1_iri"}])
     mock_resource_client_class.return_value = mock_resource_client
 
     mock_project_client = Mock()
@@ -152,7 +157,7 @@ def test_one_resource_with_link_to_existing_resource(
         IriResolver({"foo_2_id": f"{RES_IRI_NAMESPACE_STR}foo_2_iri"}),
     )
     mock_resource_client = Mock()
-    mock_resource_client.post_resource = Mock(side_effect=[f"{RES_IRI_NAMESPACE_STR}foo_1_iri"])
+    mock_resource_client.post_resource = Mock(side_effect=[{"@id": f"{RES_IRI_NAMESPACE_STR}foo_1_iri"}])
     mock_resource_client_class.return_value = mock_resource_client
 
     mock_project_client = Mock()
@@ -261,7 +266,7 @@ def _2_resources_with_stash_interrupted_by_error(
     mock_resource_client = Mock()
     mock_resource_client.post_resource = Mock(
         side_effect=[
-            f"{RES_IRI_NAMESPACE_STR}foo_1_iri",
+            {"@id": f"{RES_IRI_NAMESPACE_STR}foo_1_iri"},
             err_to_interrupt_with,
         ]
     )
@@ -315,8 +320,8 @@ def test_2_resources_with_stash(
     mock_resource_client = Mock()
     mock_resource_client.post_resource = Mock(
         side_effect=[
-            f"{RES_IRI_NAMESPACE_STR}foo_1_iri",
-            f"{RES_IRI_NAMESPACE_STR}foo_2_iri",
+            {"@id": f"{RES_IRI_NAMESPACE_STR}foo_1_iri"},
+            {"@id": f"{RES_IRI_NAMESPACE_STR}foo_2_iri"},
         ]
     )
     mock_resource_client_class.return_value = mock_resource_client
@@ -378,11 +383,11 @@ def test_5_resources_with_stash_and_interrupt_after_2(
     mock_resource_client = Mock()
     mock_resource_client.post_resource = Mock(
         side_effect=[
-            f"{RES_IRI_NAMESPACE_STR}foo_1_iri",
-            f"{RES_IRI_NAMESPACE_STR}foo_2_iri",
-            f"{RES_IRI_NAMESPACE_STR}foo_3_iri",
-            f"{RES_IRI_NAMESPACE_STR}foo_4_iri",
-            f"{RES_IRI_NAMESPACE_STR}foo_5_iri",
+            {"@id": f"{RES_IRI_NAMESPACE_STR}foo_1_iri"},
+            {"@id": f"{RES_IRI_NAMESPACE_STR}foo_2_iri"},
+            {"@id": f"{RES_IRI_NAMESPACE_STR}foo_3_iri"},
+            {"@id": f"{RES_IRI_NAMESPACE_STR}foo_4_iri"},
+            {"@id": f"{RES_IRI_NAMESPACE_STR}foo_5_iri"},
         ]
     )
     mock_resource_client_class.return_value = mock_resource_client
@@ -444,12 +449,12 @@ def test_6_resources_with_stash_and_interrupt_after_2(
     mock_resource_client = Mock()
     mock_resource_client.post_resource = Mock(
         side_effect=[
-            f"{RES_IRI_NAMESPACE_STR}foo_1_iri",
-            f"{RES_IRI_NAMESPACE_STR}foo_2_iri",
-            f"{RES_IRI_NAMESPACE_STR}foo_3_iri",
-            f"{RES_IRI_NAMESPACE_STR}foo_4_iri",
-            f"{RES_IRI_NAMESPACE_STR}foo_5_iri",
-            f"{RES_IRI_NAMESPACE_STR}foo_6_iri",
+            {"@id": f"{RES_IRI_NAMESPACE_STR}foo_1_iri"},
+            {"@id": f"{RES_IRI_NAMESPACE_STR}foo_2_iri"},
+            {"@id": f"{RES_IRI_NAMESPACE_STR}foo_3_iri"},
+            {"@id": f"{RES_IRI_NAMESPACE_STR}foo_4_iri"},
+            {"@id": f"{RES_IRI_NAMESPACE_STR}foo_5_iri"},
+            {"@id": f"{RES_IRI_NAMESPACE_STR}foo_6_iri"},
         ]
     )
     mock_resource_client_class.return_value = mock_resource_client
@@ -519,11 +524,11 @@ def test_logging(
     mock_resource_client = Mock()
     mock_resource_client.post_resource = Mock(
         side_effect=[
-            f"{RES_IRI_NAMESPACE_STR}foo_1_iri",
-            f"{RES_IRI_NAMESPACE_STR}foo_2_iri",
-            f"{RES_IRI_NAMESPACE_STR}foo_3_iri",
-            f"{RES_IRI_NAMESPACE_STR}foo_4_iri",
-            f"{RES_IRI_NAMESPACE_STR}foo_5_iri",
+            {"@id": f"{RES_IRI_NAMESPACE_STR}foo_1_iri"},
+            {"@id": f"{RES_IRI_NAMESPACE_STR}foo_2_iri"},
+            {"@id": f"{RES_IRI_NAMESPACE_STR}foo_3_iri"},
+            {"@id": f"{RES_IRI_NAMESPACE_STR}foo_4_iri"},
+            {"@id": f"{RES_IRI_NAMESPACE_STR}foo_5_iri"},
         ]
     )
     mock_resource_client_class.return_value = mock_resource_client
@@ -592,12 +597,12 @@ def test_post_requests(
     mock_resource_client = Mock()
     mock_resource_client.post_resource = Mock(
         side_effect=[
-            f"{RES_IRI_NAMESPACE_STR}foo_1_iri",
-            f"{RES_IRI_NAMESPACE_STR}foo_2_iri",
-            f"{RES_IRI_NAMESPACE_STR}foo_3_iri",
-            f"{RES_IRI_NAMESPACE_STR}foo_4_iri",
-            f"{RES_IRI_NAMESPACE_STR}foo_5_iri",
-            f"{RES_IRI_NAMESPACE_STR}foo_6_iri",
+            {"@id": f"{RES_IRI_NAMESPACE_STR}foo_1_iri"},
+            {"@id": f"{RES_IRI_NAMESPACE_STR}foo_2_iri"},
+            {"@id": f"{RES_IRI_NAMESPACE_STR}foo_3_iri"},
+            {"@id": f"{RES_IRI_NAMESPACE_STR}foo_4_iri"},
+            {"@id": f"{RES_IRI_NAMESPACE_STR}foo_5_iri"},
+            {"@id": f"{RES_IRI_NAMESPACE_STR}foo_6_iri"},
         ]
     )
     mock_resource_client_class.return_value = mock_resource_client
@@ -638,7 +643,7 @@ def test_interruption_if_resource_cannot_be_created_because_of_404(
     mock_resource_client.post_resource = Mock(
         side_effect=[
             ResponseCodeAndText(404, "not found"),  # foo_1 fails
-            f"{RES_IRI_NAMESPACE_STR}foo_2_iri",  # foo_2 succeeds
+            {"@id": f"{RES_IRI_NAMESPACE_STR}foo_2_iri"},  # foo_2 succeeds
         ]
     )
     mock_resource_client_class.return_value = mock_resource_client
@@ -652,3 +657,31 @@ def test_interruption_if_resource_cannot_be_created_because_of_404(
         handle_upload_error.assert_not_called()
         assert upload_state.failed_uploads == ["foo_1_id"]
         assert upload_state.iri_resolver.lookup == {"foo_2_id": f"{RES_IRI_NAMESPACE_STR}foo_2_iri"}
+
+
+@patch("dsp_tools.commands.xmlupload.execute_upload.ProjectClientLive")
+def test_background_work_is_shut_down_on_unexpected_error(
+    mock_project_client_class: Mock,
+    ingest_client_mock: AssetClient,
+    legal_info_client_mock: LegalInfoClient,
+    list_client_mock,
+) -> None:
+    file_value = ProcessedFileValue(
+        value=ProcessedFileBitstream("image.jpg", "foo_1_id"),
+        value_type=KnoraFileValueType.STILL_IMAGE_FILE,
+        metadata=ProcessedFileMetadata("http://rdfh.ch/licenses/cc-by-4.0", "holder", ["author"]),
+    )
+    resources = [ProcessedResource("foo_1_id", f"{ONTO}foo_1_type", "foo_1_label", None, [], file_value=file_value)]
+    upload_state = UploadState(resources.copy(), Stash(None, None), UploadConfig(), [], IriResolver())
+    ingest_client_mock.get_bitstream_info = Mock(side_effect=BadCredentialsError("expired token"))
+
+    mock_project_client = Mock()
+    mock_project_client.get_project_iri.return_value = PROJECT_IRI
+    mock_project_client_class.return_value = mock_project_client
+
+    with patch("dsp_tools.commands.xmlupload.execute_upload._shutdown_background_work") as shutdown:
+        with pytest.raises(BadCredentialsError):
+            _upload_all_resources(
+                UploadClients(ingest_client_mock, list_client_mock, legal_info_client_mock), upload_state
+            )
+        shutdown.assert_called_once()
@@ -1,7 +1,9 @@
 import pickle
 from pathlib import Path
 
+from dsp_tools.commands.xmlupload.handle_errors import get_input_fingerprint
 from dsp_tools.commands.xmlupload.handle_errors import save_upload_state
+from dsp_tools.commands.xmlupload.handle_errors import start_upload_journal
 from dsp_tools.commands.xmlupload.iri_resolver import IriResolver
 from dsp_tools.commands.xmlupload.models.processed.res import ProcessedResource
 from dsp_tools.commands.xmlupload.models.processed.values import ProcessedSimpleText
@@ -31,3 +33,81 @@ def test_save_upload_state(tmp_path: Path) -> None:
     assert upload_state.iri_resolver.lookup == saved_state.iri_resolver.lookup
     assert upload_state.pending_stash == saved_state.pending_stash
     assert upload_state.config == saved_state.config
+
+
+def test_save_upload_state_with_journal(tmp_path: Path) -> None:
+    save_location = tmp_path / "upload_state.pkl"
+    config = UploadConfig(diagnostics=DiagnosticsConfig(save_location=save_location))
+    upload_state = UploadState(
+        pending_resources=[ProcessedResource("id", "type", "label", None, [])],
+        pending_stash=None,
+        config=config,
+    )
+    start_upload_journal(upload_state)
+    assert upload_state.journal
+    snapshot = save_location.read_bytes()
+    upload_state.journal.record_resource_created("id", "iri")
+    msg = save_upload_state(upload_state)
+    assert msg == f"Saved the current upload state to {save_location}.\n"
+    # the snapshot is not rewritten, the progress is in the journal
+    assert save_location.read_bytes() == snapshot
+    assert [x["res_id"] for x in upload_state.journal.read_records()] == ["id"]
+    with open(save_location, "rb") as f:
+        saved_state: UploadState = pickle.load(f)  # noqa: S301 (deserialization of untrusted data)
+    assert saved_state.journal
+    assert saved_state.journal.path == config.diagnostics.journal_location
+
+
+def _make_new_upload_state(config: UploadConfig, res_id: str, input_fingerprint: str) -> UploadState:
+    return UploadState(
+        pending_resources=[ProcessedResource(res_id, "type", "label", None, [])],
+        pending_stash=None,
+        config=config,
+        input_fingerprint=input_fingerprint,
+    )
+
+
+def test_snapshot_of_same_input_is_reused(tmp_path: Path) -> None:
+    save_location = tmp_path / "upload_state.pkl"
+    config = UploadConfig(diagnostics=DiagnosticsConfig(save_location=save_location))
+    first_upload = _make_new_upload_state(config, "first", "fingerprint")
+    start_upload_journal(first_upload)
+    assert first_upload.journal
+    first_upload.journal.record_resource_created("first", "iri")
+    snapshot = save_location.read_bytes()
+    second_upload = _make_new_upload_state(config, "second", "fingerprint")
+    start_upload_journal(second_upload)
+    assert second_upload.journal
+    assert save_location.read_bytes() == snapshot
+    assert not list(second_upload.journal.read_records())
+
+
+def test_snapshot_of_other_input_is_replaced(tmp_path: Path) -> None:
+    save_location = tmp_path / "upload_state.pkl"
+    config = UploadConfig(diagnostics=DiagnosticsConfig(save_location=save_location))
+    start_upload_journal(_make_new_upload_state(config, "first", "fingerprint"))
+    start_upload_journal(_make_new_upload_state(config, "second", "other fingerprint"))
+    with open(save_location, "rb") as f:
+        saved_state: UploadState = pickle.load(f)  # noqa: S301 (deserialization of untrusted data)
+    assert [r.res_id for r in saved_state.pending_resources] == ["second"]
+    assert config.diagnostics.input_fingerprint_location.read_text() == "other fingerprint"
+
+
+def test_snapshot_of_progressed_upload_is_not_reused(tmp_path: Path) -> None:
+    save_location = tmp_path / "upload_state.pkl"
+    config = UploadConfig(diagnostics=DiagnosticsConfig(save_location=save_location))
+    start_upload_journal(_make_new_upload_state(config, "first", "fingerprint"))
+    save_upload_state(_make_new_upload_state(config, "first", "fingerprint"))
+    assert not config.diagnostics.input_fingerprint_location.exists()
+
+
+def test_get_input_fingerprint(tmp_path: Path) -> None:
+    xml_file = tmp_path / "data.xml"
+    xml_file.write_text("<knora/>")
+    config = UploadConfig()
+    fingerprint = get_input_fingerprint(xml_file, config, {"list": "iri"})
+    assert get_input_fingerprint(xml_file, config, {"list": "iri"}) == fingerprint
+    assert get_input_fingerprint(xml_file, config, {"list": "other iri"}) != fingerprint
+    assert get_input_fingerprint(xml_file, UploadConfig(interrupt_after=1), {"list": "iri"}) != fingerprint
+    xml_file.write_text("<knora></knora>")
+    assert get_input_fingerprint(xml_file, config, {"list": "iri"}) != fingerprint
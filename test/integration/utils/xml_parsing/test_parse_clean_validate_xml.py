@@ -4,11 +4,11 @@ import pytest
 from lxml import etree
 
 from dsp_tools.utils.xml_parsing.parse_clean_validate_xml import _reformat_error_message_str
-from dsp_tools.utils.xml_parsing.parse_clean_validate_xml import _remove_comments_from_element_tree
 from dsp_tools.utils.xml_parsing.parse_clean_validate_xml import _validate_root_get_validation_messages
 from dsp_tools.utils.xml_parsing.parse_clean_validate_xml import parse_and_clean_xml_file
 from dsp_tools.utils.xml_parsing.parse_clean_validate_xml import parse_and_validate_xml_file
 from dsp_tools.utils.xml_parsing.parse_clean_validate_xml import parse_xml_file
+from dsp_tools.utils.xml_parsing.parse_clean_validate_xml import transform_into_localnames
 
 _NS = "https://dasch.swiss/schema"
 
@@ -34,6 +34,15 @@ def test_comment_removal() -> None:
     )
 
 
+def test_transform_into_localnames_in_place() -> None:
+    root = _make_root_with_bitstream("<bitstream>file.jpg</bitstream>")
+    bitstream = root[0][0]
+    result = transform_into_localnames(root)
+    assert result is root
+    assert [x.tag for x in root.iter()] == ["knora", "resource", "bitstream"]
+    assert bitstream.tag == "bitstream"
+
+
 def test_validate_xml_data_systematic() -> None:
     assert parse_and_validate_xml_file(input_file="testdata/xml-data/test-data-systematic-4123.xml")
 
@@ -43,9 +52,7 @@ def test_validate_xml_data_minimal() -> None:
 
 
 def _prepare_root(input_file: Path) -> etree._Element:
-    root = parse_xml_file(input_file)
-    root = _remove_comments_from_element_tree(root)
-    return root
+    return parse_xml_file(input_file)
 
 
 def test_validate_xml_invalid_resource_tag_line_twelve() -> None:
@@ -0,0 +1,82 @@
+import shutil
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from dsp_tools.utils.xml_parsing import parsed_xml_cache
+from dsp_tools.utils.xml_parsing.parsed_xml_cache import ParsedXmlCache
+from dsp_tools.utils.xml_parsing.parsed_xml_cache import get_parsed_xml_file
+
+API_URL = "http://0.0.0.0:3333"
+
+
+@pytest.fixture
+def xml_file(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    monkeypatch.setenv("HOME", str(tmp_path))
+    return Path(shutil.copy("testdata/xml-data/test-data-systematic-4123.xml", tmp_path / "data.xml"))
+
+
+@pytest.fixture
+def cache_dir(tmp_path: Path) -> Path:
+    return tmp_path / ".dsp-tools" / "cache" / "parsed-xml"
+
+
+def test_header_without_resources(xml_file: Path) -> None:
+    parsed_xml = get_parsed_xml_file(xml_file, API_URL)
+    assert parsed_xml.shortcode == "4123"
+    assert {x.tag for x in parsed_xml.header} == {"permissions", "authorship"}
+    assert parsed_xml.parsed_resources
+
+
+def test_cache_not_used_by_default(xml_file: Path, cache_dir: Path) -> None:
+    get_parsed_xml_file(xml_file, API_URL)
+    assert not cache_dir.exists()
+
+
+def test_second_run_uses_cache(xml_file: Path, cache_dir: Path) -> None:
+    first = get_parsed_xml_file(xml_file, API_URL, use_cache=True)
+    assert len(list(cache_dir.glob("*.pickle"))) == 1
+    with patch.object(parsed_xml_cache, "_parse_xml_file") as parse:
+        second = get_parsed_xml_file(xml_file, API_URL, use_cache=True)
+    parse.assert_not_called()
+    assert second.parsed_resources == first.parsed_resources
+    assert second.header.attrib == first.header.attrib
+    assert [x.tag for x in second.header] == [x.tag for x in first.header]
+    assert [x.attrib["id"] for x in second.header.findall("permissions")] == [
+        "public",
+        "limited_view",
+        "private",
+        "discouraged-edge-cases",
+    ]
+
+
+def test_changed_file_is_parsed_again(xml_file: Path, cache_dir: Path) -> None:
+    get_parsed_xml_file(xml_file, API_URL, use_cache=True)
+    with open(xml_file, "a", encoding="utf-8") as f:
+        f.write("<!-- changed -->\n")
+    get_parsed_xml_file(xml_file, API_URL, use_cache=True)
+    assert len(list(cache_dir.glob("*.pickle"))) == 2
+
+
+def test_other_server_is_parsed_again(xml_file: Path) -> None:
+    first = get_parsed_xml_file(xml_file, API_URL, use_cache=True)
+    second = get_parsed_xml_file(xml_file, "https://api.dasch.swiss", use_cache=True)
+    assert first.parsed_resources[0].res_type != second.parsed_resources[0].res_type
+
+
+def test_invalid_entry_is_ignored(xml_file: Path, cache_dir: Path) -> None:
+    get_parsed_xml_file(xml_file, API_URL, use_cache=True)
+    entry = next(cache_dir.glob("*.pickle"))
+    entry.write_bytes(b"not a pickle")
+    parsed_xml = get_parsed_xml_file(xml_file, API_URL, use_cache=True)
+    assert parsed_xml.parsed_resources
+
+
+def test_least_recently_used_entries_are_removed(tmp_path: Path, xml_file: Path) -> None:
+    cache = ParsedXmlCache(directory=tmp_path / "cache", max_entries=2)
+    parsed_xml = get_parsed_xml_file(xml_file, API_URL)
+    for key in ["a", "b", "c"]:
+        cache.save(key, parsed_xml)
+    assert {x.stem for x in cache.directory.glob("*.pickle")} == {"b", "c"}
+    assert not list(cache.directory.glob("*.tmp"))
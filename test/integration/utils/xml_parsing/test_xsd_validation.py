@@ -0,0 +1,102 @@
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+from lxml import etree
+
+from dsp_tools.utils.xml_parsing import xsd_validation
+from dsp_tools.utils.xml_parsing.parse_clean_validate_xml import parse_xml_file
+from dsp_tools.utils.xml_parsing.xsd_validation import XsdError
+from dsp_tools.utils.xml_parsing.xsd_validation import _validate_sharded
+from dsp_tools.utils.xml_parsing.xsd_validation import get_data_schema
+from dsp_tools.utils.xml_parsing.xsd_validation import validate_against_data_schema
+
+_NS = "https://dasch.swiss/schema"
+
+INVALID_FILES = sorted(Path("testdata/invalid-testdata/xml-data").glob("*.xml"))
+
+
+@pytest.fixture
+def small_shards(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(xsd_validation, "RESOURCES_PER_SHARD", 1)
+
+
+def _validate_unsharded(root: etree._Element) -> list[XsdError]:
+    schema = get_data_schema()
+    schema.validate(root)
+    return [XsdError(err.message, err.line) for err in schema.error_log]
+
+
+def test_schema_is_parsed_once() -> None:
+    assert get_data_schema() is get_data_schema()
+
+
+def test_valid_file() -> None:
+    assert not validate_against_data_schema(parse_xml_file("testdata/xml-data/test-data-systematic-4123.xml"))
+
+
+def test_sharded_if_configured(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv(xsd_validation.XSD_VALIDATION_PROCESSES_ENV_VAR, "2")
+    monkeypatch.setattr(xsd_validation, "SHARDED_VALIDATION_MIN_RESOURCES", 1)
+    monkeypatch.setattr(xsd_validation, "RESOURCES_PER_SHARD", 10)
+    root = parse_xml_file("testdata/invalid-testdata/xml-data/duplicate-iri-4124.xml")
+    with patch.object(xsd_validation, "_validate_in_one_go") as in_one_go:
+        result = validate_against_data_schema(root)
+    in_one_go.assert_not_called()
+    assert result == _validate_unsharded(root)
+
+
+@pytest.mark.parametrize("num_of_processes", ["auto", "0", ""])
+def test_not_sharded_if_invalid_number_of_processes(monkeypatch: pytest.MonkeyPatch, num_of_processes: str) -> None:
+    monkeypatch.setenv(xsd_validation.XSD_VALIDATION_PROCESSES_ENV_VAR, num_of_processes)
+    monkeypatch.setattr(xsd_validation, "SHARDED_VALIDATION_MIN_RESOURCES", 1)
+    root = parse_xml_file("testdata/invalid-testdata/xml-data/duplicate-iri-4124.xml")
+    with patch.object(xsd_validation, "_validate_sharded") as sharded:
+        result = validate_against_data_schema(root)
+    sharded.assert_not_called()
+    assert result == _validate_unsharded(root)
+
+
+@pytest.mark.usefixtures("small_shards")
+def test_sharded_same_errors_as_unsharded() -> None:
+    for input_file in INVALID_FILES:
+        root = parse_xml_file(input_file)
+        assert set(_validate_sharded(root, 2)) == set(_validate_unsharded(root)), input_file
+
+
+@pytest.mark.usefixtures("small_shards")
+def test_sharded_valid_file() -> None:
+    root = parse_xml_file("testdata/xml-data/test-data-systematic-4123.xml")
+    assert _validate_sharded(root, 2) == []
+
+
+@pytest.mark.usefixtures("small_shards")
+def test_sharded_duplicates_across_shards_and_line_numbers() -> None:
+    root = etree.fromstring(
+        f'<knora xmlns="{_NS}" shortcode="4123" default-ontology="onto">\n'
+        '<permissions id="public">\n<allow group="UnknownUser">V</allow>\n</permissions>\n'
+        '<resource label="a"\n    restype=":T"\n    id="res_1"\n    iri="http://rdfh.ch/4123/x">\n'
+        '<integer-prop name=":hasInt">\n<integer>1</integer>\n</integer-prop>\n</resource>\n'
+        '<resource label="b" restype=":T" id="res_2" permissions="public">\n'
+        '<integer-prop name=":hasInt">\n<integer>not an integer</integer>\n</integer-prop>\n</resource>\n'
+        '<resource label="c" restype=":T" id="res_1" iri="http://rdfh.ch/4123/x"/>\n'
+        "</knora>"
+    )
+    result = _validate_sharded(root, 2)
+    assert result == _validate_unsharded(root)
+    assert [x.line for x in result] == [15, 18, 18]
+
+
+@pytest.mark.usefixtures("small_shards")
+def test_sharded_permissions_after_resources() -> None:
+    root = etree.fromstring(
+        f'<knora xmlns="{_NS}" shortcode="4123" default-ontology="onto">'
+        '<resource label="a" restype=":T" id="res_1"/>'
+        '<permissions id="public"><allow group="UnknownUser">V</allow></permissions>'
+        "</knora>"
+    )
+    assert _validate_sharded(root, 2) == _validate_unsharded(root)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
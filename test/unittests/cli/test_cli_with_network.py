@@ -131,6 +131,64 @@ class TestXmlupload:
             ),
         )
 
+    @patch("dsp_tools.cli.utils._check_network_health")
+    @patch("dsp_tools.cli.call_action_with_network.xmlupload")
+    def test_xmlupload_workers(self, xmlupload: Mock, check_docker: Mock) -> None:
+        args = f"xmlupload --workers 4 {DATA_XML_PATH}".split()
+        creds = ServerCredentials(
+            server="http://0.0.0.0:3333",
+            user="root@example.com",
+            password="test",
+            dsp_ingest_url="http://0.0.0.0:3340",
+        )
+        entry_point.run(args)
+        xmlupload.assert_called_once_with(
+            input_file=Path(DATA_XML_PATH),
+            creds=creds,
+            imgdir=".",
+            config=UploadConfig(
+                interrupt_after=None,
+                num_of_workers=4,
+                skip_iiif_validation=False,
+                skip_validation=False,
+                skip_ontology_validation=False,
+                ignore_duplicate_files_warning=False,
+                validation_severity=ValidationSeverity.INFO,
+                id2iri_file=None,
+                do_not_request_resource_metadata_from_db=False,
+            ),
+        )
+
+    @patch("dsp_tools.cli.utils._check_network_health")
+    @patch("dsp_tools.cli.call_action_with_network.xmlupload")
+    def test_xmlupload_xml_cache(self, xmlupload: Mock, check_docker: Mock) -> None:
+        args = f"xmlupload --xml-cache {DATA_XML_PATH}".split()
+        creds = ServerCredentials(
+            server="http://0.0.0.0:3333",
+            user="root@example.com",
+            password="test",
+            dsp_ingest_url="http://0.0.0.0:3340",
+        )
+        entry_point.run(args)
+        xmlupload.assert_called_once_with(
+            input_file=Path(DATA_XML_PATH), creds=creds, imgdir=".", config=UploadConfig(use_xml_cache=True)
+        )
+
+    @patch("dsp_tools.cli.utils._check_network_health")
+    @patch("dsp_tools.cli.call_action_with_network.xmlupload")
+    def test_xmlupload_no_api_cache(self, xmlupload: Mock, check_docker: Mock) -> None:
+        args = f"xmlupload --no-api-cache {DATA_XML_PATH}".split()
+        creds = ServerCredentials(
+            server="http://0.0.0.0:3333",
+            user="root@example.com",
+            password="test",
+            dsp_ingest_url="http://0.0.0.0:3340",
+        )
+        entry_point.run(args)
+        xmlupload.assert_called_once_with(
+            input_file=Path(DATA_XML_PATH), creds=creds, imgdir=".", config=UploadConfig(use_api_cache=False)
+        )
+
     @patch("dsp_tools.cli.utils._check_network_health")
     @patch("dsp_tools.cli.call_action_with_network.parse_and_validate_xml_file")
     def test_xmlupload_validate(self, validate_xml: Mock, check_docker: Mock) -> None:
@@ -340,6 +398,8 @@ class TestValidateData:
             skip_ontology_validation=False,
             id2iri_file=None,
             do_not_request_resource_metadata_from_db=False,
+            use_xml_cache=False,
+            use_api_cache=True,
         )
 
     @patch("dsp_tools.cli.utils._check_network_health")
@@ -359,6 +419,8 @@ class TestValidateData:
             skip_ontology_validation=False,
             id2iri_file=None,
             do_not_request_resource_metadata_from_db=False,
+            use_xml_cache=False,
+            use_api_cache=True,
         )
 
     @patch("dsp_tools.cli.utils._check_network_health")
@@ -377,6 +439,8 @@ class TestValidateData:
             skip_ontology_validation=False,
             id2iri_file=None,
             do_not_request_resource_metadata_from_db=False,
+            use_xml_cache=False,
+            use_api_cache=True,
         )
 
     @patch("dsp_tools.cli.utils._check_network_health")
@@ -398,6 +462,8 @@ class TestValidateData:
             skip_ontology_validation=False,
             id2iri_file=None,
             do_not_request_resource_metadata_from_db=False,
+            use_xml_cache=False,
+            use_api_cache=True,
         )
 
     @patch("dsp_tools.cli.utils._check_network_health")
@@ -419,6 +485,8 @@ class TestValidateData:
             skip_ontology_validation=False,
             id2iri_file=None,
             do_not_request_resource_metadata_from_db=False,
+            use_xml_cache=False,
+            use_api_cache=True,
         )
 
     @patch("dsp_tools.cli.utils._check_network_health")
@@ -437,6 +505,8 @@ class TestValidateData:
             skip_ontology_validation=True,
             id2iri_file=None,
             do_not_request_resource_metadata_from_db=False,
+            use_xml_cache=False,
+            use_api_cache=True,
         )
 
     @patch("dsp_tools.cli.utils._check_network_health")
@@ -455,6 +525,8 @@ class TestValidateData:
             skip_ontology_validation=False,
             id2iri_file=ID_2_IRI_JSON_PATH,
             do_not_request_resource_metadata_from_db=False,
+            use_xml_cache=False,
+            use_api_cache=True,
         )
 
     @patch("dsp_tools.cli.utils._check_network_health")
@@ -475,6 +547,48 @@ class TestValidateData:
             skip_ontology_validation=False,
             id2iri_file=None,
             do_not_request_resource_metadata_from_db=True,
+            use_xml_cache=False,
+            use_api_cache=True,
+        )
+
+    @patch("dsp_tools.cli.utils._check_network_health")
+    @patch("dsp_tools.cli.call_action_with_network.validate_data")
+    def test_validate_data_xml_cache(self, validate_data: Mock, check_docker: Mock) -> None:
+        args = f"validate-data {DATA_XML_PATH} --xml-cache".split()
+        entry_point.run(args)
+        creds = ServerCredentials(
+            user="root@example.com", password="test", server="http://0.0.0.0:3333", dsp_ingest_url="http://0.0.0.0:3340"
+        )
+        validate_data.assert_called_once_with(
+            filepath=Path(DATA_XML_PATH),
+            save_graphs=False,
+            creds=creds,
+            ignore_duplicate_files_warning=False,
+            skip_ontology_validation=False,
+            id2iri_file=None,
+            do_not_request_resource_metadata_from_db=False,
+            use_xml_cache=True,
+            use_api_cache=True,
+        )
+
+    @patch("dsp_tools.cli.utils._check_network_health")
+    @patch("dsp_tools.cli.call_action_with_network.validate_data")
+    def test_validate_data_no_api_cache(self, validate_data: Mock, check_docker: Mock) -> None:
+        args = f"validate-data {DATA_XML_PATH} --no-api-cache".split()
+        entry_point.run(args)
+        creds = ServerCredentials(
+            user="root@example.com", password="test", server="http://0.0.0.0:3333", dsp_ingest_url="http://0.0.0.0:3340"
+        )
+        validate_data.assert_called_once_with(
+            filepath=Path(DATA_XML_PATH),
+            save_graphs=False,
+            creds=creds,
+            ignore_duplicate_files_warning=False,
+            skip_ontology_validation=False,
+            id2iri_file=None,
+            do_not_request_resource_metadata_from_db=False,
+            use_xml_cache=False,
+            use_api_cache=False,
         )
 
 
@@ -518,7 +632,9 @@ class TestIngestUploads:
             password="test",
             dsp_ingest_url="http://0.0.0.0:3340",
         )
-        upload_files.assert_called_once_with(xml_file=Path(DATA_XML_PATH), creds=creds, imgdir=Path("."))
+        upload_files.assert_called_once_with(
+            xml_file=Path(DATA_XML_PATH), creds=creds, imgdir=Path("."), num_of_workers=1, max_bytes_per_second=None
+        )
 
     @patch("dsp_tools.cli.utils._check_network_health")
     @patch("dsp_tools.cli.call_action_with_network.upload_files")
@@ -534,7 +650,28 @@ class TestIngestUploads:
             password=password,
             dsp_ingest_url=server.replace("api", "ingest"),
         )
-        upload_files.assert_called_once_with(xml_file=Path(DATA_XML_PATH), creds=creds, imgdir=Path("."))
+        upload_files.assert_called_once_with(
+            xml_file=Path(DATA_XML_PATH), creds=creds, imgdir=Path("."), num_of_workers=1, max_bytes_per_second=None
+        )
+
+    @patch("dsp_tools.cli.utils._check_network_health")
+    @patch("dsp_tools.cli.call_action_with_network.upload_files")
+    def test_upload_files_workers(self, upload_files: Mock, check_docker: Mock) -> None:
+        args = f"upload-files --workers 4 --max-mb-per-second 10 {DATA_XML_PATH}".split()
+        entry_point.run(args)
+        creds = ServerCredentials(
+            server="http://0.0.0.0:3333",
+            user="root@example.com",
+            password="test",
+            dsp_ingest_url="http://0.0.0.0:3340",
+        )
+        upload_files.assert_called_once_with(
+            xml_file=Path(DATA_XML_PATH),
+            creds=creds,
+            imgdir=Path("."),
+            num_of_workers=4,
+            max_bytes_per_second=10 * 1024 * 1024,
+        )
 
     @patch("dsp_tools.cli.call_action_with_network.check_input_dependencies")
     @patch("dsp_tools.cli.call_action_with_network.ingest_files")
@@ -586,6 +723,7 @@ class TestIngestUploads:
             skip_ontology_validation=False,
             id2iri_file=None,
             do_not_request_resource_metadata_from_db=False,
+            use_api_cache=True,
         )
 
     @patch("dsp_tools.cli.utils._check_network_health")
@@ -608,6 +746,7 @@ class TestIngestUploads:
             skip_ontology_validation=False,
             id2iri_file=None,
             do_not_request_resource_metadata_from_db=False,
+            use_api_cache=True,
         )
 
     @patch("dsp_tools.cli.utils._check_network_health")
@@ -629,6 +768,7 @@ class TestIngestUploads:
             skip_ontology_validation=False,
             id2iri_file=None,
             do_not_request_resource_metadata_from_db=False,
+            use_api_cache=True,
         )
 
     @patch("dsp_tools.cli.utils._check_network_health")
@@ -653,6 +793,7 @@ class TestIngestUploads:
             skip_ontology_validation=False,
             id2iri_file=None,
             do_not_request_resource_metadata_from_db=False,
+            use_api_cache=True,
         )
 
     @patch("dsp_tools.cli.utils._check_network_health")
@@ -674,6 +815,7 @@ class TestIngestUploads:
             skip_ontology_validation=False,
             id2iri_file=ID_2_IRI_JSON_PATH,
             do_not_request_resource_metadata_from_db=False,
+            use_api_cache=True,
         )
 
     @patch("dsp_tools.cli.utils._check_network_health")
@@ -697,6 +839,29 @@ class TestIngestUploads:
             skip_ontology_validation=False,
             id2iri_file=None,
             do_not_request_resource_metadata_from_db=True,
+            use_api_cache=True,
+        )
+
+    @patch("dsp_tools.cli.utils._check_network_health")
+    @patch("dsp_tools.cli.call_action_with_network.ingest_xmlupload")
+    def test_ingest_xmlupload_no_api_cache(self, ingest_xmlupload: Mock, check_docker: Mock) -> None:
+        args = f"ingest-xmlupload {DATA_XML_PATH} --no-api-cache".split()
+        entry_point.run(args)
+        creds = ServerCredentials(
+            server="http://0.0.0.0:3333",
+            user="root@example.com",
+            password="test",
+            dsp_ingest_url="http://0.0.0.0:3340",
+        )
+        ingest_xmlupload.assert_called_once_with(
+            xml_file=Path(DATA_XML_PATH),
+            creds=creds,
+            interrupt_after=None,
+            skip_validation=False,
+            skip_ontology_validation=False,
+            id2iri_file=None,
+            do_not_request_resource_metadata_from_db=False,
+            use_api_cache=False,
         )
 
 
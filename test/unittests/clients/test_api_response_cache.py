@@ -0,0 +1,28 @@
+from pathlib import Path
+
+from dsp_tools.clients.api_response_cache import ApiResponseCache
+from dsp_tools.clients.api_response_cache import CachedResponse
+
+SERVER = "http://0.0.0.0:3333"
+IRI = "http://0.0.0.0:3333/ontology/9999/onto/v2"
+
+
+def test_put_and_get(tmp_path: Path) -> None:
+    cache = ApiResponseCache(directory=tmp_path)
+    response = CachedResponse(content="@prefix onto: <ä> .", validator="2024-01-01T00:00:00Z")
+    cache.put(SERVER, IRI, response)
+    assert ApiResponseCache(directory=tmp_path).get(SERVER, IRI) == response
+    assert not list(tmp_path.glob("*.tmp"))
+
+
+def test_entries_are_separated_by_server(tmp_path: Path) -> None:
+    cache = ApiResponseCache(directory=tmp_path)
+    cache.put(SERVER, IRI, CachedResponse(content="content", validator="validator"))
+    assert not cache.get("https://api.dasch.swiss", IRI)
+
+
+def test_invalid_entry_is_ignored(tmp_path: Path) -> None:
+    cache = ApiResponseCache(directory=tmp_path)
+    cache.put(SERVER, IRI, CachedResponse(content="content", validator="validator"))
+    next(tmp_path.glob("*.json")).write_text("{", encoding="utf-8")
+    assert not cache.get(SERVER, IRI)
@@ -190,7 +190,9 @@ def test_try_network_action(log_request: Mock, log_response: Mock) -> None:
     assert response == response_expected
     log_request.assert_called_once_with(params, con.session.headers)
     con.session.request.assert_called_once_with(**params.as_kwargs())
-    log_response.assert_called_once_with(response_expected, status_code=200)
+    log_response.assert_called_once_with(
+        response_expected, status_code=200, request=params, extra_headers=con.session.headers
+    )
 
 
 @patch("dsp_tools.utils.request_utils.log_response")
@@ -217,13 +219,15 @@ def test_try_network_action_connection_error(
     con.session = session_mock  # type: ignore[assignment]
     con._renew_session = Mock()
     params = RequestParameters(method="POST", url="http://example.com/", timeout=1)
-    with patch("dsp_tools.utils.request_utils.time.sleep") as sleep_mock:
+    with patch("dsp_tools.utils.rate_control.time.sleep") as sleep_mock:
         response = con._try_network_action(params)
         assert [x.args[0] for x in sleep_mock.call_args_list] == [1, 2, 4]
     assert con._renew_session.call_count == len(session_mock.responses) - 1
     assert [x.args[0] for x in log_request.call_args_list] == [params] * len(session_mock.responses)
     last_response = session_mock.responses[-1]
-    log_response.assert_called_once_with(last_response, status_code=last_response.status_code)
+    log_response.assert_called_once_with(
+        last_response, status_code=last_response.status_code, request=params, extra_headers=con.session.headers
+    )
     assert response == last_response
 
 
@@ -236,7 +240,7 @@ def test_try_network_action_non_200(log_request: Mock, log_response: Mock, monke
     session_mock = SessionMock(responses)
     con.session = session_mock  # type: ignore[assignment]
     params = RequestParameters(method="POST", url="http://example.com/", timeout=1)
-    with patch("dsp_tools.utils.request_utils.time.sleep") as sleep_mock:
+    with patch("dsp_tools.utils.rate_control.time.sleep") as sleep_mock:
         response = con._try_network_action(params)
         assert [x.args[0] for x in sleep_mock.call_args_list] == [1, 2]
     assert [x.args[0] for x in log_request.call_args_list] == [params] * len(session_mock.responses)
@@ -256,7 +260,7 @@ def test_try_network_action_in_testing_environment(
     responses = (Mock(status_code=500, text=""), Mock(status_code=404, text=""), Mock(status_code=200, text=""))
     con.session = SessionMock(responses, {})  # type: ignore[assignment]
     params = RequestParameters(method="PUT", url="http://example.com/", timeout=1)
-    with patch("dsp_tools.utils.request_utils.log_request_failure_and_sleep") as sleep_mock:
+    with patch("dsp_tools.utils.rate_control.time.sleep") as sleep_mock:
         with pytest.raises(PermanentConnectionError):
             con._try_network_action(params)
         sleep_mock.assert_not_called()
@@ -88,7 +88,7 @@ class TestGroupClientLiveGetGroup:
                 },
             ]
         }
-        with patch("dsp_tools.clients.group_user_clients_live.requests.get", return_value=mock_response) as mock_get:
+        with patch("requests.Session.get", return_value=mock_response) as mock_get:
             result = group_client.get_all_groups()
         assert len(result) == 2
         assert result[0]["name"] == "testgroup"
@@ -100,21 +100,19 @@ class TestGroupClientLiveGetGroup:
     def test_get_all_groups_empty(self, group_client: GroupClientLive) -> None:
         mock_response = Mock(status_code=200, ok=True, headers={})
         mock_response.json.return_value = {"groups": []}
-        with patch("dsp_tools.clients.group_user_clients_live.requests.get", return_value=mock_response):
+        with patch("requests.Session.get", return_value=mock_response):
             result = group_client.get_all_groups()
         assert result == []
 
     def test_get_all_groups_timeout(self, group_client: GroupClientLive) -> None:
-        with patch(
-            "dsp_tools.clients.group_user_clients_live.requests.get", side_effect=requests.ReadTimeout("Timeout")
-        ):
+        with patch("requests.Session.get", side_effect=requests.ReadTimeout("Timeout")):
             with pytest.raises(DspToolsRequestException):
                 group_client.get_all_groups()
 
     def test_get_all_groups_server_error(self, group_client: GroupClientLive) -> None:
         mock_response = Mock(status_code=500, ok=False, headers={}, text="Internal Server Error")
         mock_response.json.return_value = {}
-        with patch("dsp_tools.clients.group_user_clients_live.requests.get", return_value=mock_response):
+        with patch("requests.Session.get", return_value=mock_response):
             with pytest.warns(DspToolsUnexpectedStatusCodeWarning):
                 result = group_client.get_all_groups()
         assert result == []
@@ -134,22 +132,20 @@ class TestGroupClientCreateNewGroup:
                 "project": {"id": PROJECT_IRI},
             }
         }
-        with patch("dsp_tools.clients.group_user_clients_live.requests.post", return_value=mock_response) as mock_post:
+        with patch("requests.Session.post", return_value=mock_response) as mock_post:
             result = group_client.create_new_group(new_group)
         assert result == GROUP_IRI
         assert mock_post.call_args[0][0] == f"{group_client.api_url}/admin/groups"
 
     def test_request_exception(self, group_client: GroupClientLive, new_group) -> None:
-        with patch(
-            "dsp_tools.clients.group_user_clients_live.requests.post", side_effect=requests.ReadTimeout("Timeout")
-        ):
+        with patch("requests.Session.post", side_effect=requests.ReadTimeout("Timeout")):
             with pytest.raises(DspToolsRequestException):
                 group_client.create_new_group(new_group)
 
     def test_non_ok_response(self, group_client: GroupClientLive, new_group) -> None:
         mock_response = Mock(status_code=500, ok=False, headers={}, text="Internal Server Error")
         mock_response.json.return_value = {}
-        with patch("dsp_tools.clients.group_user_clients_live.requests.post", return_value=mock_response):
+        with patch("requests.Session.post", return_value=mock_response):
             with pytest.warns(DspToolsUnexpectedStatusCodeWarning):
                 result = group_client.create_new_group(new_group)
         assert result is None
@@ -157,7 +153,7 @@ class TestGroupClientCreateNewGroup:
     def test_forbidden(self, group_client: GroupClientLive, new_group) -> None:
         mock_response = Mock(status_code=403, ok=False, headers={}, text="Forbidden")
         mock_response.json.side_effect = JSONDecodeError("Expecting value", "", 0)
-        with patch("dsp_tools.clients.group_user_clients_live.requests.post", return_value=mock_response):
+        with patch("requests.Session.post", return_value=mock_response):
             with pytest.raises(BadCredentialsError):
                 group_client.create_new_group(new_group)
 
@@ -166,7 +162,7 @@ class TestUserClientLiveGetUserIriByUsername:
     def test_success(self, user_client: UserClientLive) -> None:
         mock_response = Mock(status_code=200, ok=True, headers={})
         mock_response.json.return_value = {"user": {"id": USER_IRI, "username": "testuser"}}
-        with patch("dsp_tools.clients.group_user_clients_live.requests.get", return_value=mock_response) as mock_get:
+        with patch("requests.Session.get", return_value=mock_response) as mock_get:
             result = user_client.get_user_iri_by_username("testuser")
         assert result == USER_IRI
         assert mock_get.call_args[1]["url"] == f"{user_client.api_url}/admin/users/username/testuser"
@@ -174,28 +170,26 @@ class TestUserClientLiveGetUserIriByUsername:
     def test_not_found(self, user_client: UserClientLive) -> None:
         mock_response = Mock(status_code=404, ok=False, headers={}, text="User not found")
         mock_response.json.return_value = {"message": "User with username 'nonexistent' not found"}
-        with patch("dsp_tools.clients.group_user_clients_live.requests.get", return_value=mock_response):
+        with patch("requests.Session.get", return_value=mock_response):
             result = user_client.get_user_iri_by_username("nonexistent")
         assert result is None
 
     def test_forbidden(self, user_client: UserClientLive) -> None:
         mock_response = Mock(status_code=403, ok=False, headers={}, text="forbidden")
         mock_response.json.side_effect = JSONDecodeError("Expecting value", "", 0)
-        with patch("dsp_tools.clients.group_user_clients_live.requests.get", return_value=mock_response):
+        with patch("requests.Session.get", return_value=mock_response):
             with pytest.raises(BadCredentialsError):
                 user_client.get_user_iri_by_username("testuser")
 
     def test_timeout(self, user_client: UserClientLive) -> None:
-        with patch(
-            "dsp_tools.clients.group_user_clients_live.requests.get", side_effect=requests.ReadTimeout("Timeout")
-        ):
+        with patch("requests.Session.get", side_effect=requests.ReadTimeout("Timeout")):
             with pytest.raises(DspToolsRequestException):
                 user_client.get_user_iri_by_username("testuser")
 
     def test_server_error(self, user_client: UserClientLive) -> None:
         mock_response = Mock(status_code=500, ok=False, headers={}, text="Internal Server Error")
         mock_response.json.return_value = {}
-        with patch("dsp_tools.clients.group_user_clients_live.requests.get", return_value=mock_response):
+        with patch("requests.Session.get", return_value=mock_response):
             with pytest.warns(DspToolsUnexpectedStatusCodeWarning):
                 result = user_client.get_user_iri_by_username("testuser")
         assert result is None
@@ -205,7 +199,7 @@ class TestUserClientLivePostNewUser:
     def test_success(self, user_client: UserClientLive, new_user) -> None:
         mock_response = Mock(status_code=200, ok=True, headers={})
         mock_response.json.return_value = {"user": {"id": USER_IRI, "username": "testuser"}}
-        with patch("dsp_tools.clients.group_user_clients_live.requests.post", return_value=mock_response) as mock_post:
+        with patch("requests.Session.post", return_value=mock_response) as mock_post:
             result = user_client.post_new_user(new_user)
         assert result == USER_IRI
         assert mock_post.call_args[1]["url"] == f"{user_client.api_url}/admin/users"
@@ -213,28 +207,26 @@ class TestUserClientLivePostNewUser:
     def test_bad_request(self, user_client: UserClientLive, new_user) -> None:
         mock_response = Mock(status_code=400, ok=False, headers={}, text="User already exists")
         mock_response.json.return_value = {}
-        with patch("dsp_tools.clients.group_user_clients_live.requests.post", return_value=mock_response):
+        with patch("requests.Session.post", return_value=mock_response):
             with pytest.raises(FatalNonOkApiResponseCode):
                 user_client.post_new_user(new_user)
 
     def test_forbidden(self, user_client: UserClientLive, new_user) -> None:
         mock_response = Mock(status_code=403, ok=False, headers={}, text="forbidden")
         mock_response.json.side_effect = JSONDecodeError("Expecting value", "", 0)
-        with patch("dsp_tools.clients.group_user_clients_live.requests.post", return_value=mock_response):
+        with patch("requests.Session.post", return_value=mock_response):
             with pytest.raises(BadCredentialsError):
                 user_client.post_new_user(new_user)
 
     def test_timeout(self, user_client: UserClientLive, new_user) -> None:
-        with patch(
-            "dsp_tools.clients.group_user_clients_live.requests.post", side_effect=requests.ReadTimeout("Timeout")
-        ):
+        with patch("requests.Session.post", side_effect=requests.ReadTimeout("Timeout")):
             with pytest.raises(DspToolsRequestException):
                 user_client.post_new_user(new_user)
 
     def test_server_error(self, user_client: UserClientLive, new_user) -> None:
         mock_response = Mock(status_code=500, ok=False, headers={}, text="Internal Server Error")
         mock_response.json.return_value = {}
-        with patch("dsp_tools.clients.group_user_clients_live.requests.post", return_value=mock_response):
+        with patch("requests.Session.post", return_value=mock_response):
             with pytest.warns(DspToolsUnexpectedStatusCodeWarning):
                 result = user_client.post_new_user(new_user)
         assert result is None
@@ -244,7 +236,7 @@ class TestUserClientLiveAddUserToProject:
     def test_success(self, user_client: UserClientLive) -> None:
         mock_response = Mock(status_code=200, ok=True, headers={})
         mock_response.json.return_value = {"user": {"id": USER_IRI}}
-        with patch("dsp_tools.clients.group_user_clients_live.requests.post", return_value=mock_response) as mock_post:
+        with patch("requests.Session.post", return_value=mock_response) as mock_post:
             result = user_client.add_user_as_project_member(USER_IRI, PROJECT_IRI)
         assert result is True
         expected_url = (
@@ -256,21 +248,19 @@ class TestUserClientLiveAddUserToProject:
     def test_forbidden(self, user_client: UserClientLive) -> None:
         mock_response = Mock(status_code=403, ok=False, headers={}, text="forbidden")
         mock_response.json.side_effect = JSONDecodeError("Expecting value", "", 0)
-        with patch("dsp_tools.clients.group_user_clients_live.requests.post", return_value=mock_response):
+        with patch("requests.Session.post", return_value=mock_response):
             with pytest.raises(BadCredentialsError):
                 user_client.add_user_as_project_member(USER_IRI, PROJECT_IRI)
 
     def test_timeout(self, user_client: UserClientLive) -> None:
-        with patch(
-            "dsp_tools.clients.group_user_clients_live.requests.post", side_effect=requests.ReadTimeout("Timeout")
-        ):
+        with patch("requests.Session.post", side_effect=requests.ReadTimeout("Timeout")):
             with pytest.raises(DspToolsRequestException):
                 user_client.add_user_as_project_member(USER_IRI, PROJECT_IRI)
 
     def test_server_error(self, user_client: UserClientLive) -> None:
         mock_response = Mock(status_code=500, ok=False, headers={}, text="Internal Server Error")
         mock_response.json.return_value = {}
-        with patch("dsp_tools.clients.group_user_clients_live.requests.post", return_value=mock_response):
+        with patch("requests.Session.post", return_value=mock_response):
             with pytest.warns(DspToolsUnexpectedStatusCodeWarning):
                 result = user_client.add_user_as_project_member(USER_IRI, PROJECT_IRI)
         assert result is False
@@ -280,7 +270,7 @@ class TestUserClientLiveAddUserAsProjectAdmin:
     def test_success(self, user_client: UserClientLive) -> None:
         mock_response = Mock(status_code=200, ok=True, headers={})
         mock_response.json.return_value = {"user": {"id": USER_IRI}}
-        with patch("dsp_tools.clients.group_user_clients_live.requests.post", return_value=mock_response) as mock_post:
+        with patch("requests.Session.post", return_value=mock_response) as mock_post:
             result = user_client.add_user_as_project_admin(USER_IRI, PROJECT_IRI)
         assert result is True
         expected_url = (
@@ -292,21 +282,19 @@ class TestUserClientLiveAddUserAsProjectAdmin:
     def test_forbidden(self, user_client: UserClientLive) -> None:
         mock_response = Mock(status_code=403, ok=False, headers={}, text="forbidden")
         mock_response.json.side_effect = JSONDecodeError("Expecting value", "", 0)
-        with patch("dsp_tools.clients.group_user_clients_live.requests.post", return_value=mock_response):
+        with patch("requests.Session.post", return_value=mock_response):
             with pytest.raises(BadCredentialsError):
                 user_client.add_user_as_project_admin(USER_IRI, PROJECT_IRI)
 
     def test_timeout(self, user_client: UserClientLive) -> None:
-        with patch(
-            "dsp_tools.clients.group_user_clients_live.requests.post", side_effect=requests.ReadTimeout("Timeout")
-        ):
+        with patch("requests.Session.post", side_effect=requests.ReadTimeout("Timeout")):
             with pytest.raises(DspToolsRequestException):
                 user_client.add_user_as_project_admin(USER_IRI, PROJECT_IRI)
 
     def test_server_error(self, user_client: UserClientLive) -> None:
         mock_response = Mock(status_code=500, ok=False, headers={}, text="Internal Server Error")
         mock_response.json.return_value = {}
-        with patch("dsp_tools.clients.group_user_clients_live.requests.post", return_value=mock_response):
+        with patch("requests.Session.post", return_value=mock_response):
             with pytest.warns(DspToolsUnexpectedStatusCodeWarning):
                 result = user_client.add_user_as_project_admin(USER_IRI, PROJECT_IRI)
         assert result is False
@@ -316,7 +304,7 @@ class TestUserClientLiveAddUserToCustomGroup:
     def test_all_success(self, user_client: UserClientLive) -> None:
         mock_response = Mock(status_code=200, ok=True, headers={})
         mock_response.json.return_value = {"user": {"id": USER_IRI}}
-        with patch("dsp_tools.clients.group_user_clients_live.requests.post", return_value=mock_response):
+        with patch("requests.Session.post", return_value=mock_response):
             result = user_client.add_user_to_custom_groups(
                 USER_IRI, [GROUP_IRI, "http://rdfh.ch/groups/4123/iri-testgroup2"]
             )
@@ -327,7 +315,7 @@ class TestUserClientLiveAddUserToCustomGroup:
         mock_success.json.return_value = {"user": {"id": USER_IRI}}
         mock_failure = Mock(status_code=500, ok=False, headers={}, text="Internal Server Error")
         mock_failure.json.return_value = {}
-        with patch("dsp_tools.clients.group_user_clients_live.requests.post", side_effect=[mock_success, mock_failure]):
+        with patch("requests.Session.post", side_effect=[mock_success, mock_failure]):
             with pytest.warns(DspToolsUnexpectedStatusCodeWarning):
                 result = user_client.add_user_to_custom_groups(
                     USER_IRI, [GROUP_IRI, "http://rdfh.ch/groups/4123/iri-testgroup2"]
@@ -337,7 +325,7 @@ class TestUserClientLiveAddUserToCustomGroup:
     def test_all_failure(self, user_client: UserClientLive) -> None:
         mock_failure = Mock(status_code=500, ok=False, headers={}, text="Internal Server Error")
         mock_failure.json.return_value = {}
-        with patch("dsp_tools.clients.group_user_clients_live.requests.post", return_value=mock_failure):
+        with patch("requests.Session.post", return_value=mock_failure):
             with pytest.warns(DspToolsUnexpectedStatusCodeWarning):
                 result = user_client.add_user_to_custom_groups(
                     USER_IRI, [GROUP_IRI, "http://rdfh.ch/groups/4123/iri-testgroup2"]
@@ -354,7 +342,7 @@ class TestUserClientLiveAddUserToOneGroup:
         mock_response = Mock(status_code=200, ok=True, headers={})
         mock_response.json.return_value = {"user": {"id": USER_IRI}}
         user_iri_encoded = "http%3A%2F%2Frdfh.ch%2Fusers%2Ftestuser-iri"
-        with patch("dsp_tools.clients.group_user_clients_live.requests.post", return_value=mock_response) as mock_post:
+        with patch("requests.Session.post", return_value=mock_response) as mock_post:
             result = user_client._add_user_to_one_group(user_iri_encoded, GROUP_IRI)
         assert result is True
         expected_url = (
@@ -367,15 +355,13 @@ class TestUserClientLiveAddUserToOneGroup:
         mock_response = Mock(status_code=403, ok=False, headers={}, text="forbidden")
         mock_response.json.side_effect = JSONDecodeError("Expecting value", "", 0)
         user_iri_encoded = "http%3A%2F%2Frdfh.ch%2Fusers%2Ftestuser-iri"
-        with patch("dsp_tools.clients.group_user_clients_live.requests.post", return_value=mock_response):
+        with patch("requests.Session.post", return_value=mock_response):
             with pytest.raises(BadCredentialsError):
                 user_client._add_user_to_one_group(user_iri_encoded, GROUP_IRI)
 
     def test_timeout(self, user_client: UserClientLive) -> None:
         user_iri_encoded = "http%3A%2F%2Frdfh.ch%2Fusers%2Ftestuser-iri"
-        with patch(
-            "dsp_tools.clients.group_user_clients_live.requests.post", side_effect=requests.ReadTimeout("Timeout")
-        ):
+        with patch("requests.Session.post", side_effect=requests.ReadTimeout("Timeout")):
             with pytest.raises(DspToolsRequestException):
                 user_client._add_user_to_one_group(user_iri_encoded, GROUP_IRI)
 
@@ -383,7 +369,7 @@ class TestUserClientLiveAddUserToOneGroup:
         mock_response = Mock(status_code=500, ok=False, headers={}, text="Internal Server Error")
         mock_response.json.return_value = {}
         user_iri_encoded = "http%3A%2F%2Frdfh.ch%2Fusers%2Ftestuser-iri"
-        with patch("dsp_tools.clients.group_user_clients_live.requests.post", return_value=mock_response):
+        with patch("requests.Session.post", return_value=mock_response):
             with pytest.warns(DspToolsUnexpectedStatusCodeWarning):
                 result = user_client._add_user_to_one_group(user_iri_encoded, GROUP_IRI)
         assert result is False
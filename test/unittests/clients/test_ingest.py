@@ -9,6 +9,8 @@ from requests_mock import Mocker
 from dsp_tools.clients.ingest import DspIngestClientLive
 from dsp_tools.error.exceptions import BadCredentialsError
 from dsp_tools.error.exceptions import PermanentConnectionError
+from dsp_tools.utils.rate_control import AdaptiveRateController
+from dsp_tools.utils.rate_control import RateControlConfig
 from test.integration.commands.xmlupload.authentication_client_mock import AuthenticationClientMockBase
 
 
@@ -78,3 +80,15 @@ def test_ingest_logs_exception_on_request_failure(
         with pytest.raises(PermanentConnectionError):
             ingest_client._ingest(tmp_file)
     assert mock_exc.call_count == 1
+
+
+def test_ingest_failure_does_not_cut_the_limit_of_the_api(
+    dsp_ingest_url: str, ingest_client: DspIngestClientLive, requests_mock: Mocker, shortcode: str, tmp_file: Path
+) -> None:
+    tmp_file.write_text("<xml></xml>")
+    requests_mock.post(_make_url(dsp_ingest_url, shortcode, tmp_file), exc=requests.exceptions.ConnectionError)
+    controller = AdaptiveRateController(RateControlConfig(initial_limit=8))
+    with patch("dsp_tools.clients.ingest.get_rate_controller", return_value=controller):
+        with pytest.raises(PermanentConnectionError):
+            ingest_client._ingest(tmp_file)
+    assert controller.limit == 8
@@ -7,7 +7,7 @@ from requests import RequestException
 
 from dsp_tools.clients.exceptions import FatalNonOkApiResponseCode
 from dsp_tools.clients.legal_info_client_live import LegalInfoClientLive
-from dsp_tools.clients.legal_info_client_live import _is_last_page
+from dsp_tools.clients.legal_info_client_live import _get_total_pages
 from dsp_tools.error.exceptions import BadCredentialsError
 from dsp_tools.utils.exceptions import DspToolsRequestException
 from dsp_tools.utils.request_utils import RequestParameters
@@ -56,7 +56,7 @@ class TestPostCopyrightHolders:
             data={"data": ["1"]},
             timeout=60,
         )
-        with patch("dsp_tools.clients.legal_info_client_live.requests.post") as post_mock:
+        with patch("requests.Session.post") as post_mock:
             post_mock.return_value = Mock(status_code=200, ok=True)
             response = client._post_and_log_request(url, ["1"])
         assert response.status_code == 200
@@ -78,7 +78,7 @@ class TestPostCopyrightHolders:
             timeout=60,
             headers={"Content-Type": "application/json", "Authorization": "Bearer tkn"},
         )
-        with patch("dsp_tools.clients.legal_info_client_live.requests.post") as post_mock:
+        with patch("requests.Session.post") as post_mock:
             post_mock.return_value = Mock(status_code=200, ok=True)
             client._post_and_log_request(url, ["1"])
             post_mock.assert_called_once_with(
@@ -122,6 +122,23 @@ class TestGetEnabledLicenses:
             response = client.get_licenses_of_a_project()
             assert response == [LICENSE_1, LICENSE_2]
 
+    def test_get_enabled_license_page_every_page_is_requested(self):
+        client = LegalInfoClientLive("http://api.com", "9999", AUTH)
+        licenses = [{**LICENSE_1, "id": f"http://rdfh.ch/{i}"} for i in range(1, 4)]
+
+        def get_page(page_num: int, enabled_only: bool) -> Mock:  # noqa: ARG001
+            response = Mock(status_code=200, ok=True)
+            response.json.return_value = {
+                "data": [licenses[page_num - 1]],
+                "pagination": {"pageSize": 1, "totalItems": 3, "totalPages": 3, "currentPage": page_num},
+            }
+            return response
+
+        with patch.object(LegalInfoClientLive, attribute="_get_one_license_page", side_effect=get_page) as get_mock:
+            response = client.get_licenses_of_a_project()
+        assert response == licenses
+        assert sorted(x.args[0] for x in get_mock.call_args_list) == [1, 2, 3]
+
     def test_get_enabled_license_page_no_license(self):
         client = LegalInfoClientLive("http://api.com", "9999", AUTH)
         get_mock = Mock(
@@ -150,7 +167,7 @@ class TestGetEnabledLicenses:
             timeout=60,
             headers={"Content-Type": "application/json", "Authorization": "Bearer tkn"},
         )
-        with patch("dsp_tools.clients.legal_info_client_live.requests.get") as get_mock:
+        with patch("requests.Session.get") as get_mock:
             mock_response = Mock(status_code=200, ok=True)
             mock_response.json.return_value = DATA_PAGE_1_OF_1
             get_mock.return_value = mock_response
@@ -163,7 +180,7 @@ class TestGetEnabledLicenses:
         mock_response = Mock(status_code=404, ok=False, text="Not Found")
         mock_response.json.return_value = {}
         mock_response.headers = {}
-        with patch("dsp_tools.clients.legal_info_client_live.requests.get") as get_mock:
+        with patch("requests.Session.get") as get_mock:
             get_mock.return_value = mock_response
             with pytest.raises(FatalNonOkApiResponseCode):
                 client._get_one_license_page(page_num=1, enabled_only=True)
@@ -171,7 +188,7 @@ class TestGetEnabledLicenses:
     def test_request_exception(self):
         client = LegalInfoClientLive("http://api.com", "9999", AUTH)
         request_error = RequestException("Connection timeout")
-        with patch("dsp_tools.clients.legal_info_client_live.requests.get") as get_mock:
+        with patch("requests.Session.get") as get_mock:
             get_mock.side_effect = request_error
             with pytest.raises(DspToolsRequestException):
                 client._get_one_license_page(page_num=1, enabled_only=True)
@@ -196,7 +213,7 @@ class TestSetResourceSideLegalInfo:
             data=RESOURCE_SIDE_LEGAL_INFO,
             headers={"Content-Type": "application/json", "Authorization": "Bearer tkn"},
         )
-        with patch("dsp_tools.clients.legal_info_client_live.requests.put") as put_mock:
+        with patch("requests.Session.put") as put_mock:
             put_mock.return_value = Mock(status_code=200, ok=True)
             client.set_resource_side_legal_info(RESOURCE_SIDE_LEGAL_INFO)
             put_mock.assert_called_once_with(
@@ -207,7 +224,7 @@ class TestSetResourceSideLegalInfo:
         client = LegalInfoClientLive("http://api.com", "9999", AUTH)
         mock_response = Mock(status_code=HTTPStatus.FORBIDDEN.value, ok=False, headers={})
         mock_response.json.return_value = {}
-        with patch("dsp_tools.clients.legal_info_client_live.requests.put") as put_mock:
+        with patch("requests.Session.put") as put_mock:
             put_mock.return_value = mock_response
             with pytest.raises(BadCredentialsError):
                 client.set_resource_side_legal_info(RESOURCE_SIDE_LEGAL_INFO)
@@ -216,22 +233,19 @@ class TestSetResourceSideLegalInfo:
         client = LegalInfoClientLive("http://api.com", "9999", AUTH)
         mock_response = Mock(status_code=404, ok=False, text="Not Found", headers={})
         mock_response.json.return_value = {}
-        with patch("dsp_tools.clients.legal_info_client_live.requests.put") as put_mock:
+        with patch("requests.Session.put") as put_mock:
             put_mock.return_value = mock_response
             with pytest.raises(FatalNonOkApiResponseCode):
                 client.set_resource_side_legal_info(RESOURCE_SIDE_LEGAL_INFO)
 
     def test_request_exception(self):
         client = LegalInfoClientLive("http://api.com", "9999", AUTH)
-        with patch("dsp_tools.clients.legal_info_client_live.requests.put") as put_mock:
+        with patch("requests.Session.put") as put_mock:
             put_mock.side_effect = RequestException("Connection timeout")
             with pytest.raises(DspToolsRequestException):
                 client.set_resource_side_legal_info(RESOURCE_SIDE_LEGAL_INFO)
 
 
-def test_is_last_page_no():
-    assert not _is_last_page(PAGE_1_OF_2)
-
-
-def test_is_last_page_yes():
-    assert _is_last_page(DATA_PAGE_1_OF_1)
+def test_get_total_pages():
+    assert _get_total_pages(PAGE_1_OF_2) == 2
+    assert _get_total_pages(DATA_PAGE_1_OF_1) == 1
@@ -1,4 +1,6 @@
 import json
+import threading
+from pathlib import Path
 from typing import Any
 from unittest.mock import Mock
 from unittest.mock import patch
@@ -7,6 +9,7 @@ import pytest
 import requests
 from requests import JSONDecodeError
 
+from dsp_tools.clients.api_response_cache import ApiResponseCache
 from dsp_tools.clients.authentication_client import AuthenticationClient
 from dsp_tools.clients.exceptions import FatalNonOkApiResponseCode
 from dsp_tools.clients.list_client_live import ListCreateClientLive
@@ -112,7 +115,7 @@ class TestListClient:
     def test_get_all_list_iris(self, list_client: ListGetClientLive) -> None:
         mock_response = Mock(status_code=200, ok=True, headers={})
         mock_response.json.return_value = {"lists": []}
-        with patch("dsp_tools.clients.list_client_live.requests.get", return_value=mock_response) as mock_get:
+        with patch("requests.Session.get", return_value=mock_response) as mock_get:
             result = list_client._get_all_list_iris()
         assert result == {"lists": []}
         assert mock_get.call_args_list[0][1]["url"] == f"{list_client.api_url}/admin/lists?projectShortcode=9999"
@@ -120,19 +123,19 @@ class TestListClient:
     def test_get_all_list_iris_non_ok_code(self, list_client: ListGetClientLive) -> None:
         mock_response = Mock(status_code=404, ok=False, headers={}, text="")
         mock_response.json.return_value = {}
-        with patch("dsp_tools.clients.list_client_live.requests.get", return_value=mock_response):
+        with patch("requests.Session.get", return_value=mock_response):
             with pytest.raises(FatalNonOkApiResponseCode):
                 list_client._get_all_list_iris()
 
     def test_get_all_list_iris_timeout(self, list_client: ListGetClientLive) -> None:
-        with patch("dsp_tools.clients.list_client_live.requests.get", side_effect=requests.ReadTimeout("Timeout")):
+        with patch("requests.Session.get", side_effect=requests.ReadTimeout("Timeout")):
             with pytest.raises(DspToolsRequestException):
                 list_client._get_all_list_iris()
 
     def test_get_one_list(self, list_client: ListGetClientLive) -> None:
         mock_response = Mock(status_code=200, ok=True, headers={})
         mock_response.json.return_value = {"type": "ListGetResponseADM", "list": {}}
-        with patch("dsp_tools.clients.list_client_live.requests.get", return_value=mock_response) as mock_get:
+        with patch("requests.Session.get", return_value=mock_response) as mock_get:
             result = list_client._get_one_list("http://rdfh.ch/lists/9999/WWqeCEj8R_qrK5djsVcHvg")
         assert result == {"type": "ListGetResponseADM", "list": {}}
         url_expected = f"{list_client.api_url}/admin/lists/http%3A%2F%2Frdfh.ch%2Flists%2F9999%2FWWqeCEj8R_qrK5djsVcHvg"
@@ -141,12 +144,53 @@ class TestListClient:
     def test_get_one_list_non_ok_code(self, list_client: ListGetClientLive) -> None:
         mock_response = Mock(status_code=404, ok=False, headers={}, text="")
         mock_response.json.return_value = {}
-        with patch("dsp_tools.clients.list_client_live.requests.get", return_value=mock_response):
+        with patch("requests.Session.get", return_value=mock_response):
             with pytest.raises(FatalNonOkApiResponseCode):
                 list_client._get_one_list("http://rdfh.ch/lists/9999/WWqeCEj8R_qrK5djsVcHvg")
 
+    def test_get_all_lists_and_nodes_concurrently(
+        self, list_client: ListGetClientLive, response_all_list_one_project: dict[str, Any]
+    ) -> None:
+        # each request only returns once all lists are requested, which fails if they are requested one by one
+        barrier = threading.Barrier(len(response_all_list_one_project["lists"]), timeout=5)
+
+        def get_one_list(list_iri: str) -> dict[str, Any]:
+            barrier.wait()
+            return {"list": {"listinfo": {"id": list_iri}, "children": []}}
+
+        with (
+            patch.object(list_client, "_get_all_list_iris", return_value=response_all_list_one_project),
+            patch.object(list_client, "_get_one_list", side_effect=get_one_list),
+        ):
+            result = list_client.get_all_lists_and_nodes()
+        assert [x.listinfo["id"] for x in result] == [
+            "http://rdfh.ch/lists/9999/list1",
+            "http://rdfh.ch/lists/9999/list2",
+        ]
+
+    def test_get_one_list_not_modified(self, api_url: str, tmp_path: Path) -> None:
+        list_client = ListGetClientLive(api_url, "9999", cache=ApiResponseCache(directory=tmp_path))
+        list_iri = "http://rdfh.ch/lists/9999/WWqeCEj8R_qrK5djsVcHvg"
+        first_response = Mock(status_code=200, ok=True, headers={"ETag": '"v1"'}, text='{"list": {"id": 1}}')
+        first_response.json.return_value = {"list": {"id": 1}}
+        with patch("requests.Session.get", return_value=first_response) as mock_get:
+            list_client._get_one_list(list_iri)
+        assert mock_get.call_args_list[0][1]["headers"] is None
+        with patch("requests.Session.get", return_value=Mock(status_code=304, ok=False, headers={})) as mock_get:
+            result = list_client._get_one_list(list_iri)
+        assert result == {"list": {"id": 1}}
+        assert mock_get.call_args_list[0][1]["headers"] == {"If-None-Match": '"v1"'}
+
+    def test_get_one_list_without_validator_is_not_cached(self, api_url: str, tmp_path: Path) -> None:
+        list_client = ListGetClientLive(api_url, "9999", cache=ApiResponseCache(directory=tmp_path))
+        mock_response = Mock(status_code=200, ok=True, headers={}, text='{"list": {}}')
+        mock_response.json.return_value = {"list": {}}
+        with patch("requests.Session.get", return_value=mock_response):
+            list_client._get_one_list("http://rdfh.ch/lists/9999/WWqeCEj8R_qrK5djsVcHvg")
+        assert not list(tmp_path.iterdir())
+
     def test_get_one_list_timeout(self, list_client: ListGetClientLive) -> None:
-        with patch("dsp_tools.clients.list_client_live.requests.get", side_effect=requests.ReadTimeout("Timeout")):
+        with patch("requests.Session.get", side_effect=requests.ReadTimeout("Timeout")):
             with pytest.raises(DspToolsRequestException):
                 list_client._get_one_list("http://rdfh.ch/lists/9999/WWqeCEj8R_qrK5djsVcHvg")
 
@@ -191,7 +235,7 @@ class TestListCreateClient:
                 },
             }
         }
-        with patch("dsp_tools.clients.list_client_live.requests.post", return_value=mock_response) as mock_post:
+        with patch("requests.Session.post", return_value=mock_response) as mock_post:
             result = list_create_client.create_new_list(list_info)
         assert result == "http://rdfh.ch/lists/0001/test-list-iri"
         assert mock_post.call_count == 1
@@ -209,7 +253,7 @@ class TestListCreateClient:
         }
         mock_response = Mock(status_code=403, ok=False, headers={}, text="Forbidden")
         mock_response.json.side_effect = JSONDecodeError("Expecting value", "", 0)
-        with patch("dsp_tools.clients.list_client_live.requests.post", return_value=mock_response):
+        with patch("requests.Session.post", return_value=mock_response):
             with pytest.raises(BadCredentialsError, match="Only a SystemAdmin or ProjectAdmin"):
                 list_create_client.create_new_list(list_info)
 
@@ -219,7 +263,7 @@ class TestListCreateClient:
             "name": "test-list",
             "labels": [{"value": "Test List", "language": "en"}],
         }
-        with patch("dsp_tools.clients.list_client_live.requests.post", side_effect=requests.ReadTimeout("Timeout")):
+        with patch("requests.Session.post", side_effect=requests.ReadTimeout("Timeout")):
             with pytest.raises(DspToolsRequestException):
                 list_create_client.create_new_list(list_info)
 
@@ -231,7 +275,7 @@ class TestListCreateClient:
         }
         mock_response = Mock(status_code=500, ok=False, headers={}, text="Internal Server Error")
         mock_response.json.side_effect = JSONDecodeError("Expecting value", "", 0)
-        with patch("dsp_tools.clients.list_client_live.requests.post", return_value=mock_response):
+        with patch("requests.Session.post", return_value=mock_response):
             with pytest.warns(DspToolsUnexpectedStatusCodeWarning):
                 result = list_create_client.create_new_list(list_info)
         assert result is None
@@ -253,7 +297,7 @@ class TestListCreateClient:
                 "position": 1,
             }
         }
-        with patch("dsp_tools.clients.list_client_live.requests.post", return_value=mock_response) as mock_post:
+        with patch("requests.Session.post", return_value=mock_response) as mock_post:
             result = list_create_client.add_list_node(node_info, PARENT_NODE_IRI)
 
         assert result == "http://rdfh.ch/lists/0001/test-node-iri"
@@ -274,7 +318,7 @@ class TestListCreateClient:
         }
         mock_response = Mock(status_code=403, ok=False, headers={}, text="Forbidden")
         mock_response.json.side_effect = JSONDecodeError("Expecting value", "", 0)
-        with patch("dsp_tools.clients.list_client_live.requests.post", return_value=mock_response):
+        with patch("requests.Session.post", return_value=mock_response):
             with pytest.raises(BadCredentialsError, match="Only a SystemAdmin or ProjectAdmin"):
                 list_create_client.add_list_node(node_info, PARENT_NODE_IRI)
 
@@ -285,7 +329,7 @@ class TestListCreateClient:
             "name": "test-node",
             "labels": [{"value": "Test Node", "language": "en"}],
         }
-        with patch("dsp_tools.clients.list_client_live.requests.post", side_effect=requests.ReadTimeout("Timeout")):
+        with patch("requests.Session.post", side_effect=requests.ReadTimeout("Timeout")):
             with pytest.raises(DspToolsRequestException):
                 list_create_client.add_list_node(node_info, PARENT_NODE_IRI)
 
@@ -298,7 +342,7 @@ class TestListCreateClient:
         }
         mock_response = Mock(status_code=500, ok=False, headers={}, text="Internal Server Error")
         mock_response.json.side_effect = JSONDecodeError("Expecting value", "", 0)
-        with patch("dsp_tools.clients.list_client_live.requests.post", return_value=mock_response):
+        with patch("requests.Session.post", return_value=mock_response):
             with pytest.warns(DspToolsUnexpectedStatusCodeWarning):
                 result = list_create_client.add_list_node(node_info, PARENT_NODE_IRI)
         assert result is None
@@ -43,14 +43,14 @@ def _make_response_mock(status_code: int, body: dict[str, Any] | str) -> Mock:
 class TestMappingClientLivePut:
     def test_put_class_mapping_success_returns_none(self):
         mock_response = _make_response_mock(200, {})
-        with patch("requests.put", return_value=mock_response):
+        with patch("requests.Session.put", return_value=mock_response):
             result = _make_client().put_class_mapping(CLASS_IRI, [MAPPING_IRI])
         assert result is None
 
     def test_put_class_mapping_bad_request_returns_response_code_and_text(self):
         body = {"errors": [{"code": "class_not_found", "message": "not found", "details": {}}]}
         mock_response = _make_response_mock(400, body)
-        with patch("requests.put", return_value=mock_response):
+        with patch("requests.Session.put", return_value=mock_response):
             result = _make_client().put_class_mapping(CLASS_IRI, [MAPPING_IRI])
         assert isinstance(result, ResponseCodeAndText)
         assert result.status_code == 400
@@ -59,13 +59,13 @@ class TestMappingClientLivePut:
 
     def test_put_class_mapping_forbidden_raises_bad_credentials(self):
         mock_response = _make_response_mock(403, "forbidden")
-        with patch("requests.put", return_value=mock_response):
+        with patch("requests.Session.put", return_value=mock_response):
             with pytest.raises(BadCredentialsError):
                 _make_client().put_class_mapping(CLASS_IRI, [MAPPING_IRI])
 
     def test_put_class_mapping_server_error_returns_response_code_and_text(self):
         mock_response = _make_response_mock(500, "internal server error")
-        with patch("requests.put", return_value=mock_response):
+        with patch("requests.Session.put", return_value=mock_response):
             result = _make_client().put_class_mapping(CLASS_IRI, [MAPPING_IRI])
         assert isinstance(result, ResponseCodeAndText)
         assert result.status_code == 500
@@ -73,14 +73,14 @@ class TestMappingClientLivePut:
 
     def test_put_class_mapping_non_json_body_returns_v3_errors_none(self):
         mock_response = _make_response_mock(400, "plain text error")
-        with patch("requests.put", return_value=mock_response):
+        with patch("requests.Session.put", return_value=mock_response):
             result = _make_client().put_class_mapping(CLASS_IRI, [MAPPING_IRI])
         assert isinstance(result, ResponseCodeAndText)
         assert result.v3_errors is None
 
     def test_put_class_mapping_url_contains_encoded_iris(self):
         mock_response = _make_response_mock(200, {})
-        with patch("requests.put", return_value=mock_response) as mock_put:
+        with patch("requests.Session.put", return_value=mock_response) as mock_put:
             _make_client().put_class_mapping(CLASS_IRI, [MAPPING_IRI])
         call_kwargs = mock_put.call_args
         url = call_kwargs.kwargs["url"]
@@ -89,28 +89,28 @@ class TestMappingClientLivePut:
 
     def test_put_class_mapping_authorization_header(self):
         mock_response = _make_response_mock(200, {})
-        with patch("requests.put", return_value=mock_response) as mock_put:
+        with patch("requests.Session.put", return_value=mock_response) as mock_put:
             _make_client().put_class_mapping(CLASS_IRI, [MAPPING_IRI])
         headers = mock_put.call_args.kwargs["headers"]
         assert headers["Authorization"] == "Bearer test-token"
 
     def test_put_class_mapping_body_contains_mappings(self):
         mock_response = _make_response_mock(200, {})
-        with patch("requests.put", return_value=mock_response) as mock_put:
+        with patch("requests.Session.put", return_value=mock_response) as mock_put:
             _make_client().put_class_mapping(CLASS_IRI, [MAPPING_IRI])
         data = json.loads(mock_put.call_args.kwargs["data"])
         assert data == {"mappings": [MAPPING_IRI]}
 
     def test_put_property_mapping_success_returns_none(self):
         mock_response = _make_response_mock(200, {})
-        with patch("requests.put", return_value=mock_response):
+        with patch("requests.Session.put", return_value=mock_response):
             result = _make_client().put_property_mapping(PROP_IRI, [MAPPING_IRI])
         assert result is None
 
     def test_put_property_mapping_bad_request_returns_response_code_and_text(self):
         body = {"errors": [{"code": "property_not_found", "message": "not found", "details": {}}]}
         mock_response = _make_response_mock(400, body)
-        with patch("requests.put", return_value=mock_response):
+        with patch("requests.Session.put", return_value=mock_response):
             result = _make_client().put_property_mapping(PROP_IRI, [MAPPING_IRI])
         assert isinstance(result, ResponseCodeAndText)
         assert result.v3_errors is not None
@@ -118,27 +118,27 @@ class TestMappingClientLivePut:
 
     def test_put_property_mapping_forbidden_raises_bad_credentials(self):
         mock_response = _make_response_mock(403, "forbidden")
-        with patch("requests.put", return_value=mock_response):
+        with patch("requests.Session.put", return_value=mock_response):
             with pytest.raises(BadCredentialsError):
                 _make_client().put_property_mapping(PROP_IRI, [MAPPING_IRI])
 
     def test_put_property_mapping_server_error_returns_response_code_and_text(self):
         mock_response = _make_response_mock(500, "internal server error")
-        with patch("requests.put", return_value=mock_response):
+        with patch("requests.Session.put", return_value=mock_response):
             result = _make_client().put_property_mapping(PROP_IRI, [MAPPING_IRI])
         assert isinstance(result, ResponseCodeAndText)
         assert result.status_code == 500
 
     def test_put_property_mapping_non_json_body_returns_v3_errors_none(self):
         mock_response = _make_response_mock(400, "plain text error")
-        with patch("requests.put", return_value=mock_response):
+        with patch("requests.Session.put", return_value=mock_response):
             result = _make_client().put_property_mapping(PROP_IRI, [MAPPING_IRI])
         assert isinstance(result, ResponseCodeAndText)
         assert result.v3_errors is None
 
     def test_put_property_mapping_url_contains_encoded_iris(self):
         mock_response = _make_response_mock(200, {})
-        with patch("requests.put", return_value=mock_response) as mock_put:
+        with patch("requests.Session.put", return_value=mock_response) as mock_put:
             _make_client().put_property_mapping(PROP_IRI, [MAPPING_IRI])
         url = mock_put.call_args.kwargs["url"]
         assert ENCODED_ONTO_IRI in url
@@ -146,14 +146,14 @@ class TestMappingClientLivePut:
 
     def test_put_property_mapping_authorization_header(self):
         mock_response = _make_response_mock(200, {})
-        with patch("requests.put", return_value=mock_response) as mock_put:
+        with patch("requests.Session.put", return_value=mock_response) as mock_put:
             _make_client().put_property_mapping(PROP_IRI, [MAPPING_IRI])
         headers = mock_put.call_args.kwargs["headers"]
         assert headers["Authorization"] == "Bearer test-token"
 
     def test_put_property_mapping_body_contains_mappings(self):
         mock_response = _make_response_mock(200, {})
-        with patch("requests.put", return_value=mock_response) as mock_put:
+        with patch("requests.Session.put", return_value=mock_response) as mock_put:
             _make_client().put_property_mapping(PROP_IRI, [MAPPING_IRI])
         data = json.loads(mock_put.call_args.kwargs["data"])
         assert data == {"mappings": [MAPPING_IRI]}
@@ -162,14 +162,14 @@ class TestMappingClientLivePut:
 class TestMappingClientLiveDelete:
     def test_delete_class_mapping_success_returns_none(self):
         mock_response = _make_response_mock(200, {})
-        with patch("requests.delete", return_value=mock_response):
+        with patch("requests.Session.delete", return_value=mock_response):
             result = _make_client().delete_class_mapping(CLASS_IRI, MAPPING_IRI)
         assert result is None
 
     def test_delete_class_mapping_bad_request_returns_response_code_and_text(self):
         body = {"errors": [{"code": "invalid_ontology_mapping_iri", "message": "invalid", "details": {"iri": "nope"}}]}
         mock_response = _make_response_mock(400, body)
-        with patch("requests.delete", return_value=mock_response):
+        with patch("requests.Session.delete", return_value=mock_response):
             result = _make_client().delete_class_mapping(CLASS_IRI, MAPPING_IRI)
         assert isinstance(result, ResponseCodeAndText)
         assert result.status_code == 400
@@ -179,13 +179,13 @@ class TestMappingClientLiveDelete:
 
     def test_delete_class_mapping_forbidden_raises_bad_credentials(self):
         mock_response = _make_response_mock(403, "forbidden")
-        with patch("requests.delete", return_value=mock_response):
+        with patch("requests.Session.delete", return_value=mock_response):
             with pytest.raises(BadCredentialsError):
                 _make_client().delete_class_mapping(CLASS_IRI, MAPPING_IRI)
 
     def test_delete_class_mapping_server_error_returns_response_code_and_text(self):
         mock_response = _make_response_mock(500, "internal server error")
-        with patch("requests.delete", return_value=mock_response):
+        with patch("requests.Session.delete", return_value=mock_response):
             result = _make_client().delete_class_mapping(CLASS_IRI, MAPPING_IRI)
         assert isinstance(result, ResponseCodeAndText)
         assert result.status_code == 500
@@ -193,7 +193,7 @@ class TestMappingClientLiveDelete:
 
     def test_delete_class_mapping_url_contains_encoded_iris(self):
         mock_response = _make_response_mock(200, {})
-        with patch("requests.delete", return_value=mock_response) as mock_delete:
+        with patch("requests.Session.delete", return_value=mock_response) as mock_delete:
             _make_client().delete_class_mapping(CLASS_IRI, MAPPING_IRI)
         url = mock_delete.call_args.kwargs["url"]
         assert ENCODED_ONTO_IRI in url
@@ -202,7 +202,7 @@ class TestMappingClientLiveDelete:
 
     def test_delete_class_mapping_authorization_header(self):
         mock_response = _make_response_mock(200, {})
-        with patch("requests.delete", return_value=mock_response) as mock_delete:
+        with patch("requests.Session.delete", return_value=mock_response) as mock_delete:
             _make_client().delete_class_mapping(CLASS_IRI, MAPPING_IRI)
         headers = mock_delete.call_args.kwargs["headers"]
         assert headers["Authorization"] == "Bearer test-token"
@@ -211,7 +211,7 @@ class TestMappingClientLiveDelete:
         # A raw '#' would be treated as a client-side fragment and never reach the server.
         mapping_with_fragment = "http://www.w3.org/ns/prov#Entity"
         mock_response = _make_response_mock(200, {})
-        with patch("requests.delete", return_value=mock_response) as mock_delete:
+        with patch("requests.Session.delete", return_value=mock_response) as mock_delete:
             _make_client().delete_class_mapping(CLASS_IRI, mapping_with_fragment)
         url = mock_delete.call_args.kwargs["url"]
         assert f"mapping={quote_plus(mapping_with_fragment)}" in url
@@ -219,14 +219,14 @@ class TestMappingClientLiveDelete:
 
     def test_delete_property_mapping_success_returns_none(self):
         mock_response = _make_response_mock(200, {})
-        with patch("requests.delete", return_value=mock_response):
+        with patch("requests.Session.delete", return_value=mock_response):
             result = _make_client().delete_property_mapping(PROP_IRI, MAPPING_IRI)
         assert result is None
 
     def test_delete_property_mapping_bad_request_returns_response_code_and_text(self):
         body = {"errors": [{"code": "property_not_found", "message": "not found", "details": {}}]}
         mock_response = _make_response_mock(400, body)
-        with patch("requests.delete", return_value=mock_response):
+        with patch("requests.Session.delete", return_value=mock_response):
             result = _make_client().delete_property_mapping(PROP_IRI, MAPPING_IRI)
         assert isinstance(result, ResponseCodeAndText)
         assert result.v3_errors is not None
@@ -234,20 +234,20 @@ class TestMappingClientLiveDelete:
 
     def test_delete_property_mapping_forbidden_raises_bad_credentials(self):
         mock_response = _make_response_mock(403, "forbidden")
-        with patch("requests.delete", return_value=mock_response):
+        with patch("requests.Session.delete", return_value=mock_response):
             with pytest.raises(BadCredentialsError):
                 _make_client().delete_property_mapping(PROP_IRI, MAPPING_IRI)
 
     def test_delete_property_mapping_server_error_returns_response_code_and_text(self):
         mock_response = _make_response_mock(500, "internal server error")
-        with patch("requests.delete", return_value=mock_response):
+        with patch("requests.Session.delete", return_value=mock_response):
             result = _make_client().delete_property_mapping(PROP_IRI, MAPPING_IRI)
         assert isinstance(result, ResponseCodeAndText)
         assert result.status_code == 500
 
     def test_delete_property_mapping_url_contains_encoded_iris(self):
         mock_response = _make_response_mock(200, {})
-        with patch("requests.delete", return_value=mock_response) as mock_delete:
+        with patch("requests.Session.delete", return_value=mock_response) as mock_delete:
             _make_client().delete_property_mapping(PROP_IRI, MAPPING_IRI)
         url = mock_delete.call_args.kwargs["url"]
         assert ENCODED_ONTO_IRI in url
@@ -256,14 +256,14 @@ class TestMappingClientLiveDelete:
 
     def test_delete_property_mapping_authorization_header(self):
         mock_response = _make_response_mock(200, {})
-        with patch("requests.delete", return_value=mock_response) as mock_delete:
+        with patch("requests.Session.delete", return_value=mock_response) as mock_delete:
             _make_client().delete_property_mapping(PROP_IRI, MAPPING_IRI)
         headers = mock_delete.call_args.kwargs["headers"]
         assert headers["Authorization"] == "Bearer test-token"
 
     def test_delete_sends_no_body(self):
         mock_response = _make_response_mock(200, {})
-        with patch("requests.delete", return_value=mock_response) as mock_delete:
+        with patch("requests.Session.delete", return_value=mock_response) as mock_delete:
             _make_client().delete_class_mapping(CLASS_IRI, MAPPING_IRI)
         assert "data" not in mock_delete.call_args.kwargs
         assert "Content-Type" not in mock_delete.call_args.kwargs["headers"]
@@ -47,7 +47,7 @@ def test_get_resource_metadata_ok_with_data(log_request, log_response, metadata_
     mock_response.status_code = 200
     mock_response.json.return_value = expected_data
 
-    with patch("dsp_tools.clients.metadata_client_live.requests.get") as get_mock:
+    with patch("requests.Session.get") as get_mock:
         get_mock.return_value = mock_response
         response_type, data = metadata_client.get_resource_metadata("4124")
 
@@ -63,7 +63,7 @@ def test_get_resource_metadata_ok_no_data(log_request, log_response, metadata_cl
     mock_response.status_code = 200
     mock_response.json.return_value = []
 
-    with patch("dsp_tools.clients.metadata_client_live.requests.get") as get_mock:
+    with patch("requests.Session.get") as get_mock:
         get_mock.return_value = mock_response
         response_type, data = metadata_client.get_resource_metadata("4124")
 
@@ -80,7 +80,7 @@ def test_get_resource_metadata_non_ok(log_request, log_response, metadata_client
     mock_response.status_code = 404
     mock_response.text = {"message": "Some message from the API."}
 
-    with patch("dsp_tools.clients.metadata_client_live.requests.get") as get_mock:
+    with patch("requests.Session.get") as get_mock:
         get_mock.return_value = mock_response
         response_type, data = metadata_client.get_resource_metadata("9999")
 
@@ -90,7 +90,7 @@ def test_get_resource_metadata_non_ok(log_request, log_response, metadata_client
 
 @patch("dsp_tools.clients.metadata_client_live.log_request")
 def test_get_resource_metadata_error_raised(log_request, metadata_client):  # noqa: ARG001
-    with patch("dsp_tools.clients.metadata_client_live.requests.get") as get_mock:
+    with patch("requests.Session.get") as get_mock:
         get_mock.side_effect = RequestException("Connection error")
         response_type, data = metadata_client.get_resource_metadata("4124")
 
@@ -104,7 +104,7 @@ def test_get_resource_metadata_forbidden_no_warning(metadata_client):
     mock_response.status_code = HTTPStatus.FORBIDDEN.value
     mock_response.text = "Forbidden"
 
-    with patch("dsp_tools.clients.metadata_client_live.requests.get") as get_mock:
+    with patch("requests.Session.get") as get_mock:
         get_mock.return_value = mock_response
         response_type, data = metadata_client.get_resource_metadata("4124")
 
@@ -117,7 +117,7 @@ def test_get_resource_metadata_unexpected_status_logs_warning(metadata_client):
     mock_response.ok = False
     mock_response.status_code = 500
     mock_response.text = "Internal Server Error"
-    with patch("dsp_tools.clients.metadata_client_live.requests.get") as get_mock:
+    with patch("requests.Session.get") as get_mock:
         get_mock.return_value = mock_response
         with pytest.warns(DspToolsUnexpectedStatusCodeWarning):
             response_type, data = metadata_client.get_resource_metadata("9999")
@@ -4,7 +4,6 @@ from typing import Any
 from unittest.mock import Mock
 
 import pytest
-import requests
 from rdflib import XSD
 from rdflib import Literal
 from rdflib import Namespace
@@ -471,7 +470,7 @@ class TestUtilFunctions:
             mock_response.json.return_value = {}
             return mock_response
 
-        monkeypatch.setattr(requests, "post", mock_post)
+        monkeypatch.setattr(ontology_client._session, "post", mock_post)
 
         test_data = {"@id": "test:id", "@type": "owl:Class"}
         ontology_client._post_and_log_request("http://test.com/api", test_data)
@@ -498,7 +497,7 @@ class TestUtilFunctions:
             mock_response.json.return_value = {}
             return mock_response
 
-        monkeypatch.setattr(requests, "post", mock_post)
+        monkeypatch.setattr(ontology_client._session, "post", mock_post)
 
         test_url = "http://0.0.0.0:3333/v2/ontologies/cardinalities"
         test_data = {"@id": "test:id"}
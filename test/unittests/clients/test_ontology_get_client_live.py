@@ -1,9 +1,15 @@
+import json
+import threading
+from pathlib import Path
+from typing import Any
+from typing import cast
 from unittest.mock import Mock
 from unittest.mock import patch
 
 import pytest
 from requests import RequestException
 
+from dsp_tools.clients.api_response_cache import ApiResponseCache
 from dsp_tools.clients.exceptions import FatalNonOkApiResponseCode
 from dsp_tools.clients.exceptions import ProjectOntologyNotFound
 from dsp_tools.clients.ontology_get_client_live import OntologyGetClientLive
@@ -24,48 +30,158 @@ class TestOntologyClient:
     def test_get_ontology_iris_ok(self, ontology_client: OntologyGetClientLive) -> None:
         mock_response = Mock(status_code=200, ok=True, headers={})
         mock_response.json.return_value = {"project": {"ontologies": ["onto_iri"]}}
-        with patch("dsp_tools.clients.ontology_get_client_live.requests.get", return_value=mock_response) as mock_get:
-            result = ontology_client._get_ontology_iris()
+        with patch("requests.Session.get", return_value=mock_response) as mock_get:
+            result = ontology_client._extract_ontology_iris(ontology_client._get_project())
         assert result == ["onto_iri"]
         assert mock_get.call_args_list[0][1]["url"] == f"{ontology_client.api_url}/admin/projects/shortcode/9999"
 
     def test_get_ontology_iris_non_ok_code(self, ontology_client: OntologyGetClientLive) -> None:
         mock_response = Mock(status_code=404, ok=False, headers={}, text="Not Found")
         mock_response.json.return_value = {}
-        with patch("dsp_tools.clients.ontology_get_client_live.requests.get", return_value=mock_response):
+        with patch("requests.Session.get", return_value=mock_response):
             with pytest.raises(FatalNonOkApiResponseCode):
-                ontology_client._get_ontology_iris()
+                ontology_client._get_project()
 
     def test_get_ontology_iris_no_ontology_key(self, ontology_client: OntologyGetClientLive) -> None:
         mock_response = Mock(status_code=200, ok=True, headers={}, text="text")
         mock_response.json.return_value = {"foo": "bar"}
-        with patch("dsp_tools.clients.ontology_get_client_live.requests.get", return_value=mock_response):
+        with patch("requests.Session.get", return_value=mock_response):
             with pytest.raises(ProjectOntologyNotFound):
-                ontology_client._get_ontology_iris()
+                ontology_client._extract_ontology_iris(ontology_client._get_project())
 
     def test_get_one_ontology(self, ontology_client: OntologyGetClientLive) -> None:
         mock_response = Mock(status_code=200, ok=True, headers={}, text="Turtle Text")
         mock_response.json.return_value = {}
-        with patch("dsp_tools.clients.ontology_get_client_live.requests.get", return_value=mock_response) as mock_get:
+        with patch("requests.Session.get", return_value=mock_response) as mock_get:
             result = ontology_client._get_one_ontology("iri")
         assert result == "Turtle Text"
         assert mock_get.call_args_list[0][1]["url"] == "iri"
         assert mock_get.call_args_list[0][1]["headers"] == {"Accept": "text/turtle"}
 
+    def test_get_ontologies_concurrently(self, ontology_client: OntologyGetClientLive) -> None:
+        ontology_iris = ["onto_1", "onto_2", "onto_3"]
+        # each request only returns once all ontologies are requested, which fails if they are requested one by one
+        barrier = threading.Barrier(len(ontology_iris), timeout=5)
+
+        def get_one_ontology(ontology_iri: str) -> str:
+            barrier.wait()
+            return f"Turtle of {ontology_iri}"
+
+        with (
+            patch.object(ontology_client, "_get_project", return_value={"id": "project", "ontologies": ontology_iris}),
+            patch.object(ontology_client, "_get_one_ontology", side_effect=get_one_ontology),
+        ):
+            ontologies, iris = ontology_client.get_ontologies()
+        assert ontologies == [f"Turtle of {x}" for x in ontology_iris]
+        assert iris == ontology_iris
+
     def test_get_ontology_iris_request_exception(self, ontology_client: OntologyGetClientLive) -> None:
         request_error = RequestException("Connection timeout")
-        with patch("dsp_tools.clients.ontology_get_client_live.requests.get") as mock_get:
+        with patch("requests.Session.get") as mock_get:
             mock_get.side_effect = request_error
             with pytest.raises(DspToolsRequestException):
-                ontology_client._get_ontology_iris()
+                ontology_client._get_project()
 
     def test_get_one_ontology_request_exception(self, ontology_client: OntologyGetClientLive) -> None:
         request_error = RequestException("Connection timeout")
-        with patch("dsp_tools.clients.ontology_get_client_live.requests.get") as mock_get:
+        with patch("requests.Session.get") as mock_get:
             mock_get.side_effect = request_error
             with pytest.raises(DspToolsRequestException):
                 ontology_client._get_one_ontology("iri")
 
 
+ONTO_IRI = "http://0.0.0.0:3333/ontology/9999/onto/v2"
+
+
+def _text_response(text: str, status_code: int = 200) -> Mock:
+    response = Mock(status_code=status_code, ok=status_code == 200, headers={}, text=text)
+    response.json.return_value = {}
+    return response
+
+
+def _metadata_response(last_modification_date: str) -> Mock:
+    metadata = {
+        "@id": ONTO_IRI,
+        "@type": "owl:Ontology",
+        "knora-api:lastModificationDate": {"@type": "xsd:dateTimeStamp", "@value": last_modification_date},
+        "@context": {
+            "knora-api": "http://api.knora.org/ontology/knora-api/v2#",
+            "owl": "http://www.w3.org/2002/07/owl#",
+            "xsd": "http://www.w3.org/2001/XMLSchema#",
+        },
+    }
+    return _text_response(json.dumps(metadata))
+
+
+class TestOntologyClientWithCache:
+    @pytest.fixture
+    def cached_client(self, api_url: str, tmp_path: Path) -> OntologyGetClientLive:
+        return OntologyGetClientLive(api_url, "9999", cache=ApiResponseCache(directory=tmp_path))
+
+    def _responses(self, last_modification_date: str, turtle: str, server_version: str = "v30.1") -> Any:
+        project_response = Mock(status_code=200, ok=True, headers={})
+        project_response.json.return_value = {
+            "project": {"id": "http://rdfh.ch/projects/9999", "ontologies": [ONTO_IRI]}
+        }
+
+        def get(url: str, **_: Any) -> Mock:
+            if url.endswith("/admin/projects/shortcode/9999"):
+                return project_response
+            if url.endswith("/v2/ontologies/metadata"):
+                return _metadata_response(last_modification_date)
+            if url.endswith("/version"):
+                return _text_response(server_version)
+            return _text_response(turtle)
+
+        return get
+
+    def test_unchanged_ontology_is_not_downloaded_again(self, cached_client: OntologyGetClientLive) -> None:
+        with patch("requests.Session.get", side_effect=self._responses("2024-01-01T00:00:00Z", "first")):
+            cached_client.get_ontologies()
+        with patch("requests.Session.get", side_effect=self._responses("2024-01-01T00:00:00Z", "second")) as get:
+            ontologies, iris = cached_client.get_ontologies()
+        assert ontologies == ["first"]
+        assert iris == [ONTO_IRI]
+        assert ONTO_IRI not in [x[1]["url"] for x in get.call_args_list]
+
+    def test_modified_ontology_is_downloaded_again(self, cached_client: OntologyGetClientLive) -> None:
+        with patch("requests.Session.get", side_effect=self._responses("2024-01-01T00:00:00Z", "first")):
+            cached_client.get_ontologies()
+        with patch("requests.Session.get", side_effect=self._responses("2024-02-01T00:00:00Z", "second")):
+            ontologies, _ = cached_client.get_ontologies()
+        assert ontologies == ["second"]
+
+    def test_ontologies_without_last_modification_dates(self, cached_client: OntologyGetClientLive) -> None:
+        responses = self._responses("2024-01-01T00:00:00Z", "turtle")
+
+        def get(url: str, **kwargs: Any) -> Mock:
+            if url.endswith("/v2/ontologies/metadata"):
+                return _text_response("Internal Server Error", status_code=500)
+            return cast(Mock, responses(url, **kwargs))
+
+        with patch("requests.Session.get", side_effect=get):
+            ontologies, _ = cached_client.get_ontologies()
+        assert ontologies == ["turtle"]
+        assert not list(cached_client.cache.directory.glob("*.json"))  # type: ignore[union-attr]
+
+    def test_knora_api_is_cached_per_server_version(self, cached_client: OntologyGetClientLive) -> None:
+        with patch("requests.Session.get", side_effect=self._responses("", "first", server_version="v30.1")):
+            cached_client.get_knora_api()
+        with patch("requests.Session.get", side_effect=self._responses("", "second", server_version="v30.1")):
+            assert cached_client.get_knora_api() == "first"
+        with patch("requests.Session.get", side_effect=self._responses("", "third", server_version="v30.2")):
+            assert cached_client.get_knora_api() == "third"
+
+    def test_knora_api_without_server_version(self, cached_client: OntologyGetClientLive) -> None:
+        def get(url: str, **_: Any) -> Mock:
+            if url.endswith("/version"):
+                return _text_response("Not Found", status_code=404)
+            return _text_response("knora-api")
+
+        with patch("requests.Session.get", side_effect=get):
+            assert cached_client.get_knora_api() == "knora-api"
+        assert not list(cached_client.cache.directory.glob("*.json"))  # type: ignore[union-attr]
+
+
 if __name__ == "__main__":
     pytest.main([__file__])
@@ -18,7 +18,7 @@ AUTH.server = "http://0.0.0.0:3333"
 class TestGetProjectDoaps:
     @patch("dsp_tools.clients.permissions_client_live.log_response")
     @patch("dsp_tools.clients.permissions_client_live.log_request")
-    @patch("dsp_tools.clients.permissions_client_live.requests.get")
+    @patch("requests.Session.get")
     def test_success(self, get_mock: Mock, log_request: Mock, log_response: Mock) -> None:  # noqa: ARG002
         client = PermissionsClientLive(
             server="http://0.0.0.0:3333",
@@ -37,7 +37,7 @@ class TestGetProjectDoaps:
 
     @patch("dsp_tools.clients.permissions_client_live.log_response")
     @patch("dsp_tools.clients.permissions_client_live.log_request")
-    @patch("dsp_tools.clients.permissions_client_live.requests.get")
+    @patch("requests.Session.get")
     def test_forbidden(self, get_mock: Mock, log_request: Mock, log_response: Mock) -> None:  # noqa: ARG002
         client = PermissionsClientLive(
             server="http://0.0.0.0:3333",
@@ -55,7 +55,7 @@ class TestGetProjectDoaps:
 
     @patch("dsp_tools.clients.permissions_client_live.log_response")
     @patch("dsp_tools.clients.permissions_client_live.log_request")
-    @patch("dsp_tools.clients.permissions_client_live.requests.get")
+    @patch("requests.Session.get")
     def test_other_error(self, get_mock: Mock, log_request: Mock, log_response: Mock) -> None:  # noqa: ARG002
         client = PermissionsClientLive(
             server="http://0.0.0.0:3333",
@@ -73,7 +73,7 @@ class TestGetProjectDoaps:
         assert result.status_code == 500
 
     @patch("dsp_tools.clients.permissions_client_live.log_request")
-    @patch("dsp_tools.clients.permissions_client_live.requests.get")
+    @patch("requests.Session.get")
     def test_request_exception(self, get_mock: Mock, log_request: Mock) -> None:  # noqa: ARG002
         client = PermissionsClientLive(
             server="http://0.0.0.0:3333",
@@ -89,7 +89,7 @@ class TestGetProjectDoaps:
 class TestDeleteDoap:
     @patch("dsp_tools.clients.permissions_client_live.log_response")
     @patch("dsp_tools.clients.permissions_client_live.log_request")
-    @patch("dsp_tools.clients.permissions_client_live.requests.delete")
+    @patch("requests.Session.delete")
     def test_success(self, delete_mock: Mock, log_request: Mock, log_response: Mock) -> None:  # noqa: ARG002
         client = PermissionsClientLive(
             server="http://0.0.0.0:3333",
@@ -105,7 +105,7 @@ class TestDeleteDoap:
 
     @patch("dsp_tools.clients.permissions_client_live.log_response")
     @patch("dsp_tools.clients.permissions_client_live.log_request")
-    @patch("dsp_tools.clients.permissions_client_live.requests.delete")
+    @patch("requests.Session.delete")
     def test_forbidden(self, delete_mock: Mock, log_request: Mock, log_response: Mock) -> None:  # noqa: ARG002
         client = PermissionsClientLive(
             server="http://0.0.0.0:3333",
@@ -121,7 +121,7 @@ class TestDeleteDoap:
 
     @patch("dsp_tools.clients.permissions_client_live.log_response")
     @patch("dsp_tools.clients.permissions_client_live.log_request")
-    @patch("dsp_tools.clients.permissions_client_live.requests.delete")
+    @patch("requests.Session.delete")
     def test_other_error(self, delete_mock: Mock, log_request: Mock, log_response: Mock) -> None:  # noqa: ARG002
         client = PermissionsClientLive(
             server="http://0.0.0.0:3333",
@@ -137,7 +137,7 @@ class TestDeleteDoap:
         assert isinstance(result, ResponseCodeAndText)
 
     @patch("dsp_tools.clients.permissions_client_live.log_request")
-    @patch("dsp_tools.clients.permissions_client_live.requests.delete")
+    @patch("requests.Session.delete")
     def test_request_exception(self, delete_mock: Mock, log_request: Mock) -> None:  # noqa: ARG002
         client = PermissionsClientLive(
             server="http://0.0.0.0:3333",
@@ -152,7 +152,7 @@ class TestDeleteDoap:
 class TestCreateNewDoap:
     @patch("dsp_tools.clients.permissions_client_live.log_response")
     @patch("dsp_tools.clients.permissions_client_live.log_request")
-    @patch("dsp_tools.clients.permissions_client_live.requests.post")
+    @patch("requests.Session.post")
     def test_success(self, post_mock: Mock, log_request: Mock, log_response: Mock) -> None:  # noqa: ARG002
         client = PermissionsClientLive(
             server="http://0.0.0.0:3333",
@@ -168,7 +168,7 @@ class TestCreateNewDoap:
 
     @patch("dsp_tools.clients.permissions_client_live.log_response")
     @patch("dsp_tools.clients.permissions_client_live.log_request")
-    @patch("dsp_tools.clients.permissions_client_live.requests.post")
+    @patch("requests.Session.post")
     def test_forbidden(self, post_mock: Mock, log_request: Mock, log_response: Mock) -> None:  # noqa: ARG002
         client = PermissionsClientLive(
             server="http://0.0.0.0:3333",
@@ -185,7 +185,7 @@ class TestCreateNewDoap:
 
     @patch("dsp_tools.clients.permissions_client_live.log_response")
     @patch("dsp_tools.clients.permissions_client_live.log_request")
-    @patch("dsp_tools.clients.permissions_client_live.requests.post")
+    @patch("requests.Session.post")
     def test_other_error(self, post_mock: Mock, log_request: Mock, log_response: Mock) -> None:  # noqa: ARG002
         client = PermissionsClientLive(
             server="http://0.0.0.0:3333",
@@ -202,7 +202,7 @@ class TestCreateNewDoap:
         assert isinstance(result, ResponseCodeAndText)
 
     @patch("dsp_tools.clients.permissions_client_live.log_request")
-    @patch("dsp_tools.clients.permissions_client_live.requests.post")
+    @patch("requests.Session.post")
     def test_request_exception(self, post_mock: Mock, log_request: Mock) -> None:  # noqa: ARG002
         client = PermissionsClientLive(
             server="http://0.0.0.0:3333",
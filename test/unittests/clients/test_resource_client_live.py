@@ -34,7 +34,7 @@ class TestPostResource:
         mock_response.json.return_value = {"@id": RES_IRI}
         with patch.object(client._session, "post", return_value=mock_response):
             result = client.post_resource(RESOURCE_JSON, resource_has_bitstream=False)
-        assert result == RES_IRI
+        assert result == {"@id": RES_IRI}
 
     @patch("dsp_tools.clients.resource_client_live.log_response")
     @patch("dsp_tools.clients.resource_client_live.log_request")
@@ -109,7 +109,7 @@ class TestGetResource:
         expected = {"@id": RES_IRI, "@type": "knora-api:Resource"}
         mock_response = Mock(status_code=HTTPStatus.OK, ok=True)
         mock_response.json.return_value = expected
-        with patch("dsp_tools.clients.resource_client_live.requests.get", return_value=mock_response) as mock_get:
+        with patch("requests.Session.get", return_value=mock_response) as mock_get:
             result = client.get_resource(RES_IRI)
         assert mock_get.call_args.args[0] == f"http://api.com/v2/resources/{quote_plus(RES_IRI)}"
         assert result == expected
@@ -120,7 +120,7 @@ class TestGetResource:
         self, log_req: Mock, log_resp: Mock, client: ResourceClientLive
     ) -> None:
         mock_response = Mock(status_code=HTTPStatus.UNAUTHORIZED, ok=False)
-        with patch("dsp_tools.clients.resource_client_live.requests.get", return_value=mock_response):
+        with patch("requests.Session.get", return_value=mock_response):
             with pytest.raises(BadCredentialsError):
                 client.get_resource(RES_IRI)
 
@@ -128,7 +128,7 @@ class TestGetResource:
     @patch("dsp_tools.clients.resource_client_live.log_request")
     def test_forbidden_raises_bad_credentials(self, log_req: Mock, log_resp: Mock, client: ResourceClientLive) -> None:
         mock_response = Mock(status_code=HTTPStatus.FORBIDDEN, ok=False)
-        with patch("dsp_tools.clients.resource_client_live.requests.get", return_value=mock_response):
+        with patch("requests.Session.get", return_value=mock_response):
             with pytest.raises(BadCredentialsError):
                 client.get_resource(RES_IRI)
 
@@ -138,7 +138,7 @@ class TestGetResource:
         self, log_req: Mock, log_resp: Mock, client: ResourceClientLive
     ) -> None:
         mock_response = Mock(status_code=500, ok=False, text="Internal Server Error")
-        with patch("dsp_tools.clients.resource_client_live.requests.get", return_value=mock_response):
+        with patch("requests.Session.get", return_value=mock_response):
             result = client.get_resource(RES_IRI)
         assert isinstance(result, ResponseCodeAndText)
         assert result.status_code == 500
@@ -146,8 +146,6 @@ class TestGetResource:
 
     @patch("dsp_tools.clients.resource_client_live.log_request")
     def test_request_exception_raises_dsp_tools_exception(self, log_req: Mock, client: ResourceClientLive) -> None:
-        with patch(
-            "dsp_tools.clients.resource_client_live.requests.get", side_effect=RequestException("Connection refused")
-        ):
+        with patch("requests.Session.get", side_effect=RequestException("Connection refused")):
             with pytest.raises(DspToolsRequestException):
                 client.get_resource(RES_IRI)
@@ -29,7 +29,7 @@ class TestPostNewValue:
     @patch("dsp_tools.clients.value_client_live.log_request")
     def test_ok_returns_none(self, log_req: Mock, log_resp: Mock, client: ValueClientLive) -> None:
         mock_response = Mock(status_code=HTTPStatus.OK)
-        with patch("dsp_tools.clients.value_client_live.requests.post", return_value=mock_response) as mock_post:
+        with patch("requests.Session.post", return_value=mock_response) as mock_post:
             result = client.post_new_value(VALUE_JSON)
         assert mock_post.call_args.kwargs["url"] == f"{client.server}/v2/values"
         assert json.loads(mock_post.call_args.kwargs["data"]) == VALUE_JSON
@@ -39,7 +39,7 @@ class TestPostNewValue:
     @patch("dsp_tools.clients.value_client_live.log_request")
     def test_unauthorized_raises_bad_credentials(self, log_req: Mock, log_resp: Mock, client: ValueClientLive) -> None:
         mock_response = Mock(status_code=HTTPStatus.UNAUTHORIZED)
-        with patch("dsp_tools.clients.value_client_live.requests.post", return_value=mock_response):
+        with patch("requests.Session.post", return_value=mock_response):
             with pytest.raises(BadCredentialsError):
                 client.post_new_value(VALUE_JSON)
 
@@ -47,7 +47,7 @@ class TestPostNewValue:
     @patch("dsp_tools.clients.value_client_live.log_request")
     def test_forbidden_raises_bad_credentials(self, log_req: Mock, log_resp: Mock, client: ValueClientLive) -> None:
         mock_response = Mock(status_code=HTTPStatus.FORBIDDEN)
-        with patch("dsp_tools.clients.value_client_live.requests.post", return_value=mock_response):
+        with patch("requests.Session.post", return_value=mock_response):
             with pytest.raises(BadCredentialsError):
                 client.post_new_value(VALUE_JSON)
 
@@ -57,7 +57,7 @@ class TestPostNewValue:
         self, log_req: Mock, log_resp: Mock, client: ValueClientLive
     ) -> None:
         mock_response = Mock(status_code=HTTPStatus.INTERNAL_SERVER_ERROR, text="Internal Server Error")
-        with patch("dsp_tools.clients.value_client_live.requests.post", return_value=mock_response):
+        with patch("requests.Session.post", return_value=mock_response):
             result = client.post_new_value(VALUE_JSON)
         assert isinstance(result, ResponseCodeAndText)
         assert result.status_code == HTTPStatus.INTERNAL_SERVER_ERROR
@@ -65,9 +65,7 @@ class TestPostNewValue:
 
     @patch("dsp_tools.clients.value_client_live.log_request")
     def test_request_exception_raises_dsp_tools_exception(self, log_req: Mock, client: ValueClientLive) -> None:
-        with patch(
-            "dsp_tools.clients.value_client_live.requests.post", side_effect=RequestException("Connection refused")
-        ):
+        with patch("requests.Session.post", side_effect=RequestException("Connection refused")):
             with pytest.raises(DspToolsRequestException):
                 client.post_new_value(VALUE_JSON)
 
@@ -77,7 +75,7 @@ class TestReplaceExistingValue:
     @patch("dsp_tools.clients.value_client_live.log_request")
     def test_ok_returns_none(self, log_req: Mock, log_resp: Mock, client: ValueClientLive) -> None:
         mock_response = Mock(status_code=HTTPStatus.OK)
-        with patch("dsp_tools.clients.value_client_live.requests.put", return_value=mock_response) as mock_put:
+        with patch("requests.Session.put", return_value=mock_response) as mock_put:
             result = client.replace_existing_value(VALUE_JSON)
         assert mock_put.call_args.kwargs["url"] == f"{client.server}/v2/values"
         assert json.loads(mock_put.call_args.kwargs["data"]) == VALUE_JSON
@@ -87,7 +85,7 @@ class TestReplaceExistingValue:
     @patch("dsp_tools.clients.value_client_live.log_request")
     def test_unauthorized_raises_bad_credentials(self, log_req: Mock, log_resp: Mock, client: ValueClientLive) -> None:
         mock_response = Mock(status_code=HTTPStatus.UNAUTHORIZED)
-        with patch("dsp_tools.clients.value_client_live.requests.put", return_value=mock_response):
+        with patch("requests.Session.put", return_value=mock_response):
             with pytest.raises(BadCredentialsError):
                 client.replace_existing_value(VALUE_JSON)
 
@@ -95,7 +93,7 @@ class TestReplaceExistingValue:
     @patch("dsp_tools.clients.value_client_live.log_request")
     def test_forbidden_raises_bad_credentials(self, log_req: Mock, log_resp: Mock, client: ValueClientLive) -> None:
         mock_response = Mock(status_code=HTTPStatus.FORBIDDEN)
-        with patch("dsp_tools.clients.value_client_live.requests.put", return_value=mock_response):
+        with patch("requests.Session.put", return_value=mock_response):
             with pytest.raises(BadCredentialsError):
                 client.replace_existing_value(VALUE_JSON)
 
@@ -105,7 +103,7 @@ class TestReplaceExistingValue:
         self, log_req: Mock, log_resp: Mock, client: ValueClientLive
     ) -> None:
         mock_response = Mock(status_code=HTTPStatus.INTERNAL_SERVER_ERROR, text="Internal Server Error")
-        with patch("dsp_tools.clients.value_client_live.requests.put", return_value=mock_response):
+        with patch("requests.Session.put", return_value=mock_response):
             result = client.replace_existing_value(VALUE_JSON)
         assert isinstance(result, ResponseCodeAndText)
         assert result.status_code == HTTPStatus.INTERNAL_SERVER_ERROR
@@ -113,8 +111,6 @@ class TestReplaceExistingValue:
 
     @patch("dsp_tools.clients.value_client_live.log_request")
     def test_request_exception_raises_dsp_tools_exception(self, log_req: Mock, client: ValueClientLive) -> None:
-        with patch(
-            "dsp_tools.clients.value_client_live.requests.put", side_effect=RequestException("Connection refused")
-        ):
+        with patch("requests.Session.put", side_effect=RequestException("Connection refused")):
             with pytest.raises(DspToolsRequestException):
                 client.replace_existing_value(VALUE_JSON)
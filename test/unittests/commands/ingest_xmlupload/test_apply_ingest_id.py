@@ -1,7 +1,29 @@
+from pathlib import Path
+
 import pytest
 from lxml import etree
 
+from dsp_tools.commands.ingest_xmlupload.create_resources.apply_ingest_id import get_mapping_dict_from_file
 from dsp_tools.commands.ingest_xmlupload.create_resources.apply_ingest_id import replace_filepath_with_internal_filename
+from dsp_tools.error.exceptions import UserFilepathNotFoundError
+
+
+class TestGetMappingDict:
+    def test_read_mapping(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.chdir(tmp_path)
+        Path("mapping-4123.csv").write_text(
+            'original,derivative\nimages/Fluffy.jpg,fluffy_id.jpx\n"Côté, gauche.png",cote_id.jpx\n',
+            encoding="utf-8",
+        )
+        assert get_mapping_dict_from_file("4123") == {
+            "images/Fluffy.jpg": "fluffy_id.jpx",
+            "Côté, gauche.png": "cote_id.jpx",
+        }
+
+    def test_no_mapping(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.chdir(tmp_path)
+        with pytest.raises(UserFilepathNotFoundError):
+            get_mapping_dict_from_file("4123")
 
 
 class TestReplaceBitstreamPaths:
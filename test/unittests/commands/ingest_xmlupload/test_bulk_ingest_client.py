@@ -12,6 +12,7 @@ from dsp_tools.commands.ingest_xmlupload.exceptions import IngestFailure
 from dsp_tools.commands.ingest_xmlupload.exceptions import NoIngestFileFound
 from dsp_tools.error.exceptions import BadCredentialsError
 from dsp_tools.error.exceptions import PermanentConnectionError
+from dsp_tools.utils.bandwidth_limit import BandwidthLimiter
 from test.integration.commands.xmlupload.authentication_client_mock import AuthenticationClientMockBase
 
 DSP_INGEST_URL = "https://example.com"
@@ -49,6 +50,16 @@ def test_upload_file_success(ingest_client: BulkIngestClient, requests_mock: Moc
     assert req.headers["Content-Type"] == "application/octet-stream"
 
 
+def test_upload_file_with_bandwidth_limit(requests_mock: Mocker, tmp_file: Path) -> None:
+    limiter = BandwidthLimiter(bytes_per_second=1024)
+    ingest_client = BulkIngestClient(DSP_INGEST_URL, AuthenticationClientMockBase(), SHORTCODE, Path(), limiter)
+    tmp_file.write_text("<xml></xml>")
+    requests_mock.post(_make_url(tmp_file), status_code=200)
+    assert not ingest_client.upload_file(tmp_file)
+    req = requests_mock.request_history[0]
+    assert req.headers["Content-Length"] == str(tmp_file.stat().st_size)
+
+
 def test_upload_file_with_inexisting_file(ingest_client: BulkIngestClient) -> None:
     failure_detail = ingest_client.upload_file(Path("inexisting.xml"))
     assert failure_detail
@@ -168,3 +179,40 @@ def test_trigger_when_server_response_doesnt_contain_right_shortcode(
     err_msg = re.escape("Failed to trigger the ingest process. Please check the server logs, or try again later.")
     with pytest.raises(IngestFailure, match=err_msg):
         ingest_client.trigger_ingest_process()
+
+
+def test_retrieve_mapping_after_ingest_completed(
+    ingest_client: BulkIngestClient, requests_mock: Mocker, tmp_path: Path
+) -> None:
+    url = f"{DSP_INGEST_URL}/projects/{SHORTCODE}/bulk-ingest/mapping.csv"
+    mapping = "original,derivative\n" + "".join(f"images/{i}.jpg,{i}.jpx\n" for i in range(100_000))
+    requests_mock.get(url, [{"status_code": 409}, {"status_code": 200, "text": mapping}])
+    download_path = tmp_path / "mapping.csv.part"
+    results = list(ingest_client.retrieve_mapping_generator(download_path))
+    assert results == [True, download_path]
+    assert download_path.read_text() == mapping
+
+
+def test_retrieve_mapping_with_unexpected_content(
+    ingest_client: BulkIngestClient, requests_mock: Mocker, tmp_path: Path
+) -> None:
+    url = f"{DSP_INGEST_URL}/projects/{SHORTCODE}/bulk-ingest/mapping.csv"
+    requests_mock.get(
+        url,
+        [
+            {"status_code": 200, "text": "<html>Maintenance</html>"},
+            {"status_code": 502},
+            {"status_code": 200, "text": "original,derivative\n"},
+        ],
+    )
+    download_path = tmp_path / "mapping.csv.part"
+    results = list(ingest_client.retrieve_mapping_generator(download_path))
+    assert results == [False, False, download_path]
+
+
+def test_retrieve_mapping_with_too_many_errors(
+    ingest_client: BulkIngestClient, requests_mock: Mocker, tmp_path: Path
+) -> None:
+    requests_mock.get(f"{DSP_INGEST_URL}/projects/{SHORTCODE}/bulk-ingest/mapping.csv", status_code=502)
+    with pytest.raises(PermanentConnectionError):
+        list(ingest_client.retrieve_mapping_generator(tmp_path / "mapping.csv.part"))
@@ -44,6 +44,14 @@ def test_check_files_non_existing_and_unsupported() -> None:
     assert res == expected
 
 
+def test_check_files_relative_to_imgdir(tmp_path: Path) -> None:
+    (tmp_path / "images").mkdir()
+    (tmp_path / "images" / "test.jpg").write_bytes(b"")
+    res = check_files({Path("images/test.jpg"), Path("images/inexisting.jpg")}, tmp_path)
+    expected = FileProblems([Path("images/inexisting.jpg")], [])
+    assert res == expected
+
+
 def test_check_files_mixed_unsupported() -> None:
     mixed_unsupported_paths = {Path("foo/bar.baz"), Path("testdata/invalid-testdata/bitstreams/test.gif")}
     res = check_files(mixed_unsupported_paths)
@@ -0,0 +1,28 @@
+from itertools import islice
+from pathlib import Path
+
+import pytest
+
+from dsp_tools.commands.ingest_xmlupload.ingest_files.ingest_files import _get_polling_intervals
+from dsp_tools.commands.ingest_xmlupload.ingest_files.ingest_files import _save_mapping
+
+
+def test_get_polling_intervals() -> None:
+    assert list(islice(_get_polling_intervals(), 8)) == [2, 4, 8, 16, 32, 60, 60, 60]
+
+
+def test_save_mapping_keeps_earlier_mappings(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.chdir(tmp_path)
+    Path("mapping-4123.csv").write_text("first")
+    Path("mapping-4123-1.csv").write_text("older")
+    download_path = Path("mapping-4123.csv.part")
+    download_path.write_text("second")
+    _save_mapping(download_path, "4123")
+    assert Path("mapping-4123.csv").read_text() == "second"
+    assert Path("mapping-4123-1.csv").read_text() == "older"
+    assert Path("mapping-4123-2.csv").read_text() == "first"
+    assert not download_path.exists()
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
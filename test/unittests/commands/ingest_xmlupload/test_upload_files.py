@@ -0,0 +1,57 @@
+import threading
+from pathlib import Path
+from unittest.mock import Mock
+
+import pytest
+
+from dsp_tools.commands.ingest_xmlupload.upload_files.upload_failures import UploadFailure
+from dsp_tools.commands.ingest_xmlupload.upload_files.upload_files import _upload_all
+from dsp_tools.commands.ingest_xmlupload.upload_files.upload_manifest import UploadManifest
+
+
+@pytest.fixture
+def imgdir(tmp_path: Path) -> Path:
+    imgdir = tmp_path / "images"
+    imgdir.mkdir()
+    for i in range(20):
+        (imgdir / f"{i}.jpg").write_text(str(i))
+    return imgdir
+
+
+@pytest.fixture
+def manifest(tmp_path: Path) -> UploadManifest:
+    return UploadManifest(tmp_path / "manifest.jsonl")
+
+
+def _make_client(imgdir: Path, failing: set[Path]) -> Mock:
+    lock = threading.Lock()
+    uploaded: list[Path] = []
+
+    def upload_file(path: Path) -> UploadFailure | None:
+        with lock:
+            uploaded.append(path)
+        return UploadFailure(path, "Server error") if path in failing else None
+
+    client = Mock(imgdir=imgdir, uploaded=uploaded)
+    client.upload_file.side_effect = upload_file
+    return client
+
+
+def test_upload_all(imgdir: Path, manifest: UploadManifest) -> None:
+    paths = [Path(f"{i}.jpg") for i in range(20)]
+    client = _make_client(imgdir, failing={Path("3.jpg")})
+    failures = _upload_all(paths, client, manifest, num_of_workers=4)
+    assert [x.filepath for x in failures] == [Path("3.jpg")]
+    assert sorted(client.uploaded) == sorted(paths)
+    assert [x for x in paths if manifest.is_uploaded(x, imgdir)] == [x for x in paths if x != Path("3.jpg")]
+
+
+def test_upload_all_records_uploads_persistently(imgdir: Path, manifest: UploadManifest) -> None:
+    paths = [Path(f"{i}.jpg") for i in range(20)]
+    _upload_all(paths, _make_client(imgdir, failing=set()), manifest, num_of_workers=4)
+    reloaded = UploadManifest(manifest.location)
+    assert all(reloaded.is_uploaded(x, imgdir) for x in paths)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
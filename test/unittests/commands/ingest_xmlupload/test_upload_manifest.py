@@ -0,0 +1,62 @@
+import os
+from pathlib import Path
+
+import pytest
+
+from dsp_tools.commands.ingest_xmlupload.upload_files.upload_manifest import UploadManifest
+from dsp_tools.commands.ingest_xmlupload.upload_files.upload_manifest import get_manifest_location
+
+
+@pytest.fixture
+def imgdir(tmp_path: Path) -> Path:
+    imgdir = tmp_path / "images"
+    imgdir.mkdir()
+    (imgdir / "image.jpg").write_bytes(b"content")
+    return imgdir
+
+
+@pytest.fixture
+def location(tmp_path: Path) -> Path:
+    return tmp_path / "manifest" / "4123.jsonl"
+
+
+def test_get_manifest_location() -> None:
+    location = get_manifest_location("https://ingest.test.dasch.swiss/", "4123")
+    assert location == Path.home() / ".dsp-tools" / "upload-files" / "ingest.test.dasch.swiss" / "4123.jsonl"
+    location = get_manifest_location("http://0.0.0.0:3340", "4123")
+    assert location.parent.name == "0.0.0.0_3340"
+
+
+def test_uploaded_file_is_persisted(imgdir: Path, location: Path) -> None:
+    UploadManifest(location).add(Path("image.jpg"), imgdir)
+    manifest = UploadManifest(location)
+    assert manifest.is_uploaded(Path("image.jpg"), imgdir)
+    assert not manifest.is_uploaded(Path("other.jpg"), imgdir)
+
+
+def test_modified_file_is_not_uploaded(imgdir: Path, location: Path) -> None:
+    manifest = UploadManifest(location)
+    manifest.add(Path("image.jpg"), imgdir)
+    file = imgdir / "image.jpg"
+    file.write_bytes(b"modified content")
+    stat = file.stat()
+    os.utime(file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    assert not manifest.is_uploaded(Path("image.jpg"), imgdir)
+
+
+def test_deleted_file_is_not_uploaded(imgdir: Path, location: Path) -> None:
+    manifest = UploadManifest(location)
+    manifest.add(Path("image.jpg"), imgdir)
+    (imgdir / "image.jpg").unlink()
+    assert not manifest.is_uploaded(Path("image.jpg"), imgdir)
+
+
+def test_incomplete_line_is_ignored(imgdir: Path, location: Path) -> None:
+    UploadManifest(location).add(Path("image.jpg"), imgdir)
+    with open(location, "a", encoding="utf-8") as f:
+        f.write('{"path": "ima')
+    assert UploadManifest(location).is_uploaded(Path("image.jpg"), imgdir)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
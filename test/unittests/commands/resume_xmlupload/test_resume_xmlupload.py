@@ -1,9 +1,19 @@
+from pathlib import Path
 from unittest.mock import Mock
 from unittest.mock import patch
 
 import pytest
 
+from dsp_tools.commands.resume_xmlupload.resume_xmlupload import _replay_upload_journal
 from dsp_tools.commands.resume_xmlupload.resume_xmlupload import _skip_first_resource
+from dsp_tools.commands.xmlupload.models.processed.res import ProcessedResource
+from dsp_tools.commands.xmlupload.models.processed.values import ProcessedLink
+from dsp_tools.commands.xmlupload.models.upload_journal import UploadJournal
+from dsp_tools.commands.xmlupload.models.upload_state import UploadState
+from dsp_tools.commands.xmlupload.stash.stash_models import LinkValueStash
+from dsp_tools.commands.xmlupload.stash.stash_models import LinkValueStashItem
+from dsp_tools.commands.xmlupload.stash.stash_models import Stash
+from dsp_tools.commands.xmlupload.upload_config import UploadConfig
 
 STDIN_TARGET = "dsp_tools.utils.interactive.stdin_is_interactive"
 
@@ -11,6 +21,7 @@ STDIN_TARGET = "dsp_tools.utils.interactive.stdin_is_interactive"
 class TestSkipFirstResource:
     def test_pops_first_when_pending_nonempty(self) -> None:
         state = Mock()
+        state.journal = None
         state.pending_resources = ["first", "second"]
         _skip_first_resource(state)
         assert state.pending_resources == ["second"]
@@ -30,3 +41,71 @@ class TestSkipFirstResource:
                 with pytest.raises(SystemExit) as exc_info:
                     _skip_first_resource(state)
         assert exc_info.value.code == 1
+
+
+def _res(res_id: str) -> ProcessedResource:
+    return ProcessedResource(res_id, "onto:Type", res_id, None, [])
+
+
+def _link_stash_item(res_id: str, uuid: str) -> LinkValueStashItem:
+    return LinkValueStashItem(res_id, "onto:Type", ProcessedLink("target", "onto:hasLink", None, None, None, uuid))
+
+
+@pytest.fixture
+def journaled_state(tmp_path: Path) -> UploadState:
+    stash = Stash(
+        standoff_stash=None,
+        link_value_stash=LinkValueStash(
+            {
+                "a": [_link_stash_item("a", "uuid_1"), _link_stash_item("a", "uuid_2")],
+                "b": [_link_stash_item("b", "uuid_3")],
+            }
+        ),
+    )
+    return UploadState(
+        pending_resources=[_res("a"), _res("b"), _res("c"), _res("d"), _res("e")],
+        pending_stash=stash,
+        config=UploadConfig(),
+        journal=UploadJournal(tmp_path / "latest.journal"),
+    )
+
+
+class TestReplayUploadJournal:
+    def test_resources(self, journaled_state: UploadState) -> None:
+        assert journaled_state.journal
+        journaled_state.journal.record_resource_created("a", "iri_a")
+        journaled_state.journal.record_resource_failed("b")
+        journaled_state.journal.record_resource_moved_to_front("e")
+        journaled_state.journal.record_resource_skipped("e")
+        journaled_state.journal.record_resource_moved_to_front("d")
+        _replay_upload_journal(journaled_state)
+        assert journaled_state.iri_resolver.lookup == {"a": "iri_a"}
+        assert journaled_state.failed_uploads == ["b"]
+        assert [x.res_id for x in journaled_state.pending_resources] == ["d", "c"]
+
+    def test_stash(self, journaled_state: UploadState) -> None:
+        assert journaled_state.journal
+        journaled_state.journal.record_stash_item_applied(_link_stash_item("a", "uuid_2"))
+        journaled_state.journal.record_stash_item_applied(_link_stash_item("b", "uuid_3"))
+        _replay_upload_journal(journaled_state)
+        assert journaled_state.pending_stash
+        assert journaled_state.pending_stash.link_value_stash
+        assert journaled_state.pending_stash.link_value_stash.res_2_stash_items == {
+            "a": [_link_stash_item("a", "uuid_1")]
+        }
+
+    def test_replaying_twice_has_no_further_effect(self, journaled_state: UploadState) -> None:
+        assert journaled_state.journal
+        journaled_state.journal.record_resource_failed("b")
+        journaled_state.journal.record_resource_moved_to_front("d")
+        _replay_upload_journal(journaled_state)
+        _replay_upload_journal(journaled_state)
+        assert journaled_state.failed_uploads == ["b"]
+        assert [x.res_id for x in journaled_state.pending_resources] == ["d", "a", "c", "e"]
+
+    def test_skipped_resource_is_journaled(self, journaled_state: UploadState) -> None:
+        assert journaled_state.journal
+        _skip_first_resource(journaled_state)
+        _replay_upload_journal(journaled_state)
+        assert [x.res_id for x in journaled_state.pending_resources] == ["b", "c", "d", "e"]
+        assert [x["res_id"] for x in journaled_state.journal.read_records()] == ["a"]
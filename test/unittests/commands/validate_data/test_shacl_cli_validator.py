@@ -6,7 +6,7 @@ from rdflib import Graph
 from rdflib import Literal
 from rdflib import URIRef
 
-from dsp_tools.commands.validate_data.validation.get_validation_report import _merge_into_ox_store
+from dsp_tools.commands.validate_data.shacl_cli_validator import _merge_into_ox_store
 
 EX = "http://example.org/"
 
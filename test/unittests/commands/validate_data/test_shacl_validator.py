@@ -0,0 +1,66 @@
+import pytest
+from rdflib import RDF
+from rdflib import SH
+from rdflib import BNode
+from rdflib import Graph
+from rdflib import Literal
+from rdflib import URIRef
+
+from dsp_tools.commands.validate_data.shacl_cli_validator import ShaclCliValidator
+from dsp_tools.commands.validate_data.shacl_in_process_validator import ShaclInProcessValidator
+from dsp_tools.commands.validate_data.shacl_in_process_validator import _add_values_of_closed_by_types_results
+from dsp_tools.commands.validate_data.shacl_validator import SHACL_VALIDATOR_ENV_VAR
+from dsp_tools.commands.validate_data.shacl_validator import get_shacl_validator
+from dsp_tools.commands.validate_data.shacl_validator import shacl_validator_requires_docker
+from dsp_tools.error.exceptions import UserError
+from dsp_tools.utils.rdf_constants import DASH
+
+EX = "http://example.org/"
+
+
+class TestGetShaclValidator:
+    def test_default(self, monkeypatch):
+        monkeypatch.delenv(SHACL_VALIDATOR_ENV_VAR, raising=False)
+        assert shacl_validator_requires_docker()
+        assert isinstance(get_shacl_validator(), ShaclCliValidator)
+
+    def test_docker(self, monkeypatch):
+        monkeypatch.setenv(SHACL_VALIDATOR_ENV_VAR, "Docker")
+        assert shacl_validator_requires_docker()
+        assert isinstance(get_shacl_validator(), ShaclCliValidator)
+
+    def test_in_process(self, monkeypatch):
+        monkeypatch.setenv(SHACL_VALIDATOR_ENV_VAR, "in-process")
+        assert not shacl_validator_requires_docker()
+        assert isinstance(get_shacl_validator(), ShaclInProcessValidator)
+
+    def test_unknown(self, monkeypatch):
+        monkeypatch.setenv(SHACL_VALIDATOR_ENV_VAR, "inexistent")
+        with pytest.raises(UserError):
+            get_shacl_validator()
+
+
+def test_add_values_of_closed_by_types_results():
+    focus_node = URIRef(f"{EX}resource")
+    path = URIRef(f"{EX}prohibitedProp")
+    data = Graph()
+    data.add((focus_node, path, Literal("first")))
+    data.add((focus_node, path, Literal("second")))
+    report = Graph()
+    validation_report = BNode()
+    result = BNode()
+    report.add((validation_report, RDF.type, SH.ValidationReport))
+    report.add((validation_report, SH.result, result))
+    report.add((result, RDF.type, SH.ValidationResult))
+    report.add((result, SH.focusNode, focus_node))
+    report.add((result, SH.resultPath, path))
+    report.add((result, SH.value, focus_node))
+    report.add((result, SH.sourceConstraintComponent, DASH.ClosedByTypesConstraintComponent))
+    _add_values_of_closed_by_types_results(report, data)
+    results = list(report.objects(validation_report, SH.result))
+    assert len(results) == 2
+    assert result not in results
+    assert {report.value(x, SH.value) for x in results} == {Literal("first"), Literal("second")}
+    for x in results:
+        assert report.value(x, SH.focusNode) == focus_node
+        assert report.value(x, SH.resultPath) == path
@@ -1,6 +1,8 @@
 from uuid import uuid4
 
 import pytest
+from rdflib import RDF
+from rdflib import BNode
 from rdflib import Graph
 from rdflib import Namespace
 from rdflib import URIRef
@@ -9,12 +11,11 @@ from dsp_tools.commands.xmlupload.iri_resolver import IriResolver
 from dsp_tools.commands.xmlupload.make_rdf_graph.jsonld_utils import serialise_jsonld_for_resource
 from dsp_tools.commands.xmlupload.make_rdf_graph.jsonld_utils import serialise_jsonld_for_value
 from dsp_tools.commands.xmlupload.make_rdf_graph.make_resource_and_values import create_resource_with_values
+from dsp_tools.commands.xmlupload.make_rdf_graph.make_values import make_link_value_graph
 from dsp_tools.commands.xmlupload.models.lookup_models import IRILookups
 from dsp_tools.commands.xmlupload.models.processed.res import ProcessedResource
 from dsp_tools.commands.xmlupload.models.processed.values import ProcessedBoolean
 from dsp_tools.commands.xmlupload.models.processed.values import ProcessedLink
-from dsp_tools.commands.xmlupload.stash.stash_models import LinkValueStashItem
-from dsp_tools.commands.xmlupload.stash.upload_stashed_resptr_props import _make_link_value_create_graph
 
 ONTO_STR = "http://0.0.0.0:3333/ontology/9999/onto/v2#"
 
@@ -68,12 +69,9 @@ def test_serialise_jsonld_for_resource(resource_graph: Graph) -> None:
 
 
 def test_serialise_jsonld_for_value():
-    link_stash = LinkValueStashItem(
-        res_id=RES_IRI_STR,
-        res_type=RES_TYPE,
-        value=ProcessedLink("target_resource_id", ONTO.hasLink, None, None, None, str(uuid4())),
-    )
-    graph = _make_link_value_create_graph(link_stash, RES_IRI_STR, TARGET_IRI_STR)
+    link = ProcessedLink("target_resource_id", ONTO.hasLink, None, None, None, str(uuid4()))
+    graph = make_link_value_graph(link, BNode(), RES_IRI, URIRef(TARGET_IRI_STR))
+    graph.add((RES_IRI, RDF.type, RES_TYPE))
     expected = {
         "@id": "http://rdfh.ch/9999/res_one",
         "@type": "http://0.0.0.0:3333/ontology/9999/onto/v2#Resource",
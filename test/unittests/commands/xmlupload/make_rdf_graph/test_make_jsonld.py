@@ -0,0 +1,309 @@
+import json
+from typing import Any
+from uuid import uuid4
+
+import pytest
+from rdflib import RDF
+from rdflib import BNode
+from rdflib import URIRef
+
+from dsp_tools.commands.xmlupload.iri_resolver import IriResolver
+from dsp_tools.commands.xmlupload.make_rdf_graph.jsonld_utils import serialise_jsonld_for_resource
+from dsp_tools.commands.xmlupload.make_rdf_graph.jsonld_utils import serialise_jsonld_for_value
+from dsp_tools.commands.xmlupload.make_rdf_graph.make_jsonld import make_link_value_jsonld
+from dsp_tools.commands.xmlupload.make_rdf_graph.make_jsonld import make_region_preview_value_jsonld
+from dsp_tools.commands.xmlupload.make_rdf_graph.make_jsonld import make_resource_jsonld
+from dsp_tools.commands.xmlupload.make_rdf_graph.make_jsonld import make_richtext_value_jsonld
+from dsp_tools.commands.xmlupload.make_rdf_graph.make_jsonld import make_value_jsonld
+from dsp_tools.commands.xmlupload.make_rdf_graph.make_resource_and_values import create_resource_with_values
+from dsp_tools.commands.xmlupload.make_rdf_graph.make_values import make_link_value_graph
+from dsp_tools.commands.xmlupload.make_rdf_graph.make_values import make_region_preview_value_graph
+from dsp_tools.commands.xmlupload.make_rdf_graph.make_values import make_richtext_value_graph
+from dsp_tools.commands.xmlupload.models.bitstream_info import BitstreamInfo
+from dsp_tools.commands.xmlupload.models.formatted_text_value import FormattedTextValue
+from dsp_tools.commands.xmlupload.models.lookup_models import IRILookups
+from dsp_tools.commands.xmlupload.models.permission import Permissions
+from dsp_tools.commands.xmlupload.models.permission import PermissionValue
+from dsp_tools.commands.xmlupload.models.processed.file_values import ProcessedFileBitstream
+from dsp_tools.commands.xmlupload.models.processed.file_values import ProcessedFileIIIFUri
+from dsp_tools.commands.xmlupload.models.processed.file_values import ProcessedFileMetadata
+from dsp_tools.commands.xmlupload.models.processed.file_values import ProcessedFilePlaceholder
+from dsp_tools.commands.xmlupload.models.processed.file_values import ProcessedFileValue
+from dsp_tools.commands.xmlupload.models.processed.res import MigrationMetadata
+from dsp_tools.commands.xmlupload.models.processed.res import ProcessedResource
+from dsp_tools.commands.xmlupload.models.processed.values import IntervalFloats
+from dsp_tools.commands.xmlupload.models.processed.values import ProcessedBoolean
+from dsp_tools.commands.xmlupload.models.processed.values import ProcessedColor
+from dsp_tools.commands.xmlupload.models.processed.values import ProcessedDate
+from dsp_tools.commands.xmlupload.models.processed.values import ProcessedDecimal
+from dsp_tools.commands.xmlupload.models.processed.values import ProcessedGeometry
+from dsp_tools.commands.xmlupload.models.processed.values import ProcessedGeoname
+from dsp_tools.commands.xmlupload.models.processed.values import ProcessedInt
+from dsp_tools.commands.xmlupload.models.processed.values import ProcessedInterval
+from dsp_tools.commands.xmlupload.models.processed.values import ProcessedLink
+from dsp_tools.commands.xmlupload.models.processed.values import ProcessedList
+from dsp_tools.commands.xmlupload.models.processed.values import ProcessedRegionPreview
+from dsp_tools.commands.xmlupload.models.processed.values import ProcessedRichtext
+from dsp_tools.commands.xmlupload.models.processed.values import ProcessedSimpleText
+from dsp_tools.commands.xmlupload.models.processed.values import ProcessedTime
+from dsp_tools.commands.xmlupload.models.processed.values import ProcessedUri
+from dsp_tools.commands.xmlupload.models.processed.values import ProcessedValue
+from dsp_tools.legacy_models.datetimestamp import DateTimeStamp
+from dsp_tools.utils.data_formats.date_util import Calendar
+from dsp_tools.utils.data_formats.date_util import Date
+from dsp_tools.utils.data_formats.date_util import Era
+from dsp_tools.utils.data_formats.date_util import SingleDate
+from dsp_tools.utils.xml_parsing.models.parsed_resource import KnoraFileValueType
+
+ONTO_STR = "http://0.0.0.0:3333/ontology/9999/onto/v2#"
+RES_TYPE_STR = f"{ONTO_STR}TestResource"
+RES_IRI_STR = "http://rdfh.ch/9999/res_one"
+TARGET_IRI_STR = "http://rdfh.ch/9999/target_resource"
+VAL_IRI_STR = "http://rdfh.ch/9999/res_one/values/richtext"
+
+PERMISSIONS = Permissions(
+    {PermissionValue.CR: ["knora-admin:ProjectAdmin"], PermissionValue.V: ["knora-admin:KnownUser"]}
+)
+
+
+@pytest.fixture
+def lookups() -> IRILookups:
+    return IRILookups(
+        project_iri=URIRef("http://rdfh.ch/9999/project"),
+        id_to_iri=IriResolver({"res_one": RES_IRI_STR, "target_resource": TARGET_IRI_STR}),
+    )
+
+
+def _normalise(payload: Any) -> Any:
+    # the order of the objects of a property is not significant in JSON-LD, and it differs between the two paths
+    if isinstance(payload, dict):
+        return {k: _normalise(v) for k, v in payload.items()}
+    if isinstance(payload, list):
+        return sorted((_normalise(x) for x in payload), key=lambda x: json.dumps(x, sort_keys=True))
+    return payload
+
+
+def _make_resource(
+    values: list[ProcessedValue],
+    permissions: Permissions | None = None,
+    file_value: ProcessedFileValue | None = None,
+    migration_metadata: MigrationMetadata | None = None,
+    data_authorship: list[str] | None = None,
+) -> ProcessedResource:
+    return ProcessedResource(
+        res_id="resource_id",
+        type_iri=RES_TYPE_STR,
+        label="Special Characters: äöüéèà",
+        permissions=permissions,
+        values=values,
+        file_value=file_value,
+        migration_metadata=migration_metadata,
+        data_authorship=data_authorship,
+    )
+
+
+def _assert_same_resource_payload(
+    resource: ProcessedResource, lookups: IRILookups, bitstream_information: BitstreamInfo | None = None
+) -> None:
+    reference = serialise_jsonld_for_resource(create_resource_with_values(resource, bitstream_information, lookups))
+    result = make_resource_jsonld(resource, bitstream_information, lookups)
+    assert _normalise(result) == _normalise(reference)
+
+
+def _richtext(text: str, value_order: int | None = None) -> ProcessedRichtext:
+    return ProcessedRichtext(
+        FormattedTextValue(text),
+        f"{ONTO_STR}hasRichtext",
+        None,
+        None,
+        value_order=value_order,
+        resource_references=set(),
+        value_uuid=str(uuid4()),
+    )
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        ProcessedBoolean(True, f"{ONTO_STR}isTrueOrFalse", None, None, None),
+        ProcessedBoolean(False, f"{ONTO_STR}isTrueOrFalse", None, None, None),
+        ProcessedColor("#5d1f1e", f"{ONTO_STR}hasColor", None, None, None),
+        ProcessedDecimal(2.718281828459, f"{ONTO_STR}hasDecimal", None, None, None),
+        ProcessedDecimal(0.0000001, f"{ONTO_STR}hasDecimal", None, None, None),
+        ProcessedDecimal(1e22, f"{ONTO_STR}hasDecimal", None, None, None),
+        ProcessedDecimal(-1.5, f"{ONTO_STR}hasDecimal", None, None, None),
+        ProcessedGeometry(
+            '{"status": "active", "type": "polygon", "lineWidth": 5, '
+            '"points": [{"x": 0.4, "y": 0.6}, {"x": 0.5, "y": 0.9}, {"x": 0.8, "y": 0.9}]}',
+            f"{ONTO_STR}hasGeometry",
+            None,
+            None,
+            None,
+        ),
+        ProcessedGeoname("5416656", f"{ONTO_STR}hasGeoname", None, None, None),
+        ProcessedInt(1, f"{ONTO_STR}hasInteger", None, None, None),
+        ProcessedInt(-42, f"{ONTO_STR}hasInteger", None, None, None),
+        ProcessedInterval(IntervalFloats(0.1, 0.234), f"{ONTO_STR}hasSegmentBounds", None, None, None),
+        ProcessedInterval(IntervalFloats(0.0, 12.0), f"{ONTO_STR}hasSegmentBounds", None, None, None),
+        ProcessedList("http://rdfh.ch/9999/node", f"{ONTO_STR}hasListItem", None, None, None),
+        ProcessedLink("target_resource", f"{ONTO_STR}hasResource", None, None, None, str(uuid4())),
+        ProcessedLink(
+            "http://rdfh.ch/4123/DiAmYQzQSzC7cdTo6OJMYA", f"{ONTO_STR}hasResource", None, None, None, str(uuid4())
+        ),
+        ProcessedRegionPreview("target_resource", f"{ONTO_STR}hasRegionPreview", None, None, None, str(uuid4())),
+        _richtext("Text"),
+        _richtext('With <a class="salsah-link" href="IRI:res_one:IRI">link</a> & "quotes"'),
+        ProcessedSimpleText("Text with\nline break and ünïcödé", f"{ONTO_STR}hasSimpleText", None, None, None),
+        ProcessedTime("2019-10-23T13:45:12.01-14:00", f"{ONTO_STR}hasTime", None, None, None),
+        ProcessedUri("https://dasch.swiss", f"{ONTO_STR}hasUri", None, None, None),
+        ProcessedDate(
+            Date(Calendar.GREGORIAN, SingleDate(Era.AD, 476, 9, 4), SingleDate(Era.AD, 477, None, None)),
+            f"{ONTO_STR}hasDate",
+            None,
+            None,
+            None,
+        ),
+        ProcessedDate(
+            Date(Calendar.JULIAN, SingleDate(Era.BC, 100, 1, None), None),
+            f"{ONTO_STR}hasDate",
+            None,
+            None,
+            None,
+        ),
+        ProcessedDate(
+            Date(Calendar.ISLAMIC, SingleDate(None, 1400, None, None), None),
+            f"{ONTO_STR}hasDate",
+            None,
+            None,
+            None,
+        ),
+    ],
+)
+def test_value_types(value: ProcessedValue, lookups: IRILookups) -> None:
+    _assert_same_resource_payload(_make_resource([value]), lookups)
+
+
+def test_optional_value_properties(lookups: IRILookups) -> None:
+    values: list[ProcessedValue] = [
+        ProcessedBoolean(True, f"{ONTO_STR}isTrueOrFalse", "comment", PERMISSIONS, 0),
+        ProcessedInterval(IntervalFloats(0.1, 0.2), f"{ONTO_STR}hasSegmentBounds", "comment", PERMISSIONS, 1),
+        ProcessedDate(
+            Date(Calendar.GREGORIAN, SingleDate(Era.CE, 2000, 1, 1), None),
+            f"{ONTO_STR}hasDate",
+            "comment",
+            PERMISSIONS,
+            2,
+        ),
+        ProcessedLink("target_resource", f"{ONTO_STR}hasResource", "comment", PERMISSIONS, 3, str(uuid4())),
+    ]
+    _assert_same_resource_payload(_make_resource(values), lookups)
+
+
+def test_multiple_values_of_same_property(lookups: IRILookups) -> None:
+    values: list[ProcessedValue] = [
+        ProcessedSimpleText("Text", f"{ONTO_STR}hasSimpleText", None, None, None),
+        ProcessedSimpleText("Text", f"{ONTO_STR}hasSimpleText", None, None, None),
+        ProcessedSimpleText("Other Text", f"{ONTO_STR}hasSimpleText", "comment", None, 1),
+        _richtext("First", value_order=0),
+        _richtext("Second", value_order=1),
+    ]
+    _assert_same_resource_payload(_make_resource(values), lookups)
+
+
+def test_resource_metadata(lookups: IRILookups) -> None:
+    resource = _make_resource(
+        [],
+        permissions=PERMISSIONS,
+        data_authorship=["Author One", "Author Two", "Author One"],
+    )
+    _assert_same_resource_payload(resource, lookups)
+
+
+@pytest.mark.parametrize(
+    "migration_metadata",
+    [
+        MigrationMetadata(
+            "http://rdfh.ch/4123/DiAmYQzQSzC7cdTo6OJMYA", DateTimeStamp("1999-12-31T23:59:59.9999999+01:00")
+        ),
+        MigrationMetadata("http://rdfh.ch/4123/DiAmYQzQSzC7cdTo6OJMYA", None),
+        MigrationMetadata(None, DateTimeStamp("1999-12-31T23:59:59.9999999+01:00")),
+    ],
+)
+def test_migration_metadata(migration_metadata: MigrationMetadata, lookups: IRILookups) -> None:
+    values: list[ProcessedValue] = [ProcessedInt(1, f"{ONTO_STR}hasInteger", None, None, None)]
+    _assert_same_resource_payload(_make_resource(values, migration_metadata=migration_metadata), lookups)
+
+
+@pytest.mark.parametrize(
+    ("file_value", "bitstream_information"),
+    [
+        (
+            ProcessedFileValue(
+                ProcessedFileBitstream("file.jpg", "resource_id"),
+                KnoraFileValueType.STILL_IMAGE_FILE,
+                ProcessedFileMetadata("http://rdfh.ch/licenses/cc-by-4.0", "holder", ["author"]),
+            ),
+            BitstreamInfo("internal.jp2", None),
+        ),
+        (
+            ProcessedFileValue(
+                ProcessedFileBitstream("file.pdf", "resource_id"),
+                KnoraFileValueType.DOCUMENT_FILE,
+                ProcessedFileMetadata(
+                    "http://rdfh.ch/licenses/cc-by-4.0", "holder", ["Author One", "Author Two"], PERMISSIONS
+                ),
+            ),
+            BitstreamInfo("internal.pdf", PERMISSIONS),
+        ),
+        (
+            ProcessedFileValue(
+                ProcessedFileIIIFUri("https://iiif.dasch.swiss/0001/image.jp2/full/max/0/default.jpg"),
+                KnoraFileValueType.STILL_IMAGE_IIIF,
+                ProcessedFileMetadata("http://rdfh.ch/licenses/cc-by-4.0", "holder", ["author", "author"]),
+            ),
+            None,
+        ),
+        (
+            ProcessedFileValue(
+                ProcessedFilePlaceholder(),
+                KnoraFileValueType.AUDIO_FILE,
+                ProcessedFileMetadata("http://rdfh.ch/licenses/cc-by-4.0", "holder", ["author"]),
+            ),
+            None,
+        ),
+    ],
+)
+def test_file_values(
+    file_value: ProcessedFileValue, bitstream_information: BitstreamInfo | None, lookups: IRILookups
+) -> None:
+    values: list[ProcessedValue] = [ProcessedBoolean(True, f"{ONTO_STR}isTrueOrFalse", None, None, None)]
+    resource = _make_resource(values, file_value=file_value)
+    _assert_same_resource_payload(resource, lookups, bitstream_information)
+
+
+def test_link_value_for_update() -> None:
+    val = ProcessedLink("target_resource", f"{ONTO_STR}hasResource", "comment", PERMISSIONS, 1, str(uuid4()))
+    graph = make_link_value_graph(val, BNode(), URIRef(RES_IRI_STR), URIRef(TARGET_IRI_STR))
+    graph.add((URIRef(RES_IRI_STR), RDF.type, URIRef(RES_TYPE_STR)))
+    reference = serialise_jsonld_for_value(graph, RES_IRI_STR)
+    value = make_link_value_jsonld(val, TARGET_IRI_STR)
+    assert make_value_jsonld(RES_IRI_STR, RES_TYPE_STR, val.prop_iri, value) == reference
+
+
+def test_region_preview_value_for_update() -> None:
+    val = ProcessedRegionPreview("target_resource", f"{ONTO_STR}hasRegionPreview", None, None, None, str(uuid4()))
+    graph = make_region_preview_value_graph(val, BNode(), URIRef(RES_IRI_STR), URIRef(TARGET_IRI_STR))
+    graph.add((URIRef(RES_IRI_STR), RDF.type, URIRef(RES_TYPE_STR)))
+    reference = serialise_jsonld_for_value(graph, RES_IRI_STR)
+    value = make_region_preview_value_jsonld(val, TARGET_IRI_STR)
+    assert make_value_jsonld(RES_IRI_STR, RES_TYPE_STR, val.prop_iri, value) == reference
+
+
+def test_richtext_value_for_update(lookups: IRILookups) -> None:
+    val = _richtext('With <a class="salsah-link" href="IRI:target_resource:IRI">link</a>', value_order=1)
+    graph = make_richtext_value_graph(val, URIRef(VAL_IRI_STR), URIRef(RES_IRI_STR), lookups.id_to_iri)
+    graph.add((URIRef(RES_IRI_STR), RDF.type, URIRef(RES_TYPE_STR)))
+    reference = serialise_jsonld_for_value(graph, RES_IRI_STR)
+    value = make_richtext_value_jsonld(val, lookups.id_to_iri)
+    value["@id"] = VAL_IRI_STR
+    assert make_value_jsonld(RES_IRI_STR, RES_TYPE_STR, val.prop_iri, value) == reference
@@ -7,9 +7,9 @@ from rdflib import Literal
 from rdflib import Namespace
 from rdflib import URIRef
 
-from dsp_tools.commands.xmlupload.make_rdf_graph.make_resource_and_values import _get_abstract_file_value
 from dsp_tools.commands.xmlupload.make_rdf_graph.make_resource_and_values import _make_migration_metadata
 from dsp_tools.commands.xmlupload.make_rdf_graph.make_resource_and_values import _make_resource
+from dsp_tools.commands.xmlupload.make_rdf_graph.make_resource_and_values import get_abstract_file_value
 from dsp_tools.commands.xmlupload.models.bitstream_info import BitstreamInfo
 from dsp_tools.commands.xmlupload.models.permission import Permissions
 from dsp_tools.commands.xmlupload.models.permission import PermissionValue
@@ -144,7 +144,7 @@ def test_get_abstract_file_value_iiif() -> None:
         value_type=KnoraFileValueType.STILL_IMAGE_IIIF,
         metadata=FILE_METADATA,
     )
-    result = _get_abstract_file_value(file_val, None)
+    result = get_abstract_file_value(file_val, None)
     assert result.value == "https://iiif.example.com/image"
     assert result.prop_to_filename == KNORA_API.stillImageFileValueHasExternalUrl
 
@@ -156,7 +156,7 @@ def test_get_abstract_file_value_bitstream() -> None:
         metadata=FILE_METADATA,
     )
     bitstream = BitstreamInfo(internal_file_name="abcdef.jp2")
-    result = _get_abstract_file_value(file_val, bitstream)
+    result = get_abstract_file_value(file_val, bitstream)
     assert result.value == "abcdef.jp2"
     assert result.prop_to_filename == KNORA_API.fileValueHasFilename
 
@@ -167,7 +167,7 @@ def test_get_abstract_file_value_placeholder() -> None:
         value_type=KnoraFileValueType.STILL_IMAGE_FILE,
         metadata=FILE_METADATA,
     )
-    result = _get_abstract_file_value(file_val, None)
+    result = get_abstract_file_value(file_val, None)
     assert result.value == URN_DASCH_PLACEHOLDER
     assert result.prop_to_filename == KNORA_API.fileValueHasFilename
 
@@ -179,4 +179,4 @@ def test_get_abstract_file_value_unreachable() -> None:
         metadata=FILE_METADATA,
     )
     with pytest.raises(UnreachableCodeError):
-        _get_abstract_file_value(file_val, None)
+        get_abstract_file_value(file_val, None)
@@ -0,0 +1,60 @@
+import pickle
+from pathlib import Path
+
+from dsp_tools.commands.xmlupload.models.processed.values import ProcessedLink
+from dsp_tools.commands.xmlupload.models.upload_journal import JournalEvent
+from dsp_tools.commands.xmlupload.models.upload_journal import UploadJournal
+from dsp_tools.commands.xmlupload.stash.stash_models import LinkValueStashItem
+
+
+def test_records_are_read_in_order(tmp_path: Path) -> None:
+    journal = UploadJournal(tmp_path / "latest.journal")
+    journal.record_resource_created("res_1", "http://rdfh.ch/9999/res_1")
+    journal.record_resource_failed("res_2")
+    journal.record_stash_item_applied(
+        LinkValueStashItem("res_1", "onto:Type", ProcessedLink("res_3", "onto:hasLink", None, None, None, "uuid"))
+    )
+    assert list(journal.read_records()) == [
+        {"event": JournalEvent.RESOURCE_CREATED, "res_id": "res_1", "iri": "http://rdfh.ch/9999/res_1"},
+        {"event": JournalEvent.RESOURCE_FAILED, "res_id": "res_2"},
+        {"event": JournalEvent.LINK_VALUE_STASH_ITEM_APPLIED, "res_id": "res_1", "value_uuid": "uuid"},
+    ]
+
+
+def test_records_are_on_disk_without_flush(tmp_path: Path) -> None:
+    journal = UploadJournal(tmp_path / "latest.journal", fsync_batch_size=1000)
+    journal.record_resource_created("res_1", "iri_1")
+    assert list(UploadJournal(journal.path).read_records()) == [
+        {"event": JournalEvent.RESOURCE_CREATED, "res_id": "res_1", "iri": "iri_1"}
+    ]
+
+
+def test_partially_written_record_is_ignored(tmp_path: Path) -> None:
+    path = tmp_path / "latest.journal"
+    path.write_text('{"event": "resource_failed", "res_id": "res_1"}\n{"event": "resource_cr', encoding="utf-8")
+    journal = UploadJournal(path)
+    journal.record_resource_failed("res_2")
+    assert list(journal.read_records()) == [
+        {"event": JournalEvent.RESOURCE_FAILED, "res_id": "res_1"},
+        {"event": JournalEvent.RESOURCE_FAILED, "res_id": "res_2"},
+    ]
+
+
+def test_pickle_keeps_only_the_location(tmp_path: Path) -> None:
+    journal = UploadJournal(tmp_path / "latest.journal")
+    journal.record_resource_skipped("res_1")
+    unpickled: UploadJournal = pickle.loads(pickle.dumps(journal))  # noqa: S301 (deserialization of untrusted data)
+    assert unpickled.path == journal.path
+    unpickled.record_resource_skipped("res_2")
+    assert [x["res_id"] for x in journal.read_records()] == ["res_1", "res_2"]
+
+
+def test_reset_and_delete(tmp_path: Path) -> None:
+    journal = UploadJournal(tmp_path / "latest.journal")
+    journal.record_resource_skipped("res_1")
+    journal.reset()
+    assert not list(journal.read_records())
+    journal.record_resource_skipped("res_2")
+    assert [x["res_id"] for x in journal.read_records()] == ["res_2"]
+    journal.delete()
+    assert not journal.path.exists()
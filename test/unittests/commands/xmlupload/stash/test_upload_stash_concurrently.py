@@ -0,0 +1,101 @@
+import threading
+from unittest.mock import Mock
+
+import pytest
+
+from dsp_tools.commands.xmlupload.iri_resolver import IriResolver
+from dsp_tools.commands.xmlupload.models.processed.values import ProcessedLink
+from dsp_tools.commands.xmlupload.models.upload_journal import UploadJournal
+from dsp_tools.commands.xmlupload.models.upload_state import UploadState
+from dsp_tools.commands.xmlupload.stash.stash_models import LinkValueStash
+from dsp_tools.commands.xmlupload.stash.stash_models import LinkValueStashItem
+from dsp_tools.commands.xmlupload.stash.stash_models import Stash
+from dsp_tools.commands.xmlupload.stash.upload_stash_concurrently import upload_stash_concurrently
+from dsp_tools.commands.xmlupload.upload_config import UploadConfig
+
+SOME_PROP_STR = "http://0.0.0.0:3333/ontology/4123/testonto/v2#someprop"
+
+
+def _item(res_id: str, target: str) -> LinkValueStashItem:
+    return LinkValueStashItem(
+        res_id, "sometype", ProcessedLink(target, SOME_PROP_STR, None, None, None, f"{res_id}_{target}")
+    )
+
+
+def _make_upload_state(items: list[LinkValueStashItem], created: list[str]) -> UploadState:
+    stash = Stash.make(standoff_stash=None, link_value_stash=LinkValueStash.make(items))
+    iri_resolver = IriResolver({res_id: f"http://rdfh.ch/4123/{res_id}" for res_id in created})
+    upload_state = UploadState([], stash, UploadConfig(num_of_workers=4), iri_resolver=iri_resolver)
+    upload_state.journal = Mock(spec=UploadJournal)
+    return upload_state
+
+
+def _res_2_stash_items(upload_state: UploadState) -> dict[str, list[LinkValueStashItem]]:
+    assert upload_state.pending_stash
+    assert upload_state.pending_stash.link_value_stash
+    return upload_state.pending_stash.link_value_stash.res_2_stash_items
+
+
+def test_applied_items_are_removed_from_the_stash() -> None:
+    items = [_item(f"res_{i}", f"target_{j}") for i in range(20) for j in range(3)]
+    upload_state = _make_upload_state(items, created=[f"res_{i}" for i in range(20)])
+    res_2_stash_items = _res_2_stash_items(upload_state)
+    upload_stash_concurrently(res_2_stash_items, lambda _iri, stash_items: stash_items, upload_state, "desc")
+    assert not res_2_stash_items
+    assert upload_state.journal
+    journal_mock = upload_state.journal.record_stash_item_applied
+    assert isinstance(journal_mock, Mock)
+    recorded = [x.args[0] for x in journal_mock.call_args_list]
+    assert sorted(recorded, key=str) == sorted(items, key=str)
+
+
+def test_items_that_were_not_applied_remain_in_the_stash() -> None:
+    failing = _item("res_1", "target_failing")
+    items = [_item("res_1", "target_1"), failing, _item("res_2", "target_1"), _item("res_not_created", "target_1")]
+    upload_state = _make_upload_state(items, created=["res_1", "res_2"])
+    res_2_stash_items = _res_2_stash_items(upload_state)
+
+    def upload(_iri: str, stash_items: list[LinkValueStashItem]) -> list[LinkValueStashItem]:
+        return [x for x in stash_items if x != failing]
+
+    upload_stash_concurrently(res_2_stash_items, upload, upload_state, "desc")
+    assert res_2_stash_items == {"res_1": [failing], "res_not_created": [items[3]]}
+
+
+def test_items_of_one_resource_are_applied_in_order_by_one_worker() -> None:
+    items = [_item(f"res_{i}", f"target_{j}") for i in range(10) for j in range(5)]
+    upload_state = _make_upload_state(items, created=[f"res_{i}" for i in range(10)])
+    received: dict[str, list[LinkValueStashItem]] = {}
+    lock = threading.Lock()
+
+    def upload(res_iri: str, stash_items: list[LinkValueStashItem]) -> list[LinkValueStashItem]:
+        with lock:
+            assert res_iri not in received
+            received[res_iri] = stash_items
+        return stash_items
+
+    upload_stash_concurrently(_res_2_stash_items(upload_state), upload, upload_state, "desc")
+    assert received == {f"http://rdfh.ch/4123/res_{i}": items[i * 5 : (i + 1) * 5] for i in range(10)}
+
+
+def test_applied_items_are_kept_track_of_if_an_error_occurs() -> None:
+    items = [_item("res_ok", "target"), _item("res_error", "target")]
+    upload_state = _make_upload_state(items, created=["res_ok", "res_error"])
+    res_2_stash_items = _res_2_stash_items(upload_state)
+    ok_started = threading.Event()
+
+    def upload(res_iri: str, stash_items: list[LinkValueStashItem]) -> list[LinkValueStashItem]:
+        if res_iri.endswith("res_error"):
+            # resources that have not been started yet when the error occurs are not uploaded at all
+            ok_started.wait(timeout=5)
+            raise ConnectionError("unexpected")
+        ok_started.set()
+        return stash_items
+
+    with pytest.raises(ConnectionError, match="unexpected"):
+        upload_stash_concurrently(res_2_stash_items, upload, upload_state, "desc")
+    assert res_2_stash_items == {"res_error": [items[1]]}
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,162 @@
+import threading
+
+import pytest
+from requests import ReadTimeout
+
+from dsp_tools.commands.xmlupload.concurrent_upload import _get_referenced_ids
+from dsp_tools.commands.xmlupload.concurrent_upload import upload_resources_concurrently
+from dsp_tools.commands.xmlupload.exceptions import XmlUploadInterruptedError
+from dsp_tools.commands.xmlupload.models.formatted_text_value import FormattedTextValue
+from dsp_tools.commands.xmlupload.models.processed.res import ProcessedResource
+from dsp_tools.commands.xmlupload.models.processed.values import ProcessedLink
+from dsp_tools.commands.xmlupload.models.processed.values import ProcessedRichtext
+from dsp_tools.commands.xmlupload.models.processed.values import ProcessedSimpleText
+from dsp_tools.commands.xmlupload.models.processed.values import ProcessedValue
+from dsp_tools.commands.xmlupload.models.upload_state import UploadState
+from dsp_tools.commands.xmlupload.upload_config import UploadConfig
+from dsp_tools.error.custom_warnings import DspToolsUserWarning
+from dsp_tools.error.exceptions import PermanentConnectionError
+
+RES_IRI_PREFIX = "http://rdfh.ch/9999/"
+EXISTING_RES_IRI = "http://rdfh.ch/9999/DiAmYQzQSzC7cdTo6OJMYA"
+
+
+def _res(res_id: str, link_targets: list[str] | None = None) -> ProcessedResource:
+    values: list[ProcessedValue] = [
+        ProcessedLink(target, "onto:hasLink", None, None, None, f"uuid_{target}") for target in link_targets or []
+    ]
+    return ProcessedResource(res_id, "onto:Type", res_id, None, values)
+
+
+def _make_state(resources: list[ProcessedResource], interrupt_after: int | None = None) -> UploadState:
+    return UploadState(resources.copy(), None, UploadConfig(interrupt_after=interrupt_after))
+
+
+@pytest.fixture
+def resources() -> list[ProcessedResource]:
+    # the order is topological: every link target comes before the resource linking to it
+    return [
+        _res("a"),
+        _res("b"),
+        _res("c", ["a"]),
+        _res("d", ["b", "c"]),
+        _res("e"),
+        _res("f", ["d"]),
+    ]
+
+
+def test_all_resources_created_after_their_link_targets(resources: list[ProcessedResource]) -> None:
+    upload_state = _make_state(resources)
+    violations = []
+    lock = threading.Lock()
+
+    def upload_one(res: ProcessedResource) -> str:
+        targets = {v.value for v in res.values}
+        with lock:
+            missing = targets - upload_state.iri_resolver.lookup.keys()
+            if missing:
+                violations.append((res.res_id, missing))
+        return f"{RES_IRI_PREFIX}{res.res_id}"
+
+    upload_resources_concurrently(upload_state, upload_one, num_of_workers=4)
+    assert not violations
+    assert upload_state.iri_resolver.lookup == {x.res_id: f"{RES_IRI_PREFIX}{x.res_id}" for x in resources}
+    assert not upload_state.pending_resources
+    assert not upload_state.failed_uploads
+
+
+def test_failed_resources_are_registered(resources: list[ProcessedResource]) -> None:
+    upload_state = _make_state(resources)
+
+    def upload_one(res: ProcessedResource) -> str | None:
+        if res.res_id == "b":
+            return None
+        if res.res_id == "e":
+            raise ValueError("bug")
+        return f"{RES_IRI_PREFIX}{res.res_id}"
+
+    upload_resources_concurrently(upload_state, upload_one, num_of_workers=3)
+    assert sorted(upload_state.failed_uploads) == ["b", "e"]
+    assert set(upload_state.iri_resolver.lookup) == {"a", "c", "d", "f"}
+    assert not upload_state.pending_resources
+
+
+def test_permanent_connection_error_keeps_state_consistent(resources: list[ProcessedResource]) -> None:
+    upload_state = _make_state(resources)
+
+    def upload_one(res: ProcessedResource) -> str:
+        if res.res_id == "c":
+            raise PermanentConnectionError("server down")
+        return f"{RES_IRI_PREFIX}{res.res_id}"
+
+    with pytest.raises(XmlUploadInterruptedError):
+        upload_resources_concurrently(upload_state, upload_one, num_of_workers=2)
+    created = set(upload_state.iri_resolver.lookup)
+    pending = {x.res_id for x in upload_state.pending_resources}
+    assert "c" in pending
+    assert {"d", "f"} <= pending
+    assert created | pending == {x.res_id for x in resources}
+    assert not created & pending
+
+
+def test_timeout_moves_uncertain_resource_to_front(resources: list[ProcessedResource]) -> None:
+    upload_state = _make_state(resources)
+
+    def upload_one(res: ProcessedResource) -> str:
+        if res.res_id == "e":
+            raise ReadTimeout()
+        return f"{RES_IRI_PREFIX}{res.res_id}"
+
+    with pytest.raises(XmlUploadInterruptedError):
+        with pytest.warns(DspToolsUserWarning):
+            upload_resources_concurrently(upload_state, upload_one, num_of_workers=2)
+    assert upload_state.pending_resources[0].res_id == "e"
+    assert "e" not in upload_state.failed_uploads
+
+
+def test_interrupt_after(resources: list[ProcessedResource]) -> None:
+    upload_state = _make_state(resources, interrupt_after=3)
+
+    def upload_one(res: ProcessedResource) -> str:
+        return f"{RES_IRI_PREFIX}{res.res_id}"
+
+    with pytest.raises(XmlUploadInterruptedError):
+        upload_resources_concurrently(upload_state, upload_one, num_of_workers=4)
+    assert len(upload_state.iri_resolver.lookup) == 3
+    assert len(upload_state.pending_resources) == 3
+
+
+def test_get_referenced_ids() -> None:
+    richtext = ProcessedRichtext(
+        value=FormattedTextValue('<a class="salsah-link" href="IRI:target_text:IRI">link</a>'),
+        prop_iri="onto:hasText",
+        comment=None,
+        permissions=None,
+        value_order=None,
+        resource_references={"target_text"},
+        value_uuid="uuid_text",
+    )
+    stashed_richtext = ProcessedRichtext(
+        value=FormattedTextValue("uuid_stashed"),
+        prop_iri="onto:hasText",
+        comment=None,
+        permissions=None,
+        value_order=None,
+        resource_references={"stashed_target"},
+        value_uuid="uuid_stashed",
+    )
+    res = ProcessedResource(
+        res_id="source",
+        type_iri="onto:Type",
+        label="lbl",
+        permissions=None,
+        values=[
+            ProcessedLink("target_link", "onto:hasLink", None, None, None, "uuid_1"),
+            ProcessedLink(EXISTING_RES_IRI, "onto:hasLink", None, None, None, "uuid_2"),
+            ProcessedLink("source", "onto:hasLink", None, None, None, "uuid_3"),
+            richtext,
+            stashed_richtext,
+            ProcessedSimpleText("text", "onto:hasSimpleText", None, None, None),
+        ],
+    )
+    assert _get_referenced_ids(res) == {"target_link", "target_text"}
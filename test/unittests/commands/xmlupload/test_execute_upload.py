@@ -4,6 +4,7 @@ from unittest.mock import patch
 
 import pytest
 from rdflib import URIRef
+from requests import ReadTimeout
 
 from dsp_tools.clients.ingest import AssetClient
 from dsp_tools.clients.resource_client import ResourceClient
@@ -22,6 +23,8 @@ from dsp_tools.commands.xmlupload.upload_config import UploadConfig
 from dsp_tools.error.custom_warnings import DspToolsUserWarning
 from dsp_tools.error.exceptions import PermanentConnectionError
 from dsp_tools.utils.exceptions import DspToolsRequestException
+from dsp_tools.utils.rate_control import AdaptiveRateController
+from dsp_tools.utils.rate_control import RateControlConfig
 from dsp_tools.utils.request_utils import ResponseCodeAndText
 from dsp_tools.utils.xml_parsing.models.parsed_resource import KnoraFileValueType
 
@@ -93,7 +96,7 @@ def iri_lookups() -> IRILookups:
 
 @pytest.fixture(autouse=True)
 def patch_sleep():
-    with patch("dsp_tools.utils.request_utils.time.sleep"):
+    with patch("dsp_tools.utils.rate_control.time.sleep"):
         yield
 
 
@@ -106,7 +109,7 @@ class TestExecuteOneUpload:
         ingest_client: MagicMock,
         iri_lookups: IRILookups,
     ) -> None:
-        resource_client.post_resource.return_value = RES_IRI
+        resource_client.post_resource.return_value = {"@id": RES_IRI}
         _execute_one_resource_upload(resource, upload_state, resource_client, ingest_client, iri_lookups, 0)
         ingest_client.get_bitstream_info.assert_not_called()
         assert upload_state.iri_resolver.lookup == {RES_ID: RES_IRI}
@@ -120,7 +123,7 @@ class TestExecuteOneUpload:
         iri_lookups: IRILookups,
     ) -> None:
         ingest_client.get_bitstream_info.return_value = BitstreamInfo("internal.jpg")
-        resource_client.post_resource.return_value = RES_IRI
+        resource_client.post_resource.return_value = {"@id": RES_IRI}
         upload_state.pending_resources = [resource_with_file]
         _execute_one_resource_upload(resource_with_file, upload_state, resource_client, ingest_client, iri_lookups, 0)
         assert upload_state.iri_resolver.lookup == {RES_ID: RES_IRI}
@@ -189,7 +192,7 @@ class TestExecuteOneUpload:
         ingest_client: MagicMock,
         iri_lookups: IRILookups,
     ) -> None:
-        resource_client.post_resource.return_value = RES_IRI
+        resource_client.post_resource.return_value = {"@id": RES_IRI}
         with patch(
             "dsp_tools.commands.xmlupload.execute_upload.tidy_up_resource_creation_idempotent",
             side_effect=[KeyboardInterrupt(), None],
@@ -207,7 +210,7 @@ class TestResourceDataUpload:
         resource_client: MagicMock,
         iri_lookups: IRILookups,
     ) -> None:
-        resource_client.post_resource.return_value = RES_IRI
+        resource_client.post_resource.return_value = {"@id": RES_IRI}
         result = _execute_one_resource_data_upload(resource, None, resource_client, iri_lookups)
         assert result == RES_IRI
         assert resource_client.post_resource.call_count == 1
@@ -229,7 +232,7 @@ class TestResourceDataUpload:
         resource_client: MagicMock,
         iri_lookups: IRILookups,
     ) -> None:
-        resource_client.post_resource.side_effect = [DspToolsRequestException("err"), RES_IRI]
+        resource_client.post_resource.side_effect = [DspToolsRequestException("err"), {"@id": RES_IRI}]
         result = _execute_one_resource_data_upload(resource, None, resource_client, iri_lookups)
         assert result == RES_IRI
         assert resource_client.post_resource.call_count == 2
@@ -254,7 +257,24 @@ class TestResourceDataUpload:
         # the retry evaluation function is programmed not to retry if it is in a testing environment,
         # since we want to ensure that we will retry, this needs to be patched here
         with patch.dict(os.environ, {"DSP_TOOLS_TESTING": "false"}):
-            resource_client.post_resource.side_effect = [ResponseCodeAndText(503, "please try again later"), RES_IRI]
+            resource_client.post_resource.side_effect = [
+                ResponseCodeAndText(503, "please try again later"),
+                {"@id": RES_IRI},
+            ]
             result = _execute_one_resource_data_upload(resource, None, resource_client, iri_lookups)
             assert result == RES_IRI
             assert resource_client.post_resource.call_count == 2
+
+    def test_data_upload_timeout_cuts_the_limit(
+        self,
+        resource: ProcessedResource,
+        resource_client: MagicMock,
+        iri_lookups: IRILookups,
+    ) -> None:
+        controller = AdaptiveRateController(RateControlConfig(initial_limit=8))
+        resource_client.post_resource.side_effect = ReadTimeout("timed out")
+        with patch("dsp_tools.commands.xmlupload.execute_upload.get_rate_controller", return_value=controller):
+            with pytest.raises(ReadTimeout):
+                _execute_one_resource_data_upload(resource, None, resource_client, iri_lookups)
+        assert resource_client.post_resource.call_count == 1
+        assert controller.limit == 4
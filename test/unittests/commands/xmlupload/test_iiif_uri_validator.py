@@ -1,12 +1,19 @@
+import json
+import threading
+import time
+from collections import defaultdict
+from pathlib import Path
 from unittest.mock import Mock
 from unittest.mock import patch
 
 import pytest
 from requests import RequestException
 from requests import Response
+from requests_mock import Mocker
 
 from dsp_tools.commands.xmlupload.models.input_problems import IIIFUriProblem
 from dsp_tools.commands.xmlupload.prepare_xml_input.iiif_uri_validator import IIIFUriValidator
+from dsp_tools.commands.xmlupload.prepare_xml_input.iiif_uri_validator import IIIFValidationCache
 
 
 @pytest.fixture
@@ -74,12 +81,12 @@ def test_make_info_json_uri_correct(empty_validator: IIIFUriValidator, uri: str,
     assert empty_validator._make_info_json_uri(uri) == expected
 
 
-@patch("dsp_tools.commands.xmlupload.prepare_xml_input.iiif_uri_validator.IIIFUriValidator._make_network_call")
+@patch.object(IIIFUriValidator, "_make_network_call_to_info_json")
 def test_validate_with_exception(
     mock_network_call: Mock, request_exception: RequestException, empty_validator: IIIFUriValidator
 ) -> None:
     mock_network_call.return_value = request_exception
-    result = empty_validator.validate_one_uri("http://example.com")
+    [result] = empty_validator.validate_uris(["http://example.com"])
     assert isinstance(result, IIIFUriProblem)
     assert result.uri == "http://example.com"
     assert not result.regex_has_passed
@@ -87,12 +94,12 @@ def test_validate_with_exception(
     assert result.raised_exception_name == "RequestException"
 
 
-@patch("dsp_tools.commands.xmlupload.prepare_xml_input.iiif_uri_validator.IIIFUriValidator._make_network_call")
+@patch.object(IIIFUriValidator, "_make_network_call_to_info_json")
 def test_validate_with_bad_status_code(
     mock_network_call: Mock, response_404: Response, empty_validator: IIIFUriValidator
 ) -> None:
     mock_network_call.return_value = response_404
-    result = empty_validator.validate_one_uri("http://example.com")
+    [result] = empty_validator.validate_uris(["http://example.com"])
     assert isinstance(result, IIIFUriProblem)
     assert result.uri == "http://example.com"
     assert not result.regex_has_passed
@@ -100,23 +107,23 @@ def test_validate_with_bad_status_code(
     assert not result.raised_exception_name
 
 
-@patch("dsp_tools.commands.xmlupload.prepare_xml_input.iiif_uri_validator.IIIFUriValidator._make_network_call")
+@patch.object(IIIFUriValidator, "_make_network_call_to_info_json")
 def test_validate_with_good_status_code(
     mock_network_call: Mock, response_200: Response, empty_validator: IIIFUriValidator
 ) -> None:
     mock_network_call.return_value = response_200
-    result = empty_validator.validate_one_uri(
-        "https://iiif.dasch.swiss/0811/1Oi7mdiLsG7-FmFgp0xz2xU.jp2/full/837,530/0/default.jp2"
+    result = empty_validator.validate_uris(
+        ["https://iiif.dasch.swiss/0811/1Oi7mdiLsG7-FmFgp0xz2xU.jp2/full/837,530/0/default.jp2"]
     )
     assert not result
 
 
-@patch("dsp_tools.commands.xmlupload.prepare_xml_input.iiif_uri_validator.IIIFUriValidator._make_network_call")
+@patch.object(IIIFUriValidator, "_make_network_call_to_info_json")
 def test_validate_with_failed_regex_good_status_code(
     mock_network_call: Mock, response_200: Response, empty_validator: IIIFUriValidator
 ) -> None:
     mock_network_call.return_value = response_200
-    result = empty_validator.validate_one_uri("http://example.com")
+    [result] = empty_validator.validate_uris(["http://example.com"])
     assert isinstance(result, IIIFUriProblem)
     assert result.uri == "http://example.com"
     assert not result.regex_has_passed
@@ -124,5 +131,93 @@ def test_validate_with_failed_regex_good_status_code(
     assert not result.raised_exception_name
 
 
+DASCH_URI = "https://iiif.dasch.swiss/0811/1Oi7mdiLsG7-FmFgp0xz2xU.jp2/full/837,530/0/default.jp2"
+DASCH_INFO_JSON = "https://iiif.dasch.swiss/0811/1Oi7mdiLsG7-FmFgp0xz2xU.jp2/info.json"
+
+
+@pytest.fixture
+def cache(tmp_path: Path) -> IIIFValidationCache:
+    return IIIFValidationCache(tmp_path / "cache.json")
+
+
+def test_validate_uris_deduplicates_info_json(requests_mock: Mocker, cache: IIIFValidationCache) -> None:
+    requests_mock.get(DASCH_INFO_JSON, status_code=200)
+    uris = [DASCH_URI, DASCH_URI, DASCH_URI.replace("837,530", "max")]
+    assert not IIIFUriValidator(cache).validate_uris(uris)
+    assert requests_mock.call_count == 1
+
+
+def test_validate_uris_reports_each_distinct_uri(requests_mock: Mocker, cache: IIIFValidationCache) -> None:
+    requests_mock.get(DASCH_INFO_JSON, status_code=404)
+    requests_mock.get("https://example.org/iiif/abcd/info.json", exc=RequestException)
+    other_uri = "https://example.org/iiif/abcd/full/max/0/default.jpg"
+    problems = IIIFUriValidator(cache).validate_uris([DASCH_URI, DASCH_URI, other_uri])
+    assert problems == [
+        IIIFUriProblem(uri=DASCH_URI, regex_has_passed=True, status_code=404),
+        IIIFUriProblem(uri=other_uri, regex_has_passed=True, raised_exception_name="RequestException"),
+    ]
+
+
+def test_validate_uris_uses_cache_of_earlier_run(requests_mock: Mocker, tmp_path: Path) -> None:
+    requests_mock.get(DASCH_INFO_JSON, status_code=200)
+    assert not IIIFUriValidator(IIIFValidationCache(tmp_path / "cache.json")).validate_uris([DASCH_URI])
+    assert not IIIFUriValidator(IIIFValidationCache(tmp_path / "cache.json")).validate_uris([DASCH_URI])
+    assert requests_mock.call_count == 1
+
+
+def test_validate_uris_does_not_cache_failures(requests_mock: Mocker, tmp_path: Path) -> None:
+    requests_mock.get(DASCH_INFO_JSON, [{"status_code": 503}, {"status_code": 200}])
+    assert IIIFUriValidator(IIIFValidationCache(tmp_path / "cache.json")).validate_uris([DASCH_URI])
+    assert not IIIFUriValidator(IIIFValidationCache(tmp_path / "cache.json")).validate_uris([DASCH_URI])
+    assert requests_mock.call_count == 2
+
+
+def test_validate_uris_does_not_renew_cached_entries(requests_mock: Mocker, tmp_path: Path) -> None:
+    location = tmp_path / "cache.json"
+    checked_at = time.time() - 40
+    location.write_text(json.dumps({DASCH_INFO_JSON: checked_at}))
+    assert not IIIFUriValidator(IIIFValidationCache(location, ttl_seconds=50)).validate_uris([DASCH_URI])
+    assert requests_mock.call_count == 0
+    assert json.loads(location.read_text()) == {DASCH_INFO_JSON: checked_at}
+
+
+def test_cache_expires(tmp_path: Path) -> None:
+    location = tmp_path / "cache.json"
+    location.write_text(json.dumps({DASCH_INFO_JSON: time.time() - 100, "https://example.org/info.json": time.time()}))
+    cache = IIIFValidationCache(location, ttl_seconds=50)
+    assert not cache.is_valid(DASCH_INFO_JSON)
+    assert cache.is_valid("https://example.org/info.json")
+
+
+def test_invalid_cache_is_ignored(tmp_path: Path) -> None:
+    location = tmp_path / "cache.json"
+    location.write_text('{"https://example.org/info.json": 17')
+    assert not IIIFValidationCache(location).is_valid("https://example.org/info.json")
+
+
+def test_validate_uris_limits_requests_per_host() -> None:
+    lock = threading.Lock()
+    in_flight: defaultdict[str, int] = defaultdict(int)
+    max_in_flight: defaultdict[str, int] = defaultdict(int)
+
+    def network_call(info_json_uri: str) -> Response:
+        host = info_json_uri.split("/")[2]
+        with lock:
+            in_flight[host] += 1
+            max_in_flight[host] = max(max_in_flight[host], in_flight[host])
+        time.sleep(0.01)
+        with lock:
+            in_flight[host] -= 1
+        response = Response()
+        response.status_code = 200
+        return response
+
+    uris = [f"https://{host}/iiif/{i}/full/max/0/default.jpg" for host in ["a.org", "b.org"] for i in range(20)]
+    validator = IIIFUriValidator(num_of_workers=16, max_requests_per_host=3)
+    with patch.object(IIIFUriValidator, "_make_network_call_to_info_json", side_effect=network_call):
+        assert not validator.validate_uris(uris)
+    assert max_in_flight == {"a.org": 3, "b.org": 3}
+
+
 if __name__ == "__main__":
     pytest.main([__file__])
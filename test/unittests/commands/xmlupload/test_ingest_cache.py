@@ -0,0 +1,86 @@
+from pathlib import Path
+
+import pytest
+from requests_mock import Mocker
+
+from dsp_tools.clients.ingest import DspIngestClientLive
+from dsp_tools.commands.xmlupload.ingest_cache import CachingAssetClient
+from dsp_tools.commands.xmlupload.media_cache import MediaCache
+from dsp_tools.commands.xmlupload.models.processed.file_values import ProcessedFileBitstream
+from test.integration.commands.xmlupload.authentication_client_mock import AuthenticationClientMockBase
+
+DSP_INGEST_URL = "https://example.com"
+SHORTCODE = "0001"
+INGEST_URL = f"{DSP_INGEST_URL}/projects/{SHORTCODE}/assets/ingest/file.xml"
+ASSET_URL = f"{DSP_INGEST_URL}/projects/{SHORTCODE}/assets/abc"
+
+
+@pytest.fixture
+def file_info(tmp_path: Path) -> ProcessedFileBitstream:
+    (tmp_path / "file.xml").write_text("<xml></xml>")
+    return ProcessedFileBitstream("file.xml", "res_id")
+
+
+@pytest.fixture
+def caching_client(tmp_path: Path) -> CachingAssetClient:
+    ingest_client = DspIngestClientLive(DSP_INGEST_URL, AuthenticationClientMockBase(), SHORTCODE, str(tmp_path))
+    return CachingAssetClient(ingest_client, tmp_path, MediaCache(tmp_path / "media-cache"))
+
+
+def test_reuses_ingested_file(
+    caching_client: CachingAssetClient, file_info: ProcessedFileBitstream, requests_mock: Mocker
+) -> None:
+    ingest = requests_mock.post(INGEST_URL, json={"internalFilename": "abc.xml"})
+    asset_info = requests_mock.get(ASSET_URL, json={})
+    first = caching_client.get_bitstream_info(file_info, None)
+    second = caching_client.get_bitstream_info(file_info, None)
+    assert first
+    assert second
+    assert first.internal_file_name == second.internal_file_name == "abc.xml"
+    assert ingest.call_count == 1
+    assert asset_info.call_count == 1
+
+
+def test_uploads_again_if_asset_was_deleted(
+    caching_client: CachingAssetClient, file_info: ProcessedFileBitstream, requests_mock: Mocker
+) -> None:
+    ingest = requests_mock.post(INGEST_URL, json={"internalFilename": "abc.xml"})
+    requests_mock.get(ASSET_URL, status_code=404)
+    caching_client.get_bitstream_info(file_info, None)
+    caching_client.get_bitstream_info(file_info, None)
+    assert ingest.call_count == 2
+
+
+def test_reuses_ingested_file_without_check(
+    caching_client: CachingAssetClient, file_info: ProcessedFileBitstream, requests_mock: Mocker
+) -> None:
+    caching_client.check_cached_assets = False
+    ingest = requests_mock.post(INGEST_URL, json={"internalFilename": "abc.xml"})
+    caching_client.get_bitstream_info(file_info, None)
+    caching_client.get_bitstream_info(file_info, None)
+    assert ingest.call_count == 1
+
+
+def test_does_not_reuse_file_of_other_project(
+    caching_client: CachingAssetClient, file_info: ProcessedFileBitstream, requests_mock: Mocker, tmp_path: Path
+) -> None:
+    content_hash = caching_client.media_cache.get_hash(tmp_path / "file.xml")
+    caching_client.media_cache.add_internal_filename(DSP_INGEST_URL, "9999", content_hash, "other.xml")
+    ingest = requests_mock.post(INGEST_URL, json={"internalFilename": "abc.xml"})
+    result = caching_client.get_bitstream_info(file_info, None)
+    assert result
+    assert result.internal_file_name == "abc.xml"
+    assert ingest.call_count == 1
+
+
+def test_failed_upload_is_not_cached(
+    caching_client: CachingAssetClient, file_info: ProcessedFileBitstream, requests_mock: Mocker, tmp_path: Path
+) -> None:
+    requests_mock.post(INGEST_URL, status_code=500)
+    assert not caching_client.get_bitstream_info(file_info, None)
+    content_hash = caching_client.media_cache.get_hash(tmp_path / "file.xml")
+    assert not caching_client.media_cache.get_internal_filename(DSP_INGEST_URL, SHORTCODE, content_hash)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
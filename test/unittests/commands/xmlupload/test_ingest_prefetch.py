@@ -0,0 +1,130 @@
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from dsp_tools.commands.xmlupload.ingest_prefetch import PrefetchingAssetClient
+from dsp_tools.commands.xmlupload.models.bitstream_info import BitstreamInfo
+from dsp_tools.commands.xmlupload.models.permission import Permissions
+from dsp_tools.commands.xmlupload.models.processed.file_values import ProcessedFileBitstream
+from dsp_tools.commands.xmlupload.models.processed.file_values import ProcessedFileMetadata
+from dsp_tools.commands.xmlupload.models.processed.file_values import ProcessedFileValue
+from dsp_tools.commands.xmlupload.models.processed.res import ProcessedResource
+from dsp_tools.utils.xml_parsing.models.parsed_resource import KnoraFileValueType
+
+FILE_SIZE = 100
+
+
+class RecordingAssetClient:
+    def __init__(self, imgdir: Path) -> None:
+        self.imgdir = imgdir
+        self.lock = threading.Lock()
+        self.bytes_in_flight = 0
+        self.max_observed_bytes_in_flight = 0
+        self.ingested: list[str] = []
+
+    def get_bitstream_info(
+        self, file_info: ProcessedFileBitstream, permissions: Permissions | None
+    ) -> BitstreamInfo | None:
+        size = (self.imgdir / file_info.value).stat().st_size
+        with self.lock:
+            self.bytes_in_flight += size
+            self.max_observed_bytes_in_flight = max(self.max_observed_bytes_in_flight, self.bytes_in_flight)
+        time.sleep(0.01)
+        with self.lock:
+            self.bytes_in_flight -= size
+            self.ingested.append(file_info.res_id)
+        if file_info.value.startswith("broken"):
+            return None
+        return BitstreamInfo(f"internal_{file_info.value}", permissions)
+
+
+def _make_resource(res_id: str, filename: str) -> ProcessedResource:
+    file_value = ProcessedFileValue(
+        value=ProcessedFileBitstream(filename, res_id),
+        value_type=KnoraFileValueType.STILL_IMAGE_FILE,
+        metadata=ProcessedFileMetadata("http://rdfh.ch/licenses/cc-by-4.0", "holder", ["author"]),
+    )
+    return ProcessedResource(res_id, "onto:Type", res_id, None, [], file_value=file_value)
+
+
+@pytest.fixture
+def resources(tmp_path: Path) -> list[ProcessedResource]:
+    result = []
+    for i in range(10):
+        filename = f"file_{i}.jpg"
+        (tmp_path / filename).write_bytes(b"x" * FILE_SIZE)
+        result.append(_make_resource(f"res_{i}", filename))
+    (tmp_path / "broken.jpg").write_bytes(b"x" * FILE_SIZE)
+    result.append(_make_resource("res_broken", "broken.jpg"))
+    result.append(ProcessedResource("res_without_file", "onto:Type", "lbl", None, []))
+    return result
+
+
+def _consume_all(client: PrefetchingAssetClient, resources: list[ProcessedResource]) -> dict[str, str | None]:
+    results = {}
+    for res in resources:
+        if res.file_value and isinstance(res.file_value.value, ProcessedFileBitstream):
+            info = client.get_bitstream_info(res.file_value.value, None)
+            results[res.res_id] = info.internal_file_name if info else None
+    return results
+
+
+def test_prefetched_results_are_handed_out(tmp_path: Path, resources: list[ProcessedResource]) -> None:
+    inner = RecordingAssetClient(tmp_path)
+    client = PrefetchingAssetClient(inner, tmp_path, num_of_workers=3)
+    client.start(resources)
+    results = _consume_all(client, resources)
+    client.shutdown()
+    expected: dict[str, str | None] = {f"res_{i}": f"internal_file_{i}.jpg" for i in range(10)}
+    expected["res_broken"] = None
+    assert results == expected
+    assert sorted(inner.ingested) == sorted(expected)
+
+
+def test_bytes_in_flight_are_limited(tmp_path: Path, resources: list[ProcessedResource]) -> None:
+    inner = RecordingAssetClient(tmp_path)
+    client = PrefetchingAssetClient(inner, tmp_path, num_of_workers=4, max_bytes_in_flight=2 * FILE_SIZE)
+    client.start(resources)
+    _consume_all(client, resources)
+    client.shutdown()
+    assert inner.max_observed_bytes_in_flight <= 2 * FILE_SIZE
+
+
+def test_file_bigger_than_limit_is_ingested_alone(tmp_path: Path, resources: list[ProcessedResource]) -> None:
+    inner = RecordingAssetClient(tmp_path)
+    client = PrefetchingAssetClient(inner, tmp_path, num_of_workers=4, max_bytes_in_flight=FILE_SIZE // 2)
+    client.start(resources)
+    results = _consume_all(client, resources)
+    client.shutdown()
+    assert len(results) == len(resources) - 1
+    assert inner.max_observed_bytes_in_flight == FILE_SIZE
+
+
+def test_prefetching_does_not_run_ahead_unboundedly(tmp_path: Path, resources: list[ProcessedResource]) -> None:
+    inner = RecordingAssetClient(tmp_path)
+    client = PrefetchingAssetClient(inner, tmp_path, num_of_workers=1)
+    client.max_prefetched_files = 2
+    client.start(resources)
+    first = resources[0]
+    assert first.file_value
+    assert isinstance(first.file_value.value, ProcessedFileBitstream)
+    client.get_bitstream_info(first.file_value.value, None)
+    with client._condition:
+        client._condition.wait_for(lambda: len(client._futures) == client.max_prefetched_files, timeout=5)
+        assert len(client._futures) == client.max_prefetched_files
+    client.shutdown()
+
+
+def test_unscheduled_file_is_ingested_directly(tmp_path: Path, resources: list[ProcessedResource]) -> None:
+    inner = RecordingAssetClient(tmp_path)
+    client = PrefetchingAssetClient(inner, tmp_path, num_of_workers=2)
+    client.start([])
+    res = resources[0]
+    assert res.file_value
+    assert isinstance(res.file_value.value, ProcessedFileBitstream)
+    info = client.get_bitstream_info(res.file_value.value, None)
+    client.shutdown()
+    assert info == BitstreamInfo("internal_file_0.jpg", None)
+    assert inner.ingested == ["res_0"]
@@ -0,0 +1,74 @@
+import hashlib
+import os
+from pathlib import Path
+
+import pytest
+
+from dsp_tools.commands.xmlupload.media_cache import FILE_HASHES_FILENAME
+from dsp_tools.commands.xmlupload.media_cache import INGESTED_FILES_FILENAME
+from dsp_tools.commands.xmlupload.media_cache import MediaCache
+
+
+@pytest.fixture
+def cache_dir(tmp_path: Path) -> Path:
+    return tmp_path / "media-cache"
+
+
+@pytest.fixture
+def file(tmp_path: Path) -> Path:
+    file = tmp_path / "image.jpg"
+    file.write_bytes(b"content")
+    return file
+
+
+def test_get_hash(cache_dir: Path, file: Path) -> None:
+    assert MediaCache(cache_dir).get_hash(file) == hashlib.sha256(b"content").hexdigest()
+
+
+def test_get_hash_is_persisted(cache_dir: Path, file: Path) -> None:
+    content_hash = MediaCache(cache_dir).get_hash(file)
+    (cache_dir / FILE_HASHES_FILENAME).write_text(
+        (cache_dir / FILE_HASHES_FILENAME).read_text().replace(content_hash, "known")
+    )
+    assert MediaCache(cache_dir).get_hash(file) == "known"
+
+
+def test_get_hash_of_modified_file(cache_dir: Path, file: Path) -> None:
+    cache = MediaCache(cache_dir)
+    cache.get_hash(file)
+    file.write_bytes(b"other content")
+    stat = file.stat()
+    os.utime(file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    assert cache.get_hash(file) == hashlib.sha256(b"other content").hexdigest()
+
+
+def test_start_hashing(cache_dir: Path, tmp_path: Path) -> None:
+    files = [tmp_path / f"file_{i}.txt" for i in range(20)]
+    for i, f in enumerate(files):
+        f.write_text(str(i))
+    cache = MediaCache(cache_dir)
+    cache.start_hashing([*files, tmp_path / "inexistent.txt"])
+    hashes = [cache.get_hash(f) for f in files]
+    cache.stop_hashing()
+    assert hashes == [hashlib.sha256(str(i).encode()).hexdigest() for i in range(20)]
+    assert len((cache_dir / FILE_HASHES_FILENAME).read_text().splitlines()) == 20
+
+
+def test_internal_filenames_are_persisted(cache_dir: Path) -> None:
+    MediaCache(cache_dir).add_internal_filename("https://ingest.dasch.swiss", "4123", "hash", "abc.jp2")
+    cache = MediaCache(cache_dir)
+    assert cache.get_internal_filename("https://ingest.dasch.swiss", "4123", "hash") == "abc.jp2"
+    assert not cache.get_internal_filename("https://ingest.dasch.swiss", "0001", "hash")
+    assert not cache.get_internal_filename("http://0.0.0.0:3340", "4123", "hash")
+
+
+def test_incomplete_line_is_ignored(cache_dir: Path) -> None:
+    MediaCache(cache_dir).add_internal_filename("https://ingest.dasch.swiss", "4123", "hash", "abc.jp2")
+    with open(cache_dir / INGESTED_FILES_FILENAME, "a", encoding="utf-8") as f:
+        f.write('{"server": "https://ingest.da')
+    cache = MediaCache(cache_dir)
+    assert cache.get_internal_filename("https://ingest.dasch.swiss", "4123", "hash") == "abc.jp2"
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
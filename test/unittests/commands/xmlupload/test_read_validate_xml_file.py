@@ -2,43 +2,65 @@
 from pathlib import Path
 
 import pytest
-from lxml import etree
 
 from dsp_tools.commands.xmlupload.exceptions import MultimediaFileNotFound
 from dsp_tools.commands.xmlupload.prepare_xml_input.read_validate_xml_file import check_if_bitstreams_exist
+from dsp_tools.utils.xml_parsing.models.parsed_resource import KnoraFileValueType
+from dsp_tools.utils.xml_parsing.models.parsed_resource import ParsedFileBitstream
+from dsp_tools.utils.xml_parsing.models.parsed_resource import ParsedFilePlaceholder
+from dsp_tools.utils.xml_parsing.models.parsed_resource import ParsedFileValue
+from dsp_tools.utils.xml_parsing.models.parsed_resource import ParsedFileValueMetadata
+from dsp_tools.utils.xml_parsing.models.parsed_resource import ParsedFileValueValue
+from dsp_tools.utils.xml_parsing.models.parsed_resource import ParsedResource
 
 
-def _make_root(resources_xml: str) -> etree._Element:
-    return etree.fromstring(f"<knora>{resources_xml}</knora>")
+def _make_resource(res_id: str, file_value: ParsedFileValueValue | None) -> ParsedResource:
+    return ParsedResource(
+        res_id=res_id,
+        res_type="http://0.0.0.0:3333/ontology/9999/onto/v2#Image",
+        label="label",
+        permissions_id=None,
+        values=[],
+        file_value=ParsedFileValue(
+            value=file_value,
+            value_type=KnoraFileValueType.STILL_IMAGE_FILE,
+            metadata=ParsedFileValueMetadata(None, None, None, None),
+        )
+        if file_value
+        else None,
+        migration_metadata=None,
+    )
 
 
 def test_check_if_bitstreams_exist_skips_placeholder(tmp_path: Path) -> None:
-    root = _make_root(
-        """<resource id="res_1">
-            <bitstream license="http://rdfh.ch/licenses/unknown" copyright-holder="DaSCH" authorship-id="a1">
-                <placeholder type="image"/>
-            </bitstream>
-        </resource>"""
-    )
+    resources = [_make_resource("res_1", ParsedFilePlaceholder())]
     # No real file exists; if placeholder is not skipped, this raises MultimediaFileNotFound
-    check_if_bitstreams_exist(root, tmp_path)
+    check_if_bitstreams_exist(resources, tmp_path)
 
 
 def test_check_if_bitstreams_exist_checks_real_file(tmp_path: Path) -> None:
     (tmp_path / "image.jpg").write_bytes(b"")
-    root = _make_root(
-        """<resource id="res_1">
-            <bitstream>image.jpg</bitstream>
-        </resource>"""
-    )
-    check_if_bitstreams_exist(root, tmp_path)
+    resources = [_make_resource("res_1", ParsedFileBitstream("image.jpg"))]
+    check_if_bitstreams_exist(resources, tmp_path)
 
 
 def test_check_if_bitstreams_exist_raises_for_missing_file(tmp_path: Path) -> None:
-    root = _make_root(
-        """<resource id="res_1">
-            <bitstream>missing.jpg</bitstream>
-        </resource>"""
-    )
+    resources = [_make_resource("res_1", ParsedFileBitstream("missing.jpg"))]
     with pytest.raises(MultimediaFileNotFound):
-        check_if_bitstreams_exist(root, tmp_path)
+        check_if_bitstreams_exist(resources, tmp_path)
+
+
+def test_check_if_bitstreams_exist_reports_each_resource(tmp_path: Path) -> None:
+    (tmp_path / "image.jpg").write_bytes(b"")
+    resources = [
+        _make_resource("res_1", ParsedFileBitstream("image.jpg")),
+        _make_resource("res_2", ParsedFileBitstream("missing.jpg")),
+        _make_resource("res_3", ParsedFileBitstream("missing.jpg")),
+        _make_resource("res_4", None),
+    ]
+    with pytest.raises(MultimediaFileNotFound) as exc_info:
+        check_if_bitstreams_exist(resources, tmp_path)
+    message = str(exc_info.value)
+    assert "res_1" not in message
+    assert "Resource ID: res_2 | Filepath: missing.jpg" in message
+    assert "Resource ID: res_3 | Filepath: missing.jpg" in message
@@ -0,0 +1,55 @@
+import io
+import threading
+import time
+
+import pytest
+
+from dsp_tools.utils.bandwidth_limit import BandwidthLimiter
+from dsp_tools.utils.bandwidth_limit import ThrottledReader
+
+
+def test_acquire_within_saved_up_bandwidth() -> None:
+    limiter = BandwidthLimiter(bytes_per_second=1_000_000)
+    start = time.monotonic()
+    limiter.acquire(1_000_000)
+    assert time.monotonic() - start < 0.1
+
+
+def test_acquire_waits_when_exhausted() -> None:
+    limiter = BandwidthLimiter(bytes_per_second=10_000)
+    limiter.acquire(10_000)
+    start = time.monotonic()
+    limiter.acquire(2_000)
+    assert time.monotonic() - start >= 0.15
+
+
+def test_acquire_from_several_threads() -> None:
+    limiter = BandwidthLimiter(bytes_per_second=20_000)
+    limiter.acquire(20_000)
+    threads = [threading.Thread(target=limiter.acquire, args=(2_000,)) for _ in range(4)]
+    start = time.monotonic()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    # the threads share the limit: 8000 bytes at 20000 bytes per second
+    assert time.monotonic() - start >= 0.35
+
+
+def test_invalid_limit() -> None:
+    with pytest.raises(ValueError, match="positive"):
+        BandwidthLimiter(bytes_per_second=0)
+
+
+def test_throttled_reader() -> None:
+    limiter = BandwidthLimiter(bytes_per_second=10_000)
+    reader = ThrottledReader(io.BytesIO(b"x" * 15_000), limiter, 15_000)
+    assert len(reader) == 15_000
+    start = time.monotonic()
+    content = b"".join(iter(lambda: reader.read(5_000), b""))
+    assert content == b"x" * 15_000
+    assert time.monotonic() - start >= 0.45
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,56 @@
+import os
+from pathlib import Path
+
+import pytest
+
+from dsp_tools.utils.file_check import FileCheckMode
+from dsp_tools.utils.file_check import find_missing_files
+
+
+@pytest.fixture
+def imgdir(tmp_path: Path) -> Path:
+    (tmp_path / "images" / "sub").mkdir(parents=True)
+    for name in ["a.jpg", "b.jpg", "sub/c.jpg"]:
+        (tmp_path / "images" / name).write_bytes(b"")
+    (tmp_path / "images" / "directory.jpg").mkdir()
+    return tmp_path
+
+
+@pytest.mark.parametrize("mode", list(FileCheckMode))
+def test_find_missing_files(imgdir: Path, mode: FileCheckMode) -> None:
+    filepaths = [
+        Path("images/a.jpg"),
+        Path("images/b.jpg"),
+        Path("images/sub/c.jpg"),
+        Path("images/missing.jpg"),
+        Path("images/directory.jpg"),
+        Path("inexisting_dir/a.jpg"),
+    ]
+    missing = find_missing_files(filepaths, imgdir, mode)
+    assert missing == {Path("images/missing.jpg"), Path("images/directory.jpg"), Path("inexisting_dir/a.jpg")}
+
+
+@pytest.mark.parametrize("mode", list(FileCheckMode))
+def test_find_missing_files_with_absolute_paths(imgdir: Path, mode: FileCheckMode) -> None:
+    filepaths = [imgdir / "images" / "a.jpg", imgdir / "images" / "missing.jpg"]
+    assert find_missing_files(filepaths, Path("unrelated"), mode) == {imgdir / "images" / "missing.jpg"}
+
+
+def test_index_mode_with_many_files(tmp_path: Path) -> None:
+    for i in range(0, 1000, 2):
+        (tmp_path / f"{i}.jpg").write_bytes(b"")
+    filepaths = [Path(f"{i}.jpg") for i in range(1000)]
+    missing = find_missing_files(filepaths, tmp_path)
+    assert missing == {Path(f"{i}.jpg") for i in range(1, 1000, 2)}
+
+
+def test_index_mode_checks_unindexed_files_on_their_own(imgdir: Path) -> None:
+    # e.g. a symlink to a file: it is a file, even if the listing of the directory may not say so
+    os.symlink(imgdir / "images" / "a.jpg", imgdir / "images" / "link.jpg")
+    os.symlink(imgdir / "images" / "inexisting.jpg", imgdir / "images" / "broken_link.jpg")
+    filepaths = [Path("images/link.jpg"), Path("images/broken_link.jpg")]
+    assert find_missing_files(filepaths, imgdir, FileCheckMode.INDEX) == {Path("images/broken_link.jpg")}
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,53 @@
+import hashlib
+from pathlib import Path
+
+import pytest
+
+from dsp_tools.utils.file_utils import append_json_line
+from dsp_tools.utils.file_utils import hash_file
+from dsp_tools.utils.file_utils import read_json_lines
+from dsp_tools.utils.file_utils import write_atomically
+
+
+def test_write_atomically_creates_the_directory(tmp_path: Path) -> None:
+    path = tmp_path / "sub" / "file.txt"
+    write_atomically(path, "content ä")
+    assert path.read_text(encoding="utf-8") == "content ä"
+    assert list(path.parent.iterdir()) == [path]
+
+
+def test_write_atomically_replaces_the_file(tmp_path: Path) -> None:
+    path = tmp_path / "file.bin"
+    path.write_bytes(b"old")
+    write_atomically(path, b"new")
+    assert path.read_bytes() == b"new"
+    assert list(tmp_path.iterdir()) == [path]
+
+
+def test_write_atomically_keeps_the_old_file_on_failure(tmp_path: Path) -> None:
+    path = tmp_path / "file.txt"
+    path.write_text("old", encoding="utf-8")
+    with pytest.raises(UnicodeEncodeError):
+        write_atomically(path, "\ud800")
+    assert path.read_text(encoding="utf-8") == "old"
+    assert list(tmp_path.iterdir()) == [path]
+
+
+def test_hash_file(tmp_path: Path) -> None:
+    path = tmp_path / "file.bin"
+    content = b"x" * (3 * 1024 * 1024 + 1)
+    path.write_bytes(content)
+    assert hash_file(path) == hashlib.sha256(content).hexdigest()
+
+
+def test_read_json_lines_ignores_an_incomplete_line(tmp_path: Path) -> None:
+    path = tmp_path / "records.jsonl"
+    append_json_line(path, {"a": 1})
+    append_json_line(path, {"b": "ä"})
+    with open(path, "a", encoding="utf-8") as f:
+        f.write('{"c": ')
+    assert read_json_lines(path) == [{"a": 1}, {"b": "ä"}]
+
+
+def test_read_json_lines_of_missing_file(tmp_path: Path) -> None:
+    assert read_json_lines(tmp_path / "missing.jsonl") == []
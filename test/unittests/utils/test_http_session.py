@@ -0,0 +1,91 @@
+import threading
+from collections.abc import Iterator
+from http.server import BaseHTTPRequestHandler
+from http.server import ThreadingHTTPServer
+
+import pytest
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from dsp_tools.utils import http_session
+from dsp_tools.utils.http_session import HttpPoolConfig
+from dsp_tools.utils.http_session import get_connection_stats
+from dsp_tools.utils.http_session import make_session
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self) -> None:
+        self.send_response(200)
+        self.send_header("Content-Length", "2")
+        self.end_headers()
+        self.wfile.write(b"ok")
+
+    def log_message(self, *_args: object) -> None:
+        pass
+
+
+@pytest.fixture
+def server_url() -> Iterator[str]:
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+def test_sessions_share_the_pool_but_not_the_headers() -> None:
+    first = make_session()
+    second = make_session()
+    first.headers["Authorization"] = "Bearer token"
+    assert first.get_adapter("https://api.dasch.swiss") is second.get_adapter("https://api.dasch.swiss")
+    assert "Authorization" not in second.headers
+    assert str(second.headers["User-Agent"]).startswith("DSP-TOOLS/")
+
+
+def test_session_with_retries_has_its_own_pool() -> None:
+    retry = Retry(total=3)
+    session = make_session(max_retries=retry)
+    adapter = session.get_adapter("https://api.dasch.swiss")
+    assert isinstance(adapter, HTTPAdapter)
+    assert adapter is not make_session().get_adapter("https://api.dasch.swiss")
+    assert adapter.max_retries is retry
+
+
+def test_connections_are_reused_across_sessions(server_url: str, monkeypatch: pytest.MonkeyPatch) -> None:
+    # a new shared pool, without the connections of other tests
+    monkeypatch.setattr(http_session, "_shared_adapter", None)
+    before = get_connection_stats()
+    for _ in range(3):
+        assert make_session().get(server_url, timeout=5).text == "ok"
+    after = get_connection_stats()
+    assert after.requests - before.requests == 3
+    assert after.new_connections - before.new_connections == 1
+
+
+def test_config_from_env(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("DSP_TOOLS_HTTP_POOL_MAX_HOSTS", "2")
+    monkeypatch.setenv("DSP_TOOLS_HTTP_POOL_MAX_CONNECTIONS_PER_HOST", "64")
+    monkeypatch.setenv("DSP_TOOLS_HTTP_KEEP_ALIVE", "false")
+    assert HttpPoolConfig.from_env() == HttpPoolConfig(max_hosts=2, max_connections_per_host=64, keep_alive=False)
+
+
+def test_config_defaults(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.delenv("DSP_TOOLS_HTTP_POOL_MAX_HOSTS", raising=False)
+    monkeypatch.delenv("DSP_TOOLS_HTTP_POOL_MAX_CONNECTIONS_PER_HOST", raising=False)
+    monkeypatch.delenv("DSP_TOOLS_HTTP_KEEP_ALIVE", raising=False)
+    assert HttpPoolConfig.from_env() == HttpPoolConfig()
+
+
+@pytest.mark.parametrize("value", ["ten", "", "0", "-3", "2.5"])
+def test_config_with_invalid_value_falls_back_to_default(monkeypatch: pytest.MonkeyPatch, value: str) -> None:
+    monkeypatch.setenv("DSP_TOOLS_HTTP_POOL_MAX_HOSTS", value)
+    monkeypatch.setenv("DSP_TOOLS_HTTP_POOL_MAX_CONNECTIONS_PER_HOST", "64")
+    monkeypatch.delenv("DSP_TOOLS_HTTP_KEEP_ALIVE", raising=False)
+    assert HttpPoolConfig.from_env() == HttpPoolConfig(max_connections_per_host=64)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,134 @@
+import threading
+from collections.abc import Iterator
+from unittest.mock import Mock
+from unittest.mock import patch
+
+import pytest
+
+from dsp_tools.utils.rate_control import AdaptiveRateController
+from dsp_tools.utils.rate_control import RateControlConfig
+
+
+@pytest.fixture
+def sleep_mock() -> Iterator[Mock]:
+    with patch("dsp_tools.utils.rate_control.time.sleep") as sleep_mock:
+        yield sleep_mock
+
+
+def test_limit_grows_additively_while_used() -> None:
+    controller = AdaptiveRateController(RateControlConfig(initial_limit=2, max_limit=3))
+    with controller.request_slot():
+        with controller.request_slot():
+            pass
+        assert controller.limit == 2.5
+        with controller.request_slot():
+            pass
+        assert controller.limit == 2.9
+        with controller.request_slot():
+            pass
+    assert controller.limit == 3
+
+
+def test_limit_does_not_grow_while_unused() -> None:
+    controller = AdaptiveRateController(RateControlConfig(initial_limit=4))
+    for _ in range(10):
+        with controller.request_slot():
+            pass
+    assert controller.limit == 4
+
+
+def test_failure_cuts_limit_and_backs_off(sleep_mock: Mock) -> None:
+    controller = AdaptiveRateController(RateControlConfig(initial_limit=8))
+    for retry_counter in range(3):
+        with controller.request_slot() as slot:
+            slot.record_failure("Transient Error", retry_counter, exc_info=False)
+    assert controller.limit == 1
+    assert [x.args[0] for x in sleep_mock.call_args_list] == [1, 2, 4]
+
+
+def test_limit_does_not_go_below_minimum(sleep_mock: Mock) -> None:  # noqa: ARG001
+    controller = AdaptiveRateController(RateControlConfig(initial_limit=2, min_limit=2))
+    with controller.request_slot() as slot:
+        slot.record_failure("Transient Error", 0, exc_info=False)
+    assert controller.limit == 2
+
+
+def test_timeout_cuts_limit_without_backoff(sleep_mock: Mock) -> None:
+    controller = AdaptiveRateController(RateControlConfig(initial_limit=8))
+    with pytest.raises(TimeoutError):
+        _send_request_that_times_out(controller)
+    assert controller.limit == 4
+    sleep_mock.assert_not_called()
+
+
+def test_other_exceptions_give_no_signal() -> None:
+    controller = AdaptiveRateController(RateControlConfig(initial_limit=1))
+    with pytest.raises(ValueError, match="unrelated"):
+        _send_request_that_raises(controller)
+    assert controller.limit == 1
+    with controller.request_slot():
+        pass
+
+
+def test_concurrent_failures_count_once(sleep_mock: Mock) -> None:  # noqa: ARG001
+    controller = AdaptiveRateController(RateControlConfig(initial_limit=8))
+    contexts = [controller.request_slot() for _ in range(4)]
+    slots = [context.__enter__() for context in contexts]
+    for slot in slots:
+        slot.record_failure("Transient Error", 0, exc_info=False)
+    for context in contexts:
+        context.__exit__(None, None, None)
+    assert controller.limit == 4
+
+
+def test_requests_wait_for_a_free_slot() -> None:
+    controller = AdaptiveRateController(RateControlConfig(initial_limit=1, max_limit=1))
+    second_sent = threading.Event()
+
+    def send_second() -> None:
+        with controller.request_slot():
+            second_sent.set()
+
+    with controller.request_slot():
+        thread = threading.Thread(target=send_second)
+        thread.start()
+        assert not second_sent.wait(timeout=0.1)
+    thread.join(timeout=5)
+    assert second_sent.is_set()
+
+
+def test_rising_latency_cuts_limit() -> None:
+    controller = AdaptiveRateController(RateControlConfig(initial_limit=8))
+    clock = iter(x / 10 for x in range(1000))
+    with patch("dsp_tools.utils.rate_control.time.monotonic", side_effect=lambda: next(clock)):
+        for _ in range(20):
+            with controller.request_slot():
+                pass
+        assert controller.limit == 8
+        with patch("dsp_tools.utils.rate_control.time.monotonic", side_effect=[0.0, 10.0]):
+            with controller.request_slot():
+                pass
+    assert controller.limit == 4
+
+
+def test_error_cuts_limit_without_backoff(sleep_mock: Mock) -> None:
+    controller = AdaptiveRateController(RateControlConfig(initial_limit=8))
+    with controller.request_slot() as slot:
+        slot.record_error()
+    assert controller.limit == 4
+    sleep_mock.assert_not_called()
+
+
+def _send_request_that_times_out(controller: AdaptiveRateController) -> None:
+    with controller.request_slot() as slot:
+        slot.record_timeout()
+        raise TimeoutError
+
+
+def _send_request_that_raises(controller: AdaptiveRateController) -> None:
+    with controller.request_slot():
+        raise ValueError("unrelated")
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
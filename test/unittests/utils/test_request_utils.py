@@ -6,8 +6,11 @@ from unittest.mock import patch
 import pytest
 from requests import Response
 
+from dsp_tools.utils.request_utils import RequestLogConfig
+from dsp_tools.utils.request_utils import RequestParameters
 from dsp_tools.utils.request_utils import ResponseCodeAndText
 from dsp_tools.utils.request_utils import _is_retriable_status_code
+from dsp_tools.utils.request_utils import log_request
 from dsp_tools.utils.request_utils import log_response
 from dsp_tools.utils.request_utils import parse_api_v3_error
 from dsp_tools.utils.request_utils import should_retry_request
@@ -25,6 +28,13 @@ def _make_response(status_code: int, headers: dict[str, Any], text: str):
     return mock
 
 
+@pytest.fixture(autouse=True)
+def log_config(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(
+        "dsp_tools.utils.request_utils._log_config", RequestLogConfig(max_body_chars=20, success_sample_rate=1)
+    )
+
+
 def test_log_response_debug() -> None:
     response_mock = _make_response(
         200,
@@ -57,6 +67,95 @@ def test_log_response_warning() -> None:
         warning_mock.assert_called_once_with(f"RESPONSE: {json.dumps(expected_output)}")
 
 
+def test_log_response_debug_truncated() -> None:
+    response_mock = _make_response(200, {}, json.dumps({"foo": "a" * 100}))
+    expected_output = {
+        "status_code": 200,
+        "headers": "",
+        "content": '{"foo": "aaaaaaaaaaa... [truncated, 111 in total]',
+    }
+    with patch("dsp_tools.utils.request_utils.logger.debug") as debug_mock:
+        log_response(response_mock, status_code=response_mock.status_code)
+        debug_mock.assert_called_once_with(f"RESPONSE: {json.dumps(expected_output)}")
+
+
+def test_log_response_debug_not_sampled(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr("dsp_tools.utils.request_utils._log_config", RequestLogConfig(success_sample_rate=0))
+    response_mock = _make_response(200, {}, json.dumps({"foo": "bar"}))
+    with patch("dsp_tools.utils.request_utils.logger.debug") as debug_mock:
+        log_response(response_mock, status_code=response_mock.status_code)
+        debug_mock.assert_not_called()
+
+
+def test_log_request_truncated() -> None:
+    params = RequestParameters("POST", "http://0.0.0.0:3333/v2/resources", 60, data={"foo": "a" * 100})
+    expected_output = {
+        "method": "POST",
+        "url": "http://0.0.0.0:3333/v2/resources",
+        "timeout": 60,
+        "headers": {},
+        "data": '{"foo": "aaaaaaaaaaa... [truncated, 111 in total]',
+    }
+    with patch("dsp_tools.utils.request_utils.logger.debug") as debug_mock:
+        log_request(params)
+        debug_mock.assert_called_once_with(f"REQUEST: {json.dumps(expected_output)}")
+
+
+def test_log_request_password_is_masked() -> None:
+    params = RequestParameters("POST", "http://0.0.0.0:3333/v2/authentication", 60, data={"password": "secret"})
+    with patch("dsp_tools.utils.request_utils.logger.debug") as debug_mock:
+        log_request(params)
+        assert '"data": {"password": "***"}' in debug_mock.call_args.args[0]
+
+
+def test_failed_response_logs_full_request() -> None:
+    params = RequestParameters("POST", "http://0.0.0.0:3333/v2/resources", 60, data={"foo": "a" * 100})
+    response_mock = _make_response(400, {}, json.dumps({"error": "b" * 100}))
+    with patch("dsp_tools.utils.request_utils.logger.warning") as warning_mock:
+        log_response(response_mock, status_code=response_mock.status_code, request=params)
+        failed_request, response = [x.args[0] for x in warning_mock.call_args_list]
+    assert failed_request.startswith("FAILED REQUEST: ")
+    assert json.loads(failed_request.removeprefix("FAILED REQUEST: "))["data"] == {"foo": "a" * 100}
+    assert json.loads(response.removeprefix("RESPONSE: "))["content"] == {"error": "b" * 100}
+
+
+def test_successful_response_does_not_log_request() -> None:
+    params = RequestParameters("POST", "http://0.0.0.0:3333/v2/resources", 60, data={"foo": "bar"})
+    response_mock = _make_response(200, {}, json.dumps({"foo": "bar"}))
+    with (
+        patch("dsp_tools.utils.request_utils.logger.debug") as debug_mock,
+        patch("dsp_tools.utils.request_utils.logger.warning") as warning_mock,
+    ):
+        log_response(response_mock, status_code=response_mock.status_code, request=params)
+    debug_mock.assert_called_once()
+    warning_mock.assert_not_called()
+
+
+def test_failed_response_without_request() -> None:
+    response_mock = _make_response(500, {}, json.dumps({"message": "Internal Server Error"}))
+    with patch("dsp_tools.utils.request_utils.logger.warning") as warning_mock:
+        log_response(response_mock, status_code=response_mock.status_code)
+        warning_mock.assert_called_once()
+
+
+def test_log_config_from_env(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("DSP_TOOLS_REQUEST_LOG_MAX_CHARS", "500")
+    monkeypatch.setenv("DSP_TOOLS_REQUEST_LOG_SAMPLE_RATE", "0.5")
+    assert RequestLogConfig.from_env() == RequestLogConfig(max_body_chars=500, success_sample_rate=0.5)
+
+
+def test_log_config_from_env_invalid(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("DSP_TOOLS_REQUEST_LOG_MAX_CHARS", "1k")
+    monkeypatch.setenv("DSP_TOOLS_REQUEST_LOG_SAMPLE_RATE", "often")
+    assert RequestLogConfig.from_env() == RequestLogConfig()
+
+
+@pytest.mark.parametrize(("value", "expected"), [("-1", 0.0), ("2", 1.0)])
+def test_log_config_from_env_clamps_sample_rate(monkeypatch: pytest.MonkeyPatch, value: str, expected: float) -> None:
+    monkeypatch.setenv("DSP_TOOLS_REQUEST_LOG_SAMPLE_RATE", value)
+    assert RequestLogConfig.from_env().success_sample_rate == expected
+
+
 @pytest.mark.parametrize(
     ("status_code", "expected"),
     [
@@ -0,0 +1,106 @@
+import threading
+from pathlib import Path
+
+import pytest
+
+from dsp_tools.utils.telemetry import BYTES_SENT
+from dsp_tools.utils.telemetry import PROMETHEUS_TEXTFILE_ENV_VAR
+from dsp_tools.utils.telemetry import Telemetry
+from dsp_tools.utils.telemetry import write_prometheus_textfile
+
+
+def test_percentiles() -> None:
+    telemetry = Telemetry()
+    for seconds in range(1, 101):
+        telemetry.record("http", float(seconds))
+    phase = telemetry.summary().phases["http"]
+    assert phase.count == 100
+    assert phase.total_seconds == 5050
+    assert (phase.p50_seconds, phase.p95_seconds, phase.p99_seconds) == (50, 95, 99)
+
+
+def test_percentiles_of_single_execution() -> None:
+    telemetry = Telemetry()
+    telemetry.record("parse", 2.0)
+    phase = telemetry.summary().phases["parse"]
+    assert (phase.p50_seconds, phase.p95_seconds, phase.p99_seconds) == (2, 2, 2)
+
+
+def test_samples_are_bounded() -> None:
+    telemetry = Telemetry(max_samples_per_phase=100)
+    for seconds in range(1, 1001):
+        telemetry.record("http", float(seconds))
+    assert len(telemetry._durations["http"].samples) == 100
+    phase = telemetry.summary().phases["http"]
+    assert phase.count == 1000
+    assert phase.total_seconds == 500500
+    assert 1 <= phase.p50_seconds <= phase.p95_seconds <= phase.p99_seconds <= 1000
+
+
+def test_measure_records_also_if_an_error_occurs() -> None:
+    telemetry = Telemetry()
+    with pytest.raises(ValueError, match="failed"):
+        _measure_failing_phase(telemetry)
+    assert telemetry.summary().phases["graph_build"].count == 1
+
+
+def test_concurrent_records() -> None:
+    telemetry = Telemetry()
+
+    def work() -> None:
+        for _ in range(1000):
+            with telemetry.measure("http"):
+                telemetry.add(BYTES_SENT, 10)
+
+    threads = [threading.Thread(target=work) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    summary = telemetry.summary()
+    assert summary.phases["http"].count == 8000
+    assert summary.counters == {BYTES_SENT: 80000}
+
+
+def test_to_dict() -> None:
+    telemetry = Telemetry()
+    telemetry.record("parse", 1.0)
+    telemetry.add(BYTES_SENT, 42)
+    result = telemetry.summary().to_dict()
+    assert result["counters"] == {BYTES_SENT: 42}
+    assert result["phases"]["parse"]["count"] == 1
+    assert result["phases"]["parse"]["p99_seconds"] == 1
+
+
+def test_to_prometheus() -> None:
+    telemetry = Telemetry()
+    telemetry.record("http", 0.5)
+    telemetry.add(BYTES_SENT, 42)
+    lines = telemetry.summary().to_prometheus().splitlines()
+    assert "dsp_tools_xmlupload_bytes_sent_total 42" in lines
+    assert 'dsp_tools_xmlupload_phase_duration_seconds{phase="http",quantile="0.95"} 0.5' in lines
+    assert 'dsp_tools_xmlupload_phase_duration_seconds_count{phase="http"} 1' in lines
+
+
+def test_prometheus_textfile_not_configured(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.delenv(PROMETHEUS_TEXTFILE_ENV_VAR, raising=False)
+    assert write_prometheus_textfile(Telemetry().summary()) is None
+
+
+def test_prometheus_textfile(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    location = tmp_path / "textfiles" / "xmlupload.prom"
+    monkeypatch.setenv(PROMETHEUS_TEXTFILE_ENV_VAR, str(location))
+    telemetry = Telemetry()
+    telemetry.record("parse", 1.0)
+    assert write_prometheus_textfile(telemetry.summary()) == location
+    assert 'dsp_tools_xmlupload_phase_duration_seconds_sum{phase="parse"} 1.0' in location.read_text()
+    assert [x.name for x in location.parent.iterdir()] == ["xmlupload.prom"]
+
+
+def _measure_failing_phase(telemetry: Telemetry) -> None:
+    with telemetry.measure("graph_build"):
+        raise ValueError("failed")
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -5,8 +5,8 @@ from lxml import etree
 
 from dsp_tools.utils.rdf_constants import KNORA_API_PREFIX
 from dsp_tools.utils.rdf_constants import URN_DASCH_PLACEHOLDER
+from dsp_tools.utils.xml_parsing.get_parsed_resources import _AbsoluteIriLookup
 from dsp_tools.utils.xml_parsing.get_parsed_resources import _cleanup_formatted_text
-from dsp_tools.utils.xml_parsing.get_parsed_resources import _create_from_local_name_to_absolute_iri_lookup
 from dsp_tools.utils.xml_parsing.get_parsed_resources import _get_file_value_type
 from dsp_tools.utils.xml_parsing.get_parsed_resources import _get_one_absolute_iri
 from dsp_tools.utils.xml_parsing.get_parsed_resources import _get_richtext_as_string
@@ -718,13 +718,21 @@ class TestFileTypeInfo:
         assert not _get_file_value_type(None)
 
 
-def test_create_from_local_name_to_absolute_iri_lookup(root_with_2_resources):
-    result = _create_from_local_name_to_absolute_iri_lookup(root_with_2_resources, HTTP_API_URL)
-    expected = {
+def test_absolute_iri_lookup():
+    lookup = _AbsoluteIriLookup("0000", "default", HTTP_API_URL)
+    assert lookup[":minimalResource"] == f"{DEFAULT_ONTO_NAMESPACE}minimalResource"
+    assert lookup["hasLinkTo"] == f"{KNORA_API_PREFIX}hasLinkTo"
+    assert lookup == {
         ":minimalResource": f"{DEFAULT_ONTO_NAMESPACE}minimalResource",
         "hasLinkTo": f"{KNORA_API_PREFIX}hasLinkTo",
     }
-    assert result == expected
+
+
+def test_get_parsed_resources_order(root_no_resources, resource_link, resource_region, resource_no_values):
+    root = deepcopy(root_no_resources)
+    root.extend([resource_link, resource_region, resource_no_values])
+    parsed_res = get_parsed_resources(root, HTTPS_API_URL)
+    assert [x.res_id for x in parsed_res] == ["resource_no_values", "resource_region", "resource_link"]
 
 
 @pytest.mark.parametrize(